@@ -16,6 +16,9 @@ from inference.core.managers.active_learning import (
     BackgroundTaskActiveLearningManager,
 )
 from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.async_load import (
+    AsyncLoadModelManagerDecorator,
+)
 from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
 from inference.core.registries.roboflow import (
     RoboflowModelRegistry,
@@ -44,6 +47,7 @@ else:
     model_manager = ModelManager(model_registry=model_registry)
 
 model_manager = WithFixedSizeCache(model_manager, max_size=MAX_ACTIVE_MODELS)
+model_manager = AsyncLoadModelManagerDecorator(model_manager)
 model_manager.init_pingback()
 interface = HttpInterface(
     model_manager,
@@ -0,0 +1,452 @@
+import atexit
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+import zipfile
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, List, Optional, Tuple, TypeVar
+
+import numpy as np
+
+from inference.core import logger
+from inference.core.cache.base import BaseCache
+
+T = TypeVar("T")
+V = TypeVar("V")
+
+
+class EmbeddingsCache:
+    """
+    In-memory LRU cache of embeddings, bounded by the total size (in bytes) of stored embeddings
+    and keys. Keeps track of hits and misses.
+
+    When `persistence_path` is given, the cache is loaded from that file on creation and the whole
+    content is saved there with `persist()` - such that embeddings survive restarts. Callers
+    adding entries on the request path should use `persist_if_needed()`, which only writes
+    the file once `persist_after_entries` new entries were added - the rest is saved at exit.
+
+    Thread safe thanks to thread lock on all operations.
+    """
+
+    def __init__(
+        self,
+        max_size_bytes: int,
+        persistence_path: Optional[str] = None,
+        persist_after_entries: int = 64,
+    ):
+        self._max_size_bytes = max_size_bytes
+        self._persistence_path = persistence_path
+        self._persist_after_entries = persist_after_entries
+        self._entries: Dict[str, np.ndarray] = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._unpersisted_entries = 0
+        self._lock = threading.Lock()
+        self._persist_lock = threading.Lock()
+        if persistence_path is None:
+            return None
+        if os.path.isfile(persistence_path):
+            self._load()
+        atexit.register(_persist_embeddings_cache, weakref.ref(self))
+
+    def get_many(self, keys: List[str]) -> Tuple[Dict[str, np.ndarray], List[str]]:
+        """Returns embeddings found for given keys and list of (unique) keys which are missing."""
+        found, missing, seen = {}, [], set()
+        with self._lock:
+            for key in keys:
+                if key in seen:
+                    continue
+                seen.add(key)
+                embedding = self._entries.get(key)
+                if embedding is None:
+                    self._misses += 1
+                    missing.append(key)
+                    continue
+                self._hits += 1
+                self._entries.move_to_end(key)
+                found[key] = embedding
+        return found, missing
+
+    def set_many(self, entries: Dict[str, np.ndarray]) -> None:
+        with self._lock:
+            for key, embedding in entries.items():
+                self._set(key=key, embedding=embedding)
+            self._unpersisted_entries += len(entries)
+
+    def persist_if_needed(self) -> None:
+        with self._lock:
+            if self._unpersisted_entries < self._persist_after_entries:
+                return None
+        self.persist()
+
+    def persist(self) -> None:
+        if self._persistence_path is None:
+            return None
+        # writers are serialised, such that older snapshot never replaces newer one
+        with self._persist_lock:
+            with self._lock:
+                keys = list(self._entries.keys())
+                embeddings = list(self._entries.values())
+                self._unpersisted_entries = 0
+            if not keys:
+                return None
+            self._write(keys=keys, embeddings=embeddings)
+
+    def _write(self, keys: List[str], embeddings: List[np.ndarray]) -> None:
+        directory = os.path.dirname(self._persistence_path)
+        tmp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            tmp_file, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(tmp_file, "wb") as f:
+                np.savez(f, keys=np.array(keys), embeddings=np.stack(embeddings))
+            os.replace(tmp_path, self._persistence_path)
+        except OSError as error:
+            logger.warning(
+                f"Could not persist embeddings cache to {self._persistence_path}: {error}"
+            )
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _set(self, key: str, embedding: np.ndarray) -> None:
+        entry_size = _entry_size(key=key, embedding=embedding)
+        if entry_size > self._max_size_bytes:
+            return None
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size_bytes -= _entry_size(key=key, embedding=previous)
+        self._entries[key] = embedding
+        self._size_bytes += entry_size
+        while self._size_bytes > self._max_size_bytes:
+            evicted_key, evicted_embedding = self._entries.popitem(last=False)
+            self._size_bytes -= _entry_size(
+                key=evicted_key, embedding=evicted_embedding
+            )
+
+    def _load(self) -> None:
+        try:
+            with np.load(self._persistence_path, allow_pickle=False) as content:
+                keys, embeddings = content["keys"].tolist(), content["embeddings"]
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as error:
+            logger.warning(
+                f"Could not load embeddings cache from {self._persistence_path}, "
+                f"starting with empty cache: {error}"
+            )
+            return None
+        for key, embedding in zip(keys, embeddings):
+            self._set(key=key, embedding=embedding)
+
+
+def get_or_compute_embeddings(
+    cache: EmbeddingsCache,
+    keys: List[str],
+    inputs: List[T],
+    compute: Callable[[List[T]], np.ndarray],
+) -> np.ndarray:
+    """
+    Returns embeddings of `inputs` (stacked in order of `inputs`), computing with `compute(...)` only
+    the ones which `keys` are missing in `cache`. Inputs sharing the same key are computed once - for
+    the first of them.
+    """
+    embeddings_by_key, missing_keys = cache.get_many(keys=keys)
+    if missing_keys:
+        input_by_key = {}
+        for key, value in zip(keys, inputs):
+            input_by_key.setdefault(key, value)
+        missing_embeddings = dict(
+            zip(missing_keys, compute([input_by_key[key] for key in missing_keys]))
+        )
+        cache.set_many(entries=missing_embeddings)
+        cache.persist_if_needed()
+        embeddings_by_key.update(missing_embeddings)
+    return np.stack([embeddings_by_key[key] for key in keys], axis=0)
+
+
+def _persist_embeddings_cache(cache_reference: weakref.ref) -> None:
+    cache = cache_reference()
+    if cache is not None:
+        cache.persist()
+
+
+def _entry_size(key: str, embedding: np.ndarray) -> int:
+    return embedding.nbytes + len(key.encode("utf-8"))
+
+
+class SpillingEmbeddingsCache(Generic[V]):
+    """
+    Thread-safe LRU cache of embeddings (of arbitrary structure - like dicts of torch tensors), bounded by
+    number of entries and total size (in bytes) of stored values. Keeps track of hits, misses, evictions
+    and spills.
+
+    When `spill_directory` is given, entries evicted from memory are not dropped, but saved to disk
+    (as `.npy` files - one per array returned by `to_arrays(...)`) and re-hydrated from memory-mapped
+    files (with `from_arrays(...)`) on next access - which is much faster than recomputing the embedding.
+    Spilled files are removed once the entry is re-hydrated, so `from_arrays(...)` must copy the data.
+    Disk store is also LRU, bounded by `max_spill_size_bytes`. Evicted entries are written to disk after
+    the lock is released, so other threads are not blocked by the I/O. Spilled files live in directory
+    unique for the cache instance, which is removed when the cache is garbage-collected.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_size_bytes: int,
+        size_of: Callable[[V], int],
+        to_arrays: Optional[Callable[[V], List[np.ndarray]]] = None,
+        from_arrays: Optional[Callable[[List[np.ndarray]], V]] = None,
+        spill_directory: Optional[str] = None,
+        max_spill_size_bytes: int = 0,
+    ):
+        if spill_directory is not None and (to_arrays is None or from_arrays is None):
+            raise ValueError(
+                "Both `to_arrays` and `from_arrays` must be given to spill embeddings to disk"
+            )
+        self._max_entries = max_entries
+        self._max_size_bytes = max_size_bytes
+        self._size_of = size_of
+        self._to_arrays = to_arrays
+        self._from_arrays = from_arrays
+        self._max_spill_size_bytes = max_spill_size_bytes
+        self._entries: Dict[str, Tuple[V, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._spilled: Dict[str, Tuple[str, int]] = OrderedDict()
+        self._spilled_size_bytes = 0
+        self._stats = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "spills": 0,
+        }
+        self._lock = threading.Lock()
+        self._spill_directory = None
+        if spill_directory is not None and max_spill_size_bytes > 0:
+            os.makedirs(spill_directory, exist_ok=True)
+            self._spill_directory = tempfile.mkdtemp(dir=spill_directory)
+            weakref.finalize(self, shutil.rmtree, self._spill_directory, True)
+
+    def get(self, key: str) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._stats["hits"] += 1
+                self._entries.move_to_end(key)
+                return entry[0]
+            if key not in self._spilled:
+                self._stats["misses"] += 1
+                return None
+            value = self._rehydrate(key=key)
+            if value is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            evicted_entries = self._set(key=key, value=value)
+        self._spill(entries=evicted_entries)
+        return value
+
+    def set(self, key: str, value: V) -> None:
+        with self._lock:
+            self._drop_spilled(key=key)
+            evicted_entries = self._set(key=key, value=value)
+        self._spill(entries=evicted_entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            for key in list(self._spilled.keys()):
+                self._drop_spilled(key=key)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+                "spilled_entries": len(self._spilled),
+                "spilled_size_bytes": self._spilled_size_bytes,
+            }
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._entries or key in self._spilled
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries) + len(self._spilled)
+
+    def _set(self, key: str, value: V) -> List[Tuple[str, V]]:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size_bytes -= previous[1]
+        entry_size = self._size_of(value)
+        self._entries[key] = (value, entry_size)
+        self._size_bytes += entry_size
+        evicted_entries = []
+        while len(self._entries) > 1 and (
+            len(self._entries) > self._max_entries
+            or (0 < self._max_size_bytes < self._size_bytes)
+        ):
+            evicted_key, (evicted_value, evicted_size) = self._entries.popitem(
+                last=False
+            )
+            self._size_bytes -= evicted_size
+            self._stats["evictions"] += 1
+            evicted_entries.append((evicted_key, evicted_value))
+        return evicted_entries
+
+    def _spill(self, entries: List[Tuple[str, V]]) -> None:
+        # called without the lock held - entries are written to disk while other threads use the cache
+        if self._spill_directory is None:
+            return None
+        for key, value in entries:
+            self._spill_entry(key=key, value=value)
+
+    def _spill_entry(self, key: str, value: V) -> None:
+        arrays = [np.ascontiguousarray(array) for array in self._to_arrays(value)]
+        spill_size = sum(array.nbytes for array in arrays)
+        if spill_size > self._max_spill_size_bytes:
+            return None
+        entry_directory = None
+        try:
+            entry_directory = tempfile.mkdtemp(dir=self._spill_directory)
+            for idx, array in enumerate(arrays):
+                np.save(os.path.join(entry_directory, f"{idx}.npy"), array)
+        except OSError as error:
+            logger.warning(f"Could not spill embedding {key} to disk: {error}")
+            if entry_directory is not None:
+                shutil.rmtree(entry_directory, ignore_errors=True)
+            return None
+        with self._lock:
+            if key in self._entries:
+                # entry was set again while being written to disk
+                shutil.rmtree(entry_directory, ignore_errors=True)
+                return None
+            self._drop_spilled(key=key)
+            self._spilled[key] = (entry_directory, spill_size)
+            self._spilled_size_bytes += spill_size
+            self._stats["spills"] += 1
+            while self._spilled_size_bytes > self._max_spill_size_bytes:
+                self._drop_spilled(key=next(iter(self._spilled)))
+
+    def _rehydrate(self, key: str) -> Optional[V]:
+        entry_directory = self._spilled[key][0]
+        try:
+            arrays_number = len(os.listdir(entry_directory))
+            arrays = [
+                np.load(os.path.join(entry_directory, f"{idx}.npy"), mmap_mode="r")
+                for idx in range(arrays_number)
+            ]
+            value = self._from_arrays(arrays)
+        except (OSError, ValueError) as error:
+            logger.warning(f"Could not load spilled embedding {key}: {error}")
+            value = None
+        self._drop_spilled(key=key)
+        return value
+
+    def _drop_spilled(self, key: str) -> None:
+        spilled = self._spilled.pop(key, None)
+        if spilled is None:
+            return None
+        entry_directory, spill_size = spilled
+        self._spilled_size_bytes -= spill_size
+        shutil.rmtree(entry_directory, ignore_errors=True)
+
+
+class EmbeddingsStore:
+    """
+    Base class of persistent stores of embeddings. Entries are dicts of named numpy arrays, such that
+    stores may keep them outside of the process memory - to be re-used after restarts and by other
+    workers.
+    """
+
+    def get(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        raise NotImplementedError()
+
+    def set(self, key: str, arrays: Dict[str, np.ndarray]) -> None:
+        raise NotImplementedError()
+
+
+class FileEmbeddingsStore(EmbeddingsStore):
+    """
+    Keeps each entry as directory of `.npy` files (arrays names are used as file names), loaded with memory
+    mapping. Entries are written to temporary directory and atomically renamed, so the store can be safely
+    shared by multiple processes. Store is not bounded - entries are only removed with the directory.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+
+    def get(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        entry_directory = self._get_entry_directory(key=key)
+        if not os.path.isdir(entry_directory):
+            return None
+        try:
+            return {
+                os.path.splitext(file_name)[0]: np.load(
+                    os.path.join(entry_directory, file_name), mmap_mode="r"
+                )
+                for file_name in os.listdir(entry_directory)
+            }
+        except (OSError, ValueError) as error:
+            logger.warning(f"Could not load embeddings {key} from store: {error}")
+            return None
+
+    def set(self, key: str, arrays: Dict[str, np.ndarray]) -> None:
+        entry_directory = self._get_entry_directory(key=key)
+        if os.path.isdir(entry_directory):
+            return None
+        tmp_directory = None
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            tmp_directory = tempfile.mkdtemp(dir=self._directory, prefix=".tmp-")
+            for name, array in arrays.items():
+                np.save(os.path.join(tmp_directory, f"{name}.npy"), array)
+            os.rename(tmp_directory, entry_directory)
+        except OSError as error:
+            if not os.path.isdir(entry_directory):
+                logger.warning(f"Could not save embeddings {key} in store: {error}")
+            if tmp_directory is not None:
+                shutil.rmtree(tmp_directory, ignore_errors=True)
+
+    def _get_entry_directory(self, key: str) -> str:
+        return os.path.join(
+            self._directory, hashlib.md5(key.encode("utf-8")).hexdigest()
+        )
+
+
+class CacheEmbeddingsStore(EmbeddingsStore):
+    """
+    Keeps entries in `inference` cache (`set_numpy(...)` / `get_numpy(...)`) - which is shared by all
+    workers when Redis is configured.
+    """
+
+    def __init__(
+        self, cache: BaseCache, key_prefix: str, expire: Optional[float] = None
+    ):
+        self._cache = cache
+        self._key_prefix = key_prefix
+        self._expire = expire
+
+    def get(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        return self._cache.get_numpy(f"{self._key_prefix}:{key}")
+
+    def set(self, key: str, arrays: Dict[str, np.ndarray]) -> None:
+        self._cache.set_numpy(f"{self._key_prefix}:{key}", arrays, expire=self._expire)
@@ -1,30 +1,130 @@
+import heapq
+import itertools
 import threading
 import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
 from threading import Lock
-from typing import Any, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 from inference.core.cache.base import BaseCache
-from inference.core.env import MEMORY_CACHE_EXPIRE_INTERVAL
+from inference.core.env import (
+    MEMORY_CACHE_EXPIRE_INTERVAL,
+    MEMORY_CACHE_MAX_SORTED_SET_ENTRIES,
+)
+
+KEY_EXPIRY = 0
+MEMBER_EXPIRY = 1
+
+
+class SortedSet:
+    """
+    In-memory sorted set, indexed by score. Members with equal scores are kept (in the order of insertion).
+    Hashable members are unique within the set (like in Redis - adding existing member updates its score),
+    unhashable ones (like dictionaries) are always added as new members.
+
+    Entries are kept in a list ordered by `(score, sequence_number)` - lookup of range boundaries is
+    O(log n), insertion is O(log n) comparisons plus a memory move of the list tail.
+    """
+
+    def __init__(self) -> None:
+        self._index: List[Tuple[float, int]] = []
+        self._values: Dict[int, Any] = {}
+        self._members: Dict[Hashable, Tuple[float, int]] = {}
+
+    def add(self, value: Any, score: float, sequence_number: int) -> None:
+        member = _as_member(value)
+        if member is not None and member in self._members:
+            self._remove_entry(self._members[member])
+        entry = (score, sequence_number)
+        self._index.insert(bisect_right(self._index, entry), entry)
+        self._values[sequence_number] = value
+        if member is not None:
+            self._members[member] = entry
+
+    def range_by_score(self, min: float, max: float) -> List[Tuple[Any, float, int]]:
+        start, end = self._range_bounds(min=min, max=max)
+        return [
+            (self._values[sequence_number], score, sequence_number)
+            for score, sequence_number in self._index[start:end]
+        ]
+
+    def remove_range_by_score(self, min: float, max: float) -> List[int]:
+        start, end = self._range_bounds(min=min, max=max)
+        removed = self._index[start:end]
+        del self._index[start:end]
+        for _, sequence_number in removed:
+            self._forget(sequence_number=sequence_number)
+        return [sequence_number for _, sequence_number in removed]
+
+    def remove(self, score: float, sequence_number: int) -> bool:
+        if sequence_number not in self._values:
+            return False
+        self._remove_entry((score, sequence_number))
+        return True
+
+    def __contains__(self, sequence_number: int) -> bool:
+        return sequence_number in self._values
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _range_bounds(self, min: float, max: float) -> Tuple[int, int]:
+        start = bisect_left(self._index, (min, -1))
+        end = bisect_right(self._index, (max, float("inf")))
+        return start, end
+
+    def _remove_entry(self, entry: Tuple[float, int]) -> None:
+        position = bisect_left(self._index, entry)
+        if position < len(self._index) and self._index[position] == entry:
+            del self._index[position]
+        self._forget(sequence_number=entry[1])
+
+    def _forget(self, sequence_number: int) -> None:
+        value = self._values.pop(sequence_number)
+        member = _as_member(value)
+        if member is None:
+            return None
+        if self._members.get(member, (None, None))[1] == sequence_number:
+            del self._members[member]
 
 
 class MemoryCache(BaseCache):
     """
     MemoryCache is an in-memory cache that implements the BaseCache interface.
 
+    Expiration times are kept in a heap, such that the expiry thread only visits entries which actually expired.
+    The total number of sorted-set members (which grow with the number of requests) is bounded by
+    `max_sorted_set_entries` - the oldest members are evicted first. This is a limit of the number of
+    members, not of memory - the size of each member is not measured. All operations are guarded by a lock
+    and report their number of calls and total duration via `get_stats()`.
+
     Attributes:
-        cache (dict): A dictionary to store the cache values.
+        cache (dict): A dictionary to store the cache values and sorted sets.
         expires (dict): A dictionary to store the expiration times of the cache values.
-        zexpires (dict): A dictionary to store the expiration times of the sorted set values.
         _expire_thread (threading.Thread): A thread that runs the _expire method.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, max_sorted_set_entries: int = MEMORY_CACHE_MAX_SORTED_SET_ENTRIES
+    ) -> None:
         """
         Initializes a new instance of the MemoryCache class.
+
+        Args:
+            max_sorted_set_entries (int): Max number of members kept in all of the sorted sets.
         """
         self.cache = dict()
         self.expires = dict()
-        self.zexpires = dict()
+        self.max_sorted_set_entries = max_sorted_set_entries
+        self._expiry_heap: List[Tuple[float, int, str, int, float]] = []
+        self._members_order: deque = deque()
+        self._sorted_set_entries = 0
+        self._sequence = itertools.count()
+        self._lock = threading.RLock()
+        self._stats = defaultdict(lambda: [0, 0.0])
+        self._expired_entries = 0
+        self._evicted_entries = 0
 
         self._expire_thread = threading.Thread(target=self._expire)
         self._expire_thread.daemon = True
@@ -32,26 +132,14 @@ class MemoryCache(BaseCache):
 
     def _expire(self):
         """
-        Removes the expired keys from the cache and zexpires dictionaries.
+        Removes the expired keys and sorted set members from the cache.
 
         This method runs in an infinite loop and sleeps for MEMORY_CACHE_EXPIRE_INTERVAL seconds between each iteration.
         """
         while True:
             now = time.time()
-            keys_to_delete = []
-            for k, v in self.expires.copy().items():
-                if v < now:
-                    keys_to_delete.append(k)
-            for k in keys_to_delete:
-                del self.cache[k]
-                del self.expires[k]
-            keys_to_delete = []
-            for k, v in self.zexpires.copy().items():
-                if v < now:
-                    keys_to_delete.append(k)
-            for k in keys_to_delete:
-                del self.cache[k[0]][k[1]]
-                del self.zexpires[k]
+            with self._lock:
+                self._remove_expired(now=now)
             while time.time() - now < MEMORY_CACHE_EXPIRE_INTERVAL:
                 time.sleep(0.1)
 
@@ -65,12 +153,15 @@ class MemoryCache(BaseCache):
         Returns:
             str: The value associated with the key, or None if the key does not exist or is expired.
         """
-        if key in self.expires:
-            if self.expires[key] < time.time():
-                del self.cache[key]
-                del self.expires[key]
-                return None
-        return self.cache.get(key)
+        start = time.perf_counter()
+        with self._lock:
+            if key in self.expires and self.expires[key] < time.time():
+                self._delete_key(key=key)
+                result = None
+            else:
+                result = self.cache.get(key)
+            self._record_operation(operation="get", start=start)
+        return result
 
     def set(self, key: str, value: str, expire: float = None):
         """
@@ -81,9 +172,19 @@ class MemoryCache(BaseCache):
             value (str): The value to store.
             expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
         """
-        self.cache[key] = value
-        if expire:
-            self.expires[key] = expire + time.time()
+        start = time.perf_counter()
+        with self._lock:
+            self._discard_sorted_set(key=key)
+            self.cache[key] = value
+            if expire:
+                expires_at = expire + time.time()
+                self.expires[key] = expires_at
+                heapq.heappush(
+                    self._expiry_heap, (expires_at, KEY_EXPIRY, key, -1, 0.0)
+                )
+            else:
+                self.expires.pop(key, None)
+            self._record_operation(operation="set", start=start)
 
     def zadd(self, key: str, value: Any, score: float, expire: float = None):
         """
@@ -95,11 +196,25 @@ class MemoryCache(BaseCache):
             score (float): The score associated with the value.
             expire (float, optional): The time, in seconds, after which the key will expire. Defaults to None.
         """
-        if not key in self.cache:
-            self.cache[key] = dict()
-        self.cache[key][score] = value
-        if expire:
-            self.zexpires[(key, score)] = expire + time.time()
+        start = time.perf_counter()
+        with self._lock:
+            sorted_set = self.cache.get(key)
+            if not isinstance(sorted_set, SortedSet):
+                self.expires.pop(key, None)
+                sorted_set = SortedSet()
+                self.cache[key] = sorted_set
+            sequence_number = next(self._sequence)
+            size_before = len(sorted_set)
+            sorted_set.add(value=value, score=score, sequence_number=sequence_number)
+            self._sorted_set_entries += len(sorted_set) - size_before
+            self._members_order.append((key, score, sequence_number))
+            if expire:
+                heapq.heappush(
+                    self._expiry_heap,
+                    (expire + time.time(), MEMBER_EXPIRY, key, sequence_number, score),
+                )
+            self._enforce_entries_limit()
+            self._record_operation(operation="zadd", start=start)
 
     def zrangebyscore(
         self,
@@ -120,13 +235,17 @@ class MemoryCache(BaseCache):
         Returns:
             list: A list of values (or value-score pairs if withscores is True) in the specified score range.
         """
-        if not key in self.cache:
-            return []
-        keys = sorted([k for k in self.cache[key].keys() if min <= k <= max])
+        start = time.perf_counter()
+        with self._lock:
+            sorted_set = self.cache.get(key)
+            if not isinstance(sorted_set, SortedSet):
+                entries = []
+            else:
+                entries = sorted_set.range_by_score(min=min, max=max)
+            self._record_operation(operation="zrangebyscore", start=start)
         if withscores:
-            return [(self.cache[key][k], k) for k in keys]
-        else:
-            return [self.cache[key][k] for k in keys]
+            return [(value, score) for value, score, _ in entries]
+        return [value for value, _, _ in entries]
 
     def zremrangebyscore(
         self,
@@ -145,17 +264,25 @@ class MemoryCache(BaseCache):
         Returns:
             int: The number of members removed from the sorted set.
         """
-        res = self.zrangebyscore(key, min=min, max=max, withscores=True)
-        keys_to_delete = [k[1] for k in res]
-        for k in keys_to_delete:
-            del self.cache[key][k]
-        return len(keys_to_delete)
+        start = time.perf_counter()
+        with self._lock:
+            sorted_set = self.cache.get(key)
+            if not isinstance(sorted_set, SortedSet):
+                removed = []
+            else:
+                removed = sorted_set.remove_range_by_score(min=min, max=max)
+                self._sorted_set_entries -= len(removed)
+            self._record_operation(operation="zremrangebyscore", start=start)
+        return len(removed)
 
     def acquire_lock(self, key: str, expire=None) -> Any:
         lock: Optional[Lock] = self.get(key)
         if lock is None:
-            lock = Lock()
-            self.set(key, lock, expire=expire)
+            with self._lock:
+                lock = self.get(key)
+                if lock is None:
+                    lock = Lock()
+                    self.set(key, lock, expire=expire)
         if expire is None:
             expire = -1
         acquired = lock.acquire(timeout=expire)
@@ -170,3 +297,89 @@ class MemoryCache(BaseCache):
 
     def get_numpy(self, key: str):
         return self.get(key)
+
+    def get_stats(self) -> dict:
+        """
+        Returns the statistics of the cache.
+
+        Returns:
+            dict: Number of calls and total / average duration (in seconds) of each operation, number of stored
+                sorted set members and number of expired and evicted entries.
+        """
+        with self._lock:
+            operations = {
+                operation: {
+                    "calls": calls,
+                    "total_time": total_time,
+                    "avg_time": total_time / calls if calls else 0.0,
+                }
+                for operation, (calls, total_time) in self._stats.items()
+            }
+            return {
+                "operations": operations,
+                "keys": len(self.cache),
+                "sorted_set_entries": self._sorted_set_entries,
+                "expired_entries": self._expired_entries,
+                "evicted_entries": self._evicted_entries,
+            }
+
+    def _remove_expired(self, now: float) -> None:
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            expires_at, kind, key, sequence_number, score = heapq.heappop(
+                self._expiry_heap
+            )
+            if kind == KEY_EXPIRY:
+                if self.expires.get(key) == expires_at:
+                    self._delete_key(key=key)
+                    self._expired_entries += 1
+                continue
+            sorted_set = self.cache.get(key)
+            if isinstance(sorted_set, SortedSet) and sorted_set.remove(
+                score=score, sequence_number=sequence_number
+            ):
+                self._sorted_set_entries -= 1
+                self._expired_entries += 1
+
+    def _enforce_entries_limit(self) -> None:
+        while (
+            self._sorted_set_entries > self.max_sorted_set_entries
+            and self._members_order
+        ):
+            key, score, sequence_number = self._members_order.popleft()
+            sorted_set = self.cache.get(key)
+            if isinstance(sorted_set, SortedSet) and sorted_set.remove(
+                score=score, sequence_number=sequence_number
+            ):
+                self._sorted_set_entries -= 1
+                self._evicted_entries += 1
+        if len(self._members_order) > 2 * max(self._sorted_set_entries, 1024):
+            # members removed by expiry / range removal leave stale entries behind
+            self._members_order = deque(
+                entry
+                for entry in self._members_order
+                if isinstance(self.cache.get(entry[0]), SortedSet)
+                and entry[2] in self.cache[entry[0]]
+            )
+
+    def _delete_key(self, key: str) -> None:
+        self._discard_sorted_set(key=key)
+        self.cache.pop(key, None)
+        self.expires.pop(key, None)
+
+    def _discard_sorted_set(self, key: str) -> None:
+        sorted_set = self.cache.get(key)
+        if isinstance(sorted_set, SortedSet):
+            self._sorted_set_entries -= len(sorted_set)
+
+    def _record_operation(self, operation: str, start: float) -> None:
+        operation_stats = self._stats[operation]
+        operation_stats[0] += 1
+        operation_stats[1] += time.perf_counter() - start
+
+
+def _as_member(value: Any) -> Optional[Hashable]:
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return value
@@ -1,6 +1,8 @@
 from typing import List, Union
 
+import supervision as sv
 from fastapi.encoders import jsonable_encoder
+from supervision.config import CLASS_NAME_DATA_FIELD
 
 from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.entities.requests.inference import InferenceRequest
@@ -49,6 +51,42 @@ def to_cachable_inference_item(
     }
 
 
+def to_cachable_sv_detections_item(
+    infer_request: InferenceRequest,
+    detections: List[sv.Detections],
+    inference_time: float,
+) -> dict:
+    """Counterpart of `to_cachable_inference_item(...)` for inference results in form of `sv.Detections`
+    - response is always stored in condensed format."""
+    if not TINY_CACHE:
+        request = infer_request
+    else:
+        request = infer_request.dict(
+            include={
+                "api_key",
+                "confidence",
+                "model_id",
+                "model_type",
+                "source",
+                "source_info",
+            }
+        )
+    return {
+        "inference_id": infer_request.id,
+        "inference_server_version": __version__,
+        "inference_server_id": GLOBAL_INFERENCE_SERVER_ID,
+        "request": jsonable_encoder(request),
+        "response": [
+            {
+                "predictions": from_sv_detections(image_detections),
+                "time": inference_time,
+            }
+            for image_detections in detections
+            if len(image_detections) > 0
+        ],
+    }
+
+
 def build_condensed_response(responses):
     if not isinstance(responses, list):
         responses = [responses]
@@ -125,3 +163,13 @@ def from_keypoints_detection_response(response: KeypointsDetectionInferenceRespo
                 {"class": keypoint.class_name, "confidence": keypoint.confidence}
             )
     return predictions
+
+
+def from_sv_detections(detections: sv.Detections) -> List[dict]:
+    return [
+        {"class": class_name, "confidence": confidence}
+        for class_name, confidence in zip(
+            detections.data[CLASS_NAME_DATA_FIELD].tolist(),
+            detections.confidence.tolist(),
+        )
+    ]
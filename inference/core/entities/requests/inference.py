@@ -44,18 +44,18 @@ class InferenceRequestImage(BaseModel):
     """Image data for inference request.
 
     Attributes:
-        type (str): The type of image data provided, one of 'url', 'base64', or 'numpy'.
+        type (str): The type of image data provided, one of 'url', 'base64', 'bytes' or 'numpy'.
         value (Optional[Any]): Image data corresponding to the image type.
     """
 
     type: str = Field(
         examples=["url"],
-        description="The type of image data provided, one of 'url', 'base64', or 'numpy'",
+        description="The type of image data provided, one of 'url', 'base64', 'bytes' or 'numpy'",
     )
     value: Optional[Any] = Field(
         None,
         examples=["http://www.example-image-url.com"],
-        description="Image data corresponding to the image type, if type = 'url' then value is a string containing the url of an image, else if type = 'base64' then value is a string containing base64 encoded image data, else if type = 'numpy' then value is binary numpy data serialized using pickle.dumps(); array should 3 dimensions, channels last, with values in the range [0,255].",
+        description="Image data corresponding to the image type, if type = 'url' then value is a string containing the url of an image, else if type = 'base64' then value is a string containing base64 encoded image data, else if type = 'bytes' then value is encoded image (for instance JPEG) bytes - only for requests encoded with msgpack (Content-Type: application/msgpack), else if type = 'numpy' then value is binary numpy data serialized using pickle.dumps(); array should 3 dimensions, channels last, with values in the range [0,255].",
     )
 
 
@@ -178,14 +178,15 @@ class InstanceSegmentationInferenceRequest(ObjectDetectionInferenceRequest):
     """Instance Segmentation inference request.
 
     Attributes:
-        mask_decode_mode (Optional[str]): The mode used to decode instance segmentation masks, one of 'accurate', 'fast', 'tradeoff'.
+        mask_decode_mode (Optional[str]): The mode used to decode instance segmentation masks, one of 'accurate', 'fast', 'tradeoff', 'roi'.
         tradeoff_factor (Optional[float]): The amount to tradeoff between 0='fast' and 1='accurate'.
     """
 
     mask_decode_mode: Optional[str] = Field(
         default="accurate",
         examples=["accurate"],
-        description="The mode used to decode instance segmentation masks, one of 'accurate', 'fast', 'tradeoff'",
+        description="The mode used to decode instance segmentation masks, one of 'accurate', 'fast', 'tradeoff', 'roi' "
+        "('accurate' results with masks computed only within bounding boxes - recommended for many instances)",
     )
     tradeoff_factor: Optional[float] = Field(
         default=0.0,
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -28,6 +28,12 @@ class WorkflowInferenceRequest(BaseModel):
     workflow_id: Optional[str] = Field(
         default=None, description="Optional identifier of workflow"
     )
+    detections_format: Literal["objects", "columnar"] = Field(
+        default="objects",
+        description="Format of detections in the response. `objects` gives list of dictionaries (one per "
+        "detection), `columnar` gives dictionary of lists (one element per detection) - which is faster "
+        "to produce and smaller for large number of detections.",
+    )
 
 
 class PredefinedWorkflowInferenceRequest(WorkflowInferenceRequest):
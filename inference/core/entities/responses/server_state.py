@@ -40,6 +40,22 @@ class ModelDescriptionEntity(BaseModel):
         None,
         description="Image input width accepted by the model (if registered).",
     )
+    memory_footprint_bytes: Optional[int] = Field(
+        None,
+        description="Estimated memory held by the model (if tracked by model manager).",
+    )
+    load_time: Optional[float] = Field(
+        None,
+        description="Time (in seconds) it took to load the model (if tracked by model manager).",
+    )
+    hits: Optional[int] = Field(
+        None,
+        description="Number of times the model was used since it was loaded (if tracked by model manager).",
+    )
+    pinned: Optional[bool] = Field(
+        None,
+        description="Flag telling if the model is pinned and will never be unloaded (if tracked by model manager).",
+    )
 
     @classmethod
     def from_model_description(
@@ -51,6 +67,10 @@ class ModelDescriptionEntity(BaseModel):
             batch_size=model_description.batch_size,
             input_height=model_description.input_height,
             input_width=model_description.input_width,
+            memory_footprint_bytes=model_description.memory_footprint_bytes,
+            load_time=model_description.load_time,
+            hits=model_description.hits,
+            pinned=model_description.pinned,
         )
 
 
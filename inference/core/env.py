@@ -98,6 +98,12 @@ OWLV2_CPU_IMAGE_CACHE_SIZE = int(os.getenv("OWLV2_CPU_IMAGE_CACHE_SIZE", 1000))
 # OWLv2 compile model, default is True
 OWLV2_COMPILE_MODEL = str2bool(os.getenv("OWLV2_COMPILE_MODEL", True))
 
+# OWLv2 persistent store of image and class embeddings ("none", "file" or "redis"), default is "none"
+OWLV2_EMBEDDINGS_STORE = os.getenv("OWLV2_EMBEDDINGS_STORE", "none").lower()
+
+# Expiry time (in seconds) of OWLv2 embeddings kept in "redis" store, default is 604800 (7 days)
+OWLV2_EMBEDDINGS_STORE_EXPIRE = int(os.getenv("OWLV2_EMBEDDINGS_STORE_EXPIRE", 604800))
+
 # Maximum batch size for GAZE, default is 8
 GAZE_MAX_BATCH_SIZE = int(os.getenv("GAZE_MAX_BATCH_SIZE", 8))
 
@@ -107,6 +113,16 @@ TINY_CACHE = str2bool(os.getenv("TINY_CACHE", True))
 # Maximum batch size for CLIP, default is 8
 CLIP_MAX_BATCH_SIZE = int(os.getenv("CLIP_MAX_BATCH_SIZE", 8))
 
+# Size (in MB) of CLIP text embeddings cache, 0 disables the cache, default is 16
+CLIP_TEXT_EMBEDDINGS_CACHE_SIZE_MB = float(
+    os.getenv("CLIP_TEXT_EMBEDDINGS_CACHE_SIZE_MB", 16)
+)
+
+# Flag to persist CLIP text embeddings cache in model cache directory, default is False
+CLIP_TEXT_EMBEDDINGS_CACHE_PERSISTENCE = str2bool(
+    os.getenv("CLIP_TEXT_EMBEDDINGS_CACHE_PERSISTENCE", False)
+)
+
 # Class agnostic NMS flag, default is False
 CLASS_AGNOSTIC_NMS_ENV = "CLASS_AGNOSTIC_NMS"
 DEFAULT_CLASS_AGNOSTIC_NMS = False
@@ -160,9 +176,29 @@ USE_PYTORCH_FOR_PREPROCESSING = str2bool(
     os.getenv("USE_PYTORCH_FOR_PREPROCESSING", False)
 )
 
+# Whether or not ONNX models write preprocessed inputs into reusable buffers, default is True
+MODEL_INPUT_BUFFERS_REUSE_ENABLED = str2bool(
+    os.getenv("MODEL_INPUT_BUFFERS_REUSE_ENABLED", True)
+)
+
 # Flag to disable inference cache, default is False
 DISABLE_INFERENCE_CACHE = str2bool(os.getenv("DISABLE_INFERENCE_CACHE", False))
 
+# Inference telemetry mode - "full" stores whole requests and responses in cache, "lightweight"
+# keeps compact records of all requests in memory and stores full payloads only for sampled
+# requests, default is full
+INFERENCE_TELEMETRY_MODE = os.getenv("INFERENCE_TELEMETRY_MODE", "full").lower()
+
+# Fraction of requests stored with full payload in lightweight telemetry mode, default is 0.01
+INFERENCE_TELEMETRY_SAMPLE_RATE = float(
+    os.getenv("INFERENCE_TELEMETRY_SAMPLE_RATE", "0.01")
+)
+
+# Number of records kept by lightweight telemetry, default is 10000
+INFERENCE_TELEMETRY_BUFFER_SIZE = int(
+    os.getenv("INFERENCE_TELEMETRY_BUFFER_SIZE", "10000")
+)
+
 # Flag to disable auto-orientation preprocessing, default is False
 DISABLE_PREPROC_AUTO_ORIENT = str2bool(os.getenv("DISABLE_PREPROC_AUTO_ORIENT", False))
 
@@ -244,6 +280,20 @@ if MAX_BATCH_SIZE is not None:
 else:
     MAX_BATCH_SIZE = float("inf")
 
+# Flag to enable in-process batching of concurrent requests to the same model, default is False
+DYNAMIC_BATCHING_ENABLED = str2bool(os.getenv("DYNAMIC_BATCHING_ENABLED", False))
+
+# Maximum number of images gathered into one dynamic batch, default is MAX_BATCH_SIZE (or 32 if unbounded)
+DYNAMIC_BATCHING_MAX_BATCH_SIZE = int(
+    os.getenv(
+        "DYNAMIC_BATCHING_MAX_BATCH_SIZE",
+        MAX_BATCH_SIZE if MAX_BATCH_SIZE != float("inf") else 32,
+    )
+)
+
+# Maximum time (in milliseconds) the first request of a batch waits for others, default is 5
+DYNAMIC_BATCHING_MAX_WAIT_MS = float(os.getenv("DYNAMIC_BATCHING_MAX_WAIT_MS", 5))
+
 # Maximum number of candidates, default is 3000
 MAX_CANDIDATES_ENV = "MAX_CANDIDATES"
 DEFAULT_MAX_CANDIDATES = 3000
@@ -257,6 +307,11 @@ MAX_DETECTIONS = int(os.getenv(MAX_DETECTIONS_ENV, DEFAULT_MAX_DETECTIONS))
 # Loop interval for expiration of memory cache, default is 5
 MEMORY_CACHE_EXPIRE_INTERVAL = int(os.getenv("MEMORY_CACHE_EXPIRE_INTERVAL", 5))
 
+# Maximum number of sorted set members (not bytes) kept by the memory cache, default is 200000
+MEMORY_CACHE_MAX_SORTED_SET_ENTRIES = int(
+    os.getenv("MEMORY_CACHE_MAX_SORTED_SET_ENTRIES", "200000")
+)
+
 # Enable models cache auth
 MODELS_CACHE_AUTH_ENABLED = str2bool(os.getenv("MODELS_CACHE_AUTH_ENABLED", False))
 
@@ -330,7 +385,23 @@ ROBOFLOW_SERVICE_SECRET = os.getenv("ROBOFLOW_SERVICE_SECRET", None)
 # Maximum embedding cache size for SAM, default is 10
 SAM_MAX_EMBEDDING_CACHE_SIZE = int(os.getenv("SAM_MAX_EMBEDDING_CACHE_SIZE", 10))
 
+# Maximum size (in MB) of embeddings kept in SAM embedding cache, 0 means no limit, default is 256
+SAM_MAX_EMBEDDING_CACHE_SIZE_MB = float(
+    os.getenv("SAM_MAX_EMBEDDING_CACHE_SIZE_MB", 256)
+)
+
+# Size (in MB) of disk store for embeddings evicted from SAM embedding cache, 0 disables spilling, default is 0
+SAM_EMBEDDING_CACHE_SPILL_SIZE_MB = float(
+    os.getenv("SAM_EMBEDDING_CACHE_SPILL_SIZE_MB", 0)
+)
+
 SAM2_MAX_EMBEDDING_CACHE_SIZE = int(os.getenv("SAM2_MAX_EMBEDDING_CACHE_SIZE", 100))
+SAM2_MAX_EMBEDDING_CACHE_SIZE_MB = float(
+    os.getenv("SAM2_MAX_EMBEDDING_CACHE_SIZE_MB", 2048)
+)
+SAM2_EMBEDDING_CACHE_SPILL_SIZE_MB = float(
+    os.getenv("SAM2_EMBEDDING_CACHE_SPILL_SIZE_MB", 0)
+)
 SAM2_MAX_LOGITS_CACHE_SIZE = int(os.getenv("SAM2_MAX_LOGITS_CACHE_SIZE", 1000))
 DISABLE_SAM2_LOGITS_CACHE = str2bool(os.getenv("DISABLE_SAM2_LOGITS_CACHE", False))
 
@@ -395,6 +466,13 @@ PREDICTIONS_QUEUE_SIZE = int(
     os.getenv("INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE", 512)
 )
 RESTART_ATTEMPT_DELAY = int(os.getenv("INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY", 1))
+# Whether or not InferencePipeline runs preprocessing, model forward pass and postprocessing
+# of consecutive batches in separate (overlapping) stages, default is False
+PIPELINED_INFERENCE_ENABLED = str2bool(
+    os.getenv("INFERENCE_PIPELINE_PIPELINED_INFERENCE_ENABLED", False)
+)
+# Size of queues between pipelined inference stages, default is 2
+INFERENCE_STAGES_QUEUE_SIZE = int(os.getenv("INFERENCE_PIPELINE_STAGES_QUEUE_SIZE", 2))
 DEFAULT_BUFFER_SIZE = int(os.getenv("VIDEO_SOURCE_BUFFER_SIZE", "64"))
 DEFAULT_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE = float(
     os.getenv("VIDEO_SOURCE_ADAPTIVE_MODE_STREAM_PACE_TOLERANCE", "0.1")
@@ -481,6 +559,26 @@ WORKFLOWS_PROFILER_BUFFER_SIZE = int(os.getenv("WORKFLOWS_PROFILER_BUFFER_SIZE",
 WORKFLOWS_DEFINITION_CACHE_EXPIRY = int(
     os.getenv("WORKFLOWS_DEFINITION_CACHE_EXPIRY", 15 * 60)
 )
+# Number of idle, initialised Execution Engines kept by HTTP workflow endpoints for re-use,
+# 0 disables pooling, default is 0
+WORKFLOWS_EXECUTION_ENGINES_POOL_SIZE = int(
+    os.getenv("WORKFLOWS_EXECUTION_ENGINES_POOL_SIZE", "0")
+)
+# Flag to let models re-use pre-processed inputs (resized / letterboxed images) computed for the same
+# workflow image by other model steps with identical pre-processing, default is True
+ENABLE_WORKFLOWS_IMAGE_REPRESENTATIONS_CACHE = str2bool(
+    os.getenv("ENABLE_WORKFLOWS_IMAGE_REPRESENTATIONS_CACHE", "True")
+)
+# Number of frames after which analytics blocks (time in zone, velocity, path deviation) drop state
+# of tracked objects that are no longer detected, 0 disables expiry, default is 300
+WORKFLOWS_TRACKED_OBJECTS_STATE_EXPIRY_FRAMES = int(
+    os.getenv("WORKFLOWS_TRACKED_OBJECTS_STATE_EXPIRY_FRAMES", "300")
+)
+# Maximum number of points of object path kept by path deviation block, longer paths are
+# downsampled by dropping every second point, default is 1024
+WORKFLOWS_PATH_DEVIATION_MAX_PATH_LENGTH = int(
+    os.getenv("WORKFLOWS_PATH_DEVIATION_MAX_PATH_LENGTH", "1024")
+)
 USE_FILE_CACHE_FOR_WORKFLOWS_DEFINITIONS = str2bool(
     os.getenv("USE_FILE_CACHE_FOR_WORKFLOWS_DEFINITIONS", "True")
 )
@@ -505,6 +603,18 @@ PRELOAD_MODELS = (
     os.getenv("PRELOAD_MODELS").split(",") if os.getenv("PRELOAD_MODELS") else None
 )
 
+# Number of threads loading models in background, default is 4
+MODEL_LOADING_MAX_WORKERS = int(os.getenv("MODEL_LOADING_MAX_WORKERS", "4"))
+
+# Flag to reply 503 with Retry-After header to requests for models still loading
+# in background (instead of waiting for the model), default is False
+MODEL_BACKGROUND_LOADING_ENABLED = str2bool(
+    os.getenv("MODEL_BACKGROUND_LOADING_ENABLED", "False")
+)
+
+# Value of Retry-After header (in seconds) sent while the model is loading, default is 5
+MODEL_LOADING_RETRY_AFTER = int(os.getenv("MODEL_LOADING_RETRY_AFTER", "5"))
+
 LOAD_ENTERPRISE_BLOCKS = str2bool(os.getenv("LOAD_ENTERPRISE_BLOCKS", "False"))
 TRANSIENT_ROBOFLOW_API_ERRORS = set(
     int(e)
@@ -536,6 +646,18 @@ MEMORY_FREE_THRESHOLD = float(
     os.getenv("MEMORY_FREE_THRESHOLD", "0.0")
 )  # percentage of free memory, 0 disables memory pressure detection
 
+# Memory budget (in MB) for models kept loaded by the model manager, default is None (only MAX_ACTIVE_MODELS applies)
+MODELS_CACHE_MEMORY_BUDGET_MB = os.getenv("MODELS_CACHE_MEMORY_BUDGET_MB")
+if MODELS_CACHE_MEMORY_BUDGET_MB is not None:
+    MODELS_CACHE_MEMORY_BUDGET_MB = float(MODELS_CACHE_MEMORY_BUDGET_MB)
+
+# Policy used to select models to unload, either "lru" or "cost_aware", default is "lru"
+MODELS_CACHE_EVICTION_POLICY = os.getenv("MODELS_CACHE_EVICTION_POLICY", "lru")
+
+# Comma-separated list of model ids that are never unloaded by the model manager
+PINNED_MODELS = safe_split_value(os.getenv("PINNED_MODELS", "")) or []
+PINNED_MODELS = [model_id.strip() for model_id in PINNED_MODELS if model_id.strip()]
+
 # Stream manager configuration
 try:
     STREAM_MANAGER_MAX_RAM_MB: Optional[float] = abs(
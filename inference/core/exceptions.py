@@ -199,6 +199,17 @@ class CannotInitialiseModelError(Exception):
     pass
 
 
+class ModelLoadingInProgressError(Exception):
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self._retry_after = retry_after
+
+    @property
+    def retry_after(self) -> int:
+        return self._retry_after
+
+
 class RetryRequestError(Exception):
 
     def __init__(self, message: str, inner_error: Exception):
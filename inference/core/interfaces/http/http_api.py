@@ -127,6 +127,7 @@ from inference.core.env import (
     PRELOAD_MODELS,
     PROFILE,
     ROBOFLOW_SERVICE_SECRET,
+    WORKFLOWS_EXECUTION_ENGINES_POOL_SIZE,
     WORKFLOWS_MAX_CONCURRENT_STEPS,
     WORKFLOWS_PROFILER_BUFFER_SIZE,
     WORKFLOWS_STEP_EXECUTION_MODE,
@@ -144,6 +145,7 @@ from inference.core.exceptions import (
     MissingApiKeyError,
     MissingServiceSecretError,
     ModelArtefactError,
+    ModelLoadingInProgressError,
     OnnxProviderNotAvailable,
     PostProcessingError,
     PreProcessingError,
@@ -163,6 +165,7 @@ from inference.core.interfaces.http.handlers.workflows import (
 )
 from inference.core.interfaces.http.middlewares.cors import PathAwareCORSMiddleware
 from inference.core.interfaces.http.middlewares.gzip import gzip_response_if_requested
+from inference.core.interfaces.http.msgpack_utils import MsgPackRoute
 from inference.core.interfaces.http.orjson_utils import orjson_response
 from inference.core.interfaces.stream_manager.api.entities import (
     CommandResponse,
@@ -204,6 +207,9 @@ from inference.core.workflows.core_steps.common.query_language.errors import (
     InvalidInputTypeError,
     OperationTypeNotRecognisedError,
 )
+from inference.core.workflows.core_steps.loader import (
+    COLUMNAR_DETECTIONS_KINDS_SERIALIZERS,
+)
 from inference.core.workflows.errors import (
     DynamicBlockError,
     ExecutionGraphStructureError,
@@ -227,6 +233,7 @@ from inference.core.workflows.execution_engine.entities.base import OutputDefini
 from inference.core.workflows.execution_engine.introspection.blocks_loader import (
     load_workflow_blocks,
 )
+from inference.core.workflows.execution_engine.pool import ExecutionEnginePool
 from inference.core.workflows.execution_engine.profiling.core import (
     BaseWorkflowsProfiler,
     NullWorkflowsProfiler,
@@ -303,7 +310,7 @@ def with_route_exceptions(route):
                 status_code=400,
                 content={
                     "message": "Invalid mask decode argument sent. tradeoff_factor must be in [0.0, 1.0], "
-                    "mask_decode_mode: must be one of ['accurate', 'fast', 'tradeoff']"
+                    "mask_decode_mode: must be one of ['accurate', 'fast', 'tradeoff', 'roi']"
                 },
             )
             traceback.print_exc()
@@ -453,6 +460,13 @@ def with_route_exceptions(route):
                 content={"message": "Internal error. Request to Roboflow API failed."},
             )
             traceback.print_exc()
+        except ModelLoadingInProgressError as error:
+            logger.debug("%s: %s", type(error).__name__, error)
+            resp = JSONResponse(
+                status_code=503,
+                content={"message": "Model is loading. Retry the request later."},
+                headers={"Retry-After": str(error.retry_after)},
+            )
         except RoboflowAPIConnectionError as error:
             logger.error("%s: %s", type(error).__name__, error)
             resp = JSONResponse(
@@ -580,6 +594,8 @@ class HttpInterface(BaseInterface):
             },
             root_path=root_path,
         )
+        # routes accept msgpack-encoded requests and respond with msgpack if requested
+        app.router.route_class = MsgPackRoute
 
         app.mount(
             "/static",
@@ -742,6 +758,11 @@ class HttpInterface(BaseInterface):
 
         self.app = app
         self.model_manager = model_manager
+        execution_engines_pool = (
+            ExecutionEnginePool(max_size=WORKFLOWS_EXECUTION_ENGINES_POOL_SIZE)
+            if WORKFLOWS_EXECUTION_ENGINES_POOL_SIZE > 0
+            else None
+        )
         self.stream_manager_client: Optional[StreamManagerClient] = None
 
         if ENABLE_STREAM_API:
@@ -768,7 +789,9 @@ class HttpInterface(BaseInterface):
             de_aliased_model_id = resolve_roboflow_model_alias(
                 model_id=inference_request.model_id
             )
-            self.model_manager.add_model(de_aliased_model_id, inference_request.api_key)
+            await self.model_manager.add_model_async(
+                de_aliased_model_id, inference_request.api_key
+            )
             resp = await self.model_manager.infer_from_request(
                 de_aliased_model_id, inference_request, **kwargs
             )
@@ -780,27 +803,56 @@ class HttpInterface(BaseInterface):
             background_tasks: Optional[BackgroundTasks],
             profiler: WorkflowsProfiler,
         ) -> WorkflowInferenceResponse:
-            workflow_init_parameters = {
-                "workflows_core.model_manager": model_manager,
-                "workflows_core.api_key": workflow_request.api_key,
-                "workflows_core.background_tasks": background_tasks,
-            }
-            execution_engine = ExecutionEngine.init(
-                workflow_definition=workflow_specification,
-                init_parameters=workflow_init_parameters,
-                max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
-                prevent_local_images_loading=True,
-                profiler=profiler,
-                workflow_id=workflow_request.workflow_id,
-            )
             is_preview = False
             if hasattr(workflow_request, "is_preview"):
                 is_preview = workflow_request.is_preview
-            workflow_results = execution_engine.run(
-                runtime_parameters=workflow_request.inputs,
-                serialize_results=True,
-                _is_preview=is_preview,
-            )
+            kinds_serializers_overrides = None
+            if workflow_request.detections_format == "columnar":
+                kinds_serializers_overrides = COLUMNAR_DETECTIONS_KINDS_SERIALIZERS
+            if execution_engines_pool is not None and isinstance(
+                profiler, NullWorkflowsProfiler
+            ):
+                # profiler is bound to the engine at init, so profiled runs are never pooled
+                with execution_engines_pool.lease(
+                    workflow_definition=workflow_specification,
+                    init_parameters={
+                        "workflows_core.model_manager": model_manager,
+                        "workflows_core.api_key": workflow_request.api_key,
+                    },
+                    api_key=workflow_request.api_key,
+                    workflow_id=workflow_request.workflow_id,
+                    max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
+                    prevent_local_images_loading=True,
+                    request_scoped_parameters={
+                        "workflows_core.background_tasks": background_tasks,
+                    },
+                ) as execution_engine:
+                    workflow_results = execution_engine.run(
+                        runtime_parameters=workflow_request.inputs,
+                        serialize_results=True,
+                        _is_preview=is_preview,
+                        kinds_serializers_overrides=kinds_serializers_overrides,
+                    )
+            else:
+                workflow_init_parameters = {
+                    "workflows_core.model_manager": model_manager,
+                    "workflows_core.api_key": workflow_request.api_key,
+                    "workflows_core.background_tasks": background_tasks,
+                }
+                execution_engine = ExecutionEngine.init(
+                    workflow_definition=workflow_specification,
+                    init_parameters=workflow_init_parameters,
+                    max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
+                    prevent_local_images_loading=True,
+                    profiler=profiler,
+                    workflow_id=workflow_request.workflow_id,
+                )
+                workflow_results = execution_engine.run(
+                    runtime_parameters=workflow_request.inputs,
+                    serialize_results=True,
+                    _is_preview=is_preview,
+                    kinds_serializers_overrides=kinds_serializers_overrides,
+                )
             with profiler.profile_execution_phase(
                 name="workflow_results_filtering",
                 categories=["inference_package_operation"],
@@ -991,7 +1043,9 @@ class HttpInterface(BaseInterface):
                     model_id=request.model_id
                 )
                 logger.info(f"Loading model: {de_aliased_model_id}")
-                self.model_manager.add_model(de_aliased_model_id, request.api_key)
+                await self.model_manager.add_model_async(
+                    de_aliased_model_id, request.api_key
+                )
                 models_descriptions = self.model_manager.describe_models()
                 return ModelsDescriptions.from_models_descriptions(
                     models_descriptions=models_descriptions
@@ -1568,24 +1622,24 @@ class HttpInterface(BaseInterface):
 
             async def initialize_models(state: ModelInitState):
                 """Perform asynchronous initialization tasks to load models."""
-                # Limit the number of concurrent tasks to prevent resource exhaustion
-                semaphore = asyncio.Semaphore(2)  # Adjust the limit as needed
 
                 async def load_model(model_id):
                     try:
-                        async with semaphore:
-                            # Add a timeout to prevent indefinite hanging
-                            await asyncio.wait_for(
-                                model_add(
-                                    AddModelRequest(
-                                        model_id=model_id,
-                                        model_type=None,
-                                        api_key=API_KEY,
-                                    )
-                                ),
-                                timeout=300,  # Timeout after 5 minutes
-                            )
-                            logger.info(f"Model {model_id} loaded successfully.")
+                        # Models are loaded in parallel by model manager (number of concurrent
+                        # loads is limited by MODEL_LOADING_MAX_WORKERS)
+                        de_aliased_model_id = resolve_roboflow_model_alias(
+                            model_id=model_id
+                        )
+                        # Add a timeout to prevent indefinite hanging
+                        await asyncio.wait_for(
+                            asyncio.wrap_future(
+                                self.model_manager.load_model(
+                                    de_aliased_model_id, API_KEY
+                                )
+                            ),
+                            timeout=300,  # Timeout after 5 minutes
+                        )
+                        logger.info(f"Model {model_id} loaded successfully.")
                     except asyncio.TimeoutError:
                         error_msg = f"Timeout while loading model {model_id}"
                         logger.error(error_msg)
@@ -2299,7 +2353,7 @@ class HttpInterface(BaseInterface):
                 ),
                 mask_decode_mode: Optional[str] = Query(
                     "accurate",
-                    description="One of 'accurate' or 'fast'. If 'accurate' the mask will be decoded using the original image size. If 'fast' the mask will be decoded using the original mask size. 'accurate' is slower but more accurate.",
+                    description="One of 'accurate', 'fast', 'tradeoff' or 'roi'. If 'accurate' the mask will be decoded using the original image size. If 'fast' the mask will be decoded using the original mask size. 'accurate' is slower but more accurate. 'roi' gives the same results as 'accurate', decoding each mask only within its bounding box - which is faster and uses less memory.",
                 ),
                 tradeoff_factor: Optional[float] = Query(
                     0.0,
@@ -2440,7 +2494,7 @@ class HttpInterface(BaseInterface):
                 logger.debug(
                     f"State of model registry: {self.model_manager.describe_models()}"
                 )
-                self.model_manager.add_model(
+                await self.model_manager.add_model_async(
                     request_model_id, api_key, model_id_alias=model_id
                 )
 
@@ -2534,7 +2588,7 @@ class HttpInterface(BaseInterface):
                     f"Reached /start/{dataset_id}/{version_id} with {dataset_id}/{version_id}"
                 )
                 model_id = f"{dataset_id}/{version_id}"
-                self.model_manager.add_model(model_id, api_key)
+                await self.model_manager.add_model_async(model_id, api_key)
 
                 return JSONResponse(
                     {
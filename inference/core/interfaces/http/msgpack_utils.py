@@ -0,0 +1,101 @@
+from contextvars import ContextVar
+from typing import Any, Callable, Coroutine
+
+import msgpack
+import numpy as np
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+NUMPY_ARRAY_EXT_TYPE = 1
+
+msgpack_response_requested: ContextVar[bool] = ContextVar(
+    "msgpack_response_requested", default=False
+)
+
+
+def msgpack_dumps(content: Any) -> bytes:
+    return msgpack.packb(content, default=_encode_extension_type)
+
+
+def msgpack_loads(payload: bytes) -> Any:
+    return msgpack.unpackb(payload, ext_hook=_decode_extension_type)
+
+
+def _encode_extension_type(obj: Any) -> Any:
+    if isinstance(obj, np.ndarray):
+        # arrays are sent as raw buffers instead of nested lists of floats
+        array = np.ascontiguousarray(obj)
+        return msgpack.ExtType(
+            NUMPY_ARRAY_EXT_TYPE,
+            msgpack.packb([array.dtype.str, list(array.shape), array.tobytes()]),
+        )
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj)} cannot be serialised with msgpack")
+
+
+def _decode_extension_type(code: int, data: bytes) -> Any:
+    if code != NUMPY_ARRAY_EXT_TYPE:
+        return msgpack.ExtType(code, data)
+    dtype, shape, buffer = msgpack.unpackb(data)
+    return np.frombuffer(buffer, dtype=np.dtype(dtype)).reshape(shape)
+
+
+class MsgPackResponse(Response):
+    media_type = MSGPACK_CONTENT_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack_dumps(content)
+
+
+class MsgPackRequest(Request):
+    """Request with msgpack body, exposed to FastAPI body parsing as if it was JSON - such that
+    request models are validated the same way for both transports, but binary payloads
+    (like encoded images) reach the handlers as bytes."""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = msgpack_loads(await self.body())
+        return self._json
+
+
+class MsgPackRoute(APIRoute):
+    """
+    Route accepting request bodies encoded with msgpack (`Content-Type: application/msgpack`) and
+    responding with msgpack when client sends `Accept: application/msgpack`. Responses are encoded
+    with msgpack by `orjson_response(...)`, based on `msgpack_response_requested` context variable.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            if _is_msgpack_media_type(request.headers.get("content-type")):
+                headers = [
+                    (name, value)
+                    for name, value in request.scope["headers"]
+                    if name != b"content-type"
+                ]
+                headers.append((b"content-type", b"application/json"))
+                request = MsgPackRequest(
+                    {**request.scope, "headers": headers}, request.receive
+                )
+            token = msgpack_response_requested.set(
+                _is_msgpack_media_type(request.headers.get("accept"))
+            )
+            try:
+                return await original_route_handler(request)
+            finally:
+                msgpack_response_requested.reset(token)
+
+        return route_handler
+
+
+def _is_msgpack_media_type(header: Any) -> bool:
+    if not header:
+        return False
+    return any(
+        media_type.split(";")[0].strip().lower() == MSGPACK_CONTENT_TYPE
+        for media_type in header.split(",")
+    )
@@ -2,10 +2,15 @@ import base64
 from typing import Any, Dict, List, Optional, Union
 
 import orjson
+from fastapi import Response
 from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.interfaces.http.msgpack_utils import (
+    MsgPackResponse,
+    msgpack_response_requested,
+)
 from inference.core.utils.function import deprecated
 from inference.core.utils.image_utils import ImageType
 from inference.core.workflows.core_steps.common.serializers import (
@@ -33,11 +38,13 @@ def default(obj: Any) -> JSON:
 
 def orjson_response(
     response: Union[List[InferenceResponse], InferenceResponse, BaseModel],
-) -> ORJSONResponseBytes:
+) -> Response:
     if isinstance(response, list):
         content = [r.model_dump(by_alias=True, exclude_none=True) for r in response]
     else:
         content = response.model_dump(by_alias=True, exclude_none=True)
+    if msgpack_response_requested.get():
+        return MsgPackResponse(content=content)
     return ORJSONResponseBytes(content=content)
 
 
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Union
 
@@ -118,6 +118,7 @@ class PipelineStateReport:
     latency_reports: List[LatencyMonitorReport]
     inference_throughput: float
     sources_metadata: List[SourceMetadata]
+    stages_latency: Dict[str, Optional[float]] = field(default_factory=dict)
 
 
 InferenceHandler = Callable[[List[VideoFrame]], List[AnyPrediction]]
@@ -127,3 +128,14 @@ SinkHandler = Optional[
         Callable[[List[Optional[AnyPrediction]], List[Optional[VideoFrame]]], None],
     ]
 ]
+
+
+@dataclass(frozen=True)
+class InferenceStages:
+    """Inference split into stages which `InferencePipeline` may execute for consecutive
+    batches of frames in parallel - `preprocess(...)` receives video frames, `predict(...)`
+    and `postprocess(...)` - the output of previous stage and the video frames."""
+
+    preprocess: Callable[[List[VideoFrame]], Any]
+    predict: Callable[[Any, List[VideoFrame]], Any]
+    postprocess: Callable[[Any, List[VideoFrame]], List[AnyPrediction]]
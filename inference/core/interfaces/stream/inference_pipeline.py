@@ -4,6 +4,7 @@ from enum import Enum
 from functools import partial
 from queue import Queue
 from threading import Thread
+from time import perf_counter
 from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 from inference.core import logger
@@ -19,7 +20,9 @@ from inference.core.env import (
     DISABLE_PREPROC_AUTO_ORIENT,
     ENABLE_FRAME_DROP_ON_VIDEO_FILE_RATE_LIMITING,
     ENABLE_WORKFLOWS_PROFILING,
+    INFERENCE_STAGES_QUEUE_SIZE,
     MAX_ACTIVE_MODELS,
+    PIPELINED_INFERENCE_ENABLED,
     PREDICTIONS_QUEUE_SIZE,
     WORKFLOWS_PROFILER_BUFFER_SIZE,
 )
@@ -39,10 +42,12 @@ from inference.core.interfaces.camera.video_source import (
 from inference.core.interfaces.stream.entities import (
     AnyPrediction,
     InferenceHandler,
+    InferenceStages,
     ModelConfig,
     SinkHandler,
 )
 from inference.core.interfaces.stream.model_handlers.roboflow_models import (
+    build_default_inference_stages,
     default_process_frame,
 )
 from inference.core.interfaces.stream.sinks import active_learning_sink, multi_sink
@@ -56,6 +61,7 @@ from inference.core.interfaces.stream.watchdog import (
 )
 from inference.core.managers.active_learning import BackgroundTaskActiveLearningManager
 from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+from inference.core.models.roboflow import OnnxRoboflowInferenceModel
 from inference.core.registries.roboflow import RoboflowModelRegistry
 from inference.core.utils.function import experimental
 from inference.core.workflows.core_steps.common.entities import StepExecutionMode
@@ -74,6 +80,9 @@ INFERENCE_THREAD_STARTED_EVENT = "INFERENCE_THREAD_STARTED"
 INFERENCE_THREAD_FINISHED_EVENT = "INFERENCE_THREAD_FINISHED"
 INFERENCE_COMPLETED_EVENT = "INFERENCE_COMPLETED"
 INFERENCE_ERROR_EVENT = "INFERENCE_ERROR"
+PREPROCESSING_STAGE = "preprocessing"
+MODEL_FORWARD_STAGE = "model_forward"
+POSTPROCESSING_STAGE = "postprocessing"
 
 
 class SinkMode(Enum):
@@ -111,6 +120,7 @@ class InferencePipeline:
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
         predictions_queue_size: int = PREDICTIONS_QUEUE_SIZE,
         decoding_buffer_size: int = DEFAULT_BUFFER_SIZE,
+        pipelined_inference: Optional[bool] = None,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from Roboflow models against video stream.
@@ -227,10 +237,17 @@ class InferencePipeline:
                 default value is taken from INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE env variable
             decoding_buffer_size (int): size of video source decoding buffer
                 default value is taken from VIDEO_SOURCE_BUFFER_SIZE env variable
+            pipelined_inference (Optional[bool]): Flag to run preprocessing, model forward pass and postprocessing
+                in separate threads - such that preprocessing of the next batch of frames and postprocessing of
+                the previous one overlap with model forward pass of the current batch. Stages are connected with
+                bounded queues (of size dictated by INFERENCE_PIPELINE_STAGES_QUEUE_SIZE env variable) and latency
+                of each stage is reported to `watchdog`. If not given, env variable
+                `INFERENCE_PIPELINE_PIPELINED_INFERENCE_ENABLED` will be used.
 
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
         * INFERENCE_PIPELINE_RESTART_ATTEMPT_DELAY - delay for restarts on stream connection drop
+        * INFERENCE_PIPELINE_STAGES_QUEUE_SIZE - size of buffers between pipelined inference stages
         * ACTIVE_LEARNING_ENABLED - controls Active Learning middleware if explicit parameter not given
 
         Returns: Instance of InferencePipeline
@@ -254,6 +271,13 @@ class InferencePipeline:
         on_video_frame = partial(
             default_process_frame, model=model, inference_config=inference_config
         )
+        if pipelined_inference is None:
+            pipelined_inference = PIPELINED_INFERENCE_ENABLED
+        inference_stages = None
+        if pipelined_inference and isinstance(model, OnnxRoboflowInferenceModel):
+            inference_stages = build_default_inference_stages(
+                model=model, inference_config=inference_config
+            )
         active_learning_middleware = NullActiveLearningMiddleware()
         if active_learning_enabled is None:
             logger.info(
@@ -305,6 +329,7 @@ class InferencePipeline:
             sink_mode=sink_mode,
             predictions_queue_size=predictions_queue_size,
             decoding_buffer_size=decoding_buffer_size,
+            inference_stages=inference_stages,
         )
 
     @classmethod
@@ -702,6 +727,8 @@ class InferencePipeline:
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
         predictions_queue_size: int = PREDICTIONS_QUEUE_SIZE,
         decoding_buffer_size: int = DEFAULT_BUFFER_SIZE,
+        inference_stages: Optional[InferenceStages] = None,
+        stages_queue_size: int = INFERENCE_STAGES_QUEUE_SIZE,
     ) -> "InferencePipeline":
         """
         This class creates the abstraction for making inferences from given workflow against video stream.
@@ -772,6 +799,13 @@ class InferencePipeline:
                 default value is taken from INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE env variable
             decoding_buffer_size (int): size of video source decoding buffer
                 default value is taken from VIDEO_SOURCE_BUFFER_SIZE env variable
+            inference_stages (Optional[InferenceStages]): Optional split of `on_video_frame` into preprocessing,
+                model forward pass and postprocessing stages. If given, stages are executed in separate threads,
+                connected with bounded queues - such that preprocessing of the next batch of frames and
+                postprocessing of the previous one overlap with model forward pass of the current batch.
+                Latency of each stage is reported to `watchdog`.
+            stages_queue_size (int): Size of buffers between inference stages, applicable when `inference_stages`
+                are given. Default value is taken from INFERENCE_PIPELINE_STAGES_QUEUE_SIZE env variable
 
         Other ENV variables involved in low-level configuration:
         * INFERENCE_PIPELINE_PREDICTIONS_QUEUE_SIZE - size of buffer for predictions that are ready for dispatching
@@ -818,6 +852,8 @@ class InferencePipeline:
             on_pipeline_end=on_pipeline_end,
             batch_collection_timeout=batch_collection_timeout,
             sink_mode=sink_mode,
+            inference_stages=inference_stages,
+            stages_queue_size=stages_queue_size,
         )
 
     def __init__(
@@ -833,6 +869,8 @@ class InferencePipeline:
         max_fps: Optional[float] = None,
         batch_collection_timeout: Optional[float] = None,
         sink_mode: SinkMode = SinkMode.ADAPTIVE,
+        inference_stages: Optional[InferenceStages] = None,
+        stages_queue_size: int = INFERENCE_STAGES_QUEUE_SIZE,
     ):
         self._on_video_frame = on_video_frame
         self._video_sources = video_sources
@@ -850,6 +888,8 @@ class InferencePipeline:
         self._on_pipeline_end = on_pipeline_end
         self._batch_collection_timeout = batch_collection_timeout
         self._sink_mode = sink_mode
+        self._inference_stages = inference_stages
+        self._stages_queue_size = max(stages_queue_size, 1)
 
     def start(self, use_main_thread: bool = True) -> None:
         self._stop = False
@@ -903,26 +943,10 @@ class InferencePipeline:
         )
         logger.info(f"Inference thread started")
         try:
-            for video_frames in self._generate_frames():
-                self._watchdog.on_model_inference_started(
-                    frames=video_frames,
-                )
-                predictions = self._on_video_frame(video_frames)
-                self._watchdog.on_model_prediction_ready(
-                    frames=video_frames,
-                )
-                self._predictions_queue.put((predictions, video_frames))
-                send_inference_pipeline_status_update(
-                    severity=UpdateSeverity.DEBUG,
-                    event_type=INFERENCE_COMPLETED_EVENT,
-                    payload={
-                        "frames_ids": [f.frame_id for f in video_frames],
-                        "frames_timestamps": [f.frame_timestamp for f in video_frames],
-                        "sources_id": [f.source_id for f in video_frames],
-                    },
-                    status_update_handlers=self._status_update_handlers,
-                )
-
+            if self._inference_stages is None:
+                self._execute_sequential_inference()
+            else:
+                self._execute_pipelined_inference()
         except Exception as error:
             payload = {
                 "error_type": error.__class__.__name__,
@@ -945,6 +969,139 @@ class InferencePipeline:
             )
             logger.info(f"Inference thread finished")
 
+    def _execute_sequential_inference(self) -> None:
+        for video_frames in self._generate_frames():
+            self._watchdog.on_model_inference_started(
+                frames=video_frames,
+            )
+            predictions = self._on_video_frame(video_frames)
+            self._on_inference_completed(
+                predictions=predictions, video_frames=video_frames
+            )
+
+    def _execute_pipelined_inference(self) -> None:
+        # preprocessing runs in the inference thread, model forward pass and postprocessing in
+        # dedicated threads - bounded queues between stages provide back-pressure
+        stages_errors: List[Exception] = []
+        preprocessed_queue = Queue(maxsize=self._stages_queue_size)
+        predicted_queue = Queue(maxsize=self._stages_queue_size)
+        stages_threads = [
+            Thread(
+                target=self._run_inference_stage,
+                kwargs={
+                    "stage_name": MODEL_FORWARD_STAGE,
+                    "stage": self._inference_stages.predict,
+                    "input_queue": preprocessed_queue,
+                    "output_queue": predicted_queue,
+                    "errors": stages_errors,
+                },
+            ),
+            Thread(
+                target=self._run_inference_stage,
+                kwargs={
+                    "stage_name": POSTPROCESSING_STAGE,
+                    "stage": self._inference_stages.postprocess,
+                    "input_queue": predicted_queue,
+                    "output_queue": None,
+                    "errors": stages_errors,
+                },
+            ),
+        ]
+        for thread in stages_threads:
+            thread.start()
+        try:
+            for video_frames in self._generate_frames():
+                if stages_errors:
+                    break
+                self._watchdog.on_model_inference_started(
+                    frames=video_frames,
+                )
+                preprocessed = self._execute_inference_stage(
+                    stage_name=PREPROCESSING_STAGE,
+                    stage=self._inference_stages.preprocess,
+                    args=(video_frames,),
+                    video_frames=video_frames,
+                )
+                preprocessed_queue.put((preprocessed, video_frames))
+        finally:
+            preprocessed_queue.put(None)
+            for thread in stages_threads:
+                thread.join()
+        if stages_errors:
+            raise stages_errors[0]
+
+    def _run_inference_stage(
+        self,
+        stage_name: str,
+        stage: Callable[[Any, List[VideoFrame]], Any],
+        input_queue: Queue,
+        output_queue: Optional[Queue],
+        errors: List[Exception],
+    ) -> None:
+        try:
+            while True:
+                stage_input: Optional[Tuple[Any, List[VideoFrame]]] = input_queue.get()
+                if stage_input is None:
+                    break
+                if errors:
+                    # pipeline is about to stop - draining queue to unblock previous stages
+                    continue
+                payload, video_frames = stage_input
+                try:
+                    result = self._execute_inference_stage(
+                        stage_name=stage_name,
+                        stage=stage,
+                        args=(payload, video_frames),
+                        video_frames=video_frames,
+                    )
+                    if output_queue is not None:
+                        output_queue.put((result, video_frames))
+                    else:
+                        self._on_inference_completed(
+                            predictions=result, video_frames=video_frames
+                        )
+                except Exception as error:
+                    errors.append(error)
+        finally:
+            if output_queue is not None:
+                output_queue.put(None)
+
+    def _execute_inference_stage(
+        self,
+        stage_name: str,
+        stage: Callable[..., Any],
+        args: tuple,
+        video_frames: List[VideoFrame],
+    ) -> Any:
+        start = perf_counter()
+        result = stage(*args)
+        self._watchdog.on_inference_stage_completed(
+            stage=stage_name,
+            frames=video_frames,
+            duration=perf_counter() - start,
+        )
+        return result
+
+    def _on_inference_completed(
+        self,
+        predictions: List[AnyPrediction],
+        video_frames: List[VideoFrame],
+    ) -> None:
+        self._watchdog.on_model_prediction_ready(
+            frames=video_frames,
+        )
+        self._predictions_queue.put((predictions, video_frames))
+        send_inference_pipeline_status_update(
+            severity=UpdateSeverity.DEBUG,
+            event_type=INFERENCE_COMPLETED_EVENT,
+            payload={
+                "frames_ids": [f.frame_id for f in video_frames],
+                "frames_timestamps": [f.frame_timestamp for f in video_frames],
+                "sources_id": [f.source_id for f in video_frames],
+            },
+            status_update_handlers=self._status_update_handlers,
+        )
+
     def _dispatch_inference_results(self) -> None:
         while True:
             inference_results: Optional[
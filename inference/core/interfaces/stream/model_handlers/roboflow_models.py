@@ -1,9 +1,13 @@
-from typing import List
+import itertools
+from functools import partial
+from typing import Any, List, Tuple
 
 from inference.core.interfaces.camera.entities import VideoFrame
-from inference.core.interfaces.stream.entities import ModelConfig
+from inference.core.interfaces.stream.entities import InferenceStages, ModelConfig
 from inference.core.interfaces.stream.utils import wrap_in_list
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
+from inference.core.models.types import PreprocessReturnMetadata
+from inference.usage_tracking.collector import usage_collector
 
 
 def default_process_frame(
@@ -13,11 +17,7 @@ def default_process_frame(
 ) -> List[dict]:
     postprocessing_args = inference_config.to_postprocessing_params()
     # TODO: handle batch input in usage
-    fps = video_frame[0].fps
-    if video_frame[0].measured_fps:
-        fps = video_frame[0].measured_fps
-    if not fps:
-        fps = 0
+    fps = get_video_frames_fps(video_frames=video_frame)
     predictions = wrap_in_list(
         model.infer(
             [f.image for f in video_frame],
@@ -33,3 +33,92 @@ def default_process_frame(
         )
         for p in predictions
     ]
+
+
+def build_default_inference_stages(
+    model: OnnxRoboflowInferenceModel,
+    inference_config: ModelConfig,
+) -> InferenceStages:
+    """Splits `default_process_frame(...)` into stages which can be executed in parallel
+    for consecutive batches of frames by `InferencePipeline`."""
+    return InferenceStages(
+        preprocess=partial(
+            default_preprocess_frames, model=model, inference_config=inference_config
+        ),
+        predict=partial(
+            default_predict_frames, model=model, inference_config=inference_config
+        ),
+        postprocess=partial(
+            default_postprocess_frames, model=model, inference_config=inference_config
+        ),
+    )
+
+
+def default_preprocess_frames(
+    video_frames: List[VideoFrame],
+    model: OnnxRoboflowInferenceModel,
+    inference_config: ModelConfig,
+) -> List[Tuple[Any, PreprocessReturnMetadata]]:
+    postprocessing_args = inference_config.to_postprocessing_params()
+    return [
+        model.preprocess(batch, **postprocessing_args)
+        for batch in model.split_into_batches([f.image for f in video_frames])
+    ]
+
+
+def default_predict_frames(
+    preprocessed_batches: List[Tuple[Any, PreprocessReturnMetadata]],
+    video_frames: List[VideoFrame],
+    model: OnnxRoboflowInferenceModel,
+    inference_config: ModelConfig,
+) -> List[Tuple[Any, PreprocessReturnMetadata]]:
+    return predict_batches(
+        preprocessed_batches=preprocessed_batches,
+        model=model,
+        model_id=model.endpoint,
+        usage_fps=get_video_frames_fps(video_frames=video_frames),
+        usage_api_key=model.api_key,
+        **inference_config.to_postprocessing_params(),
+    )
+
+
+def default_postprocess_frames(
+    predicted_batches: List[Tuple[Any, PreprocessReturnMetadata]],
+    video_frames: List[VideoFrame],
+    model: OnnxRoboflowInferenceModel,
+    inference_config: ModelConfig,
+) -> List[dict]:
+    postprocessing_args = inference_config.to_postprocessing_params()
+    predictions = itertools.chain.from_iterable(
+        wrap_in_list(model.postprocess(predicted, metadata, **postprocessing_args))
+        for predicted, metadata in predicted_batches
+    )
+    return [
+        p.dict(
+            by_alias=True,
+            exclude_none=True,
+        )
+        for p in predictions
+    ]
+
+
+@usage_collector("model")
+def predict_batches(
+    preprocessed_batches: List[Tuple[Any, PreprocessReturnMetadata]],
+    model: OnnxRoboflowInferenceModel,
+    model_id: str,
+    **kwargs,
+) -> List[Tuple[Any, PreprocessReturnMetadata]]:
+    return [
+        (model.predict(img_in, **kwargs), metadata)
+        for img_in, metadata in preprocessed_batches
+    ]
+
+
+def get_video_frames_fps(video_frames: List[VideoFrame]) -> float:
+    fps = video_frames[0].fps
+    if video_frames[0].measured_fps:
+        fps = video_frames[0].measured_fps
+    if not fps:
+        fps = 0
+    return fps
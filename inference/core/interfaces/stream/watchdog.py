@@ -3,8 +3,9 @@ This module contains component intended to use in combination with `InferencePip
 observability. Please consider them internal details of implementation.
 """
 
+import threading
 from abc import ABC, abstractmethod
-from collections import deque
+from collections import OrderedDict, deque
 from datetime import datetime
 from typing import Any, Deque, Dict, Iterable, List, Optional, TypeVar
 
@@ -54,6 +55,14 @@ class PipelineWatchDog(ABC):
     ) -> None:
         pass
 
+    def on_inference_stage_completed(
+        self,
+        stage: str,
+        frames: List[VideoFrame],
+        duration: float,
+    ) -> None:
+        pass
+
     @abstractmethod
     def get_report(self) -> Optional[PipelineStateReport]:
         pass
@@ -79,28 +88,35 @@ class NullPipelineWatchdog(PipelineWatchDog):
 class LatencyMonitor:
     def __init__(self, source_id: Optional[int]):
         self._source_id = source_id
-        self._inference_start_event: Optional[ModelActivityEvent] = None
+        # with pipelined inference, consecutive frames enter the model before the previous ones are ready
+        self._inference_start_events: Dict[int, ModelActivityEvent] = OrderedDict()
         self._prediction_ready_event: Optional[ModelActivityEvent] = None
         self._reports: Deque[LatencyMonitorReport] = deque(maxlen=MAX_LATENCY_CONTEXT)
+        self._lock = threading.Lock()
 
     def register_inference_start(
         self, frame_timestamp: datetime, frame_id: int
     ) -> None:
-        self._inference_start_event = ModelActivityEvent(
+        event = ModelActivityEvent(
             event_timestamp=datetime.now(),
             frame_id=frame_id,
             frame_decoding_timestamp=frame_timestamp,
         )
+        with self._lock:
+            self._inference_start_events[frame_id] = event
+            while len(self._inference_start_events) > MAX_LATENCY_CONTEXT:
+                self._inference_start_events.popitem(last=False)
 
     def register_prediction_ready(
         self, frame_timestamp: datetime, frame_id: int
     ) -> None:
-        self._prediction_ready_event = ModelActivityEvent(
-            event_timestamp=datetime.now(),
-            frame_id=frame_id,
-            frame_decoding_timestamp=frame_timestamp,
-        )
-        self._generate_report()
+        with self._lock:
+            self._prediction_ready_event = ModelActivityEvent(
+                event_timestamp=datetime.now(),
+                frame_id=frame_id,
+                frame_decoding_timestamp=frame_timestamp,
+            )
+            self._generate_report()
 
     def summarise_reports(self) -> LatencyMonitorReport:
         avg_frame_decoding_latency = average_property_values(
@@ -120,14 +136,17 @@ class LatencyMonitor:
         )
 
     def _generate_report(self) -> None:
+        inference_start_event = self._inference_start_events.pop(
+            self._prediction_ready_event.frame_id, None
+        )
         frame_decoding_latency = None
-        if self._inference_start_event is not None:
+        if inference_start_event is not None:
             frame_decoding_latency = (
-                self._inference_start_event.event_timestamp
-                - self._inference_start_event.frame_decoding_timestamp
+                inference_start_event.event_timestamp
+                - inference_start_event.frame_decoding_timestamp
             ).total_seconds()
         event_pairs = [
-            (self._inference_start_event, self._prediction_ready_event),
+            (inference_start_event, self._prediction_ready_event),
         ]
         event_pairs_results = []
         for earlier_event, later_event in event_pairs:
@@ -198,9 +217,9 @@ def are_events_compatible(events: List[Optional[ModelActivityEvent]]) -> bool:
 
 class BasePipelineWatchDog(PipelineWatchDog):
     """
-    Implementation to be used from single inference thread, as it keeps
-    state assumed to represent status of consecutive stage of prediction process
-    in latency monitor.
+    Implementation keeping the state of consecutive stages of prediction process
+    in latency monitors. Events of frames being processed in parallel by pipelined
+    inference stages are matched by frame id.
     """
 
     def __init__(self):
@@ -209,6 +228,8 @@ class BasePipelineWatchDog(PipelineWatchDog):
         self._inference_throughput_monitor = sv.FPSMonitor()
         self._latency_monitors: Dict[Optional[int], LatencyMonitor] = {}
         self._stream_updates = deque(maxlen=MAX_UPDATES_CONTEXT)
+        self._stages_latencies: Dict[str, Deque[float]] = {}
+        self._stages_latencies_lock = threading.Lock()
 
     def register_video_sources(self, video_sources: List[VideoSource]) -> None:
         self._video_sources = video_sources
@@ -237,6 +258,17 @@ class BasePipelineWatchDog(PipelineWatchDog):
             )
             self._inference_throughput_monitor.tick()
 
+    def on_inference_stage_completed(
+        self,
+        stage: str,
+        frames: List[VideoFrame],
+        duration: float,
+    ) -> None:
+        with self._stages_latencies_lock:
+            if stage not in self._stages_latencies:
+                self._stages_latencies[stage] = deque(maxlen=MAX_LATENCY_CONTEXT)
+            self._stages_latencies[stage].append(duration)
+
     def get_report(self) -> PipelineStateReport:
         sources_metadata = []
         if self._video_sources is not None:
@@ -248,9 +280,15 @@ class BasePipelineWatchDog(PipelineWatchDog):
             _inference_throughput_fps = self._inference_throughput_monitor.fps
         else:
             _inference_throughput_fps = self._inference_throughput_monitor()
+        with self._stages_latencies_lock:
+            stages_latency = {
+                stage: safe_average(values=list(latencies))
+                for stage, latencies in self._stages_latencies.items()
+            }
         return PipelineStateReport(
             video_source_status_updates=list(self._stream_updates),
             latency_reports=latency_reports,
             inference_throughput=_inference_throughput_fps,
             sources_metadata=sources_metadata,
+            stages_latency=stages_latency,
         )
@@ -1,24 +1,38 @@
 import time
+from concurrent.futures import Future
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
+import supervision as sv
 from fastapi.encoders import jsonable_encoder
 
 from inference.core.cache import cache
-from inference.core.cache.serializers import to_cachable_inference_item
+from inference.core.cache.serializers import (
+    to_cachable_inference_item,
+    to_cachable_sv_detections_item,
+)
 from inference.core.devices.utils import GLOBAL_INFERENCE_SERVER_ID
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.env import (
     DISABLE_INFERENCE_CACHE,
+    DYNAMIC_BATCHING_ENABLED,
     METRICS_ENABLED,
     METRICS_INTERVAL,
     ROBOFLOW_SERVER_UUID,
 )
 from inference.core.exceptions import InferenceModelNotFound
 from inference.core.logger import logger
+from inference.core.managers.batching import DynamicBatchingScheduler
 from inference.core.managers.entities import ModelDescription
 from inference.core.managers.pingback import PingbackInfo
+from inference.core.managers.telemetry import (
+    build_sv_detections_telemetry_record,
+    build_telemetry_record,
+    is_lightweight_telemetry_enabled,
+    should_store_full_payload,
+    telemetry_buffer,
+)
 from inference.core.models.base import Model, PreprocessReturnMetadata
 from inference.core.registries.base import ModelRegistry
 
@@ -26,10 +40,18 @@ from inference.core.registries.base import ModelRegistry
 class ModelManager:
     """Model managers keep track of a dictionary of Model objects and is responsible for passing requests to the right model using the infer method."""
 
-    def __init__(self, model_registry: ModelRegistry, models: Optional[dict] = None):
+    def __init__(
+        self,
+        model_registry: ModelRegistry,
+        models: Optional[dict] = None,
+        batching_scheduler: Optional[DynamicBatchingScheduler] = None,
+    ):
         self.model_registry = model_registry
         self._models: Dict[str, Model] = models if models is not None else {}
         self.pingback = None
+        if batching_scheduler is None and DYNAMIC_BATCHING_ENABLED:
+            batching_scheduler = DynamicBatchingScheduler()
+        self._batching_scheduler = batching_scheduler
 
     def init_pingback(self):
         """Initializes pingback mechanism."""
@@ -65,6 +87,41 @@ class ModelManager:
         logger.debug("ModelManager - model successfully loaded.")
         self._models[resolved_identifier] = model
 
+    async def add_model_async(
+        self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
+    ) -> None:
+        """Adds a new model to the manager from async context. Base manager loads the model
+        synchronously - decorators may load it without blocking the event loop.
+
+        Args:
+            model_id (str): The identifier of the model.
+            api_key (str): API key used to load the model.
+            model_id_alias (Optional[str]): Identifier under which the model is registered.
+        """
+        self.add_model(model_id, api_key, model_id_alias=model_id_alias)
+
+    def load_model(
+        self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
+    ) -> Future:
+        """Requests the model to be loaded and returns the future of the load. Base manager
+        loads the model synchronously, so the returned future is already completed.
+
+        Args:
+            model_id (str): The identifier of the model.
+            api_key (str): API key used to load the model.
+            model_id_alias (Optional[str]): Identifier under which the model is registered.
+
+        Returns:
+            Future: Future resolved once the model is loaded (or failed to load).
+        """
+        future = Future()
+        try:
+            self.add_model(model_id, api_key, model_id_alias=model_id_alias)
+            future.set_result(None)
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
     def check_for_model(self, model_id: str) -> None:
         """Checks whether the model with the given ID is in the manager.
 
@@ -95,6 +152,7 @@ class ModelManager:
         if METRICS_ENABLED and self.pingback:
             logger.debug("ModelManager - setting pingback fallback api key...")
             self.pingback.fallback_api_key = request.api_key
+        start_time = time.time()
         try:
             rtn_val = await self.model_infer(
                 model_id=model_id, request=request, **kwargs
@@ -102,52 +160,18 @@ class ModelManager:
             logger.debug(
                 f"ModelManager - inference from request finished for model_id={model_id}."
             )
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                logger.debug(
-                    f"ModelManager - caching inference request started for model_id={model_id}"
-                )
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                if (
-                    hasattr(request, "image")
-                    and hasattr(request.image, "type")
-                    and request.image.type == "numpy"
-                ):
-                    request.image.value = str(request.image.value)
-                cache.zadd(
-                    f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value=to_cachable_inference_item(request, rtn_val),
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                logger.debug(
-                    f"ModelManager - caching inference request finished for model_id={model_id}"
+                self._record_inference(
+                    model_id=model_id,
+                    request=request,
+                    response=rtn_val,
+                    start_time=start_time,
                 )
             return rtn_val
         except Exception as e:
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                cache.zadd(
-                    f"error:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value={
-                        "request": jsonable_encoder(
-                            request.dict(exclude={"image", "subject", "prompt"})
-                        ),
-                        "error": str(e),
-                    },
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
+                self._record_inference_error(
+                    model_id=model_id, request=request, error=e, start_time=start_time
                 )
             raise
 
@@ -161,7 +185,8 @@ class ModelManager:
             request (InferenceRequest): The request to process.
 
         Returns:
-            InferenceResponse: The response from the inference.
+            InferenceResponse: The response from the inference - or `sv.Detections` for each input image,
+                when `return_sv_detections=True` is passed (see `infer_sv_detections_from_request_sync(...)`).
         """
         logger.debug(
             f"ModelManager - inference from request started for model_id={model_id}."
@@ -169,6 +194,7 @@ class ModelManager:
         if METRICS_ENABLED and self.pingback:
             logger.debug("ModelManager - setting pingback fallback api key...")
             self.pingback.fallback_api_key = request.api_key
+        start_time = time.time()
         try:
             rtn_val = self.model_infer_sync(
                 model_id=model_id, request=request, **kwargs
@@ -176,64 +202,193 @@ class ModelManager:
             logger.debug(
                 f"ModelManager - inference from request finished for model_id={model_id}."
             )
-            finish_time = time.time()
-            if not DISABLE_INFERENCE_CACHE:
-                logger.debug(
-                    f"ModelManager - caching inference request started for model_id={model_id}"
-                )
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                if (
-                    hasattr(request, "image")
-                    and hasattr(request.image, "type")
-                    and request.image.type == "numpy"
-                ):
-                    request.image.value = str(request.image.value)
-                cache.zadd(
-                    f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value=to_cachable_inference_item(request, rtn_val),
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
+            if not DISABLE_INFERENCE_CACHE and kwargs.get("return_sv_detections"):
+                self._record_sv_detections_inference(
+                    model_id=model_id,
+                    request=request,
+                    detections=rtn_val,
+                    start_time=start_time,
                 )
-                logger.debug(
-                    f"ModelManager - caching inference request finished for model_id={model_id}"
+            elif not DISABLE_INFERENCE_CACHE:
+                self._record_inference(
+                    model_id=model_id,
+                    request=request,
+                    response=rtn_val,
+                    start_time=start_time,
                 )
             return rtn_val
         except Exception as e:
-            finish_time = time.time()
             if not DISABLE_INFERENCE_CACHE:
-                cache.zadd(
-                    f"models",
-                    value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
-                )
-                cache.zadd(
-                    f"error:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
-                    value={
-                        "request": jsonable_encoder(
-                            request.dict(exclude={"image", "subject", "prompt"})
-                        ),
-                        "error": str(e),
-                    },
-                    score=finish_time,
-                    expire=METRICS_INTERVAL * 2,
+                self._record_inference_error(
+                    model_id=model_id, request=request, error=e, start_time=start_time
                 )
             raise
 
+    def infer_sv_detections_from_request_sync(
+        self, model_id: str, request: InferenceRequest, **kwargs
+    ) -> List[sv.Detections]:
+        """Runs inference on the specified detection model and returns results as `sv.Detections`
+        (one for each input image), skipping creation of response objects for models which support that.
+        Meant for in-process consumers (like Workflows blocks) - dynamic batching is not applied.
+
+        Args:
+            model_id (str): The identifier of the model.
+            request (InferenceRequest): The request to process.
+
+        Returns:
+            List[sv.Detections]: Detections for each input image.
+        """
+        return self.infer_from_request_sync(
+            model_id, request, return_sv_detections=True, **kwargs
+        )
+
+    def _record_sv_detections_inference(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        detections: List[sv.Detections],
+        start_time: float,
+    ) -> None:
+        finish_time = time.time()
+        cache.zadd(
+            f"models",
+            value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
+            score=finish_time,
+            expire=METRICS_INTERVAL * 2,
+        )
+        if is_lightweight_telemetry_enabled():
+            telemetry_buffer.append(
+                build_sv_detections_telemetry_record(
+                    inference_server_id=GLOBAL_INFERENCE_SERVER_ID,
+                    model_id=model_id,
+                    detections=detections,
+                    start_time=start_time,
+                    finish_time=finish_time,
+                )
+            )
+        if should_store_full_payload():
+            cache.zadd(
+                f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
+                value=to_cachable_sv_detections_item(
+                    infer_request=request,
+                    detections=detections,
+                    inference_time=finish_time - start_time,
+                ),
+                score=finish_time,
+                expire=METRICS_INTERVAL * 2,
+            )
+
+    def _record_inference(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        response: InferenceResponse,
+        start_time: float,
+    ) -> None:
+        finish_time = time.time()
+        logger.debug(
+            f"ModelManager - caching inference request started for model_id={model_id}"
+        )
+        cache.zadd(
+            f"models",
+            value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
+            score=finish_time,
+            expire=METRICS_INTERVAL * 2,
+        )
+        if is_lightweight_telemetry_enabled():
+            telemetry_buffer.append(
+                build_telemetry_record(
+                    inference_server_id=GLOBAL_INFERENCE_SERVER_ID,
+                    model_id=model_id,
+                    response=response,
+                    start_time=start_time,
+                    finish_time=finish_time,
+                )
+            )
+        if should_store_full_payload():
+            if (
+                hasattr(request, "image")
+                and hasattr(request.image, "type")
+                and request.image.type == "numpy"
+            ):
+                request.image.value = str(request.image.value)
+            cache.zadd(
+                f"inference:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
+                value=to_cachable_inference_item(request, response),
+                score=finish_time,
+                expire=METRICS_INTERVAL * 2,
+            )
+        logger.debug(
+            f"ModelManager - caching inference request finished for model_id={model_id}"
+        )
+
+    def _record_inference_error(
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        error: Exception,
+        start_time: float,
+    ) -> None:
+        finish_time = time.time()
+        cache.zadd(
+            f"models",
+            value=f"{GLOBAL_INFERENCE_SERVER_ID}:{request.api_key}:{model_id}",
+            score=finish_time,
+            expire=METRICS_INTERVAL * 2,
+        )
+        if is_lightweight_telemetry_enabled():
+            telemetry_buffer.append(
+                build_telemetry_record(
+                    inference_server_id=GLOBAL_INFERENCE_SERVER_ID,
+                    model_id=model_id,
+                    response=None,
+                    start_time=start_time,
+                    finish_time=finish_time,
+                )
+            )
+        cache.zadd(
+            f"error:{GLOBAL_INFERENCE_SERVER_ID}:{model_id}",
+            value={
+                "request": jsonable_encoder(
+                    request.dict(exclude={"image", "subject", "prompt"})
+                ),
+                "error": str(error),
+            },
+            score=finish_time,
+            expire=METRICS_INTERVAL * 2,
+        )
+
     async def model_infer(self, model_id: str, request: InferenceRequest, **kwargs):
         self.check_for_model(model_id)
-        return self._models[model_id].infer_from_request(request)
+        model = self._models[model_id]
+        if (
+            self._batching_scheduler is not None
+            and self._batching_scheduler.is_eligible(model=model, request=request)
+        ):
+            return await self._batching_scheduler.infer_from_request(
+                model_id=model_id, model=model, request=request
+            )
+        return model.infer_from_request(request)
 
     def model_infer_sync(
-        self, model_id: str, request: InferenceRequest, **kwargs
-    ) -> Union[List[InferenceResponse], InferenceResponse]:
+        self,
+        model_id: str,
+        request: InferenceRequest,
+        return_sv_detections: bool = False,
+        **kwargs,
+    ) -> Union[List[InferenceResponse], InferenceResponse, List[sv.Detections]]:
         self.check_for_model(model_id)
-        return self._models[model_id].infer_from_request(request)
+        model = self._models[model_id]
+        if return_sv_detections:
+            return model.infer_sv_detections_from_request(request)
+        if (
+            self._batching_scheduler is not None
+            and self._batching_scheduler.is_eligible(model=model, request=request)
+        ):
+            return self._batching_scheduler.infer_from_request_sync(
+                model_id=model_id, model=model, request=request
+            )
+        return model.infer_from_request(request)
 
     def make_response(
         self, model_id: str, predictions: List[List[float]], *args, **kwargs
@@ -337,6 +492,8 @@ class ModelManager:
         try:
             logger.debug(f"Removing model {model_id} from base model manager")
             self.check_for_model(model_id)
+            if self._batching_scheduler is not None:
+                self._batching_scheduler.remove(model_id=model_id)
             self._models[model_id].clear_cache(delete_from_disk=delete_from_disk)
             del self._models[model_id]
         except InferenceModelNotFound:
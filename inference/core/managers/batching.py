@@ -0,0 +1,226 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import partial
+from queue import Empty, Queue
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from inference.core.entities.requests.inference import (
+    ClassificationInferenceRequest,
+    InferenceRequest,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.env import (
+    DYNAMIC_BATCHING_MAX_BATCH_SIZE,
+    DYNAMIC_BATCHING_MAX_WAIT_MS,
+    FIX_BATCH_SIZE,
+    MAX_BATCH_SIZE,
+)
+from inference.core.logger import logger
+from inference.core.models.base import Model
+
+BATCHABLE_REQUEST_TYPES = (
+    ObjectDetectionInferenceRequest,
+    ClassificationInferenceRequest,
+)
+
+
+@dataclass
+class PendingPrediction:
+    model: Model
+    img_in: np.ndarray
+    future: Future = field(default_factory=Future)
+
+
+class ModelBatchQueue:
+    """Collects preprocessed inputs for a single model id and runs them through
+    `predict(...)` in batches, on a dedicated worker thread.
+
+    The worker blocks until the first input arrives, then keeps gathering inputs
+    until either `max_batch_size` images are collected or `max_wait_time` seconds
+    have passed since the first one. Inputs are grouped by model instance and input
+    shape, as only those can be concatenated into a single tensor.
+    """
+
+    def __init__(self, model_id: str, max_batch_size: int, max_wait_time: float):
+        self.model_id = model_id
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
+        self._queue: "Queue[Optional[PendingPrediction]]" = Queue()
+        self._worker = threading.Thread(
+            target=self._run,
+            name=f"dynamic-batching-{model_id}",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def predict(self, model: Model, img_in: np.ndarray) -> Tuple[np.ndarray, ...]:
+        pending = PendingPrediction(model=model, img_in=img_in)
+        self._queue.put(pending)
+        return pending.future.result()
+
+    def stop(self) -> None:
+        self._queue.put(None)
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return None
+            batch, stop_requested = self._collect_batch(first=first)
+            for group in group_pending_predictions(batch=batch):
+                self._predict_group(group=group)
+            if stop_requested:
+                return None
+
+    def _collect_batch(
+        self, first: PendingPrediction
+    ) -> Tuple[List[PendingPrediction], bool]:
+        batch = [first]
+        batch_size = first.img_in.shape[0]
+        deadline = time.monotonic() + self.max_wait_time
+        while batch_size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                pending = self._queue.get(timeout=remaining)
+            except Empty:
+                break
+            if pending is None:
+                return batch, True
+            batch.append(pending)
+            batch_size += pending.img_in.shape[0]
+        return batch, False
+
+    def _predict_group(self, group: List[PendingPrediction]) -> None:
+        model = group[0].model
+        logger.debug(
+            f"Dynamic batching - running batch of {len(group)} requests for model_id={self.model_id}"
+        )
+        try:
+            if len(group) == 1:
+                img_in = group[0].img_in
+            else:
+                img_in = np.concatenate([p.img_in for p in group], axis=0)
+            predictions = model.predict(img_in)
+        except Exception as error:
+            for pending in group:
+                pending.future.set_exception(error)
+            return None
+        start = 0
+        for pending in group:
+            end = start + pending.img_in.shape[0]
+            pending.future.set_result(
+                tuple(prediction[start:end] for prediction in predictions)
+            )
+            start = end
+
+
+class DynamicBatchingScheduler:
+    """In-process scheduler that coalesces concurrent requests to the same model into a
+    single `predict(...)` call.
+
+    Preprocessing and postprocessing still run in the calling threads - only the model
+    forward pass is shared, so per-request parameters (confidence, NMS settings,
+    class filters, etc.) are respected. Only single-image object-detection-like and
+    classification requests against models with dynamic batch dimension
+    (`batching_enabled`) and all outputs batch-first (`batch_first_predictions`) are
+    eligible, everything else should go through the model directly.
+
+    Args:
+        max_batch_size (int): Maximum number of images in one batch, capped by `MAX_BATCH_SIZE`.
+        max_wait_time (float): Time in seconds the first request of a batch waits for others.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = DYNAMIC_BATCHING_MAX_BATCH_SIZE,
+        max_wait_time: float = DYNAMIC_BATCHING_MAX_WAIT_MS / 1000,
+    ):
+        self.max_batch_size = int(min(max_batch_size, MAX_BATCH_SIZE))
+        self.max_wait_time = max_wait_time
+        self._queues: Dict[str, ModelBatchQueue] = {}
+        self._queues_lock = threading.Lock()
+
+    def is_eligible(self, model: Model, request: InferenceRequest) -> bool:
+        if not isinstance(request, BATCHABLE_REQUEST_TYPES):
+            return False
+        if getattr(model, "batching_enabled", False) is not True:
+            return False
+        if getattr(model, "batch_first_predictions", False) is not True:
+            # outputs are split between requests along the first axis
+            return False
+        if FIX_BATCH_SIZE or getattr(request, "fix_batch_size", False):
+            return False
+        return not isinstance(request.image, list)
+
+    async def infer_from_request(
+        self, model_id: str, model: Model, request: InferenceRequest
+    ) -> Union[InferenceResponse, List[InferenceResponse]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.infer_from_request_sync,
+                model_id=model_id,
+                model=model,
+                request=request,
+            ),
+        )
+
+    def infer_from_request_sync(
+        self, model_id: str, model: Model, request: InferenceRequest
+    ) -> Union[InferenceResponse, List[InferenceResponse]]:
+        t1 = time.perf_counter()
+        request_params = request.dict()
+        image = request_params.pop("image")
+        request_params["return_image_dims"] = False
+        responses = model.infer_with_shared_predict(
+            image,
+            shared_predict=partial(self._get_queue(model_id=model_id).predict, model),
+            **request_params,
+        )
+        for response in responses:
+            response.time = time.perf_counter() - t1
+            if request.id:
+                response.inference_id = request.id
+        if request.visualize_predictions:
+            for response in responses:
+                response.visualization = model.draw_predictions(request, response)
+        return responses[0]
+
+    def remove(self, model_id: str) -> None:
+        with self._queues_lock:
+            batch_queue = self._queues.pop(model_id, None)
+        if batch_queue is not None:
+            batch_queue.stop()
+
+    def clear(self) -> None:
+        for model_id in list(self._queues.keys()):
+            self.remove(model_id=model_id)
+
+    def _get_queue(self, model_id: str) -> ModelBatchQueue:
+        with self._queues_lock:
+            if model_id not in self._queues:
+                self._queues[model_id] = ModelBatchQueue(
+                    model_id=model_id,
+                    max_batch_size=self.max_batch_size,
+                    max_wait_time=self.max_wait_time,
+                )
+            return self._queues[model_id]
+
+
+def group_pending_predictions(
+    batch: List[PendingPrediction],
+) -> List[List[PendingPrediction]]:
+    groups: Dict[Tuple[int, tuple], List[PendingPrediction]] = {}
+    for pending in batch:
+        key = (id(pending.model), pending.img_in.shape[1:])
+        groups.setdefault(key, []).append(pending)
+    return list(groups.values())
@@ -0,0 +1,125 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, List, Optional
+
+from inference.core import logger
+from inference.core.env import (
+    MODEL_BACKGROUND_LOADING_ENABLED,
+    MODEL_LOADING_MAX_WORKERS,
+    MODEL_LOADING_RETRY_AFTER,
+)
+from inference.core.exceptions import ModelLoadingInProgressError
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.base import ModelManagerDecorator
+
+
+class AsyncLoadModelManagerDecorator(ModelManagerDecorator):
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        max_workers: int = MODEL_LOADING_MAX_WORKERS,
+        background_loading: bool = MODEL_BACKGROUND_LOADING_ENABLED,
+        retry_after: int = MODEL_LOADING_RETRY_AFTER,
+    ):
+        """Decorator loading models in a pool of background threads. Each model is loaded once - concurrent
+        requests for the same model wait for the same load, instead of queueing on the model load lock,
+        and requests for different models load in parallel.
+
+        With `background_loading` enabled, `add_model_async(...)` does not wait for the model - it starts the
+        load and raises `ModelLoadingInProgressError` (which HTTP API turns into 503 with `Retry-After` header)
+        until the model is ready. `add_model(...)` always waits for the model.
+
+        Args:
+            model_manager (ModelManager): Instance of a ModelManager.
+            max_workers (int, optional): Max number of models loaded at the same time. Defaults to
+                MODEL_LOADING_MAX_WORKERS env variable.
+            background_loading (bool, optional): Flag to reject requests for models which are still loading.
+                Defaults to MODEL_BACKGROUND_LOADING_ENABLED env variable.
+            retry_after (int, optional): Seconds after which the client should retry the request rejected
+                while the model is loading. Defaults to MODEL_LOADING_RETRY_AFTER env variable.
+        """
+        super().__init__(model_manager)
+        self.background_loading = background_loading
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="model-loader"
+        )
+        self._loading: Dict[str, Future] = {}
+        self._loading_lock = threading.RLock()
+
+    def add_model(
+        self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
+    ) -> None:
+        resolved_identifier = model_id if model_id_alias is None else model_id_alias
+        if resolved_identifier in self:
+            return None
+        self.load_model(model_id, api_key, model_id_alias=model_id_alias).result()
+
+    async def add_model_async(
+        self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
+    ) -> None:
+        resolved_identifier = model_id if model_id_alias is None else model_id_alias
+        if resolved_identifier in self:
+            return None
+        future = self.load_model(model_id, api_key, model_id_alias=model_id_alias)
+        if self.background_loading and not future.done():
+            raise ModelLoadingInProgressError(
+                f"Model {resolved_identifier} is loading.",
+                retry_after=self.retry_after,
+            )
+        await asyncio.wrap_future(future)
+
+    def load_model(
+        self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
+    ) -> Future:
+        """Starts loading the model in background (unless the load is already in progress) and returns
+        the future shared by all callers requesting the model.
+
+        In background loading mode, the failed load stays registered, such that its error is reported to
+        the first caller polling for the model - the next request triggers the load again.
+        """
+        resolved_identifier = model_id if model_id_alias is None else model_id_alias
+        with self._loading_lock:
+            future = self._loading.get(resolved_identifier)
+            if future is not None and future.done():
+                del self._loading[resolved_identifier]
+                return future
+            if future is not None:
+                return future
+            if resolved_identifier in self:
+                future = Future()
+                future.set_result(None)
+                return future
+            logger.debug(f"Starting background load of model {resolved_identifier}")
+            future = self._executor.submit(
+                self.model_manager.add_model,
+                model_id,
+                api_key,
+                model_id_alias=model_id_alias,
+            )
+            self._loading[resolved_identifier] = future
+        future.add_done_callback(
+            partial(self._on_load_finished, model_id=resolved_identifier)
+        )
+        return future
+
+    def preload_models(self, model_ids: Iterable[str], api_key: str) -> List[Future]:
+        """Starts loading all of the models in parallel, returning futures of their loads."""
+        return [self.load_model(model_id, api_key) for model_id in model_ids]
+
+    def is_loading(self, model_id: str) -> bool:
+        with self._loading_lock:
+            future = self._loading.get(model_id)
+            return future is not None and not future.done()
+
+    def _on_load_finished(self, future: Future, model_id: str) -> None:
+        error = future.exception()
+        if error is not None:
+            logger.warning(f"Could not load model {model_id}: {error}")
+            if self.background_loading:
+                return None
+        with self._loading_lock:
+            if self._loading.get(model_id) is future:
+                del self._loading[model_id]
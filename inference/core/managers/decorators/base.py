@@ -7,6 +7,8 @@ from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.env import API_KEY
 from inference.core.managers.base import Model, ModelManager
+from inference.core.managers.entities import ModelDescription
+from inference.core.managers.residency import ModelResidency
 from inference.core.models.types import PreprocessReturnMetadata
 
 
@@ -28,6 +30,7 @@ class ModelManagerDecorator(ModelManager):
         __getitem__: Retrieves a model by its ID.
         __contains__: Checks if a model exists in the manager.
         keys: Returns the keys (model IDs) from the manager.
+        describe_models: Describes models loaded by the manager.
     """
 
     @property
@@ -192,6 +195,18 @@ class ModelManagerDecorator(ModelManager):
     def models(self):
         return self.model_manager.models()
 
+    def describe_models(self) -> List[ModelDescription]:
+        return self.model_manager.describe_models()
+
+    def get_residency_stats(self) -> List[ModelResidency]:
+        return self.model_manager.get_residency_stats()
+
+    def pin_model(self, model_id: str) -> None:
+        self.model_manager.pin_model(model_id)
+
+    def unpin_model(self, model_id: str) -> None:
+        self.model_manager.unpin_model(model_id)
+
     def predict(self, model_id: str, *args, **kwargs) -> Tuple[np.ndarray, ...]:
         return self.model_manager.predict(model_id, *args, **kwargs)
 
@@ -1,26 +1,68 @@
-from collections import deque
-from typing import List, Optional
+import threading
+import time
+from dataclasses import replace
+from typing import Iterable, List, Optional, Set
 
 from inference.core import logger
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
-from inference.core.env import DISK_CACHE_CLEANUP, MEMORY_FREE_THRESHOLD
+from inference.core.env import (
+    DISK_CACHE_CLEANUP,
+    MEMORY_FREE_THRESHOLD,
+    MODELS_CACHE_EVICTION_POLICY,
+    MODELS_CACHE_MEMORY_BUDGET_MB,
+    PINNED_MODELS,
+)
 from inference.core.managers.base import Model, ModelManager
 from inference.core.managers.decorators.base import ModelManagerDecorator
 from inference.core.managers.entities import ModelDescription
+from inference.core.managers.residency import (
+    ModelResidency,
+    ModelResidencyTracker,
+    estimate_model_memory_footprint,
+)
 
 
 class WithFixedSizeCache(ModelManagerDecorator):
-    def __init__(self, model_manager: ModelManager, max_size: int = 8):
-        """Cache decorator, models will be evicted based on the last utilization (`.infer` call). Internally, a [double-ended queue](https://docs.python.org/3/library/collections.html#collections.deque) is used to keep track of model utilization.
+    def __init__(
+        self,
+        model_manager: ModelManager,
+        max_size: int = 8,
+        memory_budget_mb: Optional[float] = MODELS_CACHE_MEMORY_BUDGET_MB,
+        eviction_policy: str = MODELS_CACHE_EVICTION_POLICY,
+        pinned_models: Optional[Iterable[str]] = None,
+    ):
+        """Cache decorator, models will be evicted when the number of loaded models exceeds `max_size` or
+        their estimated memory footprint exceeds `memory_budget_mb`. By default, the least recently used model
+        (based on the last utilization - `.infer` call) is evicted, `cost_aware` policy weights model load time
+        against its size and utilisation instead. Pinned models are never evicted.
 
         Args:
             model_manager (ModelManager): Instance of a ModelManager.
             max_size (int, optional): Max number of models at the same time. Defaults to 8.
+            memory_budget_mb (Optional[float], optional): Max estimated memory (in MB) of loaded models.
+                Defaults to MODELS_CACHE_MEMORY_BUDGET_MB env variable (no limit if not set).
+            eviction_policy (str, optional): Either `lru` or `cost_aware`. Defaults to MODELS_CACHE_EVICTION_POLICY
+                env variable (`lru` if not set).
+            pinned_models (Optional[Iterable[str]], optional): Models which must never be evicted. Defaults to
+                PINNED_MODELS env variable.
         """
         super().__init__(model_manager)
         self.max_size = max_size
-        self._key_queue = deque(self.model_manager.keys())
+        self.memory_budget_bytes = (
+            int(memory_budget_mb * 1024 * 1024)
+            if memory_budget_mb is not None
+            else None
+        )
+        if pinned_models is None:
+            pinned_models = PINNED_MODELS
+        self._residency = ModelResidencyTracker(
+            eviction_policy=eviction_policy, pinned_models=pinned_models
+        )
+        for model_id in self.model_manager.keys():
+            self._residency.register(model_id=model_id)
+        self._loading_models = set()
+        self._eviction_lock = threading.Lock()
 
     def add_model(
         self, model_id: str, api_key: str, model_id_alias: Optional[str] = None
@@ -38,29 +80,56 @@ class WithFixedSizeCache(ModelManagerDecorator):
             logger.debug(
                 f"Detected {queue_id} in WithFixedSizeCache models queue -> marking as most recently used."
             )
-            self._key_queue.remove(queue_id)
-            self._key_queue.append(queue_id)
+            self._residency.touch(queue_id)
             return None
 
-        logger.debug(f"Current capacity of ModelManager: {len(self)}/{self.max_size}")
-        while len(self) >= self.max_size or (
-            MEMORY_FREE_THRESHOLD and self.memory_pressure_detected()
-        ):
-            to_remove_model_id = self._key_queue.popleft()
-            super().remove(
-                to_remove_model_id, delete_from_disk=DISK_CACHE_CLEANUP
-            )  # LRU model overflow cleanup may or maynot need the weights removed from disk
-            logger.debug(f"Model {to_remove_model_id} successfully unloaded.")
-        logger.debug(f"Marking new model {queue_id} as most recently used.")
-        self._key_queue.append(queue_id)
+        with self._eviction_lock:
+            # models being loaded concurrently are already registered - they take their slots in cache,
+            # but cannot be evicted until loaded
+            logger.debug(
+                f"Current capacity of ModelManager: {len(self._residency)}/{self.max_size}"
+            )
+            while len(self._residency) >= self.max_size or (
+                MEMORY_FREE_THRESHOLD and self.memory_pressure_detected()
+            ):
+                if not self._evict_model(exclude=self._loading_models):
+                    break
+            logger.debug(f"Marking new model {queue_id} as most recently used.")
+            self._residency.register(model_id=queue_id)
+            self._loading_models.add(queue_id)
         try:
-            return super().add_model(model_id, api_key, model_id_alias=model_id_alias)
+            load_start = time.perf_counter()
+            result = super().add_model(model_id, api_key, model_id_alias=model_id_alias)
+            load_time = time.perf_counter() - load_start
         except Exception as error:
             logger.debug(
                 f"Could not initialise model {queue_id}. Removing from WithFixedSizeCache models queue."
             )
-            self._key_queue.remove(queue_id)
+            self._residency.discard(queue_id)
             raise error
+        finally:
+            with self._eviction_lock:
+                self._loading_models.discard(queue_id)
+        self._residency.update(
+            model_id=queue_id,
+            size_bytes=self._estimate_model_size(model_id=queue_id),
+            load_time=load_time,
+        )
+        with self._eviction_lock:
+            while (
+                self.memory_budget_bytes is not None
+                and self._residency.total_bytes > self.memory_budget_bytes
+            ):
+                if not self._evict_model(
+                    exclude=self._loading_models.union([queue_id])
+                ):
+                    logger.warning(
+                        f"WithFixedSizeCache memory budget cannot be met after loading {queue_id} - "
+                        f"estimated memory of loaded models is {self._residency.total_bytes} bytes, "
+                        f"budget is {self.memory_budget_bytes} bytes."
+                    )
+                    break
+        return result
 
     def clear(self) -> None:
         """Removes all models from the manager."""
@@ -68,9 +137,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
             self.remove(model_id)
 
     def remove(self, model_id: str, delete_from_disk: bool = True) -> Model:
-        try:
-            self._key_queue.remove(model_id)
-        except ValueError:
+        if not self._residency.discard(model_id):
             logger.warning(
                 f"Could not successfully purge model {model_id} from  WithFixedSizeCache models queue"
             )
@@ -88,8 +155,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             InferenceResponse: The response from the inference.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._residency.touch(model_id)
         return await super().infer_from_request(model_id, request, **kwargs)
 
     def infer_from_request_sync(
@@ -104,8 +170,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             InferenceResponse: The response from the inference.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._residency.touch(model_id)
         return super().infer_from_request_sync(model_id, request, **kwargs)
 
     def infer_only(self, model_id: str, request, img_in, img_dims, batch_size=None):
@@ -121,8 +186,7 @@ class WithFixedSizeCache(ModelManagerDecorator):
         Returns:
             Response from the inference-only operation.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._residency.touch(model_id)
         return super().infer_only(model_id, request, img_in, img_dims, batch_size)
 
     def preprocess(self, model_id: str, request):
@@ -132,12 +196,74 @@ class WithFixedSizeCache(ModelManagerDecorator):
             model_id (str): The identifier of the model.
             request (InferenceRequest): The request to preprocess.
         """
-        self._key_queue.remove(model_id)
-        self._key_queue.append(model_id)
+        self._residency.touch(model_id)
         return super().preprocess(model_id, request)
 
     def describe_models(self) -> List[ModelDescription]:
-        return self.model_manager.describe_models()
+        descriptions = []
+        for description in self.model_manager.describe_models():
+            residency = self._residency.get(description.model_id)
+            if residency is not None:
+                description = replace(
+                    description,
+                    memory_footprint_bytes=residency.size_bytes,
+                    load_time=residency.load_time,
+                    hits=residency.hits,
+                    pinned=residency.pinned,
+                )
+            descriptions.append(description)
+        return descriptions
+
+    def get_residency_stats(self) -> List[ModelResidency]:
+        """Returns residency details (estimated memory, load time, utilisation, pinning) of loaded models,
+        ordered from the least to the most recently used."""
+        return self._residency.stats()
+
+    def pin_model(self, model_id: str) -> None:
+        """Marks the model as the one that must never be evicted."""
+        self._residency.pin(model_id)
+
+    def unpin_model(self, model_id: str) -> None:
+        self._residency.unpin(model_id)
+
+    def _evict_model(self, exclude: Iterable[str] = ()) -> bool:
+        exclude = set(exclude)
+        to_remove_model_id = self._residency.select_victim(exclude=exclude)
+        if to_remove_model_id is None:
+            logger.warning(
+                f"WithFixedSizeCache could not select any model to be unloaded - "
+                f"{self._describe_lack_of_eviction_candidates(exclude=exclude)}."
+            )
+            return False
+        self.remove(
+            to_remove_model_id, delete_from_disk=DISK_CACHE_CLEANUP
+        )  # LRU model overflow cleanup may or maynot need the weights removed from disk
+        logger.debug(f"Model {to_remove_model_id} successfully unloaded.")
+        return True
+
+    def _describe_lack_of_eviction_candidates(self, exclude: Set[str]) -> str:
+        pinned_models = [
+            model_id for model_id in self._residency.keys() if model_id not in exclude
+        ]
+        if pinned_models:
+            return f"remaining models are pinned: {', '.join(pinned_models)}"
+        excluded_models = []
+        if exclude.difference(self._loading_models):
+            excluded_models.append("the just-loaded model")
+        if exclude.intersection(self._loading_models):
+            excluded_models.append("models which are still being loaded")
+        if not excluded_models:
+            return "no models are loaded"
+        if excluded_models == ["the just-loaded model"]:
+            return "only the just-loaded model remains"
+        return f"only {' and '.join(excluded_models)} remain"
+
+    def _estimate_model_size(self, model_id: str) -> int:
+        try:
+            return estimate_model_memory_footprint(model=self[model_id])
+        except Exception as error:
+            logger.debug(f"Could not estimate size of model {model_id}: {error}")
+            return 0
 
     def _resolve_queue_id(
         self, model_id: str, model_id_alias: Optional[str] = None
@@ -9,3 +9,7 @@ class ModelDescription:
     batch_size: Optional[int]
     input_height: Optional[int]
     input_width: Optional[int]
+    memory_footprint_bytes: Optional[int] = None
+    load_time: Optional[float] = None
+    hits: Optional[int] = None
+    pinned: Optional[bool] = None
@@ -8,6 +8,10 @@ import uuid
 
 from inference.core.cache import cache
 from inference.core.logger import logger
+from inference.core.managers.telemetry import (
+    is_lightweight_telemetry_enabled,
+    telemetry_buffer,
+)
 
 
 def get_model_metrics(
@@ -28,6 +32,13 @@ def get_model_metrics(
               - avg_inference_time (float): The average inference time.
               - num_errors (int): The number of errors occurred.
     """
+    if is_lightweight_telemetry_enabled():
+        return telemetry_buffer.summarize(
+            inference_server_id=inference_server_id,
+            model_id=model_id,
+            min=min,
+            max=max,
+        )
     now = time.time()
     inferences_with_times = cache.zrangebyscore(
         f"inference:{inference_server_id}:{model_id}", min=min, max=max, withscores=True
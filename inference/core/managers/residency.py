@@ -0,0 +1,183 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Iterable, List, Optional
+
+from inference.core.logger import logger
+from inference.core.models.base import Model
+
+LRU_EVICTION_POLICY = "lru"
+COST_AWARE_EVICTION_POLICY = "cost_aware"
+EVICTION_POLICIES = {LRU_EVICTION_POLICY, COST_AWARE_EVICTION_POLICY}
+
+
+@dataclass
+class ModelResidency:
+    model_id: str
+    size_bytes: int
+    load_time: float
+    hits: int
+    last_used: float
+    pinned: bool
+    priority: float
+
+
+class ModelResidencyTracker:
+    """Keeps track of loaded models - their estimated memory footprint, load cost and
+    utilisation - and selects models to be unloaded.
+
+    Two eviction policies are supported:
+    * `lru` - least recently used, not pinned model is selected
+    * `cost_aware` - GreedyDual-Size-Frequency: model priority is
+    `inflation + hits * load_time / size`, where `inflation` is the priority of the last
+    evicted model (which ages entries that are not used anymore). The model with the
+    lowest priority is selected, so cheap-to-reload, big and rarely used models go first.
+
+    Pinned models are never selected for eviction. All operations on the hot path
+    (marking model as used) are O(1).
+
+    Args:
+        eviction_policy (str): One of `lru` or `cost_aware`.
+        pinned_models (Iterable[str]): Identifiers of models which must never be evicted.
+    """
+
+    def __init__(
+        self,
+        eviction_policy: str = LRU_EVICTION_POLICY,
+        pinned_models: Iterable[str] = (),
+    ):
+        if eviction_policy not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown model eviction policy: {eviction_policy}. "
+                f"Supported policies: {sorted(EVICTION_POLICIES)}"
+            )
+        self.eviction_policy = eviction_policy
+        self._entries: "OrderedDict[str, ModelResidency]" = OrderedDict()
+        self._pinned = set(pinned_models)
+        self._inflation = 0.0
+        self._lock = threading.Lock()
+
+    def register(
+        self, model_id: str, size_bytes: int = 0, load_time: float = 0.0
+    ) -> None:
+        with self._lock:
+            entry = ModelResidency(
+                model_id=model_id,
+                size_bytes=size_bytes,
+                load_time=load_time,
+                hits=1,
+                last_used=time.time(),
+                pinned=model_id in self._pinned,
+                priority=0.0,
+            )
+            entry.priority = self._calculate_priority(entry=entry)
+            self._entries[model_id] = entry
+            self._entries.move_to_end(model_id)
+
+    def update(
+        self,
+        model_id: str,
+        size_bytes: Optional[int] = None,
+        load_time: Optional[float] = None,
+    ) -> None:
+        with self._lock:
+            entry = self._entries.get(model_id)
+            if entry is None:
+                return None
+            if size_bytes is not None:
+                entry.size_bytes = size_bytes
+            if load_time is not None:
+                entry.load_time = load_time
+            entry.priority = self._calculate_priority(entry=entry)
+
+    def touch(self, model_id: str) -> None:
+        with self._lock:
+            entry = self._entries.get(model_id)
+            if entry is None:
+                return None
+            entry.hits += 1
+            entry.last_used = time.time()
+            entry.priority = self._calculate_priority(entry=entry)
+            self._entries.move_to_end(model_id)
+
+    def discard(self, model_id: str) -> bool:
+        with self._lock:
+            return self._entries.pop(model_id, None) is not None
+
+    def pin(self, model_id: str) -> None:
+        with self._lock:
+            self._pinned.add(model_id)
+            if model_id in self._entries:
+                self._entries[model_id].pinned = True
+
+    def unpin(self, model_id: str) -> None:
+        with self._lock:
+            self._pinned.discard(model_id)
+            if model_id in self._entries:
+                self._entries[model_id].pinned = False
+
+    def is_pinned(self, model_id: str) -> bool:
+        return model_id in self._pinned
+
+    def select_victim(self, exclude: Iterable[str] = ()) -> Optional[str]:
+        """Returns identifier of a model to be evicted (or None if there is no
+        model which can be evicted) and advances the aging clock of cost-aware policy.
+        """
+        exclude = set(exclude)
+        with self._lock:
+            candidates = [
+                entry
+                for model_id, entry in self._entries.items()
+                if model_id not in self._pinned and model_id not in exclude
+            ]
+            if not candidates:
+                return None
+            if self.eviction_policy == LRU_EVICTION_POLICY:
+                return candidates[0].model_id
+            victim = min(candidates, key=lambda e: e.priority)
+            self._inflation = victim.priority
+            return victim.model_id
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(entry.size_bytes for entry in self._entries.values())
+
+    def stats(self) -> List[ModelResidency]:
+        with self._lock:
+            return [replace(entry) for entry in self._entries.values()]
+
+    def get(self, model_id: str) -> Optional[ModelResidency]:
+        with self._lock:
+            entry = self._entries.get(model_id)
+            return replace(entry) if entry is not None else None
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._entries.keys())
+
+    def __contains__(self, model_id: str) -> bool:
+        return model_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _calculate_priority(self, entry: ModelResidency) -> float:
+        return self._inflation + entry.hits * entry.load_time / max(entry.size_bytes, 1)
+
+
+def estimate_model_memory_footprint(model: Model) -> int:
+    """Estimates the memory held by a loaded model - size of weights (which dominates the
+    memory of ONNX session) plus the float32 input buffer for a single image."""
+    size_bytes = 0
+    try:
+        size_bytes += os.path.getsize(model.cache_file(model.weights_file))
+    except Exception as error:
+        logger.debug(f"Could not determine size of model weights: {error}")
+    img_size_h = getattr(model, "img_size_h", None)
+    img_size_w = getattr(model, "img_size_w", None)
+    if isinstance(img_size_h, int) and isinstance(img_size_w, int):
+        size_bytes += 3 * img_size_h * img_size_w * 4
+    return size_bytes
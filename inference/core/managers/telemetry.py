@@ -0,0 +1,188 @@
+import random
+import threading
+from collections import deque
+from typing import List, NamedTuple, Optional
+
+import supervision as sv
+
+from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.env import (
+    INFERENCE_TELEMETRY_BUFFER_SIZE,
+    INFERENCE_TELEMETRY_MODE,
+    INFERENCE_TELEMETRY_SAMPLE_RATE,
+)
+from inference.core.workflows.execution_engine.constants import IMAGE_DIMENSIONS_KEY
+
+FULL_TELEMETRY_MODE = "full"
+LIGHTWEIGHT_TELEMETRY_MODE = "lightweight"
+
+
+class InferenceTelemetryRecord(NamedTuple):
+    timestamp: float
+    inference_server_id: str
+    model_id: str
+    processing_time: float
+    inference_time: float
+    num_images: int
+    num_predictions: int
+    image_width: Optional[int]
+    image_height: Optional[int]
+    error: bool
+
+
+class InferenceTelemetryBuffer:
+    """Ring buffer of compact inference records - old records are overwritten once the buffer is full.
+
+    Args:
+        size (int): Max number of records kept in buffer.
+    """
+
+    def __init__(self, size: int = INFERENCE_TELEMETRY_BUFFER_SIZE):
+        self._records = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def append(self, record: InferenceTelemetryRecord) -> None:
+        with self._lock:
+            self._records.append(record)
+
+    def get_records(
+        self,
+        inference_server_id: Optional[str] = None,
+        model_id: Optional[str] = None,
+        min: float = -1,
+        max: float = float("inf"),
+    ) -> List[InferenceTelemetryRecord]:
+        with self._lock:
+            records = list(self._records)
+        return [
+            record
+            for record in records
+            if min <= record.timestamp <= max
+            and (
+                inference_server_id is None
+                or record.inference_server_id == inference_server_id
+            )
+            and (model_id is None or record.model_id == model_id)
+        ]
+
+    def summarize(
+        self,
+        inference_server_id: str,
+        model_id: str,
+        min: float = -1,
+        max: float = float("inf"),
+    ) -> dict:
+        """Returns metrics of the model in the same format as `get_model_metrics(...)`."""
+        records = self.get_records(
+            inference_server_id=inference_server_id, model_id=model_id, min=min, max=max
+        )
+        successful = [record for record in records if not record.error]
+        timed_images = sum(record.num_images for record in successful)
+        total_inference_time = sum(record.inference_time for record in successful)
+        return {
+            "num_inferences": len(successful),
+            "avg_inference_time": (
+                total_inference_time / timed_images if timed_images > 0 else 0
+            ),
+            "num_errors": len(records) - len(successful),
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+def build_telemetry_record(
+    inference_server_id: str,
+    model_id: str,
+    response: Optional[InferenceResponse],
+    start_time: float,
+    finish_time: float,
+) -> InferenceTelemetryRecord:
+    """Builds compact record of inference. Error record is created when `response` is None."""
+    if response is None:
+        return InferenceTelemetryRecord(
+            timestamp=finish_time,
+            inference_server_id=inference_server_id,
+            model_id=model_id,
+            processing_time=finish_time - start_time,
+            inference_time=0.0,
+            num_images=0,
+            num_predictions=0,
+            image_width=None,
+            image_height=None,
+            error=True,
+        )
+    responses = response if isinstance(response, list) else [response]
+    inference_time, num_images, num_predictions = 0.0, 0, 0
+    image_width, image_height = None, None
+    for single_response in responses:
+        if getattr(single_response, "time", None) is not None:
+            inference_time += single_response.time
+            num_images += 1
+        predictions = getattr(single_response, "predictions", None)
+        if predictions is not None:
+            num_predictions += len(predictions)
+        image = getattr(single_response, "image", None)
+        if image is not None and not isinstance(image, list):
+            image_width, image_height = image.width, image.height
+    return InferenceTelemetryRecord(
+        timestamp=finish_time,
+        inference_server_id=inference_server_id,
+        model_id=model_id,
+        processing_time=finish_time - start_time,
+        inference_time=inference_time,
+        num_images=num_images,
+        num_predictions=num_predictions,
+        image_width=image_width,
+        image_height=image_height,
+        error=False,
+    )
+
+
+def build_sv_detections_telemetry_record(
+    inference_server_id: str,
+    model_id: str,
+    detections: List[sv.Detections],
+    start_time: float,
+    finish_time: float,
+) -> InferenceTelemetryRecord:
+    """Builds compact record of inference which results were returned in form of `sv.Detections`."""
+    image_width, image_height = None, None
+    for image_detections in detections:
+        if len(image_detections) > 0 and IMAGE_DIMENSIONS_KEY in image_detections.data:
+            image_height, image_width = image_detections[IMAGE_DIMENSIONS_KEY][0]
+            image_height, image_width = int(image_height), int(image_width)
+    processing_time = finish_time - start_time
+    return InferenceTelemetryRecord(
+        timestamp=finish_time,
+        inference_server_id=inference_server_id,
+        model_id=model_id,
+        processing_time=processing_time,
+        inference_time=processing_time * len(detections),
+        num_images=len(detections),
+        num_predictions=sum(len(image_detections) for image_detections in detections),
+        image_width=image_width,
+        image_height=image_height,
+        error=False,
+    )
+
+
+def is_lightweight_telemetry_enabled() -> bool:
+    return INFERENCE_TELEMETRY_MODE == LIGHTWEIGHT_TELEMETRY_MODE
+
+
+def should_store_full_payload(sample_rate: Optional[float] = None) -> bool:
+    """Decides if full request / response payload should be stored - always in `full` telemetry mode,
+    for randomly sampled requests in `lightweight` mode."""
+    if not is_lightweight_telemetry_enabled():
+        return True
+    if sample_rate is None:
+        sample_rate = INFERENCE_TELEMETRY_SAMPLE_RATE
+    return random.random() < sample_rate
+
+
+telemetry_buffer = InferenceTelemetryBuffer()
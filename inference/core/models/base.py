@@ -1,12 +1,15 @@
 from time import perf_counter
-from typing import Any, List, Tuple, Union
+from typing import Any, Callable, List, Tuple, Union
 
 import numpy as np
+import supervision as sv
 
 from inference.core import logger
 from inference.core.entities.requests.inference import InferenceRequest
 from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.utils.detections import inference_response_to_sv_detections
+from inference.core.workflows.execution_engine.constants import INFERENCE_ID_KEY
 from inference.usage_tracking.collector import usage_collector
 
 
@@ -31,6 +34,21 @@ class BaseInference:
 
         return postprocessed
 
+    @usage_collector("model")
+    def infer_with_shared_predict(
+        self,
+        image: Any,
+        shared_predict: Callable[[np.ndarray], Tuple[np.ndarray, ...]],
+        **kwargs,
+    ) -> Any:
+        """Runs inference on given data, like `infer(...)`, but preprocessed input is passed
+        to `shared_predict(...)` (which may run a single forward pass for inputs of many
+        requests) instead of `predict(...)`.
+        """
+        preproc_image, returned_metadata = self.preprocess(image, **kwargs)
+        predicted_arrays = shared_predict(preproc_image)
+        return self.postprocess(predicted_arrays, returned_metadata, **kwargs)
+
     def preprocess(
         self, image: Any, **kwargs
     ) -> Tuple[np.ndarray, PreprocessReturnMetadata]:
@@ -84,6 +102,13 @@ class Model(BaseInference):
         clear_cache(): Clears any cache if necessary.
     """
 
+    # models which are able to build `sv.Detections` directly from postprocessed predictions
+    # (accepting `return_sv_detections` parameter of `infer(...)`)
+    sv_detections_supported = False
+    # models which outputs of `predict(...)` are all batch-first (i-th element of each output belongs
+    # to i-th input image) - only those may share forward pass with other requests (dynamic batching)
+    batch_first_predictions = False
+
     def log(self, m):
         """Prints the given message.
 
@@ -146,6 +171,40 @@ class Model(BaseInference):
 
         return responses
 
+    def infer_sv_detections_from_request(
+        self,
+        request: InferenceRequest,
+    ) -> List[sv.Detections]:
+        """
+        In-process counterpart of `infer_from_request(...)` for detection models, returning `sv.Detections`
+        for each input image (with class names, detection ids, parent ids, image dimensions and inference id
+        in `data`) instead of response objects.
+
+        Models with `sv_detections_supported` build detections directly from postprocessed arrays, skipping
+        creation and serialisation of response objects. For other models, responses of
+        `infer_from_request(...)` are converted.
+
+        Args:
+            request (InferenceRequest): The request object containing details for inference.
+
+        Returns:
+            List[sv.Detections]: Detections for each input image - also if the request contains single image.
+        """
+        if not self.sv_detections_supported:
+            responses = self.infer_from_request(request)
+            if not isinstance(responses, list):
+                responses = [responses]
+            return [
+                inference_response_to_sv_detections(response) for response in responses
+            ]
+        batch_of_detections = self.infer(
+            **request.dict(), return_image_dims=False, return_sv_detections=True
+        )
+        if request.id:
+            for detections in batch_of_detections:
+                detections[INFERENCE_ID_KEY] = np.array([request.id] * len(detections))
+        return batch_of_detections
+
     def make_response(
         self, *args, **kwargs
     ) -> Union[InferenceResponse, List[InferenceResponse]]:
@@ -38,6 +38,7 @@ class ClassificationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
     """
 
     task_type = "classification"
+    batch_first_predictions = True
 
     preprocess_means = [0.5, 0.5, 0.5]
     preprocess_stds = [0.5, 0.5, 0.5]
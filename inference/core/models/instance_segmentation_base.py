@@ -1,6 +1,7 @@
 from typing import Any, List, Tuple, Union
 
 import numpy as np
+import supervision as sv
 
 from inference.core.entities.responses.inference import (
     InferenceResponseImage,
@@ -11,16 +12,24 @@ from inference.core.entities.responses.inference import (
 from inference.core.exceptions import InvalidMaskDecodeArgument
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
 from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.utils.detections import (
+    attach_inference_metadata_to_sv_detections,
+    build_sv_detections,
+    polygons_to_masks,
+)
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
 from inference.core.nms import w_np_non_max_suppression
 from inference.core.utils.postprocess import (
+    mask_crops2poly,
     masks2poly,
     post_process_bboxes,
+    post_process_masks,
     post_process_polygons,
     process_mask_accurate,
     process_mask_fast,
+    process_mask_roi,
     process_mask_tradeoff,
 )
 
@@ -44,6 +53,8 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
 
     task_type = "instance-segmentation"
     num_masks = 32
+    sv_detections_supported = True
+    batch_first_predictions = True
 
     def infer(
         self,
@@ -60,6 +71,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
         max_detections: int = DEFAUlT_MAX_DETECTIONS,
         return_image_dims: bool = False,
         tradeoff_factor: float = DEFAULT_TRADEOFF_FACTOR,
+        return_sv_detections: bool = False,
         **kwargs,
     ) -> Union[PREDICTIONS_TYPE, Tuple[PREDICTIONS_TYPE, List[Tuple[int, int]]]]:
         """
@@ -71,7 +83,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             class_agnostic_nms (bool, optional): Whether to use class-agnostic non-maximum suppression. Defaults to False.
             confidence (float, optional): Confidence threshold for predictions. Defaults to 0.5.
             iou_threshold (float, optional): IoU threshold for non-maximum suppression. Defaults to 0.5.
-            mask_decode_mode (str, optional): Decoding mode for masks. Choices are "accurate", "tradeoff", and "fast". Defaults to "accurate".
+            mask_decode_mode (str, optional): Decoding mode for masks. Choices are "accurate", "tradeoff", "fast" and "roi" (results of "accurate" mode, with masks computed only within bounding boxes). Defaults to "accurate".
             max_candidates (int, optional): Maximum number of candidate detections. Defaults to 3000.
             max_detections (int, optional): Maximum number of detections after non-maximum suppression. Defaults to 300.
             return_image_dims (bool, optional): Whether to return the dimensions of the processed images. Defaults to False.
@@ -108,6 +120,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             max_detections=max_detections,
             return_image_dims=return_image_dims,
             tradeoff_factor=tradeoff_factor,
+            return_sv_detections=return_sv_detections,
         )
 
     def postprocess(
@@ -143,7 +156,12 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             if pred.size == 0:
                 masks.append([])
                 continue
-            if mask_decode_mode == "accurate":
+            if mask_decode_mode == "roi":
+                polys = mask_crops2poly(
+                    process_mask_roi(proto, pred[:, 7:], pred[:, :4], img_in_shape[2:])
+                )
+                output_mask_shape = img_in_shape[2:]
+            elif mask_decode_mode == "accurate":
                 batch_masks = process_mask_accurate(
                     proto, pred[:, 7:], pred[:, :4], img_in_shape[2:]
                 )
@@ -168,9 +186,8 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
                 output_mask_shape = batch_masks.shape[1:]
             else:
                 raise InvalidMaskDecodeArgument(
-                    f"Invalid mask_decode_mode: {mask_decode_mode}. Must be one of ['accurate', 'fast', 'tradeoff']"
+                    f"Invalid mask_decode_mode: {mask_decode_mode}. Must be one of ['accurate', 'fast', 'tradeoff', 'roi']"
                 )
-            polys = masks2poly(batch_masks)
             pred[:, :4] = post_process_bboxes(
                 [pred[:, :4]],
                 infer_shape,
@@ -181,6 +198,22 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
                     "disable_preproc_static_crop"
                 ],
             )[0]
+            if mask_decode_mode != "roi" and kwargs.get("return_sv_detections"):
+                # `sv.Detections` keep masks as decoded, instead of polygons traced from them
+                masks.append(
+                    post_process_masks(
+                        img_dim,
+                        batch_masks,
+                        self.preproc,
+                        resize_method=self.resize_method,
+                        disable_preproc_static_crop=preprocess_return_metadata[
+                            "disable_preproc_static_crop"
+                        ],
+                    )
+                )
+                continue
+            if mask_decode_mode != "roi":
+                polys = masks2poly(batch_masks)
             polys = post_process_polygons(
                 img_dim,
                 polys,
@@ -221,10 +254,12 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
         masks: List[List[List[float]]],
         img_dims: List[Tuple[int, int]],
         class_filter: List[str] = [],
+        return_sv_detections: bool = False,
         **kwargs,
     ) -> Union[
         InstanceSegmentationInferenceResponse,
         List[InstanceSegmentationInferenceResponse],
+        List[sv.Detections],
     ]:
         """
         Create instance segmentation inference response objects for the provided predictions and masks.
@@ -234,6 +269,7 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             masks (List[List[List[float]]]): List of masks corresponding to the predictions.
             img_dims (List[Tuple[int, int]]): List of image dimensions corresponding to the processed images.
             class_filter (List[str], optional): List of class names to filter predictions by. Defaults to an empty list (no filtering).
+            return_sv_detections (bool): If true, `sv.Detections` are returned instead of response objects.
 
         Returns:
             Union[InstanceSegmentationInferenceResponse, List[InstanceSegmentationInferenceResponse]]: A single instance segmentation response or a list of instance segmentation responses based on the number of processed images.
@@ -242,6 +278,8 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             - For each image, constructs an `InstanceSegmentationInferenceResponse` object.
             - Each response contains a list of `InstanceSegmentationPrediction` objects.
         """
+        if return_sv_detections:
+            return self.make_sv_detections(predictions, masks, img_dims, class_filter)
         responses = []
         for ind, (batch_predictions, batch_masks) in enumerate(zip(predictions, masks)):
             predictions = []
@@ -273,6 +311,77 @@ class InstanceSegmentationBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceMo
             responses.append(response)
         return responses
 
+    def make_sv_detections(
+        self,
+        predictions: List[List[List[float]]],
+        masks: List[Union[np.ndarray, List[List[float]]]],
+        img_dims: List[Tuple[int, int]],
+        class_filter: List[str] = [],
+    ) -> List[sv.Detections]:
+        """Constructs `sv.Detections` - with the same content as `make_response(...)` output converted into
+        detections, but without creating response objects. Masks decoded by `postprocess(...)` are used as they
+        are, only polygons (given in "roi" mask decoding mode) are rasterised.
+
+        Args:
+            predictions (List[List[List[float]]]): List of prediction data, one for each image.
+            masks (List[Union[np.ndarray, List[List[float]]]]): Masks of shape (N, height, width) or polygons
+                corresponding to the predictions, one entry for each image.
+            img_dims (List[Tuple[int, int]]): List of image dimensions corresponding to the processed images.
+            class_filter (List[str], optional): List of class names to filter predictions by. Defaults to an empty list (no filtering).
+
+        Returns:
+            List[sv.Detections]: Detections for each image.
+        """
+        results = []
+        for ind, (batch_predictions, batch_masks) in enumerate(zip(predictions, masks)):
+            accepted = [
+                idx
+                for idx, pred in enumerate(batch_predictions)
+                if not class_filter
+                or self.class_names[int(pred[6])] not in class_filter
+            ]
+            if isinstance(batch_masks, np.ndarray):
+                detections_masks = batch_masks[accepted]
+                # empty masks have no polygon, so they are rejected just as in responses
+                valid_indices = np.flatnonzero(detections_masks.any(axis=(1, 2)))
+                detections_masks = detections_masks[valid_indices]
+            else:
+                valid_indices, detections_masks = polygons_to_masks(
+                    polygons=[batch_masks[idx] for idx in accepted],
+                    image_dims=img_dims[ind],
+                )
+            rows = [batch_predictions[accepted[idx]] for idx in valid_indices]
+            results.append(
+                attach_inference_metadata_to_sv_detections(
+                    detections=self._batch_predictions_to_sv_detections(
+                        batch_predictions=rows, masks=detections_masks
+                    ),
+                    image_dims=img_dims[ind],
+                )
+            )
+        return results
+
+    def _batch_predictions_to_sv_detections(
+        self, batch_predictions: List[np.ndarray], masks: np.ndarray
+    ) -> sv.Detections:
+        if len(batch_predictions) == 0:
+            return build_sv_detections(*[np.empty(0)] * 6, class_names=self.class_names)
+        batch_predictions = np.stack(batch_predictions)
+        width = batch_predictions[:, 2] - batch_predictions[:, 0]
+        height = batch_predictions[:, 3] - batch_predictions[:, 1]
+        # the same arithmetic as in `make_response(...)` - where division of numpy scalar by python
+        # number promotes the result to float64 - for results to be identical
+        return build_sv_detections(
+            x=batch_predictions[:, 0] + width.astype(np.float64) / 2,
+            y=batch_predictions[:, 1] + height.astype(np.float64) / 2,
+            width=width,
+            height=height,
+            confidence=batch_predictions[:, 4],
+            class_id=batch_predictions[:, 6],
+            class_names=self.class_names,
+            mask=masks,
+        )
+
     def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
         """Runs inference on the ONNX model.
 
@@ -1,6 +1,7 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
+import supervision as sv
 
 from inference.core.entities.responses.inference import (
     InferenceResponseImage,
@@ -13,12 +14,24 @@ from inference.core.models.object_detection_base import (
     ObjectDetectionBaseOnnxRoboflowInferenceModel,
 )
 from inference.core.models.types import PreprocessReturnMetadata
-from inference.core.models.utils.keypoints import model_keypoints_to_response
+from inference.core.models.utils.detections import (
+    attach_inference_metadata_to_sv_detections,
+)
+from inference.core.models.utils.keypoints import (
+    model_keypoints_to_arrays,
+    model_keypoints_to_response,
+)
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
 from inference.core.nms import w_np_non_max_suppression
 from inference.core.utils.postprocess import post_process_bboxes, post_process_keypoints
+from inference.core.workflows.execution_engine.constants import (
+    KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS,
+    KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS,
+    KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS,
+    KEYPOINTS_XY_KEY_IN_SV_DETECTIONS,
+)
 
 DEFAULT_CONFIDENCE = 0.4
 DEFAULT_IOU_THRESH = 0.3
@@ -115,14 +128,16 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
         img_dims: List[Tuple[int, int]],
         class_filter: Optional[List[str]] = None,
         *args,
+        return_sv_detections: bool = False,
         **kwargs,
-    ) -> List[KeypointsDetectionInferenceResponse]:
+    ) -> Union[List[KeypointsDetectionInferenceResponse], List[sv.Detections]]:
         """Constructs object detection response objects based on predictions.
 
         Args:
             predictions (List[List[float]]): The list of predictions.
             img_dims (List[Tuple[int, int]]): Dimensions of the images.
             class_filter (Optional[List[str]]): A list of class names to filter, if provided.
+            return_sv_detections (bool): If true, `sv.Detections` are returned instead of response objects.
 
         Returns:
             List[KeypointsDetectionInferenceResponse]: A list of response objects containing keypoints detection predictions.
@@ -132,6 +147,13 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
         keypoint_confidence_threshold = 0.0
         if "request" in kwargs:
             keypoint_confidence_threshold = kwargs["request"].keypoint_confidence
+        if return_sv_detections:
+            return self.make_sv_detections(
+                predictions,
+                img_dims,
+                class_filter,
+                keypoint_confidence_threshold=keypoint_confidence_threshold,
+            )
         responses = [
             KeypointsDetectionInferenceResponse(
                 predictions=[
@@ -165,6 +187,60 @@ class KeypointsDetectionBaseOnnxRoboflowInferenceModel(
         ]
         return responses
 
+    def make_sv_detections(
+        self,
+        predictions: List[List[float]],
+        img_dims: List[Tuple[int, int]],
+        class_filter: Optional[List[str]] = None,
+        keypoint_confidence_threshold: float = 0.0,
+    ) -> List[sv.Detections]:
+        """Constructs `sv.Detections` with keypoints based on predictions - with the same content as
+        `make_response(...)` output converted into detections, but without creating response objects.
+
+        Args:
+            predictions (List[List[float]]): The list of predictions.
+            img_dims (List[Tuple[int, int]]): Dimensions of the images.
+            class_filter (Optional[List[str]]): A list of class names to filter, if provided.
+            keypoint_confidence_threshold (float): Keypoints with lower confidence are rejected.
+
+        Returns:
+            List[sv.Detections]: Detections for each image.
+        """
+        if isinstance(img_dims, dict) and "img_dims" in img_dims:
+            img_dims = img_dims["img_dims"]
+        results = []
+        for ind, batch_predictions in enumerate(predictions):
+            batch_predictions = self._filter_batch_predictions(
+                batch_predictions=batch_predictions, class_filter=class_filter
+            )
+            detections = attach_inference_metadata_to_sv_detections(
+                detections=self._batch_predictions_to_sv_detections(
+                    batch_predictions=batch_predictions
+                ),
+                image_dims=img_dims[ind],
+            )
+            keypoints = [
+                model_keypoints_to_arrays(
+                    keypoints_metadata=self.keypoints_metadata,
+                    keypoints=pred[7:],
+                    predicted_object_class_id=int(pred[6]),
+                    keypoint_confidence_threshold=keypoint_confidence_threshold,
+                )
+                for pred in batch_predictions
+            ]
+            for key, values in zip(
+                [
+                    KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS,
+                    KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS,
+                    KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS,
+                    KEYPOINTS_XY_KEY_IN_SV_DETECTIONS,
+                ],
+                zip(*keypoints) if keypoints else [[]] * 4,
+            ):
+                detections[key] = np.array(list(values), dtype="object")
+            results.append(detections)
+        return results
+
     def keypoints_count(self) -> int:
         raise NotImplementedError
 
@@ -1,6 +1,7 @@
 from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
+import supervision as sv
 
 from inference.core.env import (
     FIX_BATCH_SIZE,
@@ -26,6 +27,10 @@ from inference.core.models.defaults import (
 )
 from inference.core.models.roboflow import OnnxRoboflowInferenceModel
 from inference.core.models.types import PreprocessReturnMetadata
+from inference.core.models.utils.detections import (
+    attach_inference_metadata_to_sv_detections,
+    build_sv_detections,
+)
 from inference.core.models.utils.validate import (
     get_num_classes_from_model_prediction_shape,
 )
@@ -38,6 +43,8 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
 
     task_type = "object-detection"
     box_format = "xywh"
+    sv_detections_supported = True
+    batch_first_predictions = True
 
     def infer(
         self,
@@ -103,18 +110,22 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         img_dims: List[Tuple[int, int]],
         class_filter: Optional[List[str]] = None,
         *args,
+        return_sv_detections: bool = False,
         **kwargs,
-    ) -> List[ObjectDetectionInferenceResponse]:
+    ) -> Union[List[ObjectDetectionInferenceResponse], List[sv.Detections]]:
         """Constructs object detection response objects based on predictions.
 
         Args:
             predictions (List[List[float]]): The list of predictions.
             img_dims (List[Tuple[int, int]]): Dimensions of the images.
             class_filter (Optional[List[str]]): A list of class names to filter, if provided.
+            return_sv_detections (bool): If true, `sv.Detections` are returned instead of response objects.
 
         Returns:
             List[ObjectDetectionInferenceResponse]: A list of response objects containing object detection predictions.
         """
+        if return_sv_detections:
+            return self.make_sv_detections(predictions, img_dims, class_filter)
 
         if isinstance(img_dims, dict) and "img_dims" in img_dims:
             img_dims = img_dims["img_dims"]
@@ -149,6 +160,69 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
         ]
         return responses
 
+    def make_sv_detections(
+        self,
+        predictions: List[List[float]],
+        img_dims: List[Tuple[int, int]],
+        class_filter: Optional[List[str]] = None,
+    ) -> List[sv.Detections]:
+        """Constructs `sv.Detections` based on predictions - with the same content as `make_response(...)`
+        output converted into detections, but without creating response objects.
+
+        Args:
+            predictions (List[List[float]]): The list of predictions.
+            img_dims (List[Tuple[int, int]]): Dimensions of the images.
+            class_filter (Optional[List[str]]): A list of class names to filter, if provided.
+
+        Returns:
+            List[sv.Detections]: Detections for each image.
+        """
+        if isinstance(img_dims, dict) and "img_dims" in img_dims:
+            img_dims = img_dims["img_dims"]
+        predictions = predictions[: len(img_dims)]
+        return [
+            attach_inference_metadata_to_sv_detections(
+                detections=self._batch_predictions_to_sv_detections(
+                    batch_predictions=self._filter_batch_predictions(
+                        batch_predictions=batch_predictions, class_filter=class_filter
+                    ),
+                ),
+                image_dims=img_dims[ind],
+            )
+            for ind, batch_predictions in enumerate(predictions)
+        ]
+
+    def _filter_batch_predictions(
+        self, batch_predictions: List[List[float]], class_filter: Optional[List[str]]
+    ) -> np.ndarray:
+        batch_predictions = np.asarray(batch_predictions)
+        if len(batch_predictions) == 0:
+            return batch_predictions.reshape((0, 7))
+        if not class_filter:
+            return batch_predictions
+        accepted = [
+            self.class_names[int(class_id)] in class_filter
+            for class_id in batch_predictions[:, 6]
+        ]
+        return batch_predictions[np.array(accepted, dtype=bool)]
+
+    def _batch_predictions_to_sv_detections(
+        self, batch_predictions: np.ndarray
+    ) -> sv.Detections:
+        x_sum = batch_predictions[:, 0] + batch_predictions[:, 2]
+        y_sum = batch_predictions[:, 1] + batch_predictions[:, 3]
+        # the same arithmetic as in `make_response(...)` - where division of numpy scalar by python
+        # number promotes the result to float64 - for results to be identical
+        return build_sv_detections(
+            x=x_sum.astype(np.float64) / 2,
+            y=y_sum.astype(np.float64) / 2,
+            width=batch_predictions[:, 2] - batch_predictions[:, 0],
+            height=batch_predictions[:, 3] - batch_predictions[:, 1],
+            confidence=batch_predictions[:, 4],
+            class_id=batch_predictions[:, 6],
+            class_names=self.class_names,
+        )
+
     def postprocess(
         self,
         predictions: Tuple[np.ndarray, ...],
@@ -256,7 +330,10 @@ class ObjectDetectionBaseOnnxRoboflowInferenceModel(OnnxRoboflowInferenceModel):
             else:
                 height_padding = 0
 
-            if isinstance(img_in, np.ndarray):
+            if batch_padding == width_padding == height_padding == 0:
+                # input is already aligned - padding would only copy it
+                pass
+            elif isinstance(img_in, np.ndarray):
                 img_in = np.pad(
                     img_in,
                     (
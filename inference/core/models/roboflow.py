@@ -4,9 +4,10 @@ import os
 import random
 from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from functools import partial
 from time import perf_counter
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, ContextManager, Dict, List, Optional, Tuple, Union
 
 import cv2
 import numpy as np
@@ -25,6 +26,7 @@ from inference.core.env import (
     LAMBDA,
     MAX_BATCH_SIZE,
     MODEL_CACHE_DIR,
+    MODEL_INPUT_BUFFERS_REUSE_ENABLED,
     MODEL_VALIDATION_DISABLED,
     ONNXRUNTIME_EXECUTION_PROVIDERS,
     REQUIRED_ONNX_PROVIDERS,
@@ -58,6 +60,7 @@ from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.exceptions import ModelArtefactError, OnnxProviderNotAvailable
 from inference.core.models.base import Model
 from inference.core.models.utils.batching import create_batches
+from inference.core.models.utils.input_buffers import ModelInputBuffers
 from inference.core.models.utils.onnx import has_trt
 from inference.core.roboflow_api import (
     ModelEndpointType,
@@ -65,9 +68,16 @@ from inference.core.roboflow_api import (
     get_roboflow_instant_model_data,
     get_roboflow_model_data,
 )
+from inference.core.utils.image_representations import (
+    get_attached_representations_cache,
+)
 from inference.core.utils.image_utils import load_image
-from inference.core.utils.onnx import get_onnxruntime_execution_providers
-from inference.core.utils.preprocess import letterbox_image, prepare
+from inference.core.utils.onnx import ImageMetaType, get_onnxruntime_execution_providers
+from inference.core.utils.preprocess import (
+    letterbox_image,
+    prepare,
+    resize_image_into_buffer,
+)
 from inference.core.utils.roboflow import get_model_id_chunks
 from inference.core.utils.visualisation import draw_detection_predictions
 from inference.models.aliases import resolve_roboflow_model_alias
@@ -102,6 +112,12 @@ DEFAULT_COLOR_PALETTE = [
     "#8C29FF",
 ]
 
+LETTERBOX_COLORS = {
+    "Fit (black edges) in": (0, 0, 0),
+    "Fit (white edges) in": (255, 255, 255),
+    "Fit (grey edges) in": (114, 114, 114),
+}
+
 
 class RoboflowInferenceModel(Model):
     """Base Roboflow inference model."""
@@ -431,6 +447,7 @@ class RoboflowInferenceModel(Model):
         disable_preproc_contrast: bool = False,
         disable_preproc_grayscale: bool = False,
         disable_preproc_static_crop: bool = False,
+        out: Optional[np.ndarray] = None,
     ) -> Tuple[np.ndarray, Tuple[int, int]]:
         """
         Preprocesses an inference request image by loading it, then applying any pre-processing specified by the Roboflow platform, then scaling it to the inference input dimensions.
@@ -441,6 +458,7 @@ class RoboflowInferenceModel(Model):
             disable_preproc_contrast (bool, optional): If true, the contrast preprocessing step is disabled for this call. Default is False.
             disable_preproc_grayscale (bool, optional): If true, the grayscale preprocessing step is disabled for this call. Default is False.
             disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+            out (Optional[np.ndarray], optional): Buffer of shape (1, 3, img_size_h, img_size_w) the result should be written into. Default is None.
 
         Returns:
             Tuple[np.ndarray, Tuple[int, int]]: A tuple containing a numpy array of the preprocessed image pixel data and a tuple of the images original size.
@@ -451,6 +469,63 @@ class RoboflowInferenceModel(Model):
             or "auto-orient" not in self.preproc.keys()
             or DISABLE_PREPROC_AUTO_ORIENT,
         )
+        representations_cache = (
+            get_attached_representations_cache(image=np_image)
+            if not USE_PYTORCH_FOR_PREPROCESSING
+            else None
+        )
+        if representations_cache is None:
+            return self._preproc_loaded_image(
+                np_image=np_image,
+                is_bgr=is_bgr,
+                disable_preproc_contrast=disable_preproc_contrast,
+                disable_preproc_grayscale=disable_preproc_grayscale,
+                disable_preproc_static_crop=disable_preproc_static_crop,
+                out=out,
+            )
+        # image is shared with other workflow steps - model input computed once for given
+        # pre-processing is re-used by all models sharing it
+        representation_key = (
+            "model_input",
+            type(self).preprocess_image,
+            type(self).resize_to_model_input,
+            json.dumps(self.preproc, sort_keys=True),
+            self.resize_method,
+            self.img_size_h,
+            self.img_size_w,
+            is_bgr,
+            disable_preproc_contrast,
+            disable_preproc_grayscale,
+            disable_preproc_static_crop,
+        )
+        img_in, img_dims = representations_cache.get_or_compute(
+            key=representation_key,
+            compute=lambda: self._preproc_loaded_image(
+                np_image=np_image,
+                is_bgr=is_bgr,
+                disable_preproc_contrast=disable_preproc_contrast,
+                disable_preproc_grayscale=disable_preproc_grayscale,
+                disable_preproc_static_crop=disable_preproc_static_crop,
+                out=None,
+                copy_if_shares_memory=True,
+            ),
+        )
+        # cached input is shared, while models normalise their input in-place
+        if out is not None and out.shape == img_in.shape:
+            np.copyto(out, img_in)
+            return out, img_dims
+        return img_in.copy(), img_dims
+
+    def _preproc_loaded_image(
+        self,
+        np_image: np.ndarray,
+        is_bgr: bool,
+        disable_preproc_contrast: bool,
+        disable_preproc_grayscale: bool,
+        disable_preproc_static_crop: bool,
+        out: Optional[np.ndarray],
+        copy_if_shares_memory: bool = False,
+    ) -> Tuple[np.ndarray, Tuple[int, int]]:
         preprocessed_image, img_dims = self.preprocess_image(
             np_image,
             disable_preproc_contrast=disable_preproc_contrast,
@@ -468,39 +543,76 @@ class RoboflowInferenceModel(Model):
                 preprocessed_image.permute(2, 0, 1).unsqueeze(0).contiguous().float()
             )
 
+        img_in = self.resize_to_model_input(preprocessed_image, is_bgr=is_bgr, out=out)
+        if copy_if_shares_memory and np.may_share_memory(img_in, np_image):
+            img_in = img_in.copy()
+        return img_in, img_dims
+
+    def resize_to_model_input(
+        self,
+        image: ImageMetaType,
+        is_bgr: bool,
+        out: Optional[np.ndarray] = None,
+    ) -> ImageMetaType:
+        """
+        Scales preprocessed image to the inference input dimensions (according to the resize method of the model) and converts it into RGB, channels-first batch of one image.
+
+        Args:
+            image (ImageMetaType): Preprocessed image (HWC numpy array or NCHW torch tensor).
+            is_bgr (bool): Flag to indicate that channels of the image are in BGR order.
+            out (Optional[np.ndarray], optional): Buffer of shape (1, 3, img_size_h, img_size_w) the result is written into (numpy images only) - without intermediate copies of the image. Default is None.
+
+        Returns:
+            ImageMetaType: Model input of shape (1, 3, img_size_h, img_size_w).
+        """
+        if (
+            out is not None
+            and isinstance(image, np.ndarray)
+            and (
+                self.resize_method == "Stretch to"
+                or self.resize_method in LETTERBOX_COLORS
+            )
+        ):
+            resize_image_into_buffer(
+                image,
+                out=out[0],
+                keep_aspect_ratio=self.resize_method in LETTERBOX_COLORS,
+                color=LETTERBOX_COLORS.get(self.resize_method, (0, 0, 0)),
+                bgr_to_rgb=is_bgr,
+            )
+            return out
+
         if self.resize_method == "Stretch to":
-            if isinstance(preprocessed_image, np.ndarray):
-                preprocessed_image = preprocessed_image.astype(np.float32)
+            if isinstance(image, np.ndarray):
+                image = image.astype(np.float32)
                 resized = cv2.resize(
-                    preprocessed_image,
+                    image,
                     (self.img_size_w, self.img_size_h),
                 )
             elif USE_PYTORCH_FOR_PREPROCESSING:
                 resized = torch.nn.functional.interpolate(
-                    preprocessed_image,
+                    image,
                     size=(self.img_size_h, self.img_size_w),
                     mode="bilinear",
                 )
             else:
                 raise ValueError(
-                    f"Received an image of unknown type, {type(preprocessed_image)}; "
+                    f"Received an image of unknown type, {type(image)}; "
                     "This is most likely a bug. Contact Roboflow team through github issues "
                     "(https://github.com/roboflow/inference/issues) providing full context of the problem"
                 )
 
         elif self.resize_method == "Fit (black edges) in":
-            resized = letterbox_image(
-                preprocessed_image, (self.img_size_w, self.img_size_h)
-            )
+            resized = letterbox_image(image, (self.img_size_w, self.img_size_h))
         elif self.resize_method == "Fit (white edges) in":
             resized = letterbox_image(
-                preprocessed_image,
+                image,
                 (self.img_size_w, self.img_size_h),
                 color=(255, 255, 255),
             )
         elif self.resize_method == "Fit (grey edges) in":
             resized = letterbox_image(
-                preprocessed_image,
+                image,
                 (self.img_size_w, self.img_size_h),
                 color=(114, 114, 114),
             )
@@ -524,7 +636,7 @@ class RoboflowInferenceModel(Model):
                 "(https://github.com/roboflow/inference/issues) providing full context of the problem"
             )
 
-        return img_in, img_dims
+        return img_in
 
     def preprocess_image(
         self,
@@ -711,6 +823,7 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
 
         self.initialize_model()
         self.image_loader_threadpool = ThreadPoolExecutor(max_workers=None)
+        self.input_buffers = ModelInputBuffers()
         try:
             self.validate_model()
         except ModelArtefactError as e:
@@ -726,23 +839,40 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
         - image:
             can be a BGR numpy array, filepath, InferenceRequestImage, PIL Image, byte-string, etc.
         """
+        batches = self.split_into_batches(image)
+        if len(batches) == 1:
+            with self._reuse_input_buffers():
+                return super().infer(batches[0], **kwargs)
+        inference_results = []
+        for batch_input in batches:
+            with self._reuse_input_buffers():
+                batch_inference_results = super().infer(batch_input, **kwargs)
+            inference_results.append(batch_inference_results)
+        return self.merge_inference_results(inference_results=inference_results)
+
+    def split_into_batches(self, image: Any) -> List[Any]:
+        """Splits the input into batches not larger than the maximum batch size of the model.
+        Single image (or any input when batch size is not limited) is returned as the only batch.
+        """
         input_elements = len(image) if isinstance(image, list) else 1
         max_batch_size = MAX_BATCH_SIZE if self.batching_enabled else self.batch_size
         if (input_elements == 1) or (max_batch_size == float("inf")):
-            return super().infer(image, **kwargs)
+            return [image]
         logger.debug(
             f"Inference will be executed in batches, as there is {input_elements} input elements and "
             f"maximum batch size for a model is set to: {max_batch_size}"
         )
-        inference_results = []
-        for batch_input in create_batches(sequence=image, batch_size=max_batch_size):
-            batch_inference_results = super().infer(batch_input, **kwargs)
-            inference_results.append(batch_inference_results)
-        return self.merge_inference_results(inference_results=inference_results)
+        return list(create_batches(sequence=image, batch_size=max_batch_size))
 
     def merge_inference_results(self, inference_results: List[Any]) -> Any:
         return list(itertools.chain(*inference_results))
 
+    def _reuse_input_buffers(self) -> ContextManager[None]:
+        input_buffers = getattr(self, "input_buffers", None)
+        if not MODEL_INPUT_BUFFERS_REUSE_ENABLED or input_buffers is None:
+            return nullcontext()
+        return input_buffers.reuse()
+
     def validate_model(self) -> None:
         if MODEL_VALIDATION_DISABLED:
             logger.debug("Model validation disabled.")
@@ -924,6 +1054,9 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
         disable_preproc_grayscale: bool = False,
         disable_preproc_static_crop: bool = False,
     ) -> Tuple[np.ndarray, Tuple[Tuple[int, int], ...]]:
+        input_buffer = self._acquire_input_buffer(
+            batch_size=len(image) if isinstance(image, list) else 1
+        )
         if isinstance(image, list) and len(image) > 1:
             preproc_image = partial(
                 self.preproc_image,
@@ -932,9 +1065,21 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                 disable_preproc_grayscale=disable_preproc_grayscale,
                 disable_preproc_static_crop=disable_preproc_static_crop,
             )
-            imgs_with_dims = self.image_loader_threadpool.map(preproc_image, image)
+            if input_buffer is not None:
+                # each image is written directly into its slot of the batch buffer
+                images_slots = [input_buffer[i : i + 1] for i in range(len(image))]
+                imgs_with_dims = self.image_loader_threadpool.map(
+                    lambda args: preproc_image(args[0], out=args[1]),
+                    zip(image, images_slots),
+                )
+            else:
+                imgs_with_dims = self.image_loader_threadpool.map(preproc_image, image)
             imgs, img_dims = zip(*imgs_with_dims)
-            if isinstance(imgs[0], np.ndarray):
+            if input_buffer is not None and all(
+                img is slot for img, slot in zip(imgs, images_slots)
+            ):
+                img_in = input_buffer
+            elif isinstance(imgs[0], np.ndarray):
                 img_in = np.concatenate(imgs, axis=0)
             elif USE_PYTORCH_FOR_PREPROCESSING:
                 img_in = torch.cat(imgs, dim=0)
@@ -953,10 +1098,20 @@ class OnnxRoboflowInferenceModel(RoboflowInferenceModel):
                 disable_preproc_contrast=disable_preproc_contrast,
                 disable_preproc_grayscale=disable_preproc_grayscale,
                 disable_preproc_static_crop=disable_preproc_static_crop,
+                out=input_buffer,
             )
             img_dims = (img_dims,)
         return img_in, img_dims
 
+    def _acquire_input_buffer(self, batch_size: int) -> Optional[np.ndarray]:
+        if USE_PYTORCH_FOR_PREPROCESSING or not hasattr(self, "input_buffers"):
+            return None
+        if not isinstance(self.img_size_h, int) or not isinstance(self.img_size_w, int):
+            return None
+        return self.input_buffers.acquire(
+            shape=(batch_size, 3, self.img_size_h, self.img_size_w)
+        )
+
     @property
     def weights_file(self) -> str:
         """Returns the file containing the ONNX model weights.
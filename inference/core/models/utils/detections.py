@@ -0,0 +1,114 @@
+import uuid
+from typing import List, Optional, Tuple
+
+import numpy as np
+import supervision as sv
+from supervision.config import CLASS_NAME_DATA_FIELD
+
+from inference.core.entities.responses.inference import InferenceResponse
+from inference.core.workflows.execution_engine.constants import (
+    DETECTION_ID_KEY,
+    IMAGE_DIMENSIONS_KEY,
+    INFERENCE_ID_KEY,
+    PARENT_ID_KEY,
+)
+
+
+def build_sv_detections(
+    x: np.ndarray,
+    y: np.ndarray,
+    width: np.ndarray,
+    height: np.ndarray,
+    confidence: np.ndarray,
+    class_id: np.ndarray,
+    class_names: List[str],
+    mask: Optional[np.ndarray] = None,
+) -> sv.Detections:
+    """Builds `sv.Detections` from boxes given as centers and sizes - the way boxes are represented in
+    inference responses. Arithmetic matches `sv.Detections.from_inference(...)` applied to a response,
+    such that both ways of building detections give identical coordinates.
+    """
+    if len(x) == 0:
+        detections = sv.Detections.empty()
+        detections.data = {CLASS_NAME_DATA_FIELD: np.empty(0)}
+        return detections
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    width = np.asarray(width, dtype=np.float64)
+    height = np.asarray(height, dtype=np.float64)
+    x_min = x - width / 2
+    y_min = y - height / 2
+    class_id = np.asarray(class_id).astype(int)
+    return sv.Detections(
+        xyxy=np.stack([x_min, y_min, x_min + width, y_min + height], axis=1),
+        confidence=np.asarray(confidence, dtype=np.float64),
+        class_id=class_id,
+        mask=mask,
+        data={
+            CLASS_NAME_DATA_FIELD: np.array(
+                [class_names[class_idx] for class_idx in class_id]
+            )
+        },
+    )
+
+
+def polygons_to_masks(
+    polygons: List[np.ndarray], image_dims: Tuple[int, int]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Rasterises polygons into binary masks of image size.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Indices of polygons which could be rasterised (polygons with less
+            than 3 vertices are rejected) and masks for those polygons.
+    """
+    height, width = image_dims
+    valid_indices, masks = [], []
+    for idx, polygon in enumerate(polygons):
+        if len(polygon) < 3:
+            continue
+        polygon = np.asarray(polygon)[:, :2].astype(int)
+        masks.append(
+            sv.polygon_to_mask(polygon, resolution_wh=(int(width), int(height)))
+        )
+        valid_indices.append(idx)
+    return np.array(valid_indices, dtype=int), np.array(masks, dtype=bool)
+
+
+def attach_inference_metadata_to_sv_detections(
+    detections: sv.Detections,
+    image_dims: Tuple[int, int],
+    inference_id: Optional[str] = None,
+    detection_ids: Optional[List[str]] = None,
+    parent_ids: Optional[List[str]] = None,
+) -> sv.Detections:
+    """Adds detection ids, parent ids, image dimensions and inference id to detections - the same
+    metadata Workflows attach when converting inference responses into `sv.Detections`.
+    """
+    if detection_ids is None:
+        detection_ids = [str(uuid.uuid4()) for _ in range(len(detections))]
+    if parent_ids is None:
+        parent_ids = [""] * len(detections)
+    height, width = image_dims
+    detections[DETECTION_ID_KEY] = np.array(detection_ids)
+    detections[PARENT_ID_KEY] = np.array(parent_ids)
+    detections[IMAGE_DIMENSIONS_KEY] = np.array([[height, width]] * len(detections))
+    if inference_id is not None:
+        detections[INFERENCE_ID_KEY] = np.array([inference_id] * len(detections))
+    return detections
+
+
+def inference_response_to_sv_detections(response: InferenceResponse) -> sv.Detections:
+    """Converts object detection or instance segmentation response into `sv.Detections`, preserving
+    detection ids, parent ids and inference id of the response."""
+    serialised = response.model_dump(by_alias=True, exclude_none=True)
+    detections = sv.Detections.from_inference(serialised)
+    return attach_inference_metadata_to_sv_detections(
+        detections=detections,
+        image_dims=(serialised["image"]["height"], serialised["image"]["width"]),
+        inference_id=serialised.get(INFERENCE_ID_KEY),
+        detection_ids=[
+            p.get(DETECTION_ID_KEY, str(uuid.uuid4()))
+            for p in serialised["predictions"]
+        ],
+        parent_ids=[p.get(PARENT_ID_KEY, "") for p in serialised["predictions"]],
+    )
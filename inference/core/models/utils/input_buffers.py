@@ -0,0 +1,43 @@
+import threading
+from contextlib import contextmanager
+from typing import Generator, Optional, Tuple
+
+import numpy as np
+
+
+class ModelInputBuffers:
+    """Per-thread, reusable float32 buffers the model input batches are written into, so that
+    preprocessing does not allocate new input tensor for each inference.
+
+    Buffer may only be handed out within the `reuse()` scope - which covers a single
+    `preprocess -> predict -> postprocess` cycle executed by the thread - and only once per scope.
+    Outside of it (for instance when `preprocess(...)` is called directly and its result is kept
+    by the caller), `acquire(...)` returns None and the caller is expected to allocate a new array.
+    Buffers grow to the largest batch seen by the thread and are released with the model.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    @contextmanager
+    def reuse(self) -> Generator[None, None, None]:
+        if getattr(self._local, "active", False):
+            # nested inference executed by the same thread - input of outer call must stay intact
+            yield None
+            return None
+        self._local.active, self._local.leased = True, False
+        try:
+            yield None
+        finally:
+            self._local.active, self._local.leased = False, False
+
+    def acquire(self, shape: Tuple[int, ...]) -> Optional[np.ndarray]:
+        if not getattr(self._local, "active", False) or self._local.leased:
+            return None
+        self._local.leased = True
+        size = int(np.prod(shape))
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None or buffer.size < size:
+            buffer = np.empty(size, dtype=np.float32)
+            self._local.buffer = buffer
+        return buffer[:size].reshape(shape)
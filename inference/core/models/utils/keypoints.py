@@ -1,4 +1,6 @@
-from typing import List
+from typing import List, Tuple
+
+import numpy as np
 
 from inference.core.entities.responses.inference import Keypoint
 from inference.core.exceptions import ModelArtefactError
@@ -39,3 +41,38 @@ def model_keypoints_to_response(
         )
         results.append(keypoint)
     return results
+
+
+def model_keypoints_to_arrays(
+    keypoints_metadata: dict,
+    keypoints: np.ndarray,
+    predicted_object_class_id: int,
+    keypoint_confidence_threshold: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Array-based counterpart of `model_keypoints_to_response(...)`.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Class names, class ids, confidences and
+            xy coordinates of keypoints - in the format used by Workflows to store keypoints in `sv.Detections`.
+    """
+    if keypoints_metadata is None:
+        raise ModelArtefactError("Keypoints metadata not available.")
+    keypoint_id2name = keypoints_metadata[predicted_object_class_id]
+    keypoints_count = min(len(keypoints) // 3, len(keypoint_id2name))
+    keypoints = np.asarray(keypoints)[: 3 * keypoints_count].reshape((-1, 3))
+    keypoint_ids = np.flatnonzero(~(keypoints[:, 2] < keypoint_confidence_threshold))
+    if len(keypoint_ids) == 0:
+        return (
+            np.array([]),
+            np.array([]),
+            np.array([], dtype=np.float32),
+            np.array([], dtype=np.float32),
+        )
+    return (
+        np.array(
+            [keypoint_id2name[keypoint_id] for keypoint_id in keypoint_ids.tolist()]
+        ),
+        np.array(keypoint_ids.tolist()),
+        keypoints[keypoint_ids, 2].astype(np.float32),
+        keypoints[keypoint_ids, :2].astype(np.float32),
+    )
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 
 import numpy as np
 
@@ -13,9 +13,15 @@ def w_np_non_max_suppression(
     timeout_seconds: Optional[int] = None,
     num_masks: int = 0,
     box_format: str = "xywh",
-):
+) -> List[np.ndarray]:
     """Applies non-maximum suppression to predictions.
 
+    All images of the batch and all classes are processed at once - candidates are
+    assigned to suppression groups (image, or image and class when NMS is class-aware)
+    and the greedy suppression advances every group in lockstep, so the number of
+    Python-level iterations is bounded by the largest number of detections kept in a
+    single group, not by the number of classes or images.
+
     Args:
         prediction (np.ndarray): Array of predictions. Format for single prediction is
             [bbox x 4, max_class_confidence, (confidence) x num_of_classes, additional_element x num_masks]
@@ -23,130 +29,152 @@ def w_np_non_max_suppression(
         iou_thresh (float, optional): IOU threshold. Defaults to 0.45.
         class_agnostic (bool, optional): Whether to ignore class labels. Defaults to False.
         max_detections (int, optional): Maximum number of detections. Defaults to 300.
-        max_candidate_detections (int, optional): Maximum number of candidate detections. Defaults to 3000.
+        max_candidate_detections (int, optional): Maximum number of candidate detections (per image) entering
+            suppression, candidates with highest confidence are kept. Defaults to 3000.
         timeout_seconds (Optional[int], optional): Timeout in seconds. Defaults to None.
         num_masks (int, optional): Number of masks. Defaults to 0.
         box_format (str, optional): Format of bounding boxes. Either 'xywh' or 'xyxy'. Defaults to 'xywh'.
 
     Returns:
-        list: List of filtered predictions after non-maximum suppression. Format of a single result is:
+        List[np.ndarray]: List of arrays (one for each image) with filtered predictions after non-maximum
+            suppression, sorted by confidence. Format of a single result row is:
             [bbox x 4, max_class_confidence, max_class_confidence, id_of_class_with_max_confidence,
             additional_element x num_masks]
     """
-    num_classes = prediction.shape[2] - 5 - num_masks
-
-    if box_format == "xywh":
-        pred_view = prediction[:, :, :4]
-
-        # Calculate all values without allocating a new array
-        x1 = pred_view[:, :, 0] - pred_view[:, :, 2] / 2
-        y1 = pred_view[:, :, 1] - pred_view[:, :, 3] / 2
-        x2 = pred_view[:, :, 0] + pred_view[:, :, 2] / 2
-        y2 = pred_view[:, :, 1] + pred_view[:, :, 3] / 2
-
-        # Assign directly to the view
-        pred_view[:, :, 0] = x1
-        pred_view[:, :, 1] = y1
-        pred_view[:, :, 2] = x2
-        pred_view[:, :, 3] = y2
-    elif box_format != "xyxy":
+    if box_format not in {"xywh", "xyxy"}:
         raise ValueError(
             "box_format must be either 'xywh' or 'xyxy', got {}".format(box_format)
         )
+    batch_size = prediction.shape[0]
+    num_classes = prediction.shape[2] - 5 - num_masks
+    output_width = 7 + num_masks
+    empty_result = [np.zeros((0, output_width)) for _ in range(batch_size)]
+    if num_classes <= 0:
+        return empty_result
+
+    image_ids, anchor_ids = np.nonzero(prediction[:, :, 4] >= conf_thresh)
+    if image_ids.size == 0:
+        return empty_result
+    confidence = prediction[image_ids, anchor_ids, 4]
+    if max_candidate_detections is not None:
+        candidates = select_top_k_per_group(
+            group_ids=image_ids, scores=confidence, k=max_candidate_detections
+        )
+        image_ids, anchor_ids = image_ids[candidates], anchor_ids[candidates]
+        confidence = confidence[candidates]
+
+    candidates = prediction[image_ids, anchor_ids]
+    class_confidences = candidates[:, 5 : num_classes + 5]
+    class_ids = np.argmax(class_confidences, axis=1)
+    class_confidence = np.take_along_axis(
+        class_confidences, class_ids[:, None], axis=1
+    )[:, 0]
+    boxes = candidates[:, :4].astype(np.float64)
+    if box_format == "xywh":
+        boxes = xywh_to_xyxy(boxes)
+
+    if class_agnostic:
+        group_ids = image_ids
+    else:
+        group_ids = image_ids.astype(np.int64) * num_classes + class_ids
+    kept = grouped_non_max_suppression(
+        boxes=boxes,
+        scores=confidence,
+        group_ids=group_ids,
+        iou_thresh=iou_thresh,
+        max_kept_per_group=max_detections,
+    )
+
+    kept = kept[np.lexsort((-confidence[kept], image_ids[kept]))]
+    kept = kept[rank_within_groups(sorted_group_ids=image_ids[kept]) < max_detections]
+    detections = np.empty((kept.size, output_width), dtype=np.float64)
+    detections[:, :4] = boxes[kept]
+    detections[:, 4] = confidence[kept]
+    detections[:, 5] = class_confidence[kept]
+    detections[:, 6] = class_ids[kept]
+    if num_masks > 0:
+        detections[:, 7:] = candidates[kept, 5 + num_classes :]
+    split_points = np.searchsorted(image_ids[kept], np.arange(1, batch_size))
+    return np.split(detections, split_points)
+
+
+def xywh_to_xyxy(boxes: np.ndarray) -> np.ndarray:
+    half_wh = boxes[:, 2:4] / 2
+    return np.concatenate([boxes[:, :2] - half_wh, boxes[:, :2] + half_wh], axis=1)
+
+
+def rank_within_groups(sorted_group_ids: np.ndarray) -> np.ndarray:
+    """Returns position of each element within its group, given group ids sorted in a way
+    that elements of each group are contiguous."""
+    if sorted_group_ids.size == 0:
+        return np.zeros((0,), dtype=np.int64)
+    positions = np.arange(sorted_group_ids.size)
+    is_group_start = np.empty(sorted_group_ids.size, dtype=bool)
+    is_group_start[0] = True
+    np.not_equal(sorted_group_ids[1:], sorted_group_ids[:-1], out=is_group_start[1:])
+    group_starts = np.maximum.accumulate(np.where(is_group_start, positions, 0))
+    return positions - group_starts
+
+
+def select_top_k_per_group(
+    group_ids: np.ndarray, scores: np.ndarray, k: int
+) -> np.ndarray:
+    """Returns indices of (at most) `k` elements with highest score in each group."""
+    if np.bincount(group_ids).max() <= k:
+        return np.arange(group_ids.size)
+    order = np.lexsort((-scores, group_ids))
+    return np.sort(order[rank_within_groups(sorted_group_ids=group_ids[order]) < k])
+
+
+def grouped_non_max_suppression(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    group_ids: np.ndarray,
+    iou_thresh: float,
+    max_kept_per_group: Optional[int] = None,
+) -> np.ndarray:
+    """Greedy non-maximum suppression run independently for each group of boxes.
+
+    Boxes are ordered by (group, descending score). In every step the best remaining
+    box of each group is kept and compared (vectorised, for all groups at once) against
+    the remaining boxes of its own group, suppressing the overlapping ones. The overlap
+    measure is the same as in `non_max_suppression_fast(...)`.
 
-    batch_predictions = []
-
-    # Pre-allocate space for class confidence and class prediction arrays
-    cls_confs_shape = (prediction.shape[1], 1)
-
-    for np_image_i, np_image_pred in enumerate(prediction):
-        np_conf_mask = np_image_pred[:, 4] >= conf_thresh
-        if not np.any(np_conf_mask):  # Quick check if no boxes pass threshold
-            batch_predictions.append([])
-            continue
-
-        np_image_pred = np_image_pred[np_conf_mask]
-
-        # Handle empty case after filtering
-        if np_image_pred.shape[0] == 0:
-            batch_predictions.append([])
-            continue
-
-        cls_confs = np_image_pred[:, 5 : num_classes + 5]
-
-        # Check for empty classes after slicing
-        if cls_confs.shape[1] == 0:
-            batch_predictions.append([])
-            continue
-
-        np_class_conf = np.max(cls_confs, axis=1, keepdims=True)
-        np_class_pred = np.argmax(cls_confs, axis=1, keepdims=True)
-        # Extract mask predictions if any
-        if num_masks > 0:
-            np_mask_pred = np_image_pred[:, 5 + num_classes :]
-            # Construct final detections array directly
-            np_detections = np.concatenate(
-                [
-                    np_image_pred[:, :5],
-                    np_class_conf,
-                    np_class_pred.astype(np.float32),
-                    np_mask_pred,
-                ],
-                axis=1,
-            )
-        else:
-            # Optimization: Avoid concatenation when no masks are present
-            np_detections = np.concatenate(
-                [np_image_pred[:, :5], np_class_conf, np_class_pred.astype(np.float32)],
-                axis=1,
-            )
-
-        filtered_predictions = []
-        if class_agnostic:
-            # Sort by confidence directly
-            sorted_indices = np.argsort(-np_detections[:, 4])
-            np_detections_sorted = np_detections[sorted_indices]
-            # Directly pass to optimized NMS
-            filtered_predictions.extend(
-                non_max_suppression_fast(np_detections_sorted, iou_thresh)
-            )
-        else:
-            np_unique_labels = np.unique(np_class_pred)
-
-            # Process each class
-            for c in np_unique_labels:
-                class_mask = np.atleast_1d(np_class_pred.squeeze() == c)
-                np_detections_class = np_detections[class_mask]
-
-                # Skip empty arrays
-                if np_detections_class.shape[0] == 0:
-                    continue
-
-                # Sort by confidence (highest first)
-                sorted_indices = np.argsort(-np_detections_class[:, 4])
-                np_detections_sorted = np_detections_class[sorted_indices]
-
-                # Apply optimized NMS and extend filtered predictions
-                filtered_predictions.extend(
-                    non_max_suppression_fast(np_detections_sorted, iou_thresh)
-                )
-
-        # Sort final predictions by confidence and limit to max_detections
-        if filtered_predictions:
-            # Use numpy sort for better performance
-            filtered_np = np.array(filtered_predictions)
-            idx = np.argsort(-filtered_np[:, 4])
-            filtered_np = filtered_np[idx]
-
-            # Limit to max_detections
-            if len(filtered_np) > max_detections:
-                filtered_np = filtered_np[:max_detections]
-
-            batch_predictions.append(list(filtered_np))
-        else:
-            batch_predictions.append([])
-
-    return batch_predictions
+    Args:
+        boxes (np.ndarray): Boxes in (x1, y1, x2, y2) format, shape (N, 4).
+        scores (np.ndarray): Scores of boxes, shape (N, ).
+        group_ids (np.ndarray): Integer group identifier of each box, shape (N, ).
+        iou_thresh (float): Overlap threshold for suppression.
+        max_kept_per_group (Optional[int]): If given, suppression stops once that many boxes are
+            kept in a group - boxes selected later would have lower scores anyway.
+
+    Returns:
+        np.ndarray: Indices of kept boxes.
+    """
+    remaining = np.lexsort((-scores, group_ids))
+    area = (boxes[:, 2] - boxes[:, 0] + 1) * (boxes[:, 3] - boxes[:, 1] + 1)
+    kept = []
+    while remaining.size > 0 and (
+        max_kept_per_group is None or len(kept) < max_kept_per_group
+    ):
+        remaining_groups = group_ids[remaining]
+        is_head = np.empty(remaining.size, dtype=bool)
+        is_head[0] = True
+        np.not_equal(remaining_groups[1:], remaining_groups[:-1], out=is_head[1:])
+        heads = remaining[is_head]
+        kept.append(heads)
+        head_of_element = heads[np.cumsum(is_head) - 1]
+        xx1 = np.maximum(boxes[head_of_element, 0], boxes[remaining, 0])
+        yy1 = np.maximum(boxes[head_of_element, 1], boxes[remaining, 1])
+        xx2 = np.minimum(boxes[head_of_element, 2], boxes[remaining, 2])
+        yy2 = np.minimum(boxes[head_of_element, 3], boxes[remaining, 3])
+        w = np.maximum(0, xx2 - xx1 + 1)
+        h = np.maximum(0, yy2 - yy1 + 1)
+        overlap = (w * h) / area[remaining]
+        remaining = remaining[~is_head & (overlap <= iou_thresh)]
+    if not kept:
+        return np.zeros((0,), dtype=np.int64)
+    return np.concatenate(kept)
 
 
 # Malisiewicz et al.
@@ -0,0 +1,93 @@
+import threading
+import weakref
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+class ImageRepresentationsCache:
+    """
+    Thread-safe memo of representations derived from single image (decoded pixels,
+    encoded bytes, model inputs, etc.). Each representation is computed at most once -
+    threads asking for the same key while it is being computed wait for the result,
+    while different keys are computed concurrently.
+
+    Values are shared among callers and MUST NOT be modified in-place.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[Hashable, Any] = {}
+        self._keys_locks: Dict[Hashable, threading.Lock] = {}
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+            key_lock = self._keys_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                if key in self._values:
+                    return self._values[key]
+            value = compute()
+            with self._lock:
+                self._values[key] = value
+                self._keys_locks.pop(key, None)
+            return value
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._values
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._values)
+
+    def __getstate__(self) -> dict:
+        # locks cannot be pickled - copies start with empty cache
+        return {}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__()
+
+
+_ATTACHED_CACHES: Dict[int, Tuple[weakref.ref, weakref.ref]] = {}
+_ATTACHED_CACHES_LOCK = threading.RLock()
+
+
+def attach_representations_cache(
+    image: np.ndarray, cache: ImageRepresentationsCache
+) -> None:
+    """
+    Associates `cache` with `image` array, such that code which only receives the array
+    (for instance model pre-processing) can reuse representations computed by other consumers
+    of the same image. Association is removed once the array is garbage-collected, `cache` is
+    only weakly referenced - its lifetime is bound to the owner.
+    """
+    key = id(image)
+
+    def _detach(reference: weakref.ref) -> None:
+        with _ATTACHED_CACHES_LOCK:
+            entry = _ATTACHED_CACHES.get(key)
+            if entry is not None and entry[0] is reference:
+                del _ATTACHED_CACHES[key]
+
+    with _ATTACHED_CACHES_LOCK:
+        entry = _ATTACHED_CACHES.get(key)
+        if entry is not None and entry[0]() is image and entry[1]() is cache:
+            return None
+        _ATTACHED_CACHES[key] = (weakref.ref(image, _detach), weakref.ref(cache))
+
+
+def get_attached_representations_cache(
+    image: Any,
+) -> Optional[ImageRepresentationsCache]:
+    if not isinstance(image, np.ndarray):
+        return None
+    with _ATTACHED_CACHES_LOCK:
+        entry = _ATTACHED_CACHES.get(id(image))
+    if entry is None or entry[0]() is not image:
+        return None
+    return entry[1]()
@@ -42,6 +42,7 @@ BASE64_DATA_TYPE_PATTERN = re.compile(r"^data:image\/[a-z]+;base64,")
 
 class ImageType(Enum):
     BASE64 = "base64"
+    BYTES = "bytes"
     FILE = "file"
     MULTIPART = "multipart"
     NUMPY = "numpy"
@@ -505,8 +506,16 @@ def load_image_from_encoded_bytes(
 
     Returns:
         np.ndarray: The loaded image as a numpy array.
+
+    Raises:
+        InputImageLoadError: If the value is not bytes-like or cannot be decoded as image.
     """
-    image_np = np.asarray(bytearray(value), dtype=np.uint8)
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        raise InputImageLoadError(
+            message=f"Expected bytes of encoded image, got {type(value).__name__}.",
+            public_message="Image of type `bytes` must be sent as binary data.",
+        )
+    image_np = np.frombuffer(value, dtype=np.uint8)
     image = cv2.imdecode(image_np, cv_imread_flags)
     if image is None:
         raise InputImageLoadError(
@@ -518,6 +527,7 @@ def load_image_from_encoded_bytes(
 
 IMAGE_LOADERS = {
     ImageType.BASE64: load_image_base64,
+    ImageType.BYTES: load_image_from_encoded_bytes,
     ImageType.FILE: cv2.imread,
     ImageType.MULTIPART: load_image_from_buffer,
     ImageType.NUMPY: lambda v, _: load_image_from_numpy_str(v),
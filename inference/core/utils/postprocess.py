@@ -57,17 +57,20 @@ def masks2multipoly(masks: np.ndarray) -> List[np.ndarray]:
     return segments
 
 
-def mask2poly(mask: np.ndarray) -> np.ndarray:
+def mask2poly(mask: np.ndarray, offset: Tuple[int, int] = (0, 0)) -> np.ndarray:
     """
     Find contours in the mask and return them as a float32 array.
 
     Args:
         mask (np.ndarray): A binary mask.
+        offset (Tuple[int, int]): (x, y) offset added to contours points. Defaults to (0, 0).
 
     Returns:
         np.ndarray: Contours represented as a float32 array.
     """
-    contours = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)[0]
+    contours = cv2.findContours(
+        mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE, offset=offset
+    )[0]
     if contours:
         contours = np.array(
             contours[np.array([len(x) for x in contours]).argmax()]
@@ -345,6 +348,111 @@ def process_mask_fast(
     return masks
 
 
+def process_mask_roi(
+    protos: np.ndarray,
+    masks_in: np.ndarray,
+    bboxes: np.ndarray,
+    shape: Tuple[int, int],
+) -> List[Tuple[np.ndarray, Tuple[int, int]]]:
+    """Returns masks the way `process_mask_accurate(...)` does, but each mask is only computed within
+    its bounding box - instead of materialising full-size masks for all instances.
+
+    Prototype masks are evaluated only in the region needed to bilinearly upsample the box area
+    (mirroring `cv2.resize(...)` used in accurate mode), so memory and compute scale with the
+    area of boxes rather than the number of instances times the image size.
+
+    Args:
+        protos (numpy.ndarray): Prototype masks.
+        masks_in (numpy.ndarray): Input masks.
+        bboxes (numpy.ndarray): Bounding boxes.
+        shape (tuple): Target shape.
+
+    Returns:
+        List[Tuple[numpy.ndarray, Tuple[int, int]]]: Binary (uint8) mask crops with (x, y) offsets
+            of crops within the target shape.
+    """
+    c, mh, mw = protos.shape  # CHW
+    height, width = shape
+    gain = min(mh / height, mw / width)
+    pad = (mw - width * gain) / 2, (mh - height * gain) / 2
+    top, left = int(pad[1]), int(pad[0])
+    bottom, right = int(mh - pad[1]), int(mw - pad[0])
+    protos = protos.astype(np.float32)
+    masks_in = masks_in.astype(np.float32)
+    x_start = np.clip(np.ceil(bboxes[:, 0]), 0, width).astype(int)
+    y_start = np.clip(np.ceil(bboxes[:, 1]), 0, height).astype(int)
+    x_end = np.clip(np.ceil(bboxes[:, 2]), 0, width).astype(int)
+    y_end = np.clip(np.ceil(bboxes[:, 3]), 0, height).astype(int)
+    results = []
+    for coefficients, x_min, y_min, x_max, y_max in zip(
+        masks_in, x_start, y_start, x_end, y_end
+    ):
+        if x_max <= x_min or y_max <= y_min:
+            results.append((np.zeros((0, 0), dtype=np.uint8), (int(x_min), int(y_min))))
+            continue
+        y0, y1, y_weight = _linear_interpolation_coordinates(
+            destination=np.arange(y_min, y_max),
+            source_size=bottom - top,
+            destination_size=height,
+        )
+        x0, x1, x_weight = _linear_interpolation_coordinates(
+            destination=np.arange(x_min, x_max),
+            source_size=right - left,
+            destination_size=width,
+        )
+        source_y_min, source_x_min = y0[0], x0[0]
+        source_region = protos[
+            :,
+            top + source_y_min : top + y1[-1] + 1,
+            left + source_x_min : left + x1[-1] + 1,
+        ]
+        region = sigmoid(coefficients @ source_region.reshape((c, -1))).reshape(
+            source_region.shape[1:]
+        )
+        y0, y1 = y0 - source_y_min, y1 - source_y_min
+        x0, x1 = x0 - source_x_min, x1 - source_x_min
+        y_weight, x_weight = y_weight[:, None], x_weight[None, :]
+        upper = region[y0][:, x0] * (1 - x_weight) + region[y0][:, x1] * x_weight
+        lower = region[y1][:, x0] * (1 - x_weight) + region[y1][:, x1] * x_weight
+        mask = upper * (1 - y_weight) + lower * y_weight
+        results.append(((mask >= 0.5).astype(np.uint8), (int(x_min), int(y_min))))
+    return results
+
+
+def _linear_interpolation_coordinates(
+    destination: np.ndarray, source_size: int, destination_size: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # the same coordinates mapping as `cv2.resize(..., interpolation=cv2.INTER_LINEAR)`
+    source = (destination + 0.5) * (source_size / destination_size) - 0.5
+    source = np.clip(source, 0, source_size - 1).astype(np.float32)
+    lower = np.floor(source).astype(int)
+    upper = np.minimum(lower + 1, source_size - 1)
+    return lower, upper, source - lower
+
+
+def mask_crops2poly(
+    mask_crops: List[Tuple[np.ndarray, Tuple[int, int]]]
+) -> List[np.ndarray]:
+    """Converts binary mask crops (as returned by `process_mask_roi(...)`) to polygonal segments -
+    the same segments `masks2poly(...)` gives for full-size masks.
+
+    Args:
+        mask_crops (List[Tuple[numpy.ndarray, Tuple[int, int]]]): Binary mask crops with (x, y) offsets.
+
+    Returns:
+        list: A list of segments, where each segment is obtained by converting the corresponding mask crop.
+    """
+    segments = []
+    for mask, (x_offset, y_offset) in mask_crops:
+        if mask.size == 0:
+            segments.append(np.zeros((0, 2), dtype=np.float32))
+            continue
+        # zero margin, such that contours touching crop borders are traced as in full mask
+        mask = np.pad(mask, 1)
+        segments.append(mask2poly(mask, offset=(x_offset - 1, y_offset - 1)))
+    return segments
+
+
 def preprocess_segmentation_masks(
     protos: np.ndarray,
     masks_in: np.ndarray,
@@ -470,6 +578,66 @@ def undo_image_padding_for_predicted_polygons(
     return result
 
 
+def post_process_masks(
+    origin_shape: Tuple[int, int],
+    masks: np.ndarray,
+    preproc: dict,
+    resize_method: str = "Stretch to",
+    disable_preproc_static_crop: bool = False,
+) -> np.ndarray:
+    """Scales and shifts binary masks predicted against the model input to the source image.
+
+    Counterpart of `post_process_polygons(...)` for masks - the padding added while resizing
+    the image is cut off, masks are resized to the (statically cropped) source image size and
+    placed at the position of the static crop.
+
+    Args:
+        origin_shape (tuple of int): Shape of the source image (height, width).
+        masks (np.ndarray): Masks of shape (N, H, W), predicted against the model input - non-zero
+            values mark pixels of the object.
+        preproc (dict): Preprocessing details used for generating the transformation.
+        resize_method (str, optional): Resizing method, either "Stretch to", "Fit (black edges) in", "Fit (white edges) in", or "Fit (grey edges) in". Defaults to "Stretch to".
+        disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+
+    Returns:
+        np.ndarray: Boolean masks of shape (N, height, width).
+    """
+    (crop_shift_x, crop_shift_y), crop_shape = get_static_crop_dimensions(
+        origin_shape,
+        preproc,
+        disable_preproc_static_crop=disable_preproc_static_crop,
+    )
+    result = np.zeros((len(masks), origin_shape[0], origin_shape[1]), dtype=bool)
+    if len(masks) == 0:
+        return result
+    infer_shape = masks.shape[1:]
+    if resize_method in {
+        "Fit (black edges) in",
+        "Fit (white edges) in",
+        "Fit (grey edges) in",
+    }:
+        scale = min(infer_shape[0] / crop_shape[0], infer_shape[1] / crop_shape[1])
+        inter_h = max(int(crop_shape[0] * scale), 1)
+        inter_w = max(int(crop_shape[1] * scale), 1)
+        pad_y = (infer_shape[0] - inter_h) // 2
+        pad_x = (infer_shape[1] - inter_w) // 2
+        masks = masks[:, pad_y : pad_y + inter_h, pad_x : pad_x + inter_w]
+    for i, mask in enumerate(masks):
+        resized_mask = cv2.resize(
+            (mask > 0).astype(np.float32),
+            (crop_shape[1], crop_shape[0]),
+            interpolation=cv2.INTER_LINEAR,
+        )
+        result[
+            i,
+            crop_shift_y : crop_shift_y + crop_shape[0],
+            crop_shift_x : crop_shift_x + crop_shape[1],
+        ] = (resized_mask >= 0.5)[
+            : origin_shape[0] - crop_shift_y, : origin_shape[1] - crop_shift_x
+        ]
+    return result
+
+
 def get_static_crop_dimensions(
     orig_shape: Tuple[int, int],
     preproc: dict,
@@ -241,6 +241,57 @@ def letterbox_image(
         )
 
 
+def resize_image_into_buffer(
+    image: np.ndarray,
+    out: np.ndarray,
+    keep_aspect_ratio: bool,
+    color: Tuple[int, int, int] = (0, 0, 0),
+    bgr_to_rgb: bool = False,
+) -> np.ndarray:
+    """
+    Resize the image (stretching it or letterboxing, preserving its aspect ratio) and write it in
+    channels-first layout directly into the preallocated buffer - without intermediate padded,
+    colour-converted and transposed copies of the image.
+
+    Parameters:
+    - image: numpy array representing the image (HWC).
+    - out: float buffer of shape (3, height, width) the result is written into.
+    - keep_aspect_ratio: flag to letterbox the image instead of stretching it.
+    - color: tuple (B, G, R) representing the color to pad with.
+    - bgr_to_rgb: flag to reverse the order of channels.
+
+    Returns:
+    - `out` buffer.
+    """
+    height, width = out.shape[1:]
+    if not keep_aspect_ratio:
+        resized = cv2.resize(image.astype(np.float32), (width, height))
+        top, left = 0, 0
+    else:
+        resized = resize_image_keeping_aspect_ratio(
+            image=image, desired_size=(width, height)
+        )
+        top = (height - resized.shape[0]) // 2
+        left = (width - resized.shape[1]) // 2
+    new_height, new_width = resized.shape[:2]
+    bottom, right = top + new_height, left + new_width
+    if keep_aspect_ratio:
+        fill_color = color[::-1] if bgr_to_rgb else color
+        for channel, channel_color in enumerate(fill_color):
+            plane = out[channel]
+            plane[:top] = channel_color
+            plane[bottom:] = channel_color
+            plane[top:bottom, :left] = channel_color
+            plane[top:bottom, right:] = channel_color
+    # contiguous planes are converted into float32 much faster than the strided HWC -> CHW view
+    planes = cv2.split(resized)
+    if bgr_to_rgb:
+        planes = planes[::-1]
+    for channel, plane in enumerate(planes):
+        out[channel, top:bottom, left:right] = plane
+    return out
+
+
 def downscale_image_keeping_aspect_ratio(
     image: ImageMetaType,
     desired_size: Tuple[int, int],
@@ -0,0 +1,82 @@
+from typing import Optional
+
+import numpy as np
+
+
+def discrete_frechet_distance(path: np.ndarray, reference_path: np.ndarray) -> float:
+    """
+    Calculates discrete Fréchet distance between `path` of shape (n, 2) and `reference_path`
+    of shape (m, 2).
+    """
+    return float(
+        discrete_frechet_last_row(path=path, reference_path=reference_path)[-1]
+    )
+
+
+def discrete_frechet_last_row(
+    path: np.ndarray, reference_path: np.ndarray
+) -> np.ndarray:
+    """
+    Computes the last row of discrete Fréchet dynamic programming table between `path` (rows)
+    and `reference_path` (columns) - that is distances between the whole `path` and each prefix of
+    `reference_path`. The row is everything needed to extend the path with new points through
+    `extend_frechet_last_rows(...)`.
+
+    Cells of anti-diagonal only depend on the two previous anti-diagonals, so the table is filled
+    with one vectorised operation per anti-diagonal (n + m - 1 steps).
+    """
+    path = np.asarray(path, dtype=np.float64).reshape(-1, 2)
+    reference_path = np.asarray(reference_path, dtype=np.float64).reshape(-1, 2)
+    n, m = len(path), len(reference_path)
+    distances = _pairwise_distances(points=path, reference_path=reference_path)
+    # table padded with boundary row and column, ca[i + 1, j + 1] holds value for (i, j)
+    ca = np.full((n + 1, m + 1), np.inf)
+    ca[0, 0] = -np.inf
+    for k in range(n + m - 1):
+        i = np.arange(max(0, k - m + 1), min(n - 1, k) + 1)
+        j = k - i
+        ca[i + 1, j + 1] = np.maximum(
+            distances[i, j],
+            np.minimum(np.minimum(ca[i, j + 1], ca[i, j]), ca[i + 1, j]),
+        )
+    return ca[n, 1:]
+
+
+def extend_frechet_last_rows(
+    last_rows: Optional[np.ndarray],
+    points: np.ndarray,
+    reference_path: np.ndarray,
+) -> np.ndarray:
+    """
+    Extends paths of multiple objects with one point each, given last rows of their
+    Fréchet tables (shape (t, m), rows of NaN mark objects without previous points). Cost does
+    not depend on length of paths - update is a single sweep over `reference_path`, vectorised
+    across all objects.
+
+    Returns:
+        np.ndarray: updated last rows of shape (t, m), distance between each path and the whole
+            reference path is in the last column.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    reference_path = np.asarray(reference_path, dtype=np.float64).reshape(-1, 2)
+    t, m = len(points), len(reference_path)
+    distances = _pairwise_distances(points=points, reference_path=reference_path)
+    previous = np.full((t, m + 1), np.inf)
+    if last_rows is not None:
+        previous[:, 1:] = last_rows
+    is_first_point = np.isnan(previous[:, 1])
+    previous[is_first_point, 1:] = np.inf
+    previous[is_first_point, 0] = -np.inf
+    diagonal_or_upper = np.minimum(previous[:, 1:], previous[:, :-1])
+    rows = np.empty((t, m))
+    current = np.full(t, np.inf)
+    for j in range(m):
+        current = np.maximum(
+            distances[:, j], np.minimum(diagonal_or_upper[:, j], current)
+        )
+        rows[:, j] = current
+    return rows
+
+
+def _pairwise_distances(points: np.ndarray, reference_path: np.ndarray) -> np.ndarray:
+    return np.linalg.norm(points[:, np.newaxis, :] - reference_path[np.newaxis], axis=2)
@@ -5,6 +5,14 @@ import supervision as sv
 from pydantic import ConfigDict, Field
 from typing_extensions import Literal, Type
 
+from inference.core.env import WORKFLOWS_PATH_DEVIATION_MAX_PATH_LENGTH
+from inference.core.workflows.core_steps.analytics.path_deviation.frechet import (
+    discrete_frechet_last_row,
+    extend_frechet_last_rows,
+)
+from inference.core.workflows.core_steps.common.tracked_objects_state import (
+    TrackedObjectsState,
+)
 from inference.core.workflows.execution_engine.constants import (
     PATH_DEVIATION_KEY_IN_SV_DETECTIONS,
 )
@@ -27,6 +35,7 @@ from inference.core.workflows.prototypes.block import (
 )
 
 OUTPUT_KEY: str = "path_deviation_detections"
+FRECHET_LAST_ROW_FIELD = "frechet_last_row"
 SHORT_DESCRIPTION = "Calculate Fréchet distance of object from the reference path."
 LONG_DESCRIPTION = """
 The `PathDeviationAnalyticsBlock` is an analytics block designed to measure the Frechet distance
@@ -94,6 +103,8 @@ class PathDeviationAnalyticsBlockV2(WorkflowBlock):
         self._object_paths: Dict[
             str, Dict[Union[int, str], List[Tuple[float, float]]]
         ] = {}
+        self._reference_paths: Dict[str, np.ndarray] = {}
+        self._batch_of_tracked_objects: Dict[str, TrackedObjectsState] = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -112,71 +123,49 @@ class PathDeviationAnalyticsBlockV2(WorkflowBlock):
             )
         metadata = image.video_metadata
         video_id = metadata.video_identifier
-        if video_id not in self._object_paths:
-            self._object_paths[video_id] = {}
-
-        anchor_points = detections.get_anchors_coordinates(anchor=triggering_anchor)
-        result_detections = []
-        for i, tracker_id in enumerate(detections.tracker_id):
-            detection = detections[i]
-            anchor_point = anchor_points[i]
-            if tracker_id not in self._object_paths[video_id]:
-                self._object_paths[video_id][tracker_id] = []
-            self._object_paths[video_id][tracker_id].append(anchor_point)
-
-            object_path = np.array(self._object_paths[video_id][tracker_id])
-            ref_path = np.array(reference_path)
-
-            frechet_distance = self._calculate_frechet_distance(object_path, ref_path)
-            detection[PATH_DEVIATION_KEY_IN_SV_DETECTIONS] = np.array(
-                [frechet_distance], dtype=np.float64
+        object_paths = self._object_paths.setdefault(video_id, {})
+        ref_path = np.array(reference_path)
+        if not np.issubdtype(ref_path.dtype, np.number):
+            raise TypeError(
+                f"reference_path must be a list of (x, y) points, got: {reference_path}"
             )
-            result_detections.append(detection)
-
-        return {OUTPUT_KEY: sv.Detections.merge(result_detections)}
-
-    def _calculate_frechet_distance(
-        self, path1: np.ndarray, path2: np.ndarray
-    ) -> float:
-        dist_matrix = np.ones((len(path1), len(path2))) * -1
-        return self._compute_distance(
-            dist_matrix, len(path1) - 1, len(path2) - 1, path1, path2
+        ref_path = ref_path.astype(np.float64).reshape(-1, 2)
+        tracked_objects = self._batch_of_tracked_objects.setdefault(
+            video_id,
+            TrackedObjectsState(fields={FRECHET_LAST_ROW_FIELD: (len(ref_path),)}),
         )
-
-    def _compute_distance(
-        self,
-        dist_matrix: np.ndarray,
-        i: int,
-        j: int,
-        path1: np.ndarray,
-        path2: np.ndarray,
-    ) -> float:
-        if dist_matrix[i, j] > -1:
-            return dist_matrix[i, j]
-        elif i == 0 and j == 0:
-            dist_matrix[i, j] = self._euclidean_distance(path1[0], path2[0])
-        elif i > 0 and j == 0:
-            dist_matrix[i, j] = max(
-                self._compute_distance(dist_matrix, i - 1, 0, path1, path2),
-                self._euclidean_distance(path1[i], path2[0]),
-            )
-        elif i == 0 and j > 0:
-            dist_matrix[i, j] = max(
-                self._compute_distance(dist_matrix, 0, j - 1, path1, path2),
-                self._euclidean_distance(path1[0], path2[j]),
-            )
-        elif i > 0 and j > 0:
-            dist_matrix[i, j] = max(
-                min(
-                    self._compute_distance(dist_matrix, i - 1, j, path1, path2),
-                    self._compute_distance(dist_matrix, i - 1, j - 1, path1, path2),
-                    self._compute_distance(dist_matrix, i, j - 1, path1, path2),
-                ),
-                self._euclidean_distance(path1[i], path2[j]),
+        rows, expired_tracker_ids = tracked_objects.register_frame(
+            tracker_ids=detections.tracker_id
+        )
+        for tracker_id in expired_tracker_ids.tolist():
+            object_paths.pop(tracker_id, None)
+        previous_ref_path = self._reference_paths.get(video_id)
+        if previous_ref_path is None or not np.array_equal(previous_ref_path, ref_path):
+            # last rows of Fréchet tables are only valid for the reference path they were
+            # computed against - they get recomputed from stored paths when needed
+            tracked_objects[FRECHET_LAST_ROW_FIELD] = np.full(
+                (len(tracked_objects), len(ref_path)), np.nan
             )
-        else:
-            dist_matrix[i, j] = float("inf")
-        return dist_matrix[i, j]
+            self._reference_paths[video_id] = ref_path
 
-    def _euclidean_distance(self, point1: np.ndarray, point2: np.ndarray) -> float:
-        return np.sqrt(np.sum((point1 - point2) ** 2))
+        anchor_points = detections.get_anchors_coordinates(anchor=triggering_anchor)
+        last_rows = tracked_objects[FRECHET_LAST_ROW_FIELD][rows]
+        for i, tracker_id in enumerate(detections.tracker_id.tolist()):
+            object_path = object_paths.setdefault(tracker_id, [])
+            if object_path and np.isnan(last_rows[i, 0]):
+                last_rows[i] = discrete_frechet_last_row(
+                    path=np.array(object_path), reference_path=ref_path
+                )
+            object_path.append(anchor_points[i])
+            if len(object_path) > WORKFLOWS_PATH_DEVIATION_MAX_PATH_LENGTH:
+                # dropping every second point, starting from the most recent one
+                object_paths[tracker_id] = object_path[::-1][::2][::-1]
+        last_rows = extend_frechet_last_rows(
+            last_rows=last_rows,
+            points=anchor_points,
+            reference_path=ref_path,
+        )
+        tracked_objects[FRECHET_LAST_ROW_FIELD][rows] = last_rows
+        result_detections = detections[np.ones(len(detections), dtype=bool)]
+        result_detections[PATH_DEVIATION_KEY_IN_SV_DETECTIONS] = last_rows[:, -1]
+        return {OUTPUT_KEY: result_detections}
@@ -5,6 +5,9 @@ import supervision as sv
 from pydantic import ConfigDict, Field
 from typing_extensions import Literal, Type
 
+from inference.core.workflows.core_steps.common.tracked_objects_state import (
+    TrackedObjectsState,
+)
 from inference.core.workflows.execution_engine.constants import (
     TIME_IN_ZONE_KEY_IN_SV_DETECTIONS,
 )
@@ -28,6 +31,7 @@ from inference.core.workflows.prototypes.block import (
 )
 
 OUTPUT_KEY: str = "timed_detections"
+ENTERED_ZONE_AT_FIELD = "entered_zone_at"
 SHORT_DESCRIPTION = "Track object time in zone."
 LONG_DESCRIPTION = """
 The `TimeInZoneBlock` is an analytics block designed to measure time spent by objects in a zone.
@@ -106,7 +110,7 @@ class TimeInZoneManifest(WorkflowBlockManifest):
 
 class TimeInZoneBlockV2(WorkflowBlock):
     def __init__(self):
-        self._batch_of_tracked_ids_in_zone: Dict[str, Dict[Union[int, str], float]] = {}
+        self._batch_of_tracked_objects: Dict[str, TrackedObjectsState] = {}
         self._batch_of_polygon_zones: Dict[str, sv.PolygonZone] = {}
 
     @classmethod
@@ -151,40 +155,35 @@ class TimeInZoneBlockV2(WorkflowBlock):
                 triggering_anchors=(sv.Position(triggering_anchor),),
             )
         polygon_zone = self._batch_of_polygon_zones[metadata.video_identifier]
-        tracked_ids_in_zone = self._batch_of_tracked_ids_in_zone.setdefault(
-            metadata.video_identifier, {}
+        tracked_objects = self._batch_of_tracked_objects.setdefault(
+            metadata.video_identifier,
+            TrackedObjectsState(fields={ENTERED_ZONE_AT_FIELD: ()}),
         )
-        result_detections = []
         if metadata.comes_from_video_file and metadata.fps != 0:
             ts_end = metadata.frame_number / metadata.fps
         else:
             ts_end = metadata.frame_timestamp.timestamp()
-        for i, is_in_zone, tracker_id in zip(
-            range(len(detections)),
-            polygon_zone.trigger(detections),
-            detections.tracker_id,
-        ):
-            if (
-                not is_in_zone
-                and tracker_id in tracked_ids_in_zone
-                and reset_out_of_zone_detections
-            ):
-                del tracked_ids_in_zone[tracker_id]
-            if not is_in_zone and remove_out_of_zone_detections:
-                continue
-
-            # copy
-            detection = detections[i]
-
-            detection[TIME_IN_ZONE_KEY_IN_SV_DETECTIONS] = np.array(
-                [0], dtype=np.float64
-            )
-            if is_in_zone:
-                ts_start = tracked_ids_in_zone.setdefault(tracker_id, ts_end)
-                detection[TIME_IN_ZONE_KEY_IN_SV_DETECTIONS] = np.array(
-                    [ts_end - ts_start], dtype=np.float64
-                )
-            elif tracker_id in tracked_ids_in_zone:
-                del tracked_ids_in_zone[tracker_id]
-            result_detections.append(detection)
-        return {OUTPUT_KEY: sv.Detections.merge(result_detections)}
+        rows, _ = tracked_objects.register_frame(tracker_ids=detections.tracker_id)
+        is_in_zone = np.asarray(polygon_zone.trigger(detections), dtype=bool)
+        # NaN marks objects which are not in the zone
+        entered_zone_at = tracked_objects[ENTERED_ZONE_AT_FIELD]
+        previous_entered_zone_at = entered_zone_at[rows]
+        current_entered_zone_at = np.where(
+            np.isnan(previous_entered_zone_at), ts_end, previous_entered_zone_at
+        )
+        updated_entered_zone_at = np.where(
+            is_in_zone, current_entered_zone_at, previous_entered_zone_at
+        )
+        if reset_out_of_zone_detections or not remove_out_of_zone_detections:
+            updated_entered_zone_at[~is_in_zone] = np.nan
+        entered_zone_at[rows] = updated_entered_zone_at
+        time_in_zone = np.where(is_in_zone, ts_end - current_entered_zone_at, 0).astype(
+            np.float64
+        )
+        if remove_out_of_zone_detections:
+            to_keep = is_in_zone
+        else:
+            to_keep = np.ones(len(detections), dtype=bool)
+        result_detections = detections[to_keep]
+        result_detections[TIME_IN_ZONE_KEY_IN_SV_DETECTIONS] = time_in_zone[to_keep]
+        return {OUTPUT_KEY: result_detections}
@@ -1,10 +1,13 @@
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 import supervision as sv
 from pydantic import ConfigDict, Field
 from typing_extensions import Literal, Type
 
+from inference.core.workflows.core_steps.common.tracked_objects_state import (
+    TrackedObjectsState,
+)
 from inference.core.workflows.execution_engine.entities.base import (
     OutputDefinition,
     WorkflowImageData,
@@ -38,6 +41,9 @@ VELOCITY_KEY_IN_SV_DETECTIONS = "velocity"
 SPEED_KEY_IN_SV_DETECTIONS = "speed"
 SMOOTHED_VELOCITY_KEY_IN_SV_DETECTIONS = "smoothed_velocity"
 SMOOTHED_SPEED_KEY_IN_SV_DETECTIONS = "smoothed_speed"
+POSITION_FIELD = "position"
+TIMESTAMP_FIELD = "timestamp"
+SMOOTHED_VELOCITY_FIELD = "smoothed_velocity"
 
 
 class VelocityManifest(WorkflowBlockManifest):
@@ -97,12 +103,8 @@ class VelocityManifest(WorkflowBlockManifest):
 
 class VelocityBlockV1(WorkflowBlock):
     def __init__(self):
-        # Store previous positions and timestamps for each tracker_id
-        self._previous_positions: Dict[
-            str, Dict[Union[int, str], Tuple[np.ndarray, float]]
-        ] = {}
-        # Store smoothed velocities for each tracker_id
-        self._smoothed_velocities: Dict[str, Dict[Union[int, str], np.ndarray]] = {}
+        # positions, timestamps and smoothed velocities of tracked objects for each video
+        self._batch_of_tracked_objects: Dict[str, TrackedObjectsState] = {}
 
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
@@ -132,10 +134,21 @@ class VelocityBlockV1(WorkflowBlock):
             ts_current = image.video_metadata.frame_timestamp.timestamp()
 
         video_id = image.video_metadata.video_identifier
-        previous_positions = self._previous_positions.setdefault(video_id, {})
-        smoothed_velocities = self._smoothed_velocities.setdefault(video_id, {})
-
-        num_detections = len(detections)
+        tracked_objects = self._batch_of_tracked_objects.setdefault(
+            video_id,
+            TrackedObjectsState(
+                fields={
+                    POSITION_FIELD: (2,),
+                    TIMESTAMP_FIELD: (),
+                    SMOOTHED_VELOCITY_FIELD: (2,),
+                }
+            ),
+        )
+        if len(detections) == 0:
+            tracked_objects.register_frame(tracker_ids=np.empty((0,), dtype=np.int64))
+            return {OUTPUT_KEY: detections}
+        tracker_ids = detections.tracker_id.astype(int)
+        rows, _ = tracked_objects.register_frame(tracker_ids=tracker_ids)
 
         # Compute current positions (center of bounding boxes)
         bbox_xyxy = detections.xyxy  # Shape (num_detections, 4)
@@ -145,88 +158,50 @@ class VelocityBlockV1(WorkflowBlock):
             [x_centers, y_centers], axis=1
         )  # Shape (num_detections, 2)
 
-        velocities = np.zeros_like(current_positions)  # Shape (num_detections, 2)
-        speeds = np.zeros(num_detections)  # Shape (num_detections,)
-        smoothed_velocities_arr = np.zeros_like(current_positions)
-        smoothed_speeds = np.zeros(num_detections)
-
-        for i, tracker_id in enumerate(detections.tracker_id):
-            current_position = current_positions[i]
-
-            # Ensure tracker_id is of type int or str
-            tracker_id = int(tracker_id)
-
-            if tracker_id in previous_positions:
-                prev_position, prev_timestamp = previous_positions[tracker_id]
-                delta_time = ts_current - prev_timestamp
-
-                if delta_time > 0:
-                    displacement = current_position - prev_position
-                    velocity = displacement / delta_time  # Pixels per second
-                    speed = np.linalg.norm(
-                        velocity
-                    )  # Speed is the magnitude of velocity vector
-                else:
-                    velocity = np.array([0, 0])
-                    speed = 0.0
-            else:
-                velocity = np.array([0, 0])  # No previous position
-                speed = 0.0
-
-            # Apply exponential moving average for smoothing
-            if tracker_id in smoothed_velocities:
-                prev_smoothed_velocity = smoothed_velocities[tracker_id]
-                smoothed_velocity = (
-                    smoothing_alpha * velocity
-                    + (1 - smoothing_alpha) * prev_smoothed_velocity
-                )
-            else:
-                smoothed_velocity = velocity  # Initialize with current velocity
-
-            smoothed_speed = np.linalg.norm(smoothed_velocity)
-
-            # Store current position and timestamp for the next frame
-            previous_positions[tracker_id] = (current_position, ts_current)
-            smoothed_velocities[tracker_id] = smoothed_velocity
-
-            # Convert velocities and speeds to meters per second if required
-            velocity_m_s = velocity / pixels_per_meter
-            smoothed_velocity_m_s = smoothed_velocity / pixels_per_meter
-            speed_m_s = speed / pixels_per_meter
-            smoothed_speed_m_s = smoothed_speed / pixels_per_meter
-
-            velocities[i] = velocity_m_s
-            speeds[i] = speed_m_s
-            smoothed_velocities_arr[i] = smoothed_velocity_m_s
-            smoothed_speeds[i] = smoothed_speed_m_s
-
-            # Add velocity and speed to detections.data
-            # Ensure that 'data' is a dictionary for each detection
-            if detections.data is None:
-                detections.data = {}
-
-            # Initialize dictionaries if not present
-            if VELOCITY_KEY_IN_SV_DETECTIONS not in detections.data:
-                detections.data[VELOCITY_KEY_IN_SV_DETECTIONS] = {}
-            if SPEED_KEY_IN_SV_DETECTIONS not in detections.data:
-                detections.data[SPEED_KEY_IN_SV_DETECTIONS] = {}
-            if SMOOTHED_VELOCITY_KEY_IN_SV_DETECTIONS not in detections.data:
-                detections.data[SMOOTHED_VELOCITY_KEY_IN_SV_DETECTIONS] = {}
-            if SMOOTHED_SPEED_KEY_IN_SV_DETECTIONS not in detections.data:
-                detections.data[SMOOTHED_SPEED_KEY_IN_SV_DETECTIONS] = {}
-
-            # Assign velocity data to the corresponding tracker_id
-            detections.data[VELOCITY_KEY_IN_SV_DETECTIONS][
-                tracker_id
-            ] = velocity_m_s.tolist()  # [vx, vy]
-            detections.data[SPEED_KEY_IN_SV_DETECTIONS][
-                tracker_id
-            ] = speed_m_s  # Scalar
-            detections.data[SMOOTHED_VELOCITY_KEY_IN_SV_DETECTIONS][
-                tracker_id
-            ] = smoothed_velocity_m_s.tolist()  # [vx, vy]
-            detections.data[SMOOTHED_SPEED_KEY_IN_SV_DETECTIONS][
-                tracker_id
-            ] = smoothed_speed_m_s  # Scalar
+        # state of objects seen for the first time is NaN
+        previous_positions = tracked_objects[POSITION_FIELD][rows]
+        previous_timestamps = tracked_objects[TIMESTAMP_FIELD][rows]
+        previous_smoothed_velocities = tracked_objects[SMOOTHED_VELOCITY_FIELD][rows]
+        delta_time = ts_current - previous_timestamps
+        with np.errstate(invalid="ignore"):
+            has_velocity = delta_time > 0
+        velocities = np.zeros_like(current_positions, dtype=np.float64)
+        velocities[has_velocity] = (
+            current_positions[has_velocity] - previous_positions[has_velocity]
+        ) / delta_time[
+            has_velocity, np.newaxis
+        ]  # Pixels per second
+        speeds = np.linalg.norm(velocities, axis=1)
+
+        # Apply exponential moving average for smoothing
+        has_smoothed_velocity = ~np.isnan(previous_smoothed_velocities[:, 0])
+        smoothed_velocities = velocities.copy()
+        smoothed_velocities[has_smoothed_velocity] = (
+            smoothing_alpha * velocities[has_smoothed_velocity]
+            + (1 - smoothing_alpha)
+            * previous_smoothed_velocities[has_smoothed_velocity]
+        )
+        smoothed_speeds = np.linalg.norm(smoothed_velocities, axis=1)
+
+        # Store current positions and timestamp for the next frame
+        tracked_objects[POSITION_FIELD][rows] = current_positions
+        tracked_objects[TIMESTAMP_FIELD][rows] = ts_current
+        tracked_objects[SMOOTHED_VELOCITY_FIELD][rows] = smoothed_velocities
+
+        # Convert velocities and speeds to meters per second and assign them
+        # to the corresponding tracker_id
+        ids = tracker_ids.tolist()
+        if detections.data is None:
+            detections.data = {}
+        for key, values in [
+            (VELOCITY_KEY_IN_SV_DETECTIONS, velocities / pixels_per_meter),
+            (SPEED_KEY_IN_SV_DETECTIONS, speeds / pixels_per_meter),
+            (
+                SMOOTHED_VELOCITY_KEY_IN_SV_DETECTIONS,
+                smoothed_velocities / pixels_per_meter,
+            ),
+            (SMOOTHED_SPEED_KEY_IN_SV_DETECTIONS, smoothed_speeds / pixels_per_meter),
+        ]:
+            detections.data.setdefault(key, {}).update(zip(ids, values.tolist()))
 
         return {OUTPUT_KEY: detections}
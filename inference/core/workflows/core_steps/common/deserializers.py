@@ -10,6 +10,7 @@ from pydantic import ValidationError
 
 from inference.core.utils.image_utils import (
     attempt_loading_image_from_string,
+    load_image_from_encoded_bytes,
     load_image_from_url,
 )
 from inference.core.workflows.core_steps.common.utils import (
@@ -70,6 +71,13 @@ def deserialize_image_kind(
     try:
         if isinstance(image, dict):
             image = image["value"]
+        if isinstance(image, (bytes, bytearray)):
+            # encoded image sent with binary (msgpack) transport
+            return WorkflowImageData(
+                parent_metadata=ImageParentMetadata(parent_id=parameter),
+                numpy_image=load_image_from_encoded_bytes(value=image),
+                video_metadata=video_metadata,
+            )
         if isinstance(image, str):
             base64_image = None
             image_reference = None
@@ -1,5 +1,6 @@
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Union
 
+import cv2
 import numpy as np
 import supervision as sv
 
@@ -43,111 +44,217 @@ from inference.core.workflows.execution_engine.entities.base import (
 )
 
 MIN_SECRET_LENGTH_TO_REVEAL_PREFIX = 8
+MIN_POLYGON_POINT_COUNT = 3
 
 
 def serialise_sv_detections(detections: sv.Detections) -> dict:
-    serialized_detections = []
-    image_dimensions = None
-    for xyxy, mask, confidence, class_id, tracker_id, data in detections:
-        detection_dict = {}
-        image_dimensions = data.get(IMAGE_DIMENSIONS_KEY)
-        if isinstance(xyxy, np.ndarray):
-            xyxy = xyxy.astype(float).tolist()
-        x1, y1, x2, y2 = xyxy
-        detection_dict[WIDTH_KEY] = abs(x2 - x1)
-        detection_dict[HEIGHT_KEY] = abs(y2 - y1)
-        detection_dict[X_KEY] = x1 + detection_dict[WIDTH_KEY] / 2
-        detection_dict[Y_KEY] = y1 + detection_dict[HEIGHT_KEY] / 2
-
-        detection_dict[CONFIDENCE_KEY] = float(confidence)
-        detection_dict[CLASS_ID_KEY] = int(class_id)
-        if mask is not None:
-            polygon = sv.mask_to_polygons(mask=mask)
-            detection_dict[POLYGON_KEY] = []
-            for x, y in polygon[0]:
-                detection_dict[POLYGON_KEY].append(
-                    {
-                        X_KEY: float(x),
-                        Y_KEY: float(y),
-                    }
-                )
-        if tracker_id is not None:
-            detection_dict[TRACKER_ID_KEY] = int(tracker_id)
-        detection_dict[CLASS_NAME_KEY] = str(data["class_name"])
-        detection_dict[DETECTION_ID_KEY] = str(data[DETECTION_ID_KEY])
-        if PATH_DEVIATION_KEY_IN_SV_DETECTIONS in data:
-            detection_dict[PATH_DEVIATION_KEY_IN_INFERENCE_RESPONSE] = data[
-                PATH_DEVIATION_KEY_IN_SV_DETECTIONS
-            ]
-        if TIME_IN_ZONE_KEY_IN_SV_DETECTIONS in data:
-            detection_dict[TIME_IN_ZONE_KEY_IN_INFERENCE_RESPONSE] = data[
-                TIME_IN_ZONE_KEY_IN_SV_DETECTIONS
-            ]
-        if POLYGON_KEY_IN_SV_DETECTIONS in data:
-            detection_dict[POLYGON_KEY_IN_INFERENCE_RESPONSE] = data[
-                POLYGON_KEY_IN_SV_DETECTIONS
-            ]
-        if (
-            BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS in data
-            and BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS in data
-        ):
-            detection_dict[BOUNDING_RECT_ANGLE_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS
-            ]
-            detection_dict[BOUNDING_RECT_RECT_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS
-            ]
-            detection_dict[BOUNDING_RECT_HEIGHT_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS
-            ]
-            detection_dict[BOUNDING_RECT_WIDTH_KEY_IN_INFERENCE_RESPONSE] = data[
-                BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS
+    image_metadata = _get_sv_detections_image_metadata(detections=detections)
+    if len(detections) == 0:
+        return {"image": image_metadata, "predictions": []}
+    columns = _serialise_sv_detections_columns(detections=detections, columnar=False)
+    column_names = list(columns.keys())
+    serialized_detections = [
+        dict(zip(column_names, detection_values))
+        for detection_values in zip(*columns.values())
+    ]
+    return {"image": image_metadata, "predictions": serialized_detections}
+
+
+def serialise_sv_detections_columnar(detections: sv.Detections) -> dict:
+    """Serialises detections into compact, columnar representation - `predictions` is a dictionary
+    of parallel lists (one element per detection) under the same keys as used by
+    `serialise_sv_detections(...)`. Polygons are lists of `[x, y]` pairs and keypoints are
+    dictionary of parallel lists of lists (one list per detection).
+    """
+    image_metadata = _get_sv_detections_image_metadata(detections=detections)
+    if len(detections) == 0:
+        columns = {
+            key: []
+            for key in [
+                WIDTH_KEY,
+                HEIGHT_KEY,
+                X_KEY,
+                Y_KEY,
+                CONFIDENCE_KEY,
+                CLASS_ID_KEY,
+                CLASS_NAME_KEY,
+                DETECTION_ID_KEY,
             ]
-        if PARENT_ID_KEY in data:
-            detection_dict[PARENT_ID_KEY] = str(data[PARENT_ID_KEY])
-        if (
-            KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS in data
-            and KEYPOINTS_XY_KEY_IN_SV_DETECTIONS in data
-        ):
-            kp_class_id = data[KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS]
-            kp_class_name = data[KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS]
-            kp_confidence = data[KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS]
-            kp_xy = data[KEYPOINTS_XY_KEY_IN_SV_DETECTIONS]
-            detection_dict[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE] = []
-            for (
-                keypoint_class_id,
-                keypoint_class_name,
-                keypoint_confidence,
-                (x, y),
-            ) in zip(kp_class_id, kp_class_name, kp_confidence, kp_xy):
-                detection_dict[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE].append(
-                    {
-                        "class_id": int(keypoint_class_id),
-                        "class": str(keypoint_class_name),
-                        "confidence": float(keypoint_confidence),
-                        "x": float(x),
-                        "y": float(y),
-                    }
-                )
-        if DETECTED_CODE_KEY in data:
-            detection_dict[DETECTED_CODE_KEY] = data[DETECTED_CODE_KEY]
-        serialized_detections.append(detection_dict)
+        }
+    else:
+        columns = _serialise_sv_detections_columns(detections=detections, columnar=True)
+    return {"image": image_metadata, "format": "columnar", "predictions": columns}
+
+
+def _get_sv_detections_image_metadata(detections: sv.Detections) -> dict:
     image_metadata = {
         "width": None,
         "height": None,
     }  # TODO: this breaks the contract of
     # standard inference, but to fix that problem, we would need sv.Detections to provide
     # detection-level metadata.
-    if image_dimensions is not None:
+    if len(detections) > 0 and IMAGE_DIMENSIONS_KEY in detections.data:
+        image_dimensions = detections.data[IMAGE_DIMENSIONS_KEY][-1]
         image_metadata = {
             "width": image_dimensions[1].item(),
             "height": image_dimensions[0].item(),
         }
-    return {"image": image_metadata, "predictions": serialized_detections}
+    return image_metadata
+
+
+def _serialise_sv_detections_columns(
+    detections: sv.Detections, columnar: bool
+) -> Dict[str, list]:
+    data = detections.data
+    xyxy = np.asarray(detections.xyxy).astype(float)
+    width = np.abs(xyxy[:, 2] - xyxy[:, 0])
+    height = np.abs(xyxy[:, 3] - xyxy[:, 1])
+    columns = {
+        WIDTH_KEY: width.tolist(),
+        HEIGHT_KEY: height.tolist(),
+        X_KEY: (xyxy[:, 0] + width / 2).tolist(),
+        Y_KEY: (xyxy[:, 1] + height / 2).tolist(),
+        CONFIDENCE_KEY: np.asarray(detections.confidence).astype(float).tolist(),
+        CLASS_ID_KEY: np.asarray(detections.class_id).astype(int).tolist(),
+    }
+    if detections.mask is not None:
+        polygons = [
+            polygon.astype(float).tolist()
+            for polygon in masks_to_polygons(masks=detections.mask)
+        ]
+        if not columnar:
+            polygons = [
+                [{X_KEY: x, Y_KEY: y} for x, y in polygon] for polygon in polygons
+            ]
+        columns[POLYGON_KEY] = polygons
+    if detections.tracker_id is not None:
+        columns[TRACKER_ID_KEY] = np.asarray(detections.tracker_id).astype(int).tolist()
+    columns[CLASS_NAME_KEY] = _to_str_list(values=data["class_name"])
+    columns[DETECTION_ID_KEY] = _to_str_list(values=data[DETECTION_ID_KEY])
+    for key_in_sv_detections, key_in_inference_response in [
+        (PATH_DEVIATION_KEY_IN_SV_DETECTIONS, PATH_DEVIATION_KEY_IN_INFERENCE_RESPONSE),
+        (TIME_IN_ZONE_KEY_IN_SV_DETECTIONS, TIME_IN_ZONE_KEY_IN_INFERENCE_RESPONSE),
+        (POLYGON_KEY_IN_SV_DETECTIONS, POLYGON_KEY_IN_INFERENCE_RESPONSE),
+    ]:
+        if key_in_sv_detections in data:
+            columns[key_in_inference_response] = list(data[key_in_sv_detections])
+    bounding_rect_keys = [
+        (
+            BOUNDING_RECT_ANGLE_KEY_IN_SV_DETECTIONS,
+            BOUNDING_RECT_ANGLE_KEY_IN_INFERENCE_RESPONSE,
+        ),
+        (
+            BOUNDING_RECT_RECT_KEY_IN_SV_DETECTIONS,
+            BOUNDING_RECT_RECT_KEY_IN_INFERENCE_RESPONSE,
+        ),
+        (
+            BOUNDING_RECT_HEIGHT_KEY_IN_SV_DETECTIONS,
+            BOUNDING_RECT_HEIGHT_KEY_IN_INFERENCE_RESPONSE,
+        ),
+        (
+            BOUNDING_RECT_WIDTH_KEY_IN_SV_DETECTIONS,
+            BOUNDING_RECT_WIDTH_KEY_IN_INFERENCE_RESPONSE,
+        ),
+    ]
+    if all(key in data for key, _ in bounding_rect_keys):
+        for key_in_sv_detections, key_in_inference_response in bounding_rect_keys:
+            columns[key_in_inference_response] = list(data[key_in_sv_detections])
+    if PARENT_ID_KEY in data:
+        columns[PARENT_ID_KEY] = _to_str_list(values=data[PARENT_ID_KEY])
+    if (
+        KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS in data
+        and KEYPOINTS_XY_KEY_IN_SV_DETECTIONS in data
+    ):
+        columns[KEYPOINTS_KEY_IN_INFERENCE_RESPONSE] = _serialise_keypoints(
+            data=data, columnar=columnar
+        )
+    if DETECTED_CODE_KEY in data:
+        columns[DETECTED_CODE_KEY] = list(data[DETECTED_CODE_KEY])
+    return columns
+
+
+def _serialise_keypoints(
+    data: Dict[str, np.ndarray], columnar: bool
+) -> Union[List[List[dict]], Dict[str, list]]:
+    class_ids, class_names, confidences, xs, ys = [], [], [], [], []
+    for kp_class_id, kp_class_name, kp_confidence, kp_xy in zip(
+        data[KEYPOINTS_CLASS_ID_KEY_IN_SV_DETECTIONS],
+        data[KEYPOINTS_CLASS_NAME_KEY_IN_SV_DETECTIONS],
+        data[KEYPOINTS_CONFIDENCE_KEY_IN_SV_DETECTIONS],
+        data[KEYPOINTS_XY_KEY_IN_SV_DETECTIONS],
+    ):
+        kp_xy = np.asarray(kp_xy).astype(float).reshape(-1, 2)
+        keypoints_number = min(
+            len(kp_class_id), len(kp_class_name), len(kp_confidence), len(kp_xy)
+        )
+        class_ids.append(
+            np.asarray(kp_class_id[:keypoints_number]).astype(int).tolist()
+        )
+        class_names.append(_to_str_list(values=kp_class_name[:keypoints_number]))
+        confidences.append(
+            np.asarray(kp_confidence[:keypoints_number]).astype(float).tolist()
+        )
+        xs.append(kp_xy[:keypoints_number, 0].tolist())
+        ys.append(kp_xy[:keypoints_number, 1].tolist())
+    if columnar:
+        return {
+            "class_id": class_ids,
+            "class": class_names,
+            "confidence": confidences,
+            "x": xs,
+            "y": ys,
+        }
+    return [
+        [
+            {"class_id": c, "class": n, "confidence": p, "x": x, "y": y}
+            for c, n, p, x, y in zip(*detection_keypoints)
+        ]
+        for detection_keypoints in zip(class_ids, class_names, confidences, xs, ys)
+    ]
+
+
+def _to_str_list(values: Union[np.ndarray, list]) -> List[str]:
+    if isinstance(values, np.ndarray) and values.dtype.kind == "U":
+        return values.tolist()
+    return [str(value) for value in values]
+
+
+def masks_to_polygons(masks: np.ndarray) -> List[np.ndarray]:
+    """Converts binary masks of shape (N, H, W) into polygons - for each mask, the same polygon
+    `sv.mask_to_polygons(mask)[0]` would give (or empty array when mask yields no polygon).
+
+    Bounding boxes of all masks are found in single, vectorised pass and contours are searched only
+    within those boxes (with 1px margin), instead of the whole image for each mask.
+    """
+    if len(masks) == 0:
+        return []
+    _, height, width = masks.shape
+    rows_with_pixels, columns_with_pixels = masks.any(axis=2), masks.any(axis=1)
+    non_empty = rows_with_pixels.any(axis=1)
+    y_min = np.maximum(rows_with_pixels.argmax(axis=1) - 1, 0)
+    y_max = np.minimum(height - rows_with_pixels[:, ::-1].argmax(axis=1) + 1, height)
+    x_min = np.maximum(columns_with_pixels.argmax(axis=1) - 1, 0)
+    x_max = np.minimum(width - columns_with_pixels[:, ::-1].argmax(axis=1) + 1, width)
+    polygons = []
+    for mask, is_non_empty, top, bottom, left, right in zip(
+        masks, non_empty, y_min, y_max, x_min, x_max
+    ):
+        polygon = np.empty((0, 2), dtype=np.int32)
+        if is_non_empty:
+            contours, _ = cv2.findContours(
+                mask[top:bottom, left:right].astype(np.uint8),
+                cv2.RETR_TREE,
+                cv2.CHAIN_APPROX_SIMPLE,
+                offset=(int(left), int(top)),
+            )
+            for contour in contours:
+                if contour.shape[0] >= MIN_POLYGON_POINT_COUNT:
+                    polygon = contour[:, 0, :]
+                    break
+        polygons.append(polygon)
+    return polygons
 
 
 def serialise_image(image: WorkflowImageData) -> Dict[str, Any]:
@@ -162,30 +269,53 @@ def serialize_video_metadata_kind(video_metadata: VideoMetadata) -> dict:
     return video_metadata.dict()
 
 
-def serialize_wildcard_kind(value: Any) -> Any:
+def serialize_wildcard_kind(
+    value: Any,
+    sv_detections_serializer: Callable[[sv.Detections], dict] = serialise_sv_detections,
+) -> Any:
     if isinstance(value, WorkflowImageData):
         value = serialise_image(image=value)
     elif isinstance(value, dict):
-        value = serialize_dict(elements=value)
+        value = serialize_dict(
+            elements=value, sv_detections_serializer=sv_detections_serializer
+        )
     elif isinstance(value, list):
-        value = serialize_list(elements=value)
+        value = serialize_list(
+            elements=value, sv_detections_serializer=sv_detections_serializer
+        )
     elif isinstance(value, sv.Detections):
-        value = serialise_sv_detections(detections=value)
+        value = sv_detections_serializer(detections=value)
     return value
 
 
-def serialize_list(elements: List[Any]) -> List[Any]:
+def serialize_wildcard_kind_with_columnar_detections(value: Any) -> Any:
+    return serialize_wildcard_kind(
+        value=value, sv_detections_serializer=serialise_sv_detections_columnar
+    )
+
+
+def serialize_list(
+    elements: List[Any],
+    sv_detections_serializer: Callable[[sv.Detections], dict] = serialise_sv_detections,
+) -> List[Any]:
     result = []
     for element in elements:
-        element = serialize_wildcard_kind(value=element)
+        element = serialize_wildcard_kind(
+            value=element, sv_detections_serializer=sv_detections_serializer
+        )
         result.append(element)
     return result
 
 
-def serialize_dict(elements: Dict[str, Any]) -> Dict[str, Any]:
+def serialize_dict(
+    elements: Dict[str, Any],
+    sv_detections_serializer: Callable[[sv.Detections], dict] = serialise_sv_detections,
+) -> Dict[str, Any]:
     serialized_result = {}
     for key, value in elements.items():
-        value = serialize_wildcard_kind(value=value)
+        value = serialize_wildcard_kind(
+            value=value, sv_detections_serializer=sv_detections_serializer
+        )
         serialized_result[key] = value
     return serialized_result
 
@@ -0,0 +1,98 @@
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from inference.core.env import WORKFLOWS_TRACKED_OBJECTS_STATE_EXPIRY_FRAMES
+
+
+class TrackedObjectsState:
+    """
+    Per-video state of tracked objects, kept in arrays with one row per tracker id. Rows are
+    looked up with binary search over sorted tracker ids, so blocks can read and update state
+    of all detections from the frame with array operations.
+
+    Each field is a float array initialised with NaN for new tracker ids. Objects not seen for
+    more than `max_missing_frames` frames (calls to `register_frame(...)`, defaults to
+    `WORKFLOWS_TRACKED_OBJECTS_STATE_EXPIRY_FRAMES`) are dropped - trackers do not bring lost ids
+    back after their lost track buffer elapses, so state of such ids would only grow. Value 0
+    disables expiry.
+    """
+
+    def __init__(
+        self,
+        fields: Dict[str, Tuple[int, ...]],
+        max_missing_frames: Optional[int] = None,
+    ):
+        if max_missing_frames is None:
+            max_missing_frames = WORKFLOWS_TRACKED_OBJECTS_STATE_EXPIRY_FRAMES
+        self._max_missing_frames = max_missing_frames
+        self._frame = 0
+        self._tracker_ids = np.empty((0,), dtype=np.int64)
+        self._last_seen = np.empty((0,), dtype=np.int64)
+        self._fields = {
+            name: np.empty((0, *shape), dtype=np.float64)
+            for name, shape in fields.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._tracker_ids)
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self._fields[field]
+
+    def __setitem__(self, field: str, value: np.ndarray) -> None:
+        self._fields[field] = value
+
+    @property
+    def tracker_ids(self) -> np.ndarray:
+        return self._tracker_ids
+
+    def register_frame(self, tracker_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Marks `tracker_ids` as seen in the next frame (adding rows for new ids) and expires objects
+        that were missing for too long.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: rows of state corresponding to `tracker_ids` (valid until
+                next call of this method) and tracker ids expired in this call.
+        """
+        self._frame += 1
+        tracker_ids = np.asarray(tracker_ids, dtype=np.int64)
+        unique_ids = np.unique(tracker_ids)
+        rows, found = self._lookup(tracker_ids=unique_ids)
+        new_ids = unique_ids[~found]
+        if len(new_ids) > 0:
+            positions = np.searchsorted(self._tracker_ids, new_ids)
+            self._tracker_ids = np.insert(self._tracker_ids, positions, new_ids)
+            self._last_seen = np.insert(self._last_seen, positions, self._frame)
+            for name, values in self._fields.items():
+                self._fields[name] = np.insert(values, positions, np.nan, axis=0)
+            rows, _ = self._lookup(tracker_ids=unique_ids)
+        self._last_seen[rows] = self._frame
+        expired_ids = self._expire()
+        rows, _ = self._lookup(tracker_ids=tracker_ids)
+        return rows, expired_ids
+
+    def _lookup(self, tracker_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if len(self._tracker_ids) == 0:
+            return np.zeros(len(tracker_ids), dtype=np.int64), np.zeros(
+                len(tracker_ids), dtype=bool
+            )
+        rows = np.minimum(
+            np.searchsorted(self._tracker_ids, tracker_ids),
+            len(self._tracker_ids) - 1,
+        )
+        return rows, self._tracker_ids[rows] == tracker_ids
+
+    def _expire(self) -> np.ndarray:
+        if self._max_missing_frames <= 0:
+            return np.empty((0,), dtype=np.int64)
+        to_keep = self._frame - self._last_seen <= self._max_missing_frames
+        if to_keep.all():
+            return np.empty((0,), dtype=np.int64)
+        expired_ids = self._tracker_ids[~to_keep]
+        self._tracker_ids = self._tracker_ids[to_keep]
+        self._last_seen = self._last_seen[to_keep]
+        for name, values in self._fields.items():
+            self._fields[name] = values[to_keep]
+        return expired_ids
@@ -1,8 +1,6 @@
-import math
 import statistics
-from collections import Counter
 from enum import Enum
-from typing import Dict, Generator, List, Literal, Optional, Set, Tuple, Type, Union
+from typing import Dict, List, Literal, Optional, Tuple, Type, Union
 from uuid import uuid4
 
 import numpy as np
@@ -270,57 +268,6 @@ def filter_predictions(
     ]
 
 
-def get_detections_from_different_sources_with_max_overlap(
-    detection: sv.Detections,
-    source: int,
-    detections_from_sources: List[sv.Detections],
-    iou_threshold: float,
-    class_aware: bool,
-    detections_already_considered: Set[str],
-) -> Dict[int, Tuple[sv.Detections, float]]:
-    current_max_overlap = {}
-    for other_source, other_detection in enumerate_detections(
-        detections_from_sources=detections_from_sources,
-        excluded_source_id=source,
-    ):
-        if other_detection[DETECTION_ID_KEY][0] in detections_already_considered:
-            continue
-        if (
-            class_aware
-            and detection["class_name"][0] != other_detection["class_name"][0]
-        ):
-            continue
-        iou_value = calculate_iou(
-            detection_a=detection,
-            detection_b=other_detection,
-        )
-        if iou_value <= iou_threshold:
-            continue
-        if current_max_overlap.get(other_source) is None:
-            current_max_overlap[other_source] = (other_detection, iou_value)
-        if current_max_overlap[other_source][1] < iou_value:
-            current_max_overlap[other_source] = (other_detection, iou_value)
-    return current_max_overlap
-
-
-def enumerate_detections(
-    detections_from_sources: List[sv.Detections],
-    excluded_source_id: Optional[int] = None,
-) -> Generator[Tuple[int, sv.Detections], None, None]:
-    for source_id, detections in enumerate(detections_from_sources):
-        if excluded_source_id == source_id:
-            continue
-        for i in range(len(detections)):
-            yield source_id, detections[i]
-
-
-def calculate_iou(detection_a: sv.Detections, detection_b: sv.Detections) -> float:
-    iou = float(sv.box_iou_batch(detection_a.xyxy, detection_b.xyxy)[0][0])
-    if math.isnan(iou):
-        iou = 0
-    return iou
-
-
 def agree_on_consensus_for_all_detections_sources(
     detections_from_sources: List[sv.Detections],
     required_votes: int,
@@ -344,28 +291,15 @@ def agree_on_consensus_for_all_detections_sources(
         predictions=detections_from_sources,
         classes_to_consider=classes_to_consider,
     )
-    detections_already_considered = set()
-    consensus_detections = []
-    for source_id, detection in enumerate_detections(
-        detections_from_sources=detections_from_sources
-    ):
-        (
-            consensus_detections_update,
-            detections_already_considered,
-        ) = get_consensus_for_single_detection(
-            detection=detection,
-            source_id=source_id,
-            detections_from_sources=detections_from_sources,
-            iou_threshold=iou_threshold,
-            class_aware=class_aware,
-            required_votes=required_votes,
-            confidence=confidence,
-            detections_merge_confidence_aggregation=detections_merge_confidence_aggregation,
-            detections_merge_coordinates_aggregation=detections_merge_coordinates_aggregation,
-            detections_already_considered=detections_already_considered,
-        )
-        consensus_detections += consensus_detections_update
-    consensus_detections = sv.Detections.merge(consensus_detections)
+    consensus_detections = get_consensus_detections(
+        detections_from_sources=detections_from_sources,
+        iou_threshold=iou_threshold,
+        class_aware=class_aware,
+        required_votes=required_votes,
+        confidence=confidence,
+        detections_merge_confidence_aggregation=detections_merge_confidence_aggregation,
+        detections_merge_coordinates_aggregation=detections_merge_coordinates_aggregation,
+    )
     (
         object_present,
         presence_confidence,
@@ -383,9 +317,7 @@ def agree_on_consensus_for_all_detections_sources(
     )
 
 
-def get_consensus_for_single_detection(
-    detection: sv.Detections,
-    source_id: int,
+def get_consensus_detections(
     detections_from_sources: List[sv.Detections],
     iou_threshold: float,
     class_aware: bool,
@@ -393,42 +325,198 @@ def get_consensus_for_single_detection(
     confidence: float,
     detections_merge_confidence_aggregation: AggregationMode,
     detections_merge_coordinates_aggregation: AggregationMode,
-    detections_already_considered: Set[str],
-) -> Tuple[List[sv.Detections], Set[str]]:
-    if detection and detection["detection_id"][0] in detections_already_considered:
-        return [], detections_already_considered
-    consensus_detections = []
-    detections_with_max_overlap = (
-        get_detections_from_different_sources_with_max_overlap(
-            detection=detection,
-            source=source_id,
-            detections_from_sources=detections_from_sources,
-            iou_threshold=iou_threshold,
-            class_aware=class_aware,
-            detections_already_considered=detections_already_considered,
-        )
+) -> sv.Detections:
+    """
+    Detections are visited one by one (in order of sources) and each is grouped with the best
+    matching, not yet used detection from every other source. Group makes consensus if it
+    collects `required_votes` and its aggregated confidence reaches `confidence`. IoU between
+    sources is computed once per pair of sources, and merging of all groups is done with array
+    operations.
+    """
+    detections_from_sources = [d for d in detections_from_sources if len(d) > 0]
+    if not detections_from_sources:
+        return sv.Detections.empty()
+    source_ids = np.concatenate(
+        [
+            np.full(len(detections), source_id)
+            for source_id, detections in enumerate(detections_from_sources)
+        ]
     )
-
-    if len(detections_with_max_overlap) < (required_votes - 1):
-        # Returning empty sv.Detections
-        return consensus_detections, detections_already_considered
-    detections_to_merge = sv.Detections.merge(
-        [detection]
-        + [matched_value[0] for matched_value in detections_with_max_overlap.values()]
+    confidences = np.concatenate(
+        [d.confidence for d in detections_from_sources]
+    ).astype(np.float64)
+    ious = calculate_matching_iou_matrix(
+        detections_from_sources=detections_from_sources,
+        iou_threshold=iou_threshold,
+        class_aware=class_aware,
     )
-    merged_detection = merge_detections(
-        detections=detections_to_merge,
+    aggregate_confidence = AGGREGATION_MODE2ARRAY_AGGREGATOR[
+        detections_merge_confidence_aggregation
+    ]
+    not_considered = np.ones(len(source_ids), dtype=bool)
+    groups = []
+    for detection_index in range(len(source_ids)):
+        if not not_considered[detection_index]:
+            continue
+        candidates = np.flatnonzero((ious[detection_index] > 0) & not_considered)
+        # stable sort by source and descending IoU - first candidate of each source has max
+        # overlap, earlier detections win ties
+        candidates = candidates[
+            np.lexsort((-ious[detection_index, candidates], source_ids[candidates]))
+        ]
+        _, first_in_source = np.unique(source_ids[candidates], return_index=True)
+        if len(first_in_source) < (required_votes - 1):
+            continue
+        group = np.concatenate([[detection_index], candidates[first_in_source]])
+        if aggregate_confidence(confidences[group]) < confidence:
+            continue
+        not_considered[group] = False
+        groups.append(group)
+    if not groups:
+        return sv.Detections.empty()
+    return merge_consensus_groups(
+        detections_from_sources=detections_from_sources,
+        groups=groups,
         confidence_aggregation_mode=detections_merge_confidence_aggregation,
         boxes_aggregation_mode=detections_merge_coordinates_aggregation,
     )
-    if merged_detection.confidence[0] < confidence:
-        # Returning empty sv.Detections
-        return consensus_detections, detections_already_considered
-    consensus_detections.append(merged_detection)
-    detections_already_considered.add(detection[DETECTION_ID_KEY][0])
-    for matched_value in detections_with_max_overlap.values():
-        detections_already_considered.add(matched_value[0][DETECTION_ID_KEY][0])
-    return consensus_detections, detections_already_considered
+
+
+def calculate_matching_iou_matrix(
+    detections_from_sources: List[sv.Detections],
+    iou_threshold: float,
+    class_aware: bool,
+) -> np.ndarray:
+    """
+    Returns square matrix of IoU between all detections (concatenated in order of sources),
+    with zeros for pairs that cannot be matched - detections from the same source,
+    with IoU not exceeding `iou_threshold` or of different classes in class-aware mode.
+    """
+    offsets = np.cumsum([0] + [len(d) for d in detections_from_sources])
+    ious = np.zeros((offsets[-1], offsets[-1]), dtype=np.float64)
+    for source_a, detections_a in enumerate(detections_from_sources):
+        for source_b in range(source_a + 1, len(detections_from_sources)):
+            detections_b = detections_from_sources[source_b]
+            pair_ious = np.nan_to_num(
+                sv.box_iou_batch(detections_a.xyxy, detections_b.xyxy), nan=0.0
+            )
+            pair_ious[pair_ious <= iou_threshold] = 0.0
+            if class_aware:
+                pair_ious[
+                    detections_a["class_name"][:, np.newaxis]
+                    != detections_b["class_name"][np.newaxis, :]
+                ] = 0.0
+            a_slice = slice(offsets[source_a], offsets[source_a + 1])
+            b_slice = slice(offsets[source_b], offsets[source_b + 1])
+            ious[a_slice, b_slice] = pair_ious
+            ious[b_slice, a_slice] = pair_ious.T
+    return ious
+
+
+def merge_consensus_groups(
+    detections_from_sources: List[sv.Detections],
+    groups: List[np.ndarray],
+    confidence_aggregation_mode: AggregationMode,
+    boxes_aggregation_mode: AggregationMode,
+) -> sv.Detections:
+    """
+    Merges each group of detections (indices into detections concatenated in order of sources,
+    first index being the detection that initiated the group) into single detection. Class is
+    the majority class in `average` mode and class of the most / least confident detection
+    otherwise, box is the average or the largest / smallest one. Masks are never merged, but
+    they define the area used to pick the largest / smallest box. Metadata is taken from the
+    detection that initiated the group.
+    """
+    members = np.full((len(groups), max(len(g) for g in groups)), -1)
+    for group_index, group in enumerate(groups):
+        members[group_index, : len(group)] = group
+    is_member = members >= 0
+    members_count = is_member.sum(axis=1)
+    members = np.where(is_member, members, members[:, :1])
+    rows = np.arange(len(groups))
+    confidences = np.concatenate(
+        [d.confidence for d in detections_from_sources]
+    ).astype(np.float64)[members]
+    class_names = np.concatenate([d["class_name"] for d in detections_from_sources])
+    class_ids = np.concatenate([d.class_id for d in detections_from_sources])
+    if confidence_aggregation_mode is AggregationMode.AVERAGE:
+        merged_confidence = (
+            np.where(is_member, confidences, 0.0).sum(axis=1) / members_count
+        )
+        same_class = (
+            (
+                class_names[members][:, :, np.newaxis]
+                == class_names[members][:, np.newaxis, :]
+            )
+            & (
+                class_ids[members][:, :, np.newaxis]
+                == class_ids[members][:, np.newaxis, :]
+            )
+            & is_member[:, np.newaxis, :]
+        )
+        votes = np.where(is_member, same_class.sum(axis=2), -1)
+        class_source = members[rows, np.argmax(votes, axis=1)]
+    else:
+        is_max = confidence_aggregation_mode is AggregationMode.MAX
+        padded_confidences = np.where(
+            is_member, confidences, -np.inf if is_max else np.inf
+        )
+        selected = (np.argmax if is_max else np.argmin)(padded_confidences, axis=1)
+        merged_confidence = padded_confidences[rows, selected]
+        class_source = members[rows, selected]
+    xyxy = np.concatenate([d.xyxy for d in detections_from_sources]).astype(np.float64)
+    if boxes_aggregation_mode is AggregationMode.AVERAGE:
+        merged_xyxy = (
+            np.where(is_member[:, :, np.newaxis], xyxy[members], 0.0).sum(axis=1)
+            / members_count[:, np.newaxis]
+        )
+    else:
+        is_max = boxes_aggregation_mode is AggregationMode.MAX
+        areas = np.concatenate([d.area for d in detections_from_sources]).astype(
+            np.float64
+        )
+        padded_areas = np.where(
+            is_member, areas[members], -np.inf if is_max else np.inf
+        )
+        selected = (np.argmax if is_max else np.argmin)(padded_areas, axis=1)
+        merged_xyxy = xyxy[members[rows, selected]]
+    leaders = members[:, 0]
+
+    def leaders_values(key: str, default: Optional[float] = None) -> np.ndarray:
+        values = [
+            (
+                d.data[key]
+                if default is None or key in d.data
+                else np.full(len(d), default)
+            )
+            for d in detections_from_sources
+        ]
+        return np.concatenate(values)[leaders]
+
+    data = {
+        "class_name": class_names[class_source],
+        PARENT_ID_KEY: leaders_values(PARENT_ID_KEY),
+        DETECTION_ID_KEY: np.array([str(uuid4()) for _ in groups]),
+        PREDICTION_TYPE_KEY: np.array(["object-detection"] * len(groups)),
+        PARENT_COORDINATES_KEY: leaders_values(PARENT_COORDINATES_KEY),
+        PARENT_DIMENSIONS_KEY: leaders_values(PARENT_DIMENSIONS_KEY),
+        ROOT_PARENT_ID_KEY: leaders_values(ROOT_PARENT_ID_KEY),
+        ROOT_PARENT_COORDINATES_KEY: leaders_values(ROOT_PARENT_COORDINATES_KEY),
+        ROOT_PARENT_DIMENSIONS_KEY: leaders_values(ROOT_PARENT_DIMENSIONS_KEY),
+        IMAGE_DIMENSIONS_KEY: leaders_values(IMAGE_DIMENSIONS_KEY),
+        SCALING_RELATIVE_TO_PARENT_KEY: leaders_values(
+            SCALING_RELATIVE_TO_PARENT_KEY, default=1.0
+        ),
+        SCALING_RELATIVE_TO_ROOT_PARENT_KEY: leaders_values(
+            SCALING_RELATIVE_TO_ROOT_PARENT_KEY, default=1.0
+        ),
+    }
+    return sv.Detections(
+        xyxy=merged_xyxy,
+        class_id=class_ids[class_source],
+        confidence=merged_confidence,
+        data=data,
+    )
 
 
 def check_objects_presence_in_consensus_detections(
@@ -478,126 +566,10 @@ def check_objects_presence_in_consensus_detections(
     return True, class2confidence
 
 
-def merge_detections(
-    detections: sv.Detections,
-    confidence_aggregation_mode: AggregationMode,
-    boxes_aggregation_mode: AggregationMode,
-) -> sv.Detections:
-    class_name, class_id = AGGREGATION_MODE2CLASS_SELECTOR[confidence_aggregation_mode](
-        detections
-    )
-    x1, y1, x2, y2 = AGGREGATION_MODE2BOXES_AGGREGATOR[boxes_aggregation_mode](
-        detections
-    )
-    data = {
-        "class_name": np.array([class_name]),
-        PARENT_ID_KEY: np.array([detections[PARENT_ID_KEY][0]]),
-        DETECTION_ID_KEY: np.array([str(uuid4())]),
-        PREDICTION_TYPE_KEY: np.array(["object-detection"]),
-        PARENT_COORDINATES_KEY: np.array([detections[PARENT_COORDINATES_KEY][0]]),
-        PARENT_DIMENSIONS_KEY: np.array([detections[PARENT_DIMENSIONS_KEY][0]]),
-        ROOT_PARENT_ID_KEY: np.array([detections[ROOT_PARENT_ID_KEY][0]]),
-        ROOT_PARENT_COORDINATES_KEY: np.array(
-            [detections[ROOT_PARENT_COORDINATES_KEY][0]]
-        ),
-        ROOT_PARENT_DIMENSIONS_KEY: np.array(
-            [detections[ROOT_PARENT_DIMENSIONS_KEY][0]]
-        ),
-        IMAGE_DIMENSIONS_KEY: np.array([detections[IMAGE_DIMENSIONS_KEY][0]]),
-    }
-    if SCALING_RELATIVE_TO_PARENT_KEY in detections.data:
-        data[SCALING_RELATIVE_TO_PARENT_KEY] = np.array(
-            [detections[SCALING_RELATIVE_TO_PARENT_KEY][0]]
-        )
-    else:
-        data[SCALING_RELATIVE_TO_PARENT_KEY] = np.array([1.0])
-    if SCALING_RELATIVE_TO_ROOT_PARENT_KEY in detections.data:
-        data[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] = np.array(
-            [detections[SCALING_RELATIVE_TO_ROOT_PARENT_KEY][0]]
-        )
-    else:
-        data[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] = np.array([1.0])
-    return sv.Detections(
-        xyxy=np.array([[x1, y1, x2, y2]], dtype=np.float64),
-        class_id=np.array([class_id]),
-        confidence=np.array(
-            [
-                aggregate_field_values(
-                    detections=detections,
-                    field="confidence",
-                    aggregation_mode=confidence_aggregation_mode,
-                )
-            ],
-            dtype=np.float64,
-        ),
-        data=data,
-    )
-
-
-def get_majority_class(detections: sv.Detections) -> Tuple[str, int]:
-    class_counts = Counter(
-        [
-            (str(class_name), int(class_id))
-            for class_name, class_id in zip(
-                detections["class_name"], detections.class_id
-            )
-        ]
-    )
-    return class_counts.most_common(1)[0][0]
-
-
-def get_class_of_most_confident_detection(detections: sv.Detections) -> Tuple[str, int]:
-    confidences: List[float] = detections.confidence.astype(float).tolist()
-    max_confidence_index = confidences.index(max(confidences))
-    max_confidence_detection = detections[max_confidence_index]
-    return (
-        max_confidence_detection["class_name"][0],
-        max_confidence_detection.class_id[0],
-    )
-
-
-def get_class_of_least_confident_detection(
-    detections: sv.Detections,
-) -> Tuple[str, int]:
-    confidences: List[float] = detections.confidence.astype(float).tolist()
-    min_confidence_index = confidences.index(min(confidences))
-    min_confidence_detection = detections[min_confidence_index]
-    return (
-        min_confidence_detection["class_name"][0],
-        min_confidence_detection.class_id[0],
-    )
-
-
-AGGREGATION_MODE2CLASS_SELECTOR = {
-    AggregationMode.MAX: get_class_of_most_confident_detection,
-    AggregationMode.MIN: get_class_of_least_confident_detection,
-    AggregationMode.AVERAGE: get_majority_class,
-}
-
-
-def get_average_bounding_box(detections: sv.Detections) -> Tuple[int, int, int, int]:
-    avg_xyxy: np.ndarray = sum(detections.xyxy) / len(detections)
-    return tuple(avg_xyxy.astype(float))
-
-
-def get_smallest_bounding_box(detections: sv.Detections) -> Tuple[int, int, int, int]:
-    areas: List[float] = detections.area.astype(float).tolist()
-    min_area = min(areas)
-    min_area_index = areas.index(min_area)
-    return tuple(detections[min_area_index].xyxy[0])
-
-
-def get_largest_bounding_box(detections: sv.Detections) -> Tuple[int, int, int, int]:
-    areas: List[float] = detections.area.astype(float).tolist()
-    max_area = max(areas)
-    max_area_index = areas.index(max_area)
-    return tuple(detections[max_area_index].xyxy[0])
-
-
-AGGREGATION_MODE2BOXES_AGGREGATOR = {
-    AggregationMode.MAX: get_largest_bounding_box,
-    AggregationMode.MIN: get_smallest_bounding_box,
-    AggregationMode.AVERAGE: get_average_bounding_box,
+AGGREGATION_MODE2ARRAY_AGGREGATOR = {
+    AggregationMode.MAX: np.max,
+    AggregationMode.MIN: np.min,
+    AggregationMode.AVERAGE: np.mean,
 }
 
 AGGREGATION_MODE2FIELD_AGGREGATOR = {
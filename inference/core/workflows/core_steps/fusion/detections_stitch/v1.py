@@ -1,10 +1,10 @@
-from copy import deepcopy
+from dataclasses import replace
 from typing import Dict, List, Literal, Optional, Tuple, Type, Union
 
 import numpy as np
 import supervision as sv
 from pydantic import ConfigDict, Field
-from supervision import OverlapFilter, move_boxes, move_masks
+from supervision import OverlapFilter, move_boxes
 
 from inference.core.workflows.execution_engine.constants import (
     PARENT_COORDINATES_KEY,
@@ -133,26 +133,13 @@ class DetectionsStitchBlockV1(WorkflowBlock):
         overlap_filtering_strategy: Optional[Literal["none", "nms", "nmm"]],
         iou_threshold: Optional[float],
     ) -> BlockResult:
-        re_aligned_predictions = []
-        for detections in predictions:
-            detections_copy = deepcopy(detections)
-            resolution_wh = retrieve_crop_wh(detections=detections_copy)
-            offset = retrieve_crop_offset(detections=detections_copy)
-            detections_copy = manage_crops_metadata(
-                detections=detections_copy,
-                offset=offset,
-                parent_id=reference_image.parent_metadata.parent_id,
-            )
-            re_aligned_detections = move_detections(
-                detections=detections_copy,
-                offset=offset,
-                resolution_wh=resolution_wh,
-            )
-            re_aligned_predictions.append(re_aligned_detections)
+        merged = stitch_crops_detections(
+            crops_detections=list(predictions),
+            parent_id=reference_image.parent_metadata.parent_id,
+        )
         overlap_filter = choose_overlap_filter_strategy(
             overlap_filtering_strategy=overlap_filtering_strategy,
         )
-        merged = sv.Detections.merge(detections_list=re_aligned_predictions)
         if overlap_filter is OverlapFilter.NONE:
             return {"predictions": merged}
         if overlap_filter is OverlapFilter.NON_MAX_SUPPRESSION:
@@ -160,6 +147,85 @@ class DetectionsStitchBlockV1(WorkflowBlock):
         return {"predictions": merged.with_nmm(threshold=iou_threshold)}
 
 
+def stitch_crops_detections(
+    crops_detections: List[sv.Detections],
+    parent_id: str,
+) -> sv.Detections:
+    """
+    Re-aligns detections made against crops to the coordinates system of the image crops were
+    taken from and merges them. Detections of all crops are merged first (which copies them,
+    so crops predictions are not modified) and moved with a single offset per detection, only
+    masks are pasted crop by crop directly into the output array.
+    """
+    crops_detections = [d for d in crops_detections if len(d) > 0]
+    if not crops_detections:
+        return sv.Detections.empty()
+    offsets = np.array(
+        [retrieve_crop_offset(detections=detections) for detections in crops_detections]
+    )
+    detections_offsets = np.repeat(
+        offsets, [len(detections) for detections in crops_detections], axis=0
+    )
+    resolutions_wh = {
+        retrieve_crop_wh(detections=detections) for detections in crops_detections
+    }
+    if len(resolutions_wh) > 1:
+        raise ValueError(
+            f"Detections Stitch block expects all crops to be taken from images of the same size, "
+            f"got crops of images of sizes (width, height): {sorted(resolutions_wh)}. This error "
+            f"probably indicate wrong step output plugged as input of this step."
+        )
+    resolution_wh = resolutions_wh.pop()
+    crops_masks = [detections.mask for detections in crops_detections]
+    if any(mask is not None for mask in crops_masks):
+        if any(mask is None for mask in crops_masks):
+            raise ValueError("All or none of the 'mask' fields must be None")
+        # masks of different crops may be of different size, they get merged while moving
+        crops_detections = [replace(d, mask=None) for d in crops_detections]
+    merged = sv.Detections.merge(detections_list=crops_detections)
+    merged = manage_crops_metadata(
+        detections=merged,
+        offset=detections_offsets,
+        parent_id=parent_id,
+    )
+    merged.xyxy = move_boxes(xyxy=merged.xyxy, offset=detections_offsets)
+    if crops_masks[0] is not None:
+        merged.mask = move_crops_masks(
+            crops_masks=crops_masks,
+            offsets=offsets,
+            resolution_wh=resolution_wh,
+        )
+    return merged
+
+
+def move_crops_masks(
+    crops_masks: List[np.ndarray],
+    offsets: np.ndarray,
+    resolution_wh: Tuple[int, int],
+) -> np.ndarray:
+    if (offsets < 0).any():
+        raise ValueError(
+            f"Offset values must be non-negative integers. Got: {offsets[(offsets < 0).any(axis=1)][0]}"
+        )
+    masks = np.zeros(
+        (sum(len(m) for m in crops_masks), resolution_wh[1], resolution_wh[0]),
+        dtype=bool,
+    )
+    start = 0
+    for crop_masks, (offset_x, offset_y) in zip(crops_masks, offsets):
+        end = start + len(crop_masks)
+        # parts of crops reaching beyond the image are cut off
+        height = max(min(crop_masks.shape[1], resolution_wh[1] - offset_y), 0)
+        width = max(min(crop_masks.shape[2], resolution_wh[0] - offset_x), 0)
+        masks[
+            start:end,
+            offset_y : offset_y + height,
+            offset_x : offset_x + width,
+        ] = crop_masks[:, :height, :width]
+        start = end
+    return masks
+
+
 def retrieve_crop_wh(detections: sv.Detections) -> Optional[Tuple[int, int]]:
     if len(detections) == 0:
         return None
@@ -199,8 +265,8 @@ def manage_crops_metadata(
             "To process non-empty detections offset is needed, but not given"
         )
     if SCALING_RELATIVE_TO_PARENT_KEY in detections.data:
-        scale = detections[SCALING_RELATIVE_TO_PARENT_KEY][0]
-        if abs(scale - 1.0) > 1e-4:
+        scale = detections[SCALING_RELATIVE_TO_PARENT_KEY]
+        if np.any(np.abs(scale - 1.0) > 1e-4):
             raise ValueError(
                 f"Scaled bounding boxes were passed to Detections Stitch block "
                 f"which is not supported. Block is supposed to merge predictions "
@@ -216,32 +282,6 @@ def manage_crops_metadata(
     return detections
 
 
-def move_detections(
-    detections: sv.Detections,
-    offset: Optional[np.ndarray],
-    resolution_wh: Optional[Tuple[int, int]],
-) -> sv.Detections:
-    """
-    Copied from: https://github.com/roboflow/supervision/blob/5123085037ec594524fc8f9d9b71b1cd9f487e8d/supervision/detection/tools/inference_slicer.py#L17-L16
-    to avoid fragile contract with supervision, as this function is not element of public
-    API.
-    """
-    if len(detections) == 0:
-        return detections
-    if offset is None:
-        raise ValueError("To move non-empty detections offset is needed, but not given")
-    detections.xyxy = move_boxes(xyxy=detections.xyxy, offset=offset)
-    if detections.mask is not None:
-        if resolution_wh is None:
-            raise ValueError(
-                "To move non-empty detections with segmentation mask, resolution_wh is needed, but not given."
-            )
-        detections.mask = move_masks(
-            masks=detections.mask, offset=offset, resolution_wh=resolution_wh
-        )
-    return detections
-
-
 def choose_overlap_filter_strategy(
     overlap_filtering_strategy: Literal["none", "nms", "nmm"],
 ) -> sv.OverlapFilter:
@@ -95,9 +95,11 @@ from inference.core.workflows.core_steps.common.entities import StepExecutionMod
 from inference.core.workflows.core_steps.common.serializers import (
     serialise_image,
     serialise_sv_detections,
+    serialise_sv_detections_columnar,
     serialize_secret,
     serialize_video_metadata_kind,
     serialize_wildcard_kind,
+    serialize_wildcard_kind_with_columnar_detections,
 )
 from inference.core.workflows.core_steps.flow_control.continue_if.v1 import (
     ContinueIfBlockV1,
@@ -465,6 +467,16 @@ KINDS_SERIALIZERS = {
     SECRET_KIND.name: serialize_secret,
     WILDCARD_KIND.name: serialize_wildcard_kind,
 }
+# overrides of KINDS_SERIALIZERS to be applied when clients request detections
+# to be serialised in columnar format
+COLUMNAR_DETECTIONS_KINDS_SERIALIZERS = {
+    OBJECT_DETECTION_PREDICTION_KIND.name: serialise_sv_detections_columnar,
+    INSTANCE_SEGMENTATION_PREDICTION_KIND.name: serialise_sv_detections_columnar,
+    KEYPOINT_DETECTION_PREDICTION_KIND.name: serialise_sv_detections_columnar,
+    QR_CODE_DETECTION_KIND.name: serialise_sv_detections_columnar,
+    BAR_CODE_DETECTION_KIND.name: serialise_sv_detections_columnar,
+    WILDCARD_KIND.name: serialize_wildcard_kind_with_columnar_detections,
+}
 KINDS_DESERIALIZERS = {
     IMAGE_KIND.name: deserialize_image_kind,
     VIDEO_METADATA_KIND.name: deserialize_video_metadata_kind,
@@ -1,5 +1,6 @@
 from typing import List, Literal, Optional, Type, Union
 
+import supervision as sv
 from pydantic import ConfigDict, Field, PositiveInt
 
 from inference.core.entities.requests.inference import (
@@ -122,7 +123,7 @@ class BlockManifest(WorkflowBlockManifest):
         examples=[3000, "$inputs.max_candidates"],
     )
     mask_decode_mode: Union[
-        Literal["accurate", "tradeoff", "fast"],
+        Literal["accurate", "tradeoff", "fast", "roi"],
         Selector(kind=[STRING_KIND]),
     ] = Field(
         default="accurate",
@@ -200,7 +201,7 @@ class RoboflowInstanceSegmentationModelBlockV2(WorkflowBlock):
         iou_threshold: Optional[float],
         max_detections: Optional[int],
         max_candidates: Optional[int],
-        mask_decode_mode: Literal["accurate", "tradeoff", "fast"],
+        mask_decode_mode: Literal["accurate", "tradeoff", "fast", "roi"],
         tradeoff_factor: Optional[float],
         disable_active_learning: Optional[bool],
         active_learning_target_dataset: Optional[str],
@@ -250,7 +251,7 @@ class RoboflowInstanceSegmentationModelBlockV2(WorkflowBlock):
         iou_threshold: Optional[float],
         max_detections: Optional[int],
         max_candidates: Optional[int],
-        mask_decode_mode: Literal["accurate", "tradeoff", "fast"],
+        mask_decode_mode: Literal["accurate", "tradeoff", "fast", "roi"],
         tradeoff_factor: Optional[float],
         disable_active_learning: Optional[bool],
         active_learning_target_dataset: Optional[str],
@@ -276,17 +277,13 @@ class RoboflowInstanceSegmentationModelBlockV2(WorkflowBlock):
             model_id=model_id,
             api_key=self._api_key,
         )
-        predictions = self._model_manager.infer_from_request_sync(
+        detections = self._model_manager.infer_sv_detections_from_request_sync(
             model_id=model_id, request=request
         )
-        if not isinstance(predictions, list):
-            predictions = [predictions]
-        predictions = [
-            e.model_dump(by_alias=True, exclude_none=True) for e in predictions
-        ]
-        return self._post_process_result(
+        return self._post_process_detections(
             images=images,
-            predictions=predictions,
+            detections=detections,
+            inference_ids=[request.id] * len(detections),
             class_filter=class_filter,
             model_id=model_id,
         )
@@ -301,7 +298,7 @@ class RoboflowInstanceSegmentationModelBlockV2(WorkflowBlock):
         iou_threshold: Optional[float],
         max_detections: Optional[int],
         max_candidates: Optional[int],
-        mask_decode_mode: Literal["accurate", "tradeoff", "fast"],
+        mask_decode_mode: Literal["accurate", "tradeoff", "fast", "roi"],
         tradeoff_factor: Optional[float],
         disable_active_learning: Optional[bool],
         active_learning_target_dataset: Optional[str],
@@ -355,9 +352,25 @@ class RoboflowInstanceSegmentationModelBlockV2(WorkflowBlock):
         model_id: str,
     ) -> BlockResult:
         inference_ids = [p.get(INFERENCE_ID_KEY, None) for p in predictions]
-        predictions = convert_inference_detections_batch_to_sv_detections(predictions)
+        detections = convert_inference_detections_batch_to_sv_detections(predictions)
+        return self._post_process_detections(
+            images=images,
+            detections=detections,
+            inference_ids=inference_ids,
+            class_filter=class_filter,
+            model_id=model_id,
+        )
+
+    def _post_process_detections(
+        self,
+        images: Batch[WorkflowImageData],
+        detections: List[sv.Detections],
+        inference_ids: List[Optional[str]],
+        class_filter: Optional[List[str]],
+        model_id: str,
+    ) -> BlockResult:
         predictions = attach_prediction_type_info_to_sv_detections_batch(
-            predictions=predictions,
+            predictions=detections,
             prediction_type="instance-segmentation",
         )
         predictions = filter_out_unwanted_classes_from_sv_detections_batch(
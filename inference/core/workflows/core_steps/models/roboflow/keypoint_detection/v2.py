@@ -1,5 +1,6 @@
 from typing import List, Literal, Optional, Type, Union
 
+import supervision as sv
 from pydantic import ConfigDict, Field, PositiveInt
 
 from inference.core.entities.requests.inference import (
@@ -261,17 +262,13 @@ class RoboflowKeypointDetectionModelBlockV2(WorkflowBlock):
             model_id=model_id,
             api_key=self._api_key,
         )
-        predictions = self._model_manager.infer_from_request_sync(
+        detections = self._model_manager.infer_sv_detections_from_request_sync(
             model_id=model_id, request=request
         )
-        if not isinstance(predictions, list):
-            predictions = [predictions]
-        predictions = [
-            e.model_dump(by_alias=True, exclude_none=True) for e in predictions
-        ]
-        return self._post_process_result(
+        return self._post_process_detections(
             images=images,
-            predictions=predictions,
+            detections=detections,
+            inference_ids=[request.id] * len(detections),
             class_filter=class_filter,
             model_id=model_id,
         )
@@ -344,6 +341,22 @@ class RoboflowKeypointDetectionModelBlockV2(WorkflowBlock):
                 inference_prediction=prediction["predictions"],
                 detections=image_detections,
             )
+        return self._post_process_detections(
+            images=images,
+            detections=detections,
+            inference_ids=inference_ids,
+            class_filter=class_filter,
+            model_id=model_id,
+        )
+
+    def _post_process_detections(
+        self,
+        images: Batch[WorkflowImageData],
+        detections: List[sv.Detections],
+        inference_ids: List[Optional[str]],
+        class_filter: Optional[List[str]],
+        model_id: str,
+    ) -> BlockResult:
         detections = attach_prediction_type_info_to_sv_detections_batch(
             predictions=detections,
             prediction_type="keypoint-detection",
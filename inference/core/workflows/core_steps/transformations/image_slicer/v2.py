@@ -4,7 +4,6 @@ from uuid import uuid4
 
 import numpy as np
 from pydantic import AliasChoices, ConfigDict, Field, PositiveInt
-from supervision import crop_image
 from typing_extensions import Annotated
 
 from inference.core.workflows.execution_engine.entities.base import (
@@ -138,9 +137,9 @@ class ImageSlicerBlockV2(WorkflowBlock):
             overlap_ratio_wh=(overlap_ratio_width, overlap_ratio_height),
         )
         slices = []
-        for offset in offsets:
-            x_min, y_min, _, _ = offset
-            crop_numpy = crop_image(image=image_numpy, xyxy=offset)
+        for x_min, y_min, x_max, y_max in offsets.tolist():
+            # slices are views into the input image - no pixels are copied
+            crop_numpy = image_numpy[y_min:y_max, x_min:x_max]
             if crop_numpy.size:
                 cropped_image = WorkflowImageData.create_crop(
                     origin_image_data=image,
@@ -185,12 +184,5 @@ def generate_offsets(
     xmax = np.clip(xmin + slice_width, 0, image_width)
     ymax = np.clip(ymin + slice_height, 0, image_height)
     results = np.stack([xmin, ymin, xmax, ymax], axis=-1).reshape(-1, 4)
-    deduplicated_results = []
-    already_seen = set()
-    for xyxy in results:
-        xyxy_tuple = tuple(xyxy)
-        if xyxy_tuple in already_seen:
-            continue
-        deduplicated_results.append(xyxy)
-        already_seen.add(xyxy_tuple)
-    return np.array(deduplicated_results)
+    _, first_occurrences = np.unique(results, axis=0, return_index=True)
+    return results[np.sort(first_occurrences)]
@@ -1,5 +1,5 @@
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Type
 
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
@@ -69,12 +69,14 @@ class ExecutionEngine(BaseExecutionEngine):
         fps: float = 0,
         _is_preview: bool = False,
         serialize_results: bool = False,
+        kinds_serializers_overrides: Optional[Dict[str, Callable[[Any], Any]]] = None,
     ) -> List[Dict[str, Any]]:
         return self._engine.run(
             runtime_parameters=runtime_parameters,
             fps=fps,
             _is_preview=_is_preview,
             serialize_results=serialize_results,
+            kinds_serializers_overrides=kinds_serializers_overrides,
         )
 
 
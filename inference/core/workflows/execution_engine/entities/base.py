@@ -5,8 +5,10 @@ from datetime import datetime
 from enum import Enum
 from typing import (
     Any,
+    Callable,
     Dict,
     Generic,
+    Hashable,
     Iterator,
     List,
     Optional,
@@ -21,6 +23,11 @@ import numpy as np
 from pydantic import BaseModel, Field
 from typing_extensions import Annotated, Literal
 
+from inference.core.env import ENABLE_WORKFLOWS_IMAGE_REPRESENTATIONS_CACHE
+from inference.core.utils.image_representations import (
+    ImageRepresentationsCache,
+    attach_representations_cache,
+)
 from inference.core.utils.image_utils import (
     attempt_loading_image_from_string,
     encode_image_to_jpeg_bytes,
@@ -114,6 +121,7 @@ InputType = Annotated[
 ]
 
 B = TypeVar("B")
+T = TypeVar("T")
 
 
 class Batch(Generic[B]):
@@ -246,6 +254,7 @@ class WorkflowImageData:
         self._base64_image = base64_image
         self._numpy_image = numpy_image
         self._video_metadata = video_metadata
+        self._representations_cache = ImageRepresentationsCache()
 
     @classmethod
     def copy_and_replace(
@@ -287,7 +296,7 @@ class WorkflowImageData:
             workflow_root_ancestor_metadata = kwargs["workflow_root_ancestor_metadata"]
         if "video_metadata" in kwargs:
             video_metadata = kwargs["video_metadata"]
-        return cls(
+        result = cls(
             parent_metadata=parent_metadata,
             workflow_root_ancestor_metadata=workflow_root_ancestor_metadata,
             image_reference=image_reference,
@@ -295,6 +304,12 @@ class WorkflowImageData:
             numpy_image=numpy_image,
             video_metadata=video_metadata,
         )
+        if not any(
+            k in kwargs for k in ["numpy_image", "base64_image", "image_reference"]
+        ):
+            # pixels are not changed - representations derived so far remain valid
+            result._representations_cache = origin_image_data._representations_cache
+        return result
 
     @classmethod
     def create_crop(
@@ -378,27 +393,56 @@ class WorkflowImageData:
     def numpy_image(self) -> np.ndarray:
         if self._numpy_image is not None:
             return self._numpy_image
+        # concurrently executed steps wait for single decoding of the image
+        self._numpy_image = self._representations_cache.get_or_compute(
+            key=("numpy_image",), compute=self._load_numpy_image
+        )
+        return self._numpy_image
+
+    def _load_numpy_image(self) -> np.ndarray:
         if self._base64_image:
-            self._numpy_image = attempt_loading_image_from_string(self._base64_image)[0]
-            return self._numpy_image
+            return attempt_loading_image_from_string(self._base64_image)[0]
         if self._image_reference.startswith(
             "http://"
         ) or self._image_reference.startswith("https://"):
-            self._numpy_image = load_image_from_url(value=self._image_reference)
-        else:
-            self._numpy_image = cv2.imread(self._image_reference)
-        return self._numpy_image
+            return load_image_from_url(value=self._image_reference)
+        return cv2.imread(self._image_reference)
 
     @property
     def base64_image(self) -> str:
         if self._base64_image is not None:
             return self._base64_image
-        numpy_image = self.numpy_image
-        self._base64_image = base64.b64encode(
-            encode_image_to_jpeg_bytes(numpy_image, jpeg_quality=95)
-        ).decode("ascii")
+        self._base64_image = self._representations_cache.get_or_compute(
+            key=("base64_image",),
+            compute=lambda: base64.b64encode(self.jpeg_bytes(jpeg_quality=95)).decode(
+                "ascii"
+            ),
+        )
         return self._base64_image
 
+    def jpeg_bytes(self, jpeg_quality: int = 95) -> bytes:
+        """
+        Returns image encoded as JPEG with given quality - encoding happens once per quality
+        value for the lifetime of the object.
+        """
+        return self._representations_cache.get_or_compute(
+            key=("jpeg_bytes", jpeg_quality),
+            compute=lambda: encode_image_to_jpeg_bytes(
+                self.numpy_image, jpeg_quality=jpeg_quality
+            ),
+        )
+
+    def get_or_compute_representation(
+        self, key: Hashable, compute: Callable[[], T]
+    ) -> T:
+        """
+        Returns representation of the image (for instance resized variant) registered under `key`,
+        computing it with `compute()` if not present. Computation is performed once, even if requested
+        concurrently by multiple steps. Key must capture all parameters of the transformation and
+        returned values MUST NOT be modified in-place, as they are shared among callers.
+        """
+        return self._representations_cache.get_or_compute(key=key, compute=compute)
+
     @property
     def video_metadata(self) -> VideoMetadata:
         if self._video_metadata is not None:
@@ -413,7 +457,7 @@ class WorkflowImageData:
 
     def to_inference_format(self, numpy_preferred: bool = False) -> Dict[str, Any]:
         if numpy_preferred:
-            return {"type": "numpy_object", "value": self.numpy_image}
+            return {"type": "numpy_object", "value": self._numpy_image_for_inference()}
         if self._image_reference:
             if self._image_reference.startswith(
                 "http://"
@@ -422,4 +466,13 @@ class WorkflowImageData:
             return {"type": "file", "value": self._image_reference}
         if self._base64_image:
             return {"type": "base64", "value": self.base64_image}
-        return {"type": "numpy_object", "value": self.numpy_image}
+        return {"type": "numpy_object", "value": self._numpy_image_for_inference()}
+
+    def _numpy_image_for_inference(self) -> np.ndarray:
+        numpy_image = self.numpy_image
+        if ENABLE_WORKFLOWS_IMAGE_REPRESENTATIONS_CACHE:
+            # lets models running against the same image re-use pre-processed inputs
+            attach_representations_cache(
+                image=numpy_image, cache=self._representations_cache
+            )
+        return numpy_image
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from inference.core.workflows.execution_engine.profiling.core import WorkflowsProfiler
 
@@ -28,5 +28,6 @@ class BaseExecutionEngine(ABC):
         fps: float = 0,
         _is_preview: bool = False,
         serialize_results: bool = False,
+        kinds_serializers_overrides: Optional[Dict[str, Callable[[Any], Any]]] = None,
     ) -> List[Dict[str, Any]]:
         pass
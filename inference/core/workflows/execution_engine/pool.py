@@ -0,0 +1,230 @@
+import hashlib
+import json
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Dict, Generator, List, Optional
+
+from inference.core.workflows.execution_engine.core import (
+    ExecutionEngine,
+    retrieve_requested_execution_engine_version,
+)
+
+
+class RequestScopedParameter:
+    """Stand-in for init parameter which changes with each request (like FastAPI `BackgroundTasks`).
+
+    Blocks of pooled Execution Engine are initialised once, so instead of the value itself they
+    receive this object - which forwards attributes access to the value bound for the request
+    currently served by the engine. When no value is bound, object evaluates to False - the same
+    way as `None` passed as init parameter would.
+    """
+
+    def __init__(self):
+        self._value: Any = None
+
+    def bind(self, value: Any) -> None:
+        self._value = value
+
+    def unbind(self) -> None:
+        self._value = None
+
+    def __bool__(self) -> bool:
+        return bool(self._value)
+
+    def __getattr__(self, item: str) -> Any:
+        if item == "_value":
+            raise AttributeError(item)
+        return getattr(self._value, item)
+
+
+class _PooledEngine:
+
+    def __init__(
+        self,
+        engine: ExecutionEngine,
+        workflow_definition: dict,
+        request_scoped_parameters: Dict[str, RequestScopedParameter],
+    ):
+        self.engine = engine
+        self.workflow_definition = workflow_definition
+        self.request_scoped_parameters = request_scoped_parameters
+
+
+class ExecutionEnginePool:
+    """
+    Keeps initialised Execution Engines, such that consecutive runs of the same workflow do not
+    pay for compilation and steps initialisation.
+
+    Engines are keyed by workflow id (or hash of workflow definition, when id is not given),
+    Execution Engine version, api key and engine settings - other init parameters are assumed to
+    be the same for all engines taken from given pool. Engines keyed by workflow id are only
+    re-used for the definition they were initialised with - when workflow gets modified, engines
+    of its previous definition are discarded. Engine is leased exclusively - concurrent requests
+    for the same workflow get different engines (initialising new ones when no idle engine is
+    available), as workflow blocks are not guaranteed to be thread-safe. Pool is bounded by total
+    number of idle engines, when the limit is exceeded, engines of the least recently used
+    workflows are discarded.
+
+    As step instances are re-used, stateful blocks (like trackers) keep their state between runs
+    served by the same engine.
+
+    Thread safe thanks to thread lock guarding idle engines.
+    """
+
+    def __init__(self, max_size: int):
+        self._max_size = max(max_size, 1)
+        self._idle_engines: Dict[str, List[_PooledEngine]] = OrderedDict()
+        self._idle_engines_number = 0
+        self._lock = Lock()
+
+    @contextmanager
+    def lease(
+        self,
+        workflow_definition: dict,
+        init_parameters: Dict[str, Any],
+        api_key: Optional[str],
+        workflow_id: Optional[str] = None,
+        max_concurrent_steps: int = 1,
+        prevent_local_images_loading: bool = False,
+        request_scoped_parameters: Optional[Dict[str, Any]] = None,
+    ) -> Generator[ExecutionEngine, None, None]:
+        if request_scoped_parameters is None:
+            request_scoped_parameters = {}
+        key = self._get_key(
+            workflow_definition=workflow_definition,
+            api_key=api_key,
+            workflow_id=workflow_id,
+            max_concurrent_steps=max_concurrent_steps,
+            prevent_local_images_loading=prevent_local_images_loading,
+            request_scoped_parameters_names=sorted(request_scoped_parameters.keys()),
+        )
+        pooled_engine = self._take_idle_engine(
+            key=key,
+            workflow_definition=workflow_definition,
+            check_definition=bool(workflow_id),
+        )
+        if pooled_engine is None:
+            pooled_engine = self._init_engine(
+                workflow_definition=workflow_definition,
+                init_parameters=init_parameters,
+                workflow_id=workflow_id,
+                max_concurrent_steps=max_concurrent_steps,
+                prevent_local_images_loading=prevent_local_images_loading,
+                request_scoped_parameters_names=list(request_scoped_parameters.keys()),
+            )
+        for name, value in request_scoped_parameters.items():
+            pooled_engine.request_scoped_parameters[name].bind(value)
+        try:
+            yield pooled_engine.engine
+        except Exception:
+            # engine which failed is not returned to the pool - its steps may be left in
+            # inconsistent state
+            self._unbind_parameters(pooled_engine=pooled_engine)
+            raise
+        self._unbind_parameters(pooled_engine=pooled_engine)
+        self._return_engine(key=key, pooled_engine=pooled_engine)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._idle_engines.clear()
+            self._idle_engines_number = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._idle_engines_number
+
+    def _get_key(
+        self,
+        workflow_definition: dict,
+        api_key: Optional[str],
+        workflow_id: Optional[str],
+        max_concurrent_steps: int,
+        prevent_local_images_loading: bool,
+        request_scoped_parameters_names: List[str],
+    ) -> str:
+        execution_engine_version = retrieve_requested_execution_engine_version(
+            workflow_definition=workflow_definition
+        )
+        if workflow_id:
+            # serialising the whole definition is only needed when workflow cannot be identified
+            workflow_identifier = f"workflow_id:{workflow_id}"
+        else:
+            workflow_identifier = json.dumps(workflow_definition, sort_keys=True)
+        hash_chunks = [
+            workflow_identifier,
+            str(execution_engine_version),
+            str(api_key),
+            str(max_concurrent_steps),
+            str(prevent_local_images_loading),
+            ",".join(request_scoped_parameters_names),
+        ]
+        return hashlib.md5("<|>".join(hash_chunks).encode("utf-8")).hexdigest()
+
+    def _take_idle_engine(
+        self, key: str, workflow_definition: dict, check_definition: bool
+    ) -> Optional[_PooledEngine]:
+        with self._lock:
+            idle_engines = self._idle_engines.get(key)
+            if not idle_engines:
+                return None
+            self._idle_engines.move_to_end(key)
+            pooled_engine = None
+            while idle_engines and pooled_engine is None:
+                pooled_engine = idle_engines.pop()
+                self._idle_engines_number -= 1
+                if check_definition and not _is_the_same_definition(
+                    pooled_engine.workflow_definition, workflow_definition
+                ):
+                    # workflow was modified - engine of previous definition is discarded
+                    pooled_engine = None
+            if not idle_engines:
+                del self._idle_engines[key]
+            return pooled_engine
+
+    def _return_engine(self, key: str, pooled_engine: _PooledEngine) -> None:
+        with self._lock:
+            self._idle_engines.setdefault(key, []).append(pooled_engine)
+            self._idle_engines.move_to_end(key)
+            self._idle_engines_number += 1
+            while self._idle_engines_number > self._max_size:
+                evicted_key, evicted_engines = next(iter(self._idle_engines.items()))
+                evicted_engines.pop(0)
+                self._idle_engines_number -= 1
+                if not evicted_engines:
+                    del self._idle_engines[evicted_key]
+
+    def _init_engine(
+        self,
+        workflow_definition: dict,
+        init_parameters: Dict[str, Any],
+        workflow_id: Optional[str],
+        max_concurrent_steps: int,
+        prevent_local_images_loading: bool,
+        request_scoped_parameters_names: List[str],
+    ) -> _PooledEngine:
+        request_scoped_parameters = {
+            name: RequestScopedParameter() for name in request_scoped_parameters_names
+        }
+        engine = ExecutionEngine.init(
+            workflow_definition=workflow_definition,
+            init_parameters={**init_parameters, **request_scoped_parameters},
+            max_concurrent_steps=max_concurrent_steps,
+            prevent_local_images_loading=prevent_local_images_loading,
+            workflow_id=workflow_id,
+        )
+        return _PooledEngine(
+            engine=engine,
+            workflow_definition=workflow_definition,
+            request_scoped_parameters=request_scoped_parameters,
+        )
+
+    @staticmethod
+    def _unbind_parameters(pooled_engine: _PooledEngine) -> None:
+        for parameter in pooled_engine.request_scoped_parameters.values():
+            parameter.unbind()
+
+
+def _is_the_same_definition(first: dict, second: dict) -> bool:
+    # definitions of predefined workflows are served from cache, usually as the same object
+    return first is second or first == second
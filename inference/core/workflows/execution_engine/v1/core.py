@@ -1,5 +1,5 @@
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from packaging.version import Version
 
@@ -83,6 +83,7 @@ class ExecutionEngineV1(BaseExecutionEngine):
         fps: float = 0,
         _is_preview: bool = False,
         serialize_results: bool = False,
+        kinds_serializers_overrides: Optional[Dict[str, Callable[[Any], Any]]] = None,
     ) -> List[Dict[str, Any]]:
         self._profiler.start_workflow_run()
         runtime_parameters = assemble_runtime_parameters(
@@ -97,6 +98,9 @@ class ExecutionEngineV1(BaseExecutionEngine):
             input_substitutions=self._compiled_workflow.input_substitutions,
             profiler=self._profiler,
         )
+        kinds_serializers = self._compiled_workflow.kinds_serializers
+        if kinds_serializers_overrides:
+            kinds_serializers = {**kinds_serializers, **kinds_serializers_overrides}
         usage_workflow_id = self._internal_id
         if self._workflow_id and not usage_workflow_id:
             logger.debug(
@@ -111,7 +115,7 @@ class ExecutionEngineV1(BaseExecutionEngine):
             usage_fps=fps,
             usage_workflow_id=usage_workflow_id,
             usage_workflow_preview=_is_preview,
-            kinds_serializers=self._compiled_workflow.kinds_serializers,
+            kinds_serializers=kinds_serializers,
             serialize_results=serialize_results,
             profiler=self._profiler,
             executor=self._executor,
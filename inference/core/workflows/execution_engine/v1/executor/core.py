@@ -1,7 +1,6 @@
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
-from functools import partial
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional
 
 from inference.core import logger
 from inference.core.workflows.errors import (
@@ -24,14 +23,12 @@ from inference.core.workflows.execution_engine.v1.executor.execution_data_manage
     ExecutionDataManager,
 )
 from inference.core.workflows.execution_engine.v1.executor.flow_coordinator import (
-    ParallelStepExecutionCoordinator,
+    ReadyQueueStepExecutionCoordinator,
+    StepExecutionCoordinator,
 )
 from inference.core.workflows.execution_engine.v1.executor.output_constructor import (
     construct_workflow_output,
 )
-from inference.core.workflows.execution_engine.v1.executor.utils import (
-    run_steps_in_parallel,
-)
 from inference.core.workflows.prototypes.block import WorkflowBlock
 from inference.usage_tracking.collector import usage_collector
 
@@ -54,20 +51,28 @@ def run_workflow(
         execution_graph=workflow.execution_graph,
         runtime_parameters=runtime_parameters,
     )
-    execution_coordinator = ParallelStepExecutionCoordinator.init(
+    execution_coordinator = ReadyQueueStepExecutionCoordinator.init(
         execution_graph=workflow.execution_graph,
     )
-    next_steps = execution_coordinator.get_steps_to_execute_next(profiler=profiler)
-    while next_steps is not None:
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max(max_concurrent_steps, 1)) as executor:
+            execute_steps(
+                execution_coordinator=execution_coordinator,
+                workflow=workflow,
+                execution_data_manager=execution_data_manager,
+                max_concurrent_steps=max_concurrent_steps,
+                executor=executor,
+                profiler=profiler,
+            )
+    else:
         execute_steps(
-            next_steps=next_steps,
+            execution_coordinator=execution_coordinator,
             workflow=workflow,
             execution_data_manager=execution_data_manager,
             max_concurrent_steps=max_concurrent_steps,
-            profiler=profiler,
             executor=executor,
+            profiler=profiler,
         )
-        next_steps = execution_coordinator.get_steps_to_execute_next(profiler=profiler)
     with profiler.profile_execution_phase(
         name="outputs_construction",
         categories=["execution_engine_operation"],
@@ -82,32 +87,56 @@ def run_workflow(
 
 
 @execution_phase(
-    name="group_of_steps_execution",
+    name="steps_execution",
     categories=["execution_engine_operation"],
-    runtime_metadata=["next_steps", "max_concurrent_steps"],
+    runtime_metadata=["max_concurrent_steps"],
 )
 def execute_steps(
-    next_steps: List[str],
+    execution_coordinator: StepExecutionCoordinator,
     workflow: CompiledWorkflow,
     execution_data_manager: ExecutionDataManager,
     max_concurrent_steps: int,
+    executor: ThreadPoolExecutor,
     profiler: Optional[WorkflowsProfiler] = None,
-    executor: Optional[ThreadPoolExecutor] = None,
 ) -> None:
-    logger.info(f"Executing steps: {next_steps}.")
-    steps_functions = [
-        partial(
-            safe_execute_step,
-            step_selector=step_selector,
-            workflow=workflow,
-            execution_data_manager=execution_data_manager,
-            profiler=profiler,
+    # each step is submitted as soon as all of its predecessors finished - at most
+    # `max_concurrent_steps` at once, such that slow step only blocks its own descendants
+    running_steps: Dict[Future, str] = {}
+    try:
+        while True:
+            while len(running_steps) < max(max_concurrent_steps, 1):
+                step_selector = execution_coordinator.get_next_ready_step()
+                if step_selector is None:
+                    break
+                logger.info(f"Executing step: {step_selector}.")
+                future = executor.submit(
+                    safe_execute_step,
+                    step_selector=step_selector,
+                    workflow=workflow,
+                    execution_data_manager=execution_data_manager,
+                    profiler=profiler,
+                )
+                running_steps[future] = step_selector
+            if not running_steps:
+                break
+            finished, _ = wait(running_steps, return_when=FIRST_COMPLETED)
+            for future in finished:
+                step_selector = running_steps.pop(future)
+                future.result()
+                execution_coordinator.register_step_completion(
+                    step_selector=step_selector
+                )
+    finally:
+        # steps already started must not outlive the workflow run (nor write into its data)
+        wait(running_steps)
+    if not execution_coordinator.is_finished():
+        raise ExecutionEngineRuntimeError(
+            public_message=f"Error in execution engine. Not all steps of the workflow could be scheduled "
+            f"for execution. This is most likely bug. Contact Roboflow team through github issues "
+            f"(https://github.com/roboflow/inference/issues) providing full context of"
+            f"the problem - including workflow definition you use.",
+            context="workflow_execution | steps_scheduling",
         )
-        for step_selector in next_steps
-    ]
-    _ = run_steps_in_parallel(
-        steps=steps_functions, max_workers=max_concurrent_steps, executor=executor
-    )
 
 
 @execution_phase(
@@ -1,17 +1,11 @@
 import abc
-from typing import List, Optional
+import heapq
+import threading
+from typing import Dict, List, Optional, Set, Tuple
 
 import networkx as nx
 
-from inference.core.workflows.execution_engine.profiling.core import (
-    WorkflowsProfiler,
-    execution_phase,
-)
 from inference.core.workflows.execution_engine.v1.compiler.entities import NodeCategory
-from inference.core.workflows.execution_engine.v1.compiler.graph_traversal import (
-    assign_max_distances_from_start,
-    group_nodes_by_sorted_key_value,
-)
 from inference.core.workflows.execution_engine.v1.compiler.utils import (
     get_nodes_of_specific_category,
 )
@@ -25,66 +19,95 @@ class StepExecutionCoordinator(metaclass=abc.ABCMeta):
         pass
 
     @abc.abstractmethod
-    def get_steps_to_execute_next(
-        self, profiler: Optional[WorkflowsProfiler] = None
-    ) -> Optional[List[str]]:
+    def get_next_ready_step(self) -> Optional[str]:
+        pass
+
+    @abc.abstractmethod
+    def register_step_completion(self, step_selector: str) -> None:
+        pass
+
+    @abc.abstractmethod
+    def is_finished(self) -> bool:
         pass
 
 
-class ParallelStepExecutionCoordinator(StepExecutionCoordinator):
+class ReadyQueueStepExecutionCoordinator(StepExecutionCoordinator):
+    """
+    Hands out steps as soon as all the steps they depend on are finished - instead of
+    executing the workflow level by level. When more steps are ready than can be executed
+    at once, steps on the longer path to the end of the workflow (critical path) go first.
+    """
 
     @classmethod
-    def init(cls, execution_graph: nx.DiGraph) -> "StepExecutionCoordinator":
-        return cls(execution_graph=execution_graph)
+    def init(cls, execution_graph: nx.DiGraph) -> "ReadyQueueStepExecutionCoordinator":
+        super_start_node = "<start>"
+        steps_flow_graph = construct_steps_flow_graph(
+            execution_graph=execution_graph,
+            super_start_node=super_start_node,
+        )
+        steps_flow_graph.remove_node(super_start_node)
+        return cls(steps_flow_graph=steps_flow_graph)
 
-    def __init__(self, execution_graph: nx.DiGraph):
-        self._execution_graph = execution_graph.copy()
-        self.__execution_order: Optional[List[List[str]]] = None
-        self.__execution_pointer = 0
+    def __init__(self, steps_flow_graph: nx.DiGraph):
+        self._steps_flow_graph = steps_flow_graph
+        self._priorities = establish_steps_priorities(steps_flow_graph=steps_flow_graph)
+        self._pending_dependencies: Dict[str, int] = {
+            step: steps_flow_graph.in_degree(step) for step in steps_flow_graph.nodes
+        }
+        self._topological_positions = {
+            step: position
+            for position, step in enumerate(nx.topological_sort(steps_flow_graph))
+        }
+        self._ready_steps: List[Tuple[int, int, str]] = []
+        self._started_steps: Set[str] = set()
+        self._finished_steps: Set[str] = set()
+        self._lock = threading.Lock()
+        for step, pending_dependencies in self._pending_dependencies.items():
+            if pending_dependencies == 0:
+                self._push_ready_step(step=step)
 
-    @execution_phase(
-        name="next_steps_selection",
-        categories=["execution_engine_operation"],
-    )
-    def get_steps_to_execute_next(
-        self, profiler: Optional[WorkflowsProfiler] = None
-    ) -> Optional[List[str]]:
-        if self.__execution_order is None:
-            self.__execution_order = establish_execution_order(
-                execution_graph=self._execution_graph
-            )
-            self.__execution_pointer = 0
-        next_step = None
-        while self.__execution_pointer < len(self.__execution_order):
-            candidate_steps = [
-                e for e in self.__execution_order[self.__execution_pointer]
-            ]
-            self.__execution_pointer += 1
-            if len(candidate_steps) == 0:
-                continue
-            return candidate_steps
-        return next_step
-
-
-def establish_execution_order(
-    execution_graph: nx.DiGraph,
-) -> List[List[str]]:
-    super_start_node = "<start>"
-    steps_flow_graph = construct_steps_flow_graph(
-        execution_graph=execution_graph,
-        super_start_node=super_start_node,
-    )
-    distance_key = "distance"
-    steps_flow_graph = assign_max_distances_from_start(
-        graph=steps_flow_graph,
-        start_node=super_start_node,
-        distance_key=distance_key,
-    )
-    return group_nodes_by_sorted_key_value(
-        graph=steps_flow_graph,
-        excluded_nodes={super_start_node},
-        key=distance_key,
-    )
+    def get_next_ready_step(self) -> Optional[str]:
+        with self._lock:
+            if not self._ready_steps:
+                return None
+            _, _, step = heapq.heappop(self._ready_steps)
+            self._started_steps.add(step)
+            return step
+
+    def register_step_completion(self, step_selector: str) -> None:
+        with self._lock:
+            if step_selector not in self._started_steps:
+                raise ValueError(
+                    f"Step {step_selector} was not handed out for execution."
+                )
+            if step_selector in self._finished_steps:
+                return None
+            self._finished_steps.add(step_selector)
+            for successor in self._steps_flow_graph.successors(step_selector):
+                self._pending_dependencies[successor] -= 1
+                if self._pending_dependencies[successor] == 0:
+                    self._push_ready_step(step=successor)
+
+    def is_finished(self) -> bool:
+        with self._lock:
+            return len(self._finished_steps) == len(self._pending_dependencies)
+
+    def _push_ready_step(self, step: str) -> None:
+        heapq.heappush(
+            self._ready_steps,
+            (-self._priorities[step], self._topological_positions[step], step),
+        )
+
+
+def establish_steps_priorities(steps_flow_graph: nx.DiGraph) -> Dict[str, int]:
+    """Assigns each step the number of steps on the longest path from the step to the end of workflow."""
+    priorities = {}
+    for step in reversed(list(nx.topological_sort(steps_flow_graph))):
+        successors_priorities = [
+            priorities[successor] for successor in steps_flow_graph.successors(step)
+        ]
+        priorities[step] = max(successors_priorities, default=0) + 1
+    return priorities
 
 
 def construct_steps_flow_graph(
@@ -4,8 +4,13 @@ from typing import Any, Dict, List, Tuple, Union
 import clip
 import numpy as np
 import onnxruntime
+from clip.simple_tokenizer import basic_clean, whitespace_clean
 from PIL import Image
 
+from inference.core.cache.embeddings import (
+    EmbeddingsCache,
+    get_or_compute_embeddings,
+)
 from inference.core.entities.requests.clip import (
     ClipCompareRequest,
     ClipImageEmbeddingRequest,
@@ -21,6 +26,8 @@ from inference.core.entities.responses.inference import InferenceResponse
 from inference.core.env import (
     CLIP_MAX_BATCH_SIZE,
     CLIP_MODEL_ID,
+    CLIP_TEXT_EMBEDDINGS_CACHE_PERSISTENCE,
+    CLIP_TEXT_EMBEDDINGS_CACHE_SIZE_MB,
     ONNXRUNTIME_EXECUTION_PROVIDERS,
     REQUIRED_ONNX_PROVIDERS,
     TENSORRT_CACHE_PATH,
@@ -33,6 +40,8 @@ from inference.core.utils.image_utils import load_image_rgb
 from inference.core.utils.onnx import get_onnxruntime_execution_providers
 from inference.core.utils.postprocess import cosine_similarity
 
+TEXT_EMBEDDINGS_CACHE_FILE = "text_embeddings_cache.npz"
+
 
 class Clip(OnnxRoboflowCoreModel):
     """Roboflow ONNX ClipModel model.
@@ -83,6 +92,16 @@ class Clip(OnnxRoboflowCoreModel):
         self.resolution = self.visual_onnx_session.get_inputs()[0].shape[2]
 
         self.clip_preprocess = clip.clip._transform(self.resolution)
+        self.text_embeddings_cache = None
+        if CLIP_TEXT_EMBEDDINGS_CACHE_SIZE_MB > 0:
+            self.text_embeddings_cache = EmbeddingsCache(
+                max_size_bytes=int(CLIP_TEXT_EMBEDDINGS_CACHE_SIZE_MB * 1024 * 1024),
+                persistence_path=(
+                    self.cache_file(TEXT_EMBEDDINGS_CACHE_FILE)
+                    if CLIP_TEXT_EMBEDDINGS_CACHE_PERSISTENCE
+                    else None
+                ),
+            )
         self.log(f"CLIP model loaded in {perf_counter() - t1:.2f} seconds")
         self.task_type = "embedding"
 
@@ -259,11 +278,23 @@ class Clip(OnnxRoboflowCoreModel):
 
         Notes:
             The function utilizes an ONNX session to compute embeddings and measures the embedding time with perf_counter.
+            Embeddings are cached (by text normalised the way CLIP tokenizer does) - only texts missing in
+            the cache are encoded.
         """
         if isinstance(text, list):
             texts = text
         else:
             texts = [text]
+        if self.text_embeddings_cache is None:
+            return self._encode_texts(texts=texts)
+        return get_or_compute_embeddings(
+            cache=self.text_embeddings_cache,
+            keys=[whitespace_clean(basic_clean(t)).lower() for t in texts],
+            inputs=texts,
+            compute=lambda missing_texts: self._encode_texts(texts=missing_texts),
+        )
+
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
         results = []
         for texts_batch in create_batches(
             sequence=texts, batch_size=CLIP_MAX_BATCH_SIZE
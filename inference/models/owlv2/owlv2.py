@@ -14,7 +14,14 @@ from transformers import Owlv2ForObjectDetection, Owlv2Processor
 from transformers.models.owlv2.modeling_owlv2 import box_iou
 
 from inference.core import logger
+from inference.core.cache import cache
+from inference.core.cache.embeddings import (
+    CacheEmbeddingsStore,
+    EmbeddingsStore,
+    FileEmbeddingsStore,
+)
 from inference.core.cache.model_artifacts import save_bytes_in_cache
+from inference.core.cache.redis import RedisCache
 from inference.core.entities.requests.inference import ObjectDetectionInferenceRequest
 from inference.core.entities.responses.inference import (
     InferenceResponseImage,
@@ -27,11 +34,17 @@ from inference.core.env import (
     MODEL_CACHE_DIR,
     OWLV2_COMPILE_MODEL,
     OWLV2_CPU_IMAGE_CACHE_SIZE,
+    OWLV2_EMBEDDINGS_STORE,
+    OWLV2_EMBEDDINGS_STORE_EXPIRE,
     OWLV2_IMAGE_CACHE_SIZE,
     OWLV2_MODEL_CACHE_SIZE,
     OWLV2_VERSION_ID,
 )
-from inference.core.exceptions import InvalidModelIDError, ModelArtefactError
+from inference.core.exceptions import (
+    InvalidEnvironmentVariableError,
+    InvalidModelIDError,
+    ModelArtefactError,
+)
 from inference.core.models.roboflow import (
     DEFAULT_COLOR_PALETTE,
     RoboflowInferenceModel,
@@ -56,6 +69,14 @@ Hash = NewType("Hash", str)
 PosNegKey = Literal["positive", "negative"]
 PosNegDictType = Dict[PosNegKey, torch.Tensor]
 QuerySpecType = Dict[Hash, List[List[int]]]
+ImageEmbedsType = Tuple[torch.Tensor, ...]
+IMAGE_EMBEDS_NAMES = [
+    "objectness",
+    "boxes",
+    "image_class_embeds",
+    "logit_shift",
+    "logit_scale",
+]
 if DEVICE is None:
     DEVICE = "cuda:0" if torch.cuda.is_available() else "cpu"
 
@@ -298,6 +319,79 @@ def hash_wrapped_training_data(wrapped_training_data: List[Dict[str, Any]]) -> H
     return hash_function(pickle.dumps(just_hash_relevant_data))
 
 
+def init_embeddings_store(version_id: str) -> Optional[EmbeddingsStore]:
+    """Creates store of image and class embeddings selected with `OWLV2_EMBEDDINGS_STORE`.
+
+    Embeddings depend on OWLv2 version, so each version gets separate namespace in the store.
+    """
+    if OWLV2_EMBEDDINGS_STORE == "none":
+        return None
+    if OWLV2_EMBEDDINGS_STORE == "file":
+        return FileEmbeddingsStore(
+            directory=os.path.join(MODEL_CACHE_DIR, "owlv2", version_id, "embeddings")
+        )
+    if OWLV2_EMBEDDINGS_STORE == "redis":
+        if not isinstance(cache, RedisCache):
+            logger.warning(
+                "OWLV2_EMBEDDINGS_STORE is set to redis, but Redis cache is not in use "
+                "(REDIS_HOST not set or Redis not reachable). OWLv2 embeddings will only "
+                "be cached in memory of the process."
+            )
+            return None
+        return CacheEmbeddingsStore(
+            cache=cache,
+            key_prefix=f"owlv2:{version_id}",
+            expire=OWLV2_EMBEDDINGS_STORE_EXPIRE,
+        )
+    raise InvalidEnvironmentVariableError(
+        f"Invalid value of OWLV2_EMBEDDINGS_STORE: {OWLV2_EMBEDDINGS_STORE}. "
+        f"Expected one of: none, file, redis."
+    )
+
+
+def image_embeds_to_arrays(image_embeds: ImageEmbedsType) -> Dict[str, np.ndarray]:
+    return {
+        name: tensor.cpu().numpy()
+        for name, tensor in zip(IMAGE_EMBEDS_NAMES, image_embeds)
+    }
+
+
+def arrays_to_image_embeds(arrays: Dict[str, np.ndarray]) -> ImageEmbedsType:
+    return tuple(
+        torch.tensor(np.asarray(arrays[name]), device=DEVICE)
+        for name in IMAGE_EMBEDS_NAMES
+    )
+
+
+def class_embeddings_to_arrays(
+    class_embeddings: Dict[str, PosNegDictType],
+) -> Dict[str, np.ndarray]:
+    # class names are stored separately, as they are not safe to be used as arrays names
+    class_names = list(class_embeddings.keys())
+    arrays = {"class_names": np.array(class_names, dtype=str)}
+    for idx, class_name in enumerate(class_names):
+        for key, tensor in class_embeddings[class_name].items():
+            if tensor is not None:
+                arrays[f"{key}_{idx}"] = tensor.cpu().numpy()
+    return arrays
+
+
+def arrays_to_class_embeddings(
+    arrays: Dict[str, np.ndarray],
+) -> Dict[str, PosNegDictType]:
+    class_embeddings = {}
+    for idx, class_name in enumerate(arrays["class_names"].tolist()):
+        class_embeddings[class_name] = {}
+        for key in ["positive", "negative"]:
+            array = arrays.get(f"{key}_{idx}")
+            class_embeddings[class_name][key] = (
+                torch.tensor(np.asarray(array), device=DEVICE)
+                if array is not None
+                else None
+            )
+    return class_embeddings
+
+
 class OwlV2(RoboflowInferenceModel):
     task_type = "object-detection"
     box_format = "xywh"
@@ -321,6 +415,7 @@ class OwlV2(RoboflowInferenceModel):
             processor.image_processor.image_std, device=DEVICE
         ).view(1, 3, 1, 1)
         self.model = Owlv2Singleton(hf_id).model
+        self.embeddings_store = init_embeddings_store(version_id=self.version_id)
         self.reset_cache()
 
     def reset_cache(self):
@@ -372,6 +467,13 @@ class OwlV2(RoboflowInferenceModel):
             tensors = self.cpu_image_embed_cache[image_hash]
             tensors = tuple(t.to(DEVICE) for t in tensors)
             return tensors
+        elif self.embeddings_store is not None:
+            arrays = self.embeddings_store.get(f"image/{image_hash}")
+            if arrays is None:
+                return None
+            tensors = arrays_to_image_embeds(arrays=arrays)
+            self.image_embed_cache[image_hash] = tensors
+            return tensors
         else:
             return None
 
@@ -445,6 +547,11 @@ class OwlV2(RoboflowInferenceModel):
             logit_shift,
             logit_scale,
         )
+        if self.embeddings_store is not None:
+            self.embeddings_store.set(
+                f"image/{image_hash}",
+                image_embeds_to_arrays(image_embeds=self.image_embed_cache[image_hash]),
+            )
 
         # Explicitly delete temporary tensors to free memory.
         del pixel_values, np_image, image_features, image_embeds
@@ -613,11 +720,23 @@ class OwlV2(RoboflowInferenceModel):
 
         wrapped_training_data_hash = hash_wrapped_training_data(wrapped_training_data)
 
+        class_embeddings_dict = self.class_embeddings_cache.get(
+            wrapped_training_data_hash
+        )
+        # when image embeddings are requested (to serialise the model), they must be gathered from
+        # training images - image embeddings are still loaded from the store if available
         if (
-            class_embeddings_dict := self.class_embeddings_cache.get(
-                wrapped_training_data_hash
-            )
-        ) is not None:
+            class_embeddings_dict is None
+            and self.embeddings_store is not None
+            and not return_image_embeds
+        ):
+            arrays = self.embeddings_store.get(f"class/{wrapped_training_data_hash}")
+            if arrays is not None:
+                class_embeddings_dict = arrays_to_class_embeddings(arrays=arrays)
+                self.class_embeddings_cache[wrapped_training_data_hash] = (
+                    class_embeddings_dict
+                )
+        if class_embeddings_dict is not None:
             if return_image_embeds:
                 # Return a dummy empty dict as the second value
                 # or extract it from CPU cache if available
@@ -676,6 +795,11 @@ class OwlV2(RoboflowInferenceModel):
         }
 
         self.class_embeddings_cache[wrapped_training_data_hash] = class_embeddings_dict
+        if self.embeddings_store is not None:
+            self.embeddings_store.set(
+                f"class/{wrapped_training_data_hash}",
+                class_embeddings_to_arrays(class_embeddings=class_embeddings_dict),
+            )
         if return_image_embeds:
             return class_embeddings_dict, return_image_embeds_dict
 
@@ -1,8 +1,7 @@
 import os
 from time import perf_counter
-from typing import Any, List, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
-import cv2
 import numpy as np
 import onnxruntime
 
@@ -25,7 +24,6 @@ from inference.core.models.types import PreprocessReturnMetadata
 from inference.core.models.utils.onnx import has_trt
 from inference.core.utils.image_utils import load_image
 from inference.core.utils.onnx import ImageMetaType, run_session_via_iobinding
-from inference.core.utils.preprocess import letterbox_image
 
 if USE_PYTORCH_FOR_PREPROCESSING:
     import torch
@@ -63,6 +61,7 @@ class RFDETRObjectDetection(ObjectDetectionBaseOnnxRoboflowInferenceModel):
         disable_preproc_contrast: bool = False,
         disable_preproc_grayscale: bool = False,
         disable_preproc_static_crop: bool = False,
+        out: Optional[np.ndarray] = None,
     ) -> Tuple[np.ndarray, Tuple[int, int]]:
         """
         Preprocesses an inference request image by loading it, then applying any pre-processing specified by the Roboflow platform, then scaling it to the inference input dimensions.
@@ -73,6 +72,7 @@ class RFDETRObjectDetection(ObjectDetectionBaseOnnxRoboflowInferenceModel):
             disable_preproc_contrast (bool, optional): If true, the contrast preprocessing step is disabled for this call. Default is False.
             disable_preproc_grayscale (bool, optional): If true, the grayscale preprocessing step is disabled for this call. Default is False.
             disable_preproc_static_crop (bool, optional): If true, the static crop preprocessing step is disabled for this call. Default is False.
+            out (Optional[np.ndarray], optional): Buffer of shape (1, 3, img_size_h, img_size_w) the result should be written into. Default is None.
 
         Returns:
             Tuple[np.ndarray, Tuple[int, int]]: A tuple containing a numpy array of the preprocessed image pixel data and a tuple of the images original size.
@@ -113,61 +113,7 @@ class RFDETRObjectDetection(ObjectDetectionBaseOnnxRoboflowInferenceModel):
                 preprocessed_image.permute(2, 0, 1).unsqueeze(0).contiguous().float()
             )
 
-        if self.resize_method == "Stretch to":
-            if isinstance(preprocessed_image, np.ndarray):
-                preprocessed_image = preprocessed_image.astype(np.float32)
-                resized = cv2.resize(
-                    preprocessed_image,
-                    (self.img_size_w, self.img_size_h),
-                )
-            elif USE_PYTORCH_FOR_PREPROCESSING:
-                resized = torch.nn.functional.interpolate(
-                    preprocessed_image,
-                    size=(self.img_size_h, self.img_size_w),
-                    mode="bilinear",
-                )
-            else:
-                raise ValueError(
-                    f"Received an image of unknown type, {type(preprocessed_image)}; "
-                    "This is most likely a bug. Contact Roboflow team through github issues "
-                    "(https://github.com/roboflow/inference/issues) providing full context of the problem"
-                )
-
-        elif self.resize_method == "Fit (black edges) in":
-            resized = letterbox_image(
-                preprocessed_image, (self.img_size_w, self.img_size_h)
-            )
-        elif self.resize_method == "Fit (white edges) in":
-            resized = letterbox_image(
-                preprocessed_image,
-                (self.img_size_w, self.img_size_h),
-                color=(255, 255, 255),
-            )
-        elif self.resize_method == "Fit (grey edges) in":
-            resized = letterbox_image(
-                preprocessed_image,
-                (self.img_size_w, self.img_size_h),
-                color=(114, 114, 114),
-            )
-
-        if is_bgr:
-            if isinstance(resized, np.ndarray):
-                resized = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
-            else:
-                resized = resized[:, [2, 1, 0], :, :]
-
-        if isinstance(resized, np.ndarray):
-            img_in = np.transpose(resized, (2, 0, 1))
-            img_in = img_in.astype(np.float32)
-            img_in = np.expand_dims(img_in, axis=0)
-        elif USE_PYTORCH_FOR_PREPROCESSING:
-            img_in = resized.float()
-        else:
-            raise ValueError(
-                f"Received an image of unknown type, {type(resized)}; "
-                "This is most likely a bug. Contact Roboflow team through github issues "
-                "(https://github.com/roboflow/inference/issues) providing full context of the problem"
-            )
+        img_in = self.resize_to_model_input(preprocessed_image, is_bgr=is_bgr, out=out)
         return img_in, img_dims
 
     def preprocess(
@@ -187,7 +133,7 @@ class RFDETRObjectDetection(ObjectDetectionBaseOnnxRoboflowInferenceModel):
             disable_preproc_grayscale=disable_preproc_grayscale,
             disable_preproc_static_crop=disable_preproc_static_crop,
         )
-        img_in = img_in.astype(np.float32)
+        img_in = img_in.astype(np.float32, copy=False)
 
         if self.batching_enabled:
             batch_padding = 0
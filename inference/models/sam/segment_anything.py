@@ -1,4 +1,5 @@
 import base64
+from collections import OrderedDict
 from io import BytesIO
 from time import perf_counter
 from typing import Any, List, Optional, Union
@@ -10,6 +11,7 @@ import torch
 from segment_anything import SamPredictor, sam_model_registry
 from shapely.geometry import Polygon as ShapelyPolygon
 
+from inference.core.cache.embeddings import SpillingEmbeddingsCache
 from inference.core.entities.requests.inference import InferenceRequestImage
 from inference.core.entities.requests.sam import (
     SamEmbeddingRequest,
@@ -20,7 +22,12 @@ from inference.core.entities.responses.sam import (
     SamEmbeddingResponse,
     SamSegmentationResponse,
 )
-from inference.core.env import SAM_MAX_EMBEDDING_CACHE_SIZE, SAM_VERSION_ID
+from inference.core.env import (
+    SAM_EMBEDDING_CACHE_SPILL_SIZE_MB,
+    SAM_MAX_EMBEDDING_CACHE_SIZE,
+    SAM_MAX_EMBEDDING_CACHE_SIZE_MB,
+    SAM_VERSION_ID,
+)
 from inference.core.models.roboflow import RoboflowCoreModel
 from inference.core.utils.image_utils import load_image_rgb
 from inference.core.utils.postprocess import masks2poly
@@ -33,11 +40,8 @@ class SegmentAnything(RoboflowCoreModel):
         sam: The segmentation model.
         predictor: The predictor for the segmentation model.
         ort_session: ONNX runtime inference session.
-        embedding_cache: Cache for embeddings.
-        image_size_cache: Cache for image sizes.
-        embedding_cache_keys: Keys for the embedding cache.
+        embedding_cache: Cache for embeddings and image sizes.
         low_res_logits_cache: Cache for low resolution logits.
-        segmentation_cache_keys: Keys for the segmentation cache.
     """
 
     def __init__(self, *args, model_id: str = f"sam/{SAM_VERSION_ID}", **kwargs):
@@ -61,12 +65,17 @@ class SegmentAnything(RoboflowCoreModel):
                 "CPUExecutionProvider",
             ],
         )
-        self.embedding_cache = {}
-        self.image_size_cache = {}
-        self.embedding_cache_keys = []
+        self.embedding_cache = SpillingEmbeddingsCache(
+            max_entries=SAM_MAX_EMBEDDING_CACHE_SIZE,
+            max_size_bytes=int(SAM_MAX_EMBEDDING_CACHE_SIZE_MB * 1024 * 1024),
+            size_of=lambda value: value[0].nbytes,
+            to_arrays=lambda value: [value[0], np.array(value[1])],
+            from_arrays=lambda arrays: (np.array(arrays[0]), tuple(arrays[1].tolist())),
+            spill_directory=self.cache_file("embeddings_spill"),
+            max_spill_size_bytes=int(SAM_EMBEDDING_CACHE_SPILL_SIZE_MB * 1024 * 1024),
+        )
 
-        self.low_res_logits_cache = {}
-        self.segmentation_cache_keys = []
+        self.low_res_logits_cache = OrderedDict()
         self.task_type = "unsupervised-segmentation"
 
     def get_infer_bucket_file_list(self) -> List[str]:
@@ -94,30 +103,24 @@ class SegmentAnything(RoboflowCoreModel):
 
         Notes:
             - Embeddings and image sizes are cached to improve performance on repeated requests for the same image.
-            - The cache has a maximum size defined by SAM_MAX_EMBEDDING_CACHE_SIZE. When the cache exceeds this size,
-              the oldest entries are removed.
+            - The cache is bounded by SAM_MAX_EMBEDDING_CACHE_SIZE entries and SAM_MAX_EMBEDDING_CACHE_SIZE_MB.
+              When the cache exceeds limits, the least recently used entries are removed (or spilled to disk,
+              when SAM_EMBEDDING_CACHE_SPILL_SIZE_MB is set).
 
         Example:
             >>> img_array = ... # some image array
             >>> embed_image(img_array, image_id="sample123")
             (array([...]), (224, 224))
         """
-        if image_id and image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
-            )
+        if image_id:
+            cached_embedding = self.embedding_cache.get(image_id)
+            if cached_embedding is not None:
+                return cached_embedding
         img_in = self.preproc_image(image)
         self.predictor.set_image(img_in)
         embedding = self.predictor.get_image_embedding().cpu().numpy()
         if image_id:
-            self.embedding_cache[image_id] = embedding
-            self.image_size_cache[image_id] = img_in.shape[:2]
-            self.embedding_cache_keys.append(image_id)
-            if len(self.embedding_cache_keys) > SAM_MAX_EMBEDDING_CACHE_SIZE:
-                cache_key = self.embedding_cache_keys.pop(0)
-                del self.embedding_cache[cache_key]
-                del self.image_size_cache[cache_key]
+            self.embedding_cache.set(image_id, (embedding, img_in.shape[:2]))
         return (embedding, img_in.shape[:2])
 
     def infer_from_request(self, request: SamInferenceRequest):
@@ -307,11 +310,8 @@ class SegmentAnything(RoboflowCoreModel):
         masks, _, low_res_logits = self.ort_session.run(None, ort_inputs)
         if image_id:
             self.low_res_logits_cache[image_id] = low_res_logits
-            if image_id not in self.segmentation_cache_keys:
-                self.segmentation_cache_keys.append(image_id)
-            if len(self.segmentation_cache_keys) > SAM_MAX_EMBEDDING_CACHE_SIZE:
-                cache_key = self.segmentation_cache_keys.pop(0)
-                del self.low_res_logits_cache[cache_key]
+            if len(self.low_res_logits_cache) > SAM_MAX_EMBEDDING_CACHE_SIZE:
+                self.low_res_logits_cache.popitem(last=False)
         masks = masks[0]
         low_res_masks = low_res_logits[0]
 
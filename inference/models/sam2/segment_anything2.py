@@ -1,5 +1,6 @@
 import copy
 import hashlib
+from collections import OrderedDict
 from io import BytesIO
 from time import perf_counter
 from typing import Any, Dict, List, Optional, Tuple, TypedDict, Union
@@ -16,6 +17,7 @@ sam2.utils.misc.get_sdp_backends = lambda z: [
 from sam2.build_sam import build_sam2
 from sam2.sam2_image_predictor import SAM2ImagePredictor
 
+from inference.core.cache.embeddings import SpillingEmbeddingsCache
 from inference.core.entities.requests.inference import InferenceRequestImage
 from inference.core.entities.requests.sam2 import (
     Sam2EmbeddingRequest,
@@ -32,7 +34,9 @@ from inference.core.entities.responses.sam2 import (
 from inference.core.env import (
     DEVICE,
     DISABLE_SAM2_LOGITS_CACHE,
+    SAM2_EMBEDDING_CACHE_SPILL_SIZE_MB,
     SAM2_MAX_EMBEDDING_CACHE_SIZE,
+    SAM2_MAX_EMBEDDING_CACHE_SIZE_MB,
     SAM2_MAX_LOGITS_CACHE_SIZE,
     SAM2_VERSION_ID,
 )
@@ -56,9 +60,8 @@ class SegmentAnything2(RoboflowCoreModel):
         sam: The segmentation model.
         predictor: The predictor for the segmentation model.
         ort_session: ONNX runtime inference session.
-        embedding_cache: Cache for embeddings.
-        image_size_cache: Cache for image sizes.
-        embedding_cache_keys: Keys for the embedding cache.
+        embedding_cache: Cache for embeddings and image sizes.
+        low_res_logits_cache: Cache for low resolution logits.
 
     """
 
@@ -68,6 +71,8 @@ class SegmentAnything2(RoboflowCoreModel):
         model_id: str = f"sam2/{SAM2_VERSION_ID}",
         low_res_logits_cache_size: int = SAM2_MAX_LOGITS_CACHE_SIZE,
         embedding_cache_size: int = SAM2_MAX_EMBEDDING_CACHE_SIZE,
+        embedding_cache_size_mb: float = SAM2_MAX_EMBEDDING_CACHE_SIZE_MB,
+        embedding_cache_spill_size_mb: float = SAM2_EMBEDDING_CACHE_SPILL_SIZE_MB,
         **kwargs,
     ):
         """Initializes the SegmentAnything.
@@ -91,11 +96,20 @@ class SegmentAnything2(RoboflowCoreModel):
 
         self.predictor = SAM2ImagePredictor(self.sam)
 
-        self.embedding_cache = {}
-        self.image_size_cache = {}
-        self.embedding_cache_keys = []
-        self.low_res_logits_cache: Dict[Tuple[str, str], LogitsCacheType] = {}
-        self.low_res_logits_cache_keys = []
+        self.embedding_cache = SpillingEmbeddingsCache(
+            max_entries=embedding_cache_size,
+            max_size_bytes=int(embedding_cache_size_mb * 1024 * 1024),
+            size_of=lambda value: features_size(features=value[0]),
+            to_arrays=lambda value: features_to_arrays(
+                features=value[0], image_size=value[1]
+            ),
+            from_arrays=features_from_arrays,
+            spill_directory=self.cache_file("embeddings_spill"),
+            max_spill_size_bytes=int(embedding_cache_spill_size_mb * 1024 * 1024),
+        )
+        self.low_res_logits_cache: Dict[Tuple[str, str], LogitsCacheType] = (
+            OrderedDict()
+        )
 
         self.task_type = "unsupervised-segmentation"
 
@@ -129,45 +143,32 @@ class SegmentAnything2(RoboflowCoreModel):
 
         Notes:
             - Embeddings and image sizes are cached to improve performance on repeated requests for the same image.
-            - The cache has a maximum size defined by SAM2_MAX_CACHE_SIZE. When the cache exceeds this size,
-              the oldest entries are removed.
+            - The cache is bounded by `embedding_cache_size` entries and `embedding_cache_size_mb`. When the cache
+              exceeds limits, the least recently used entries are removed (or spilled to disk, when
+              `embedding_cache_spill_size_mb` is set).
 
         Example:
             >>> img_array = ... # some image array
             >>> embed_image(img_array, image_id="sample123")
             (array([...]), (224, 224))
         """
-        if image_id and image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
-                image_id,
-            )
+        if image_id:
+            cached_embedding = self.embedding_cache.get(image_id)
+            if cached_embedding is not None:
+                return (*cached_embedding, image_id)
 
         img_in = self.preproc_image(image)
         if image_id is None:
             image_id = hashlib.md5(img_in.tobytes()).hexdigest()[:12]
-
-        if image_id in self.embedding_cache:
-            return (
-                self.embedding_cache[image_id],
-                self.image_size_cache[image_id],
-                image_id,
-            )
+            cached_embedding = self.embedding_cache.get(image_id)
+            if cached_embedding is not None:
+                return (*cached_embedding, image_id)
 
         with torch.inference_mode():
             self.predictor.set_image(img_in)
             embedding_dict = self.predictor._features
 
-        self.embedding_cache[image_id] = embedding_dict
-        self.image_size_cache[image_id] = img_in.shape[:2]
-        if image_id in self.embedding_cache_keys:
-            self.embedding_cache_keys.remove(image_id)
-        self.embedding_cache_keys.append(image_id)
-        if len(self.embedding_cache_keys) > self.embedding_cache_size:
-            cache_key = self.embedding_cache_keys.pop(0)
-            del self.embedding_cache[cache_key]
-            del self.image_size_cache[cache_key]
+        self.embedding_cache.set(image_id, (embedding_dict, img_in.shape[:2]))
         return (embedding_dict, img_in.shape[:2], image_id)
 
     def infer_from_request(self, request: Sam2InferenceRequest):
@@ -327,16 +328,36 @@ class SegmentAnything2(RoboflowCoreModel):
     ) -> None:
         logits = logits[:, None, :, :]
         prompt_id = hash_prompt_set(image_id, prompt_set)
+        self.low_res_logits_cache.pop(prompt_id, None)
         self.low_res_logits_cache[prompt_id] = {
             "logits": logits,
             "prompt_set": prompt_set,
         }
-        if prompt_id in self.low_res_logits_cache_keys:
-            self.low_res_logits_cache_keys.remove(prompt_id)
-        self.low_res_logits_cache_keys.append(prompt_id)
-        if len(self.low_res_logits_cache_keys) > self.low_res_logits_cache_size:
-            cache_key = self.low_res_logits_cache_keys.pop(0)
-            del self.low_res_logits_cache[cache_key]
+        if len(self.low_res_logits_cache) > self.low_res_logits_cache_size:
+            self.low_res_logits_cache.popitem(last=False)
+
+
+def features_size(features: Dict[str, Any]) -> int:
+    """Computes size (in bytes) of image features produced by SAM2 image encoder."""
+    tensors = [features["image_embed"], *features["high_res_feats"]]
+    return sum(tensor.element_size() * tensor.nelement() for tensor in tensors)
+
+
+def features_to_arrays(
+    features: Dict[str, Any], image_size: Tuple[int, int]
+) -> List[np.ndarray]:
+    """Flattens image features and image size into list of arrays, such that they can be stored on disk."""
+    tensors = [features["image_embed"], *features["high_res_feats"]]
+    return [tensor.cpu().numpy() for tensor in tensors] + [np.array(image_size)]
+
+
+def features_from_arrays(
+    arrays: List[np.ndarray],
+) -> Tuple[Dict[str, Any], Tuple[int, int]]:
+    """Restores image features and image size from the output of `features_to_arrays(...)`."""
+    tensors = [torch.from_numpy(np.array(array)).to(DEVICE) for array in arrays[:-1]]
+    features = {"image_embed": tensors[0], "high_res_feats": tensors[1:]}
+    return features, tuple(arrays[-1].tolist())
 
 
 def hash_prompt_set(image_id: str, prompt_set: Sam2PromptSet) -> Tuple[str, str]:
@@ -193,7 +193,7 @@ class YOLACT(OnnxRoboflowInferenceModel):
         )
         predictions = np.array(predictions)
         batch_preds = []
-        if predictions.shape != (1, 0):
+        if predictions.size > 0:
             for batch_idx, img_dim in enumerate(preprocess_return_metadata["img_dims"]):
                 boxes = predictions[batch_idx, :, :4]
                 scores = predictions[batch_idx, :, 4]
@@ -6,7 +6,10 @@ from typing_extensions import Annotated
 
 from inference_cli.lib.benchmark.dataset import PREDEFINED_DATASETS
 from inference_cli.lib.benchmark_adapter import (
+    BenchmarkOutputFormat,
+    run_benchmark_comparison,
     run_infer_api_speed_benchmark,
+    run_processing_speed_benchmark,
     run_python_package_speed_benchmark,
     run_workflow_api_speed_benchmark,
 )
@@ -75,7 +78,10 @@ def api_speed(
     benchmark_requests: Annotated[
         int,
         typer.Option(
-            "--benchmark_requests", "-br", help="Number of benchmark requests"
+            "--benchmark_requests",
+            "-br",
+            help="Number of benchmark requests - sent by each client when `rps` not specified, "
+            "in total otherwise",
         ),
     ] = 1000,
     request_batch_size: Annotated[
@@ -144,6 +150,43 @@ def api_speed(
             "return non-success error code. Expected percentage values in range 0.0-100.0",
         ),
     ] = None,
+    output_format: Annotated[
+        BenchmarkOutputFormat,
+        typer.Option(
+            "--output_format",
+            help="Format of results saved in `output_location` - `json` (summary, latency percentiles and "
+            "time series) or `csv` (summary and time series, one row per interval)",
+        ),
+    ] = BenchmarkOutputFormat.JSON,
+    time_series_interval: Annotated[
+        float,
+        typer.Option(
+            "--time_series_interval",
+            help="Length (in seconds) of intervals which results time series is reported for",
+        ),
+    ] = 1.0,
+    baseline: Annotated[
+        Optional[str],
+        typer.Option(
+            "--baseline",
+            help="Path to JSON results of previous benchmark - if given, results are compared against baseline "
+            "and command returns non-success error code on regression",
+        ),
+    ] = None,
+    max_latency_regression: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max_latency_regression",
+            help="Max acceptable increase of latency (mean and percentiles) against baseline, in percent",
+        ),
+    ] = None,
+    max_throughput_regression: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max_throughput_regression",
+            help="Max acceptable decrease of throughput against baseline, in percent",
+        ),
+    ] = None,
 ):
     if "roboflow.com" in host and not proceed_automatically:
         proceed = input(
@@ -167,6 +210,11 @@ def api_speed(
                 output_location=output_location,
                 enforce_legacy_endpoints=enforce_legacy_endpoints,
                 max_error_rate=max_error_rate,
+                output_format=output_format,
+                time_series_interval=time_series_interval,
+                baseline=baseline,
+                max_latency_regression=max_latency_regression,
+                max_throughput_regression=max_throughput_regression,
             )
         else:
             if workflow_specification:
@@ -189,6 +237,11 @@ def api_speed(
                 model_configuration=model_configuration,
                 output_location=output_location,
                 max_error_rate=max_error_rate,
+                output_format=output_format,
+                time_series_interval=time_series_interval,
+                baseline=baseline,
+                max_latency_regression=max_latency_regression,
+                max_throughput_regression=max_throughput_regression,
             )
     except Exception as error:
         typer.echo(f"Command failed. Cause: {error}")
@@ -269,5 +322,167 @@ def python_package_speed(
         raise typer.Exit(code=1)
 
 
+@benchmark_app.command()
+def processing_speed(
+    stages: Annotated[
+        Optional[str],
+        typer.Option(
+            "--stages",
+            "-s",
+            help="Comma-separated names of pre- / post-processing stages to benchmark (all stages if not given)",
+        ),
+    ] = None,
+    image_height: Annotated[
+        int,
+        typer.Option("--image_height", help="Height of synthetic input image"),
+    ] = 1080,
+    image_width: Annotated[
+        int,
+        typer.Option("--image_width", help="Width of synthetic input image"),
+    ] = 1920,
+    input_size: Annotated[
+        int,
+        typer.Option("--input_size", help="Size of (square) model input"),
+    ] = 640,
+    candidates: Annotated[
+        int,
+        typer.Option(
+            "--candidates", help="Number of raw model predictions to be passed to NMS"
+        ),
+    ] = 8400,
+    detections: Annotated[
+        int,
+        typer.Option(
+            "--detections", help="Number of detections (and masks) to be post-processed"
+        ),
+    ] = 100,
+    classes: Annotated[
+        int,
+        typer.Option("--classes", help="Number of model classes"),
+    ] = 80,
+    iterations: Annotated[
+        int,
+        typer.Option(
+            "--iterations", "-i", help="Number of measured executions of each stage"
+        ),
+    ] = 100,
+    warm_up_iterations: Annotated[
+        int,
+        typer.Option(
+            "--warm_up_iterations", "-wi", help="Number of warm-up executions"
+        ),
+    ] = 5,
+    output_location: Annotated[
+        Optional[str],
+        typer.Option(
+            "--output_location",
+            "-o",
+            help="Location where to save the result (path to file or directory)",
+        ),
+    ] = None,
+    baseline: Annotated[
+        Optional[str],
+        typer.Option(
+            "--baseline",
+            "-b",
+            help="Path to JSON results of previous `processing-speed` benchmark to compare against",
+        ),
+    ] = None,
+    max_latency_regression: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max_latency_regression",
+            help="Max acceptable increase of median stage latency against baseline, in percent",
+        ),
+    ] = None,
+    max_allocation_regression: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max_allocation_regression",
+            help="Max acceptable increase of stage peak allocation against baseline, in percent",
+        ),
+    ] = None,
+):
+    try:
+        run_processing_speed_benchmark(
+            stages=(
+                [stage.strip() for stage in stages.split(",")]
+                if stages is not None
+                else None
+            ),
+            image_height=image_height,
+            image_width=image_width,
+            input_size=input_size,
+            candidates=candidates,
+            detections=detections,
+            classes=classes,
+            iterations=iterations,
+            warm_up_iterations=warm_up_iterations,
+            output_location=output_location,
+            baseline=baseline,
+            max_latency_regression=max_latency_regression,
+            max_allocation_regression=max_allocation_regression,
+        )
+    except KeyboardInterrupt:
+        print("Benchmark interrupted.")
+        return
+    except Exception as error:
+        typer.echo(f"Command failed. Cause: {error}")
+        raise typer.Exit(code=1)
+
+
+@benchmark_app.command()
+def compare(
+    baseline: Annotated[
+        str,
+        typer.Option(
+            "--baseline",
+            "-b",
+            help="Path to JSON results of `api-speed` benchmark to be used as baseline",
+        ),
+    ],
+    candidate: Annotated[
+        str,
+        typer.Option(
+            "--candidate",
+            "-c",
+            help="Path to JSON results of `api-speed` benchmark to be compared against baseline",
+        ),
+    ],
+    max_latency_regression: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max_latency_regression",
+            help="Max acceptable increase of latency (mean and percentiles), in percent",
+        ),
+    ] = None,
+    max_throughput_regression: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max_throughput_regression",
+            help="Max acceptable decrease of throughput, in percent",
+        ),
+    ] = None,
+    max_error_rate_increase: Annotated[
+        Optional[float],
+        typer.Option(
+            "--max_error_rate_increase",
+            help="Max acceptable increase of error rate, in percentage points",
+        ),
+    ] = None,
+):
+    try:
+        run_benchmark_comparison(
+            baseline=baseline,
+            candidate=candidate,
+            max_latency_regression=max_latency_regression,
+            max_throughput_regression=max_throughput_regression,
+            max_error_rate_increase=max_error_rate_increase,
+        )
+    except Exception as error:
+        typer.echo(f"Command failed. Cause: {error}")
+        raise typer.Exit(code=1)
+
+
 if __name__ == "__main__":
     benchmark_app()
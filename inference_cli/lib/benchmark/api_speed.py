@@ -1,14 +1,12 @@
-import math
 import random
 import time
 from functools import partial
 from threading import Thread
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
-import requests
-from tqdm import tqdm
 
+from inference_cli.lib.benchmark.load_generator import LoadTestReport, run_load_test
 from inference_cli.lib.benchmark.results_gathering import (
     InferenceStatistics,
     ResultsCollector,
@@ -17,21 +15,6 @@ from inference_sdk import InferenceHTTPClient
 from inference_sdk.http.entities import HTTPClientMode
 
 
-def run_api_warm_up(
-    client: InferenceHTTPClient,
-    image: np.ndarray,
-    warm_up_requests: int,
-) -> None:
-    for _ in tqdm(
-        range(warm_up_requests), desc="Warming up API...", total=warm_up_requests
-    ):
-        try:
-            _ = client.infer(inference_input=image)
-        except Exception:
-            # ignoring errors, without slight API instability may terminate benchmark
-            pass
-
-
 def coordinate_infer_api_speed_benchmark(
     client: InferenceHTTPClient,
     images: List[np.ndarray],
@@ -41,8 +24,8 @@ def coordinate_infer_api_speed_benchmark(
     request_batch_size: int,
     number_of_clients: int,
     requests_per_second: Optional[int],
-) -> InferenceStatistics:
-    run_api_warm_up(client=client, image=images[0], warm_up_requests=warm_up_requests)
+    time_series_interval: float = 1.0,
+) -> Tuple[InferenceStatistics, LoadTestReport]:
     image_sizes = {i.shape[:2] for i in images}
     print(f"Detected images dimensions: {image_sizes}")
     if client.client_mode is HTTPClientMode.V1:
@@ -51,23 +34,21 @@ def coordinate_infer_api_speed_benchmark(
             f"Model details | task_type={model_details.task_type} | batch_size={model_details.batch_size} | "
             f"input_height={model_details.input_height} | input_width={model_details.input_width}"
         )
-    results_collector = ResultsCollector()
-    statistics_display_thread = Thread(
-        target=display_benchmark_statistics, args=(results_collector,)
-    )
-    statistics_display_thread.start()
-    execute_infer_api_speed_benchmark(
-        results_collector=results_collector,
+    request_function = partial(
+        execute_infer_api_request,
         client=client,
-        images=images,
+        images=_ensure_enough_images(images=images, batch_size=request_batch_size),
+        request_batch_size=request_batch_size,
+    )
+    return run_api_speed_benchmark(
+        request_function=request_function,
+        warm_up_requests=warm_up_requests,
         benchmark_requests=benchmark_requests,
         request_batch_size=request_batch_size,
         number_of_clients=number_of_clients,
         requests_per_second=requests_per_second,
+        time_series_interval=time_series_interval,
     )
-    statistics = results_collector.get_statistics()
-    statistics_display_thread.join()
-    return statistics
 
 
 def coordinate_workflow_api_speed_benchmark(
@@ -81,199 +62,87 @@ def coordinate_workflow_api_speed_benchmark(
     request_batch_size: int,
     number_of_clients: int,
     requests_per_second: Optional[int],
-) -> InferenceStatistics:
+    warm_up_requests: int = 0,
+    time_series_interval: float = 1.0,
+) -> Tuple[InferenceStatistics, LoadTestReport]:
     image_sizes = {i.shape[:2] for i in images}
     print(f"Detected images dimensions: {image_sizes}")
-    results_collector = ResultsCollector()
-    statistics_display_thread = Thread(
-        target=display_benchmark_statistics, args=(results_collector,)
-    )
-    statistics_display_thread.start()
-    execute_workflow_api_speed_benchmark(
+    request_function = partial(
+        execute_workflow_api_request,
         workspace_name=workspace_name,
         workflow_id=workflow_id,
         workflow_specification=workflow_specification,
         workflow_parameters=workflow_parameters,
-        results_collector=results_collector,
         client=client,
-        images=images,
+        images=_ensure_enough_images(images=images, batch_size=request_batch_size),
+        request_batch_size=request_batch_size,
+    )
+    return run_api_speed_benchmark(
+        request_function=request_function,
+        warm_up_requests=warm_up_requests,
         benchmark_requests=benchmark_requests,
         request_batch_size=request_batch_size,
         number_of_clients=number_of_clients,
         requests_per_second=requests_per_second,
+        time_series_interval=time_series_interval,
     )
-    statistics = results_collector.get_statistics()
-    statistics_display_thread.join()
-    return statistics
 
 
-def execute_infer_api_speed_benchmark(
-    results_collector: ResultsCollector,
-    client: InferenceHTTPClient,
-    images: List[np.ndarray],
+def run_api_speed_benchmark(
+    request_function: Callable[[], None],
+    warm_up_requests: int,
     benchmark_requests: int,
     request_batch_size: int,
     number_of_clients: int,
     requests_per_second: Optional[int],
-) -> None:
-    while len(images) < request_batch_size:
-        images = images + images
-    api_request_executor = partial(
-        execute_infer_api_request,
-        results_collector=results_collector,
-        client=client,
-        images=images,
-        request_batch_size=request_batch_size,
-        delay=requests_per_second is not None,
-    )
-    if requests_per_second is not None:
-        if number_of_clients is not None:
-            print(
-                "Parameter specifying `number_of_clients` is ignored when number of "
-                "RPS to maintain is specified."
-            )
-        results_collector.start_benchmark()
-        execute_given_rps_sequentially(
-            executor=api_request_executor,
-            benchmark_requests=benchmark_requests,
-            requests_per_second=requests_per_second,
-        )
-        results_collector.stop_benchmark()
-        return None
-    client_threads = []
-    results_collector.start_benchmark()
-    for _ in range(number_of_clients):
-        client_thread = Thread(
-            target=execute_requests_sequentially,
-            args=(api_request_executor, benchmark_requests),
+    time_series_interval: float,
+) -> Tuple[InferenceStatistics, LoadTestReport]:
+    if requests_per_second is not None and number_of_clients not in {None, 1}:
+        print(
+            "Parameter specifying `number_of_clients` is ignored when number of "
+            "RPS to maintain is specified."
         )
-        client_thread.start()
-        client_threads.append(client_thread)
-    for thread in client_threads:
-        thread.join()
-    results_collector.stop_benchmark()
-    return None
-
-
-def execute_workflow_api_speed_benchmark(
-    workspace_name: Optional[str],
-    workflow_id: Optional[str],
-    workflow_specification: Optional[str],
-    workflow_parameters: Optional[Dict[str, Any]],
-    results_collector: ResultsCollector,
-    client: InferenceHTTPClient,
-    images: List[np.ndarray],
-    benchmark_requests: int,
-    request_batch_size: int,
-    number_of_clients: int,
-    requests_per_second: Optional[int],
-) -> None:
-    while len(images) < request_batch_size:
-        images = images + images
-    api_request_executor = partial(
-        execute_workflow_api_request,
-        workspace_name=workspace_name,
-        workflow_id=workflow_id,
-        workflow_specification=workflow_specification,
-        workflow_parameters=workflow_parameters,
-        results_collector=results_collector,
-        client=client,
-        images=images,
-        request_batch_size=request_batch_size,
-        delay=requests_per_second is not None,
+    concurrency = number_of_clients or 1
+    if requests_per_second is None:
+        # in closed-loop mode each client sends `benchmark_requests` requests
+        benchmark_requests = benchmark_requests * concurrency
+    results_collector = ResultsCollector()
+    statistics_display_thread = Thread(
+        target=display_benchmark_statistics, args=(results_collector,)
     )
-    if requests_per_second is not None:
-        if number_of_clients is not None:
-            print(
-                "Parameter specifying `number_of_clients` is ignored when number of "
-                "RPS to maintain is specified."
-            )
-        results_collector.start_benchmark()
-        execute_given_rps_sequentially(
-            executor=api_request_executor,
+    statistics_display_thread.start()
+    try:
+        report = run_load_test(
+            request_function=request_function,
             benchmark_requests=benchmark_requests,
             requests_per_second=requests_per_second,
+            concurrency=concurrency,
+            warm_up_requests=warm_up_requests,
+            time_series_interval=time_series_interval,
+            results_collector=results_collector,
+            batch_size=request_batch_size,
         )
-        results_collector.stop_benchmark()
-        return None
-    client_threads = []
-    results_collector.start_benchmark()
-    for _ in range(number_of_clients):
-        client_thread = Thread(
-            target=execute_requests_sequentially,
-            args=(api_request_executor, benchmark_requests),
-        )
-        client_thread.start()
-        client_threads.append(client_thread)
-    for thread in client_threads:
-        thread.join()
-    results_collector.stop_benchmark()
-    return None
-
-
-def execute_requests_sequentially(
-    executor: Callable[[], None], benchmark_requests: int
-) -> None:
-    for _ in range(benchmark_requests):
-        executor()
+    finally:
+        statistics_display_thread.join()
+    print(report.to_string())
+    return results_collector.get_statistics(), report
 
 
-def execute_given_rps_sequentially(
-    executor: Callable[[], None],
-    benchmark_requests: int,
-    requests_per_second: int,
-) -> None:
-    rounds = math.ceil(benchmark_requests / requests_per_second)
-    threads = []
-    for _ in range(rounds):
-        start = time.time()
-        for _ in range(requests_per_second):
-            executor_thread = Thread(target=executor, daemon=True)
-            executor_thread.start()
-            threads.append(executor_thread)
-        still_alive_threads = []
-        for thread in threads:
-            thread.join(timeout=0.0)
-            if thread.is_alive():
-                still_alive_threads.append(thread)
-        threads = still_alive_threads
-        duration = time.time() - start
-        remaining = max(0.0, 1.0 - duration)
-        time.sleep(remaining)
-    for thread in threads:
-        thread.join()
+def _ensure_enough_images(
+    images: List[np.ndarray], batch_size: int
+) -> List[np.ndarray]:
+    while len(images) < batch_size:
+        images = images + images
+    return images
 
 
 def execute_infer_api_request(
-    results_collector: ResultsCollector,
     client: InferenceHTTPClient,
     images: List[np.ndarray],
     request_batch_size: int,
-    delay: bool = False,
 ) -> None:
-    if delay:
-        time.sleep(random.random())
-    random.shuffle(images)
-    payload = images[:request_batch_size]
-    start = time.time()
-    try:
-        _ = client.infer(payload)
-        duration = time.time() - start
-        results_collector.register_inference_duration(
-            batch_size=request_batch_size, duration=duration
-        )
-    except Exception as exc:
-        duration = time.time() - start
-        results_collector.register_inference_duration(
-            batch_size=request_batch_size, duration=duration
-        )
-        status_code = exc.__class__.__name__
-        if isinstance(exc, requests.exceptions.HTTPError):
-            status_code = str(exc.response.status_code)
-
-        results_collector.register_error(
-            batch_size=request_batch_size, status_code=status_code
-        )
+    payload = random.sample(images, request_batch_size)
+    _ = client.infer(payload)
 
 
 def execute_workflow_api_request(
@@ -281,45 +150,21 @@ def execute_workflow_api_request(
     workflow_id: Optional[str],
     workflow_specification: Optional[str],
     workflow_parameters: Optional[Dict[str, Any]],
-    results_collector: ResultsCollector,
     client: InferenceHTTPClient,
     images: List[np.ndarray],
     request_batch_size: int,
-    delay: bool = False,
 ) -> None:
-    if delay:
-        time.sleep(random.random())
-    random.shuffle(images)
-    images = {f"image": images[:request_batch_size]}
-    start = time.time()
-    try:
-        kwargs = {
-            "images": images,
-        }
-        if workflow_parameters:
-            kwargs["parameters"] = workflow_parameters
-        if workspace_name and workflow_id:
-            kwargs["workspace_name"] = workspace_name
-            kwargs["workflow_id"] = workflow_id
-        else:
-            kwargs["specification"] = workflow_specification
-        _ = client.run_workflow(**kwargs)
-        duration = time.time() - start
-        results_collector.register_inference_duration(
-            batch_size=request_batch_size, duration=duration
-        )
-    except Exception as exc:
-        duration = time.time() - start
-        results_collector.register_inference_duration(
-            batch_size=request_batch_size, duration=duration
-        )
-        status_code = exc.__class__.__name__
-        if isinstance(exc, requests.exceptions.HTTPError):
-            status_code = str(exc.response.status_code)
-
-        results_collector.register_error(
-            batch_size=request_batch_size, status_code=status_code
-        )
+    kwargs = {
+        "images": {"image": random.sample(images, request_batch_size)},
+    }
+    if workflow_parameters:
+        kwargs["parameters"] = workflow_parameters
+    if workspace_name and workflow_id:
+        kwargs["workspace_name"] = workspace_name
+        kwargs["workflow_id"] = workflow_id
+    else:
+        kwargs["specification"] = workflow_specification
+    _ = client.run_workflow(**kwargs)
 
 
 def display_benchmark_statistics(
@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from inference_cli.lib.benchmark.load_generator import LoadTestReport
+from inference_cli.lib.utils import read_json
+
+COMPARED_LATENCY_METRICS = ("mean", "p50", "p90", "p99", "p99.9")
+
+
+@dataclass(frozen=True)
+class MetricComparison:
+    metric: str
+    baseline: float
+    candidate: float
+    change: float
+    threshold: Optional[float]
+    is_regression: bool
+
+    def to_string(self) -> str:
+        status = "REGRESSION" if self.is_regression else "ok"
+        threshold = "-" if self.threshold is None else self.threshold
+        return (
+            f"{self.metric:<20}| baseline: {self.baseline:<12}| candidate: {self.candidate:<12}| "
+            f"change: {self.change:+.2f}\t| threshold: {threshold}\t| {status}"
+        )
+
+
+def load_load_test_report(path: str) -> LoadTestReport:
+    content = read_json(path=path)
+    if "load_test" in content:
+        # results dumped by `inference benchmark api-speed`
+        content = content["load_test"]
+    return LoadTestReport.from_dict(content)
+
+
+def compare_with_baseline(
+    baseline: LoadTestReport,
+    candidate: LoadTestReport,
+    max_latency_regression: Optional[float] = None,
+    max_throughput_regression: Optional[float] = None,
+    max_error_rate_increase: Optional[float] = None,
+) -> List[MetricComparison]:
+    """
+    Compares candidate results with baseline. Latency and throughput changes are expressed in percent
+    of baseline value (positive value means latency increase / throughput increase) and error rate change
+    in percentage points. Metric is marked as regression if the change is worse than given threshold
+    (metrics without threshold are reported, but never marked as regressions).
+    """
+    comparisons = []
+    for metric in COMPARED_LATENCY_METRICS:
+        if metric not in baseline.latency_ms or metric not in candidate.latency_ms:
+            continue
+        change = calculate_relative_change(
+            baseline=baseline.latency_ms[metric],
+            candidate=candidate.latency_ms[metric],
+        )
+        comparisons.append(
+            MetricComparison(
+                metric=f"latency {metric} [ms]",
+                baseline=baseline.latency_ms[metric],
+                candidate=candidate.latency_ms[metric],
+                change=change,
+                threshold=max_latency_regression,
+                is_regression=max_latency_regression is not None
+                and change > max_latency_regression,
+            )
+        )
+    change = calculate_relative_change(
+        baseline=baseline.requests_per_second,
+        candidate=candidate.requests_per_second,
+    )
+    comparisons.append(
+        MetricComparison(
+            metric="throughput [rps]",
+            baseline=baseline.requests_per_second,
+            candidate=candidate.requests_per_second,
+            change=change,
+            threshold=max_throughput_regression,
+            is_regression=max_throughput_regression is not None
+            and -change > max_throughput_regression,
+        )
+    )
+    change = round(candidate.error_rate - baseline.error_rate, 2)
+    comparisons.append(
+        MetricComparison(
+            metric="error rate [%]",
+            baseline=baseline.error_rate,
+            candidate=candidate.error_rate,
+            change=change,
+            threshold=max_error_rate_increase,
+            is_regression=max_error_rate_increase is not None
+            and change > max_error_rate_increase,
+        )
+    )
+    return comparisons
+
+
+def ensure_no_regression(comparisons: List[MetricComparison]) -> None:
+    regressions = [c.metric for c in comparisons if c.is_regression]
+    if not regressions:
+        return None
+    raise RuntimeError(
+        f"Benchmark results regressed against baseline for metrics: {', '.join(regressions)}"
+    )
+
+
+def calculate_relative_change(baseline: float, candidate: float) -> float:
+    if baseline == 0:
+        return 0.0 if candidate == 0 else float("inf")
+    return round((candidate - baseline) / baseline * 100, 2)
@@ -0,0 +1,392 @@
+import asyncio
+import math
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+
+from inference_cli.lib.benchmark.results_gathering import ResultsCollector
+from inference_sdk.http.errors import HTTPCallErrorError
+
+REPORTED_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+HISTOGRAM_SUB_BUCKETS = 128
+HISTOGRAM_MIN_VALUE_MS = 0.001
+OPEN_LOOP_MAX_IN_FLIGHT = 512
+
+
+class LoadMode(str, Enum):
+    OPEN_LOOP = "open_loop"
+    CLOSED_LOOP = "closed_loop"
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram - values are counted in log-linear buckets (each power of 2 is split
+    into `HISTOGRAM_SUB_BUCKETS` linear sub-buckets), such that memory is bounded regardless of the
+    number of samples, while percentiles are reported with relative error below 1%.
+    """
+
+    def __init__(self):
+        self._counts: Dict[int, int] = defaultdict(int)
+        self._total = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = 0.0
+
+    def record(self, value_ms: float) -> None:
+        value_ms = max(value_ms, HISTOGRAM_MIN_VALUE_MS)
+        self._counts[_bucket_index(value_ms=value_ms)] += 1
+        self._total += 1
+        self._sum += value_ms
+        self._min = min(self._min, value_ms)
+        self._max = max(self._max, value_ms)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other._counts.items():
+            self._counts[index] += count
+        self._total += other._total
+        self._sum += other._sum
+        self._min = min(self._min, other._min)
+        self._max = max(self._max, other._max)
+
+    @property
+    def count(self) -> int:
+        return self._total
+
+    def mean(self) -> float:
+        if self._total == 0:
+            return 0.0
+        return self._sum / self._total
+
+    def max(self) -> float:
+        return self._max
+
+    def percentile(self, percentile: float) -> float:
+        if self._total == 0:
+            return 0.0
+        rank = max(1, math.ceil(percentile / 100 * self._total))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                # bucket upper bound, clipped to extreme values which are tracked exactly
+                return min(max(_bucket_upper_bound(index=index), self._min), self._max)
+        return self._max
+
+    def summary(self) -> Dict[str, float]:
+        result = {"mean": round(self.mean(), 3)}
+        for percentile in REPORTED_PERCENTILES:
+            result[format_percentile(percentile)] = round(
+                self.percentile(percentile=percentile), 3
+            )
+        result["max"] = round(self.max(), 3)
+        return result
+
+
+def _bucket_index(value_ms: float) -> int:
+    mantissa, exponent = math.frexp(value_ms / HISTOGRAM_MIN_VALUE_MS)
+    sub_bucket = min(
+        int((mantissa - 0.5) * 2 * HISTOGRAM_SUB_BUCKETS), HISTOGRAM_SUB_BUCKETS - 1
+    )
+    return exponent * HISTOGRAM_SUB_BUCKETS + sub_bucket
+
+
+def _bucket_upper_bound(index: int) -> float:
+    exponent, sub_bucket = divmod(index, HISTOGRAM_SUB_BUCKETS)
+    mantissa = 0.5 + (sub_bucket + 1) / (2 * HISTOGRAM_SUB_BUCKETS)
+    return math.ldexp(mantissa, exponent) * HISTOGRAM_MIN_VALUE_MS
+
+
+def format_percentile(percentile: float) -> str:
+    return f"p{percentile:g}"
+
+
+@dataclass(frozen=True)
+class TimeSeriesPoint:
+    elapsed_seconds: float
+    requests: int
+    errors: int
+    requests_per_second: float
+    latency_ms: Dict[str, float]
+
+
+@dataclass(frozen=True)
+class LoadTestReport:
+    mode: LoadMode
+    requests_per_second_target: Optional[float]
+    concurrency: Optional[int]
+    warm_up_requests: int
+    requests: int
+    errors: int
+    error_rate: float
+    duration_seconds: float
+    requests_per_second: float
+    latency_ms: Dict[str, float]
+    error_status_codes: Dict[str, int]
+    time_series: List[TimeSeriesPoint] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = asdict(self)
+        result["mode"] = self.mode.value
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LoadTestReport":
+        data = dict(data)
+        data["mode"] = LoadMode(data["mode"])
+        data["time_series"] = [
+            TimeSeriesPoint(**point) for point in data.get("time_series", [])
+        ]
+        return cls(**data)
+
+    def to_string(self) -> str:
+        latency = " | ".join(f"{k}: {v}ms" for k, v in self.latency_ms.items())
+        return (
+            f"mode: {self.mode.value} | requests: {self.requests} | rps: {self.requests_per_second} | "
+            f"%err: {self.error_rate} | {latency}"
+        )
+
+
+class _LoadTestRecorder:
+    def __init__(
+        self,
+        time_series_interval: float,
+        results_collector: Optional[ResultsCollector],
+        batch_size: int,
+    ):
+        self._time_series_interval = time_series_interval
+        self._results_collector = results_collector
+        self._batch_size = batch_size
+        self.histogram = LatencyHistogram()
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.windows: Dict[int, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.window_errors: Dict[int, int] = defaultdict(int)
+        self.first_start: Optional[float] = None
+        self.last_end: Optional[float] = None
+
+    def start(self, timestamp: float) -> None:
+        self.first_start = timestamp
+        if self._results_collector is not None:
+            self._results_collector.start_benchmark()
+
+    def register(self, start: float, end: float, error: Optional[str]) -> None:
+        latency_ms = (end - start) * 1000
+        self.histogram.record(value_ms=latency_ms)
+        window = int((end - self.first_start) // self._time_series_interval)
+        self.windows[window].record(value_ms=latency_ms)
+        self.last_end = end if self.last_end is None else max(self.last_end, end)
+        if error is not None:
+            self.errors[error] += 1
+            self.window_errors[window] += 1
+        if self._results_collector is None:
+            return None
+        self._results_collector.register_inference_duration(
+            batch_size=self._batch_size, duration=end - start
+        )
+        if error is not None:
+            self._results_collector.register_error(
+                batch_size=self._batch_size, status_code=error
+            )
+
+    def time_series(self) -> List[TimeSeriesPoint]:
+        result = []
+        for window in sorted(self.windows):
+            histogram = self.windows[window]
+            result.append(
+                TimeSeriesPoint(
+                    elapsed_seconds=round(window * self._time_series_interval, 3),
+                    requests=histogram.count,
+                    errors=self.window_errors[window],
+                    requests_per_second=round(
+                        histogram.count / self._time_series_interval, 1
+                    ),
+                    latency_ms=histogram.summary(),
+                )
+            )
+        return result
+
+
+def run_load_test(
+    request_function: Callable[[], Any],
+    benchmark_requests: int,
+    requests_per_second: Optional[float] = None,
+    concurrency: int = 1,
+    warm_up_requests: int = 0,
+    time_series_interval: float = 1.0,
+    results_collector: Optional[ResultsCollector] = None,
+    batch_size: int = 1,
+) -> LoadTestReport:
+    """
+    Runs `request_function` `benchmark_requests` times in total (after `warm_up_requests`, which are
+    executed the same way, but excluded from results).
+
+    When `requests_per_second` is given, load is generated in open-loop mode - requests are
+    scheduled at fixed arrival rate, regardless of server response times, and latency is measured
+    from the scheduled (not actual) start of each request, such that saturation of the server (or of
+    the load generator itself) is visible in tail latency instead of being hidden (coordinated omission).
+    Otherwise, closed-loop mode is used - `concurrency` clients send the next request once previous
+    one is completed.
+
+    Errors raised by `request_function` are registered with exception name (or HTTP status code).
+    `results_collector` (if given) is started with the first measured request and always stopped
+    once the load test ends.
+    """
+    try:
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("`requests_per_second` must be positive")
+        if concurrency < 1:
+            raise ValueError("`concurrency` must be positive")
+        if time_series_interval <= 0:
+            raise ValueError("`time_series_interval` must be positive")
+        return asyncio.run(
+            _run_load_test(
+                request_function=request_function,
+                benchmark_requests=benchmark_requests,
+                requests_per_second=requests_per_second,
+                concurrency=concurrency,
+                warm_up_requests=warm_up_requests,
+                time_series_interval=time_series_interval,
+                results_collector=results_collector,
+                batch_size=batch_size,
+            )
+        )
+    finally:
+        if results_collector is not None:
+            results_collector.stop_benchmark()
+
+
+async def _run_load_test(
+    request_function: Callable[[], Any],
+    benchmark_requests: int,
+    requests_per_second: Optional[float],
+    concurrency: int,
+    warm_up_requests: int,
+    time_series_interval: float,
+    results_collector: Optional[ResultsCollector],
+    batch_size: int,
+) -> LoadTestReport:
+    mode = (
+        LoadMode.OPEN_LOOP if requests_per_second is not None else LoadMode.CLOSED_LOOP
+    )
+    recorder = _LoadTestRecorder(
+        time_series_interval=time_series_interval,
+        results_collector=results_collector,
+        batch_size=batch_size,
+    )
+    max_workers = OPEN_LOOP_MAX_IN_FLIGHT if mode is LoadMode.OPEN_LOOP else concurrency
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        runner = _RequestRunner(
+            request_function=request_function,
+            executor=executor,
+            recorder=recorder,
+            warm_up_requests=warm_up_requests,
+        )
+        if mode is LoadMode.OPEN_LOOP:
+            await _generate_open_loop_load(
+                runner=runner,
+                total_requests=warm_up_requests + benchmark_requests,
+                requests_per_second=requests_per_second,
+            )
+        else:
+            await _generate_closed_loop_load(
+                runner=runner,
+                total_requests=warm_up_requests + benchmark_requests,
+                concurrency=concurrency,
+            )
+    requests_made = recorder.histogram.count
+    errors = sum(recorder.errors.values())
+    duration = 0.0
+    if recorder.first_start is not None:
+        duration = recorder.last_end - recorder.first_start
+    return LoadTestReport(
+        mode=mode,
+        requests_per_second_target=requests_per_second,
+        concurrency=concurrency if mode is LoadMode.CLOSED_LOOP else None,
+        warm_up_requests=warm_up_requests,
+        requests=requests_made,
+        errors=errors,
+        error_rate=round(errors / requests_made * 100, 2) if requests_made else 0.0,
+        duration_seconds=round(duration, 3),
+        requests_per_second=round(requests_made / duration, 1) if duration else 0.0,
+        latency_ms=recorder.histogram.summary(),
+        error_status_codes=dict(recorder.errors),
+        time_series=recorder.time_series(),
+    )
+
+
+class _RequestRunner:
+    def __init__(
+        self,
+        request_function: Callable[[], Any],
+        executor: ThreadPoolExecutor,
+        recorder: _LoadTestRecorder,
+        warm_up_requests: int,
+    ):
+        self._request_function = request_function
+        self._executor = executor
+        self._recorder = recorder
+        self._warm_up_requests = warm_up_requests
+
+    async def run(self, request_index: int, scheduled_start: float) -> None:
+        # requests are dispatched in order of indices - so the first measured request
+        # marks the beginning of measurement
+        if request_index == self._warm_up_requests:
+            self._recorder.start(timestamp=scheduled_start)
+        loop = asyncio.get_running_loop()
+        error = None
+        try:
+            await loop.run_in_executor(self._executor, self._request_function)
+        except Exception as exc:
+            error = get_error_status_code(error=exc)
+        end = loop.time()
+        if request_index < self._warm_up_requests:
+            return None
+        self._recorder.register(start=scheduled_start, end=end, error=error)
+
+
+async def _generate_open_loop_load(
+    runner: _RequestRunner,
+    total_requests: int,
+    requests_per_second: float,
+) -> None:
+    loop = asyncio.get_running_loop()
+    interval = 1.0 / requests_per_second
+    start = loop.time()
+    tasks = []
+    for request_index in range(total_requests):
+        scheduled_start = start + request_index * interval
+        delay = scheduled_start - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(
+            asyncio.ensure_future(
+                runner.run(request_index=request_index, scheduled_start=scheduled_start)
+            )
+        )
+    await asyncio.gather(*tasks)
+
+
+async def _generate_closed_loop_load(
+    runner: _RequestRunner,
+    total_requests: int,
+    concurrency: int,
+) -> None:
+    loop = asyncio.get_running_loop()
+    requests_indices = iter(range(total_requests))
+
+    async def client() -> None:
+        for request_index in requests_indices:
+            await runner.run(request_index=request_index, scheduled_start=loop.time())
+
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+
+
+def get_error_status_code(error: Exception) -> str:
+    if isinstance(error, HTTPCallErrorError):
+        return str(error.status_code)
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return str(error.response.status_code)
+    return error.__class__.__name__
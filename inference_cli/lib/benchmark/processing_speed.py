@@ -0,0 +1,398 @@
+import time
+import tracemalloc
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import cv2
+import numpy as np
+import supervision as sv
+
+from inference.core.nms import w_np_non_max_suppression
+from inference.core.utils.postprocess import (
+    masks2poly,
+    post_process_bboxes,
+    process_mask_accurate,
+    process_mask_fast,
+    process_mask_roi,
+    process_mask_tradeoff,
+)
+from inference.core.utils.preprocess import letterbox_image, prepare
+from inference.core.workflows.core_steps.common.serializers import (
+    serialise_sv_detections,
+)
+from inference_cli.lib.benchmark.baseline import (
+    MetricComparison,
+    calculate_relative_change,
+)
+from inference_cli.lib.benchmark.load_generator import LatencyHistogram
+from inference_cli.lib.utils import read_json
+
+PREPARE_PREPROCESSING_CONFIG = {
+    "static-crop": {
+        "enabled": True,
+        "x_min": 5,
+        "y_min": 5,
+        "x_max": 95,
+        "y_max": 95,
+    },
+    "contrast": {"enabled": True, "type": "Contrast Stretching"},
+    "grayscale": {"enabled": True},
+}
+MASK_PROTOTYPES_DOWNSCALE = 4
+TRADEOFF_FACTOR = 0.5
+
+
+@dataclass(frozen=True)
+class ProcessingBenchmarkInputs:
+    image_height: int = 1080
+    image_width: int = 1920
+    input_size: int = 640
+    candidates: int = 8400
+    detections: int = 100
+    classes: int = 80
+    mask_prototypes: int = 32
+    seed: int = 42
+
+
+@dataclass(frozen=True)
+class StageBenchmarkResult:
+    stage: str
+    iterations: int
+    operations_per_second: float
+    latency_ms: Dict[str, float]
+    peak_allocated_bytes: int
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StageBenchmarkResult":
+        return cls(
+            stage=data["stage"],
+            iterations=data["iterations"],
+            operations_per_second=data["operations_per_second"],
+            latency_ms=data["latency_ms"],
+            peak_allocated_bytes=data["peak_allocated_bytes"],
+        )
+
+    def to_string(self) -> str:
+        return (
+            f"{self.stage:<28}| ops/s: {self.operations_per_second:<10}| "
+            f"mean: {self.latency_ms['mean']:.3f}ms\t| p50: {self.latency_ms['p50']:.3f}ms\t| "
+            f"p99: {self.latency_ms['p99']:.3f}ms\t| "
+            f"peak alloc: {round(self.peak_allocated_bytes / 1024 ** 2, 2)}MB"
+        )
+
+
+StageFactory = Callable[[ProcessingBenchmarkInputs], Callable[[], Any]]
+
+
+def run_processing_speed_benchmark(
+    inputs: ProcessingBenchmarkInputs,
+    stages: Optional[List[str]] = None,
+    iterations: int = 100,
+    warm_up_iterations: int = 5,
+) -> List[StageBenchmarkResult]:
+    """
+    Runs in-process micro-benchmark of pre- / post-processing stages against synthetic data
+    described by `inputs` - no network access nor model weights are required. Each stage is
+    timed in a loop of `iterations` calls (after `warm_up_iterations` calls that are not measured)
+    and then executed once more with `tracemalloc` enabled to measure peak memory allocated by the stage
+    (tracing slows down execution, so it is kept separate from time measurements).
+    """
+    if stages is None:
+        stages = list(PROCESSING_STAGES.keys())
+    unknown_stages = [stage for stage in stages if stage not in PROCESSING_STAGES]
+    if unknown_stages:
+        raise ValueError(
+            f"Unknown processing stages: {unknown_stages}. "
+            f"Available stages: {list(PROCESSING_STAGES.keys())}"
+        )
+    if iterations < 1:
+        raise ValueError("Number of benchmark iterations must be positive")
+    results = []
+    for stage in stages:
+        stage_function = PROCESSING_STAGES[stage](inputs)
+        result = benchmark_stage(
+            stage=stage,
+            stage_function=stage_function,
+            iterations=iterations,
+            warm_up_iterations=warm_up_iterations,
+        )
+        print(result.to_string())
+        results.append(result)
+    return results
+
+
+def benchmark_stage(
+    stage: str,
+    stage_function: Callable[[], Any],
+    iterations: int,
+    warm_up_iterations: int,
+) -> StageBenchmarkResult:
+    for _ in range(warm_up_iterations):
+        stage_function()
+    histogram = LatencyHistogram()
+    benchmark_start = time.perf_counter()
+    for _ in range(iterations):
+        start = time.perf_counter()
+        stage_function()
+        histogram.record(value_ms=(time.perf_counter() - start) * 1000)
+    duration = time.perf_counter() - benchmark_start
+    return StageBenchmarkResult(
+        stage=stage,
+        iterations=iterations,
+        operations_per_second=round(iterations / duration, 2),
+        latency_ms=histogram.summary(),
+        peak_allocated_bytes=measure_peak_allocation(stage_function=stage_function),
+    )
+
+
+def measure_peak_allocation(stage_function: Callable[[], Any]) -> int:
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        stage_function()
+        _, peak = tracemalloc.get_traced_memory()
+        return max(peak - baseline, 0)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+
+def load_processing_benchmark_results(path: str) -> List[StageBenchmarkResult]:
+    content = read_json(path=path)
+    return [
+        StageBenchmarkResult.from_dict(result)
+        for result in content["processing_benchmark"]
+    ]
+
+
+def compare_processing_benchmark_results(
+    baseline: List[StageBenchmarkResult],
+    candidate: List[StageBenchmarkResult],
+    max_latency_regression: Optional[float] = None,
+    max_allocation_regression: Optional[float] = None,
+) -> List[MetricComparison]:
+    """
+    Compares median latency and peak allocation of stages present in both results, changes
+    are expressed in percent of baseline value.
+    """
+    baseline_by_stage = {result.stage: result for result in baseline}
+    comparisons = []
+    for candidate_result in candidate:
+        baseline_result = baseline_by_stage.get(candidate_result.stage)
+        if baseline_result is None:
+            continue
+        change = calculate_relative_change(
+            baseline=baseline_result.latency_ms["p50"],
+            candidate=candidate_result.latency_ms["p50"],
+        )
+        comparisons.append(
+            MetricComparison(
+                metric=f"{candidate_result.stage} p50 [ms]",
+                baseline=baseline_result.latency_ms["p50"],
+                candidate=candidate_result.latency_ms["p50"],
+                change=change,
+                threshold=max_latency_regression,
+                is_regression=max_latency_regression is not None
+                and change > max_latency_regression,
+            )
+        )
+        change = calculate_relative_change(
+            baseline=baseline_result.peak_allocated_bytes,
+            candidate=candidate_result.peak_allocated_bytes,
+        )
+        comparisons.append(
+            MetricComparison(
+                metric=f"{candidate_result.stage} peak alloc [B]",
+                baseline=baseline_result.peak_allocated_bytes,
+                candidate=candidate_result.peak_allocated_bytes,
+                change=change,
+                threshold=max_allocation_regression,
+                is_regression=max_allocation_regression is not None
+                and change > max_allocation_regression,
+            )
+        )
+    return comparisons
+
+
+def _generate_image(inputs: ProcessingBenchmarkInputs) -> np.ndarray:
+    rng = np.random.default_rng(inputs.seed)
+    return rng.integers(
+        0, 256, size=(inputs.image_height, inputs.image_width, 3), dtype=np.uint8
+    )
+
+
+def _generate_boxes_xyxy(
+    inputs: ProcessingBenchmarkInputs, rng: np.random.Generator, count: int
+) -> np.ndarray:
+    centers = rng.uniform(0, inputs.input_size, size=(count, 2))
+    sizes = rng.uniform(8, inputs.input_size / 4, size=(count, 2))
+    xyxy = np.concatenate([centers - sizes / 2, centers + sizes / 2], axis=1)
+    return np.clip(xyxy, 0, inputs.input_size).astype(np.float32)
+
+
+def _generate_raw_predictions(inputs: ProcessingBenchmarkInputs) -> np.ndarray:
+    # emulates raw output of YOLO-like model: most candidates have low confidence
+    # for all classes, the rest is confident about single class
+    rng = np.random.default_rng(inputs.seed)
+    xyxy = _generate_boxes_xyxy(inputs=inputs, rng=rng, count=inputs.candidates)
+    xywh = np.concatenate(
+        [(xyxy[:, :2] + xyxy[:, 2:]) / 2, xyxy[:, 2:] - xyxy[:, :2]], axis=1
+    )
+    class_confidence = rng.uniform(0, 0.05, size=(inputs.candidates, inputs.classes))
+    object_classes = rng.integers(0, inputs.classes, size=inputs.candidates)
+    class_confidence[np.arange(inputs.candidates), object_classes] = (
+        rng.random(inputs.candidates) ** 4
+    )
+    max_confidence = class_confidence.max(axis=1, keepdims=True)
+    prediction = np.concatenate([xywh, max_confidence, class_confidence], axis=1)
+    return np.expand_dims(prediction, axis=0).astype(np.float32)
+
+
+def _generate_detections_array(inputs: ProcessingBenchmarkInputs) -> np.ndarray:
+    rng = np.random.default_rng(inputs.seed)
+    xyxy = _generate_boxes_xyxy(inputs=inputs, rng=rng, count=inputs.detections)
+    confidence = rng.uniform(0.25, 1.0, size=(inputs.detections, 1))
+    class_id = rng.integers(0, inputs.classes, size=(inputs.detections, 1))
+    return np.concatenate([xyxy, confidence, confidence, class_id], axis=1)
+
+
+def _generate_mask_inputs(inputs: ProcessingBenchmarkInputs) -> tuple:
+    rng = np.random.default_rng(inputs.seed)
+    prototypes_size = inputs.input_size // MASK_PROTOTYPES_DOWNSCALE
+    protos = rng.standard_normal(
+        size=(inputs.mask_prototypes, prototypes_size, prototypes_size),
+        dtype=np.float32,
+    )
+    masks_in = rng.standard_normal(
+        size=(inputs.detections, inputs.mask_prototypes), dtype=np.float32
+    )
+    bboxes = _generate_boxes_xyxy(inputs=inputs, rng=rng, count=inputs.detections)
+    return protos, masks_in, bboxes, (inputs.input_size, inputs.input_size)
+
+
+def _generate_binary_masks(inputs: ProcessingBenchmarkInputs) -> np.ndarray:
+    rng = np.random.default_rng(inputs.seed)
+    bboxes = _generate_boxes_xyxy(inputs=inputs, rng=rng, count=inputs.detections)
+    masks = np.zeros(
+        (inputs.detections, inputs.input_size, inputs.input_size), dtype=np.float32
+    )
+    for mask, (x_min, y_min, x_max, y_max) in zip(masks, bboxes):
+        center = (int((x_min + x_max) / 2), int((y_min + y_max) / 2))
+        axes = (max(int((x_max - x_min) / 2), 1), max(int((y_max - y_min) / 2), 1))
+        cv2.ellipse(mask, center, axes, 0, 0, 360, 1.0, thickness=-1)
+    return masks
+
+
+def _generate_sv_detections(inputs: ProcessingBenchmarkInputs) -> sv.Detections:
+    rng = np.random.default_rng(inputs.seed)
+    xyxy = _generate_boxes_xyxy(inputs=inputs, rng=rng, count=inputs.detections)
+    class_id = rng.integers(0, inputs.classes, size=inputs.detections)
+    return sv.Detections(
+        xyxy=xyxy,
+        confidence=rng.uniform(0.25, 1.0, size=inputs.detections),
+        class_id=class_id,
+        data={
+            "class_name": np.array([f"class_{i}" for i in class_id]),
+            "detection_id": np.array(
+                [str(uuid.uuid4()) for _ in range(inputs.detections)]
+            ),
+        },
+    )
+
+
+def _prepare_stage(inputs: ProcessingBenchmarkInputs) -> Callable[[], Any]:
+    image = _generate_image(inputs=inputs)
+    return lambda: prepare(image=image, preproc=PREPARE_PREPROCESSING_CONFIG)
+
+
+def _letterbox_image_stage(inputs: ProcessingBenchmarkInputs) -> Callable[[], Any]:
+    image = _generate_image(inputs=inputs)
+    desired_size = (inputs.input_size, inputs.input_size)
+    return lambda: letterbox_image(image=image, desired_size=desired_size)
+
+
+def _nms_stage(inputs: ProcessingBenchmarkInputs) -> Callable[[], Any]:
+    prediction = _generate_raw_predictions(inputs=inputs)
+    return lambda: w_np_non_max_suppression(prediction=prediction)
+
+
+def _post_process_bboxes_stage(inputs: ProcessingBenchmarkInputs) -> Callable[[], Any]:
+    predictions = [_generate_detections_array(inputs=inputs)]
+    infer_shape = (inputs.input_size, inputs.input_size)
+    img_dims = [(inputs.image_height, inputs.image_width)]
+    return lambda: post_process_bboxes(
+        predictions=predictions,
+        infer_shape=infer_shape,
+        img_dims=img_dims,
+        preproc={},
+        resize_method="Fit (black edges) in",
+    )
+
+
+def _process_mask_accurate_stage(
+    inputs: ProcessingBenchmarkInputs,
+) -> Callable[[], Any]:
+    protos, masks_in, bboxes, shape = _generate_mask_inputs(inputs=inputs)
+    return lambda: process_mask_accurate(
+        protos=protos, masks_in=masks_in, bboxes=bboxes, shape=shape
+    )
+
+
+def _process_mask_tradeoff_stage(
+    inputs: ProcessingBenchmarkInputs,
+) -> Callable[[], Any]:
+    protos, masks_in, bboxes, shape = _generate_mask_inputs(inputs=inputs)
+    return lambda: process_mask_tradeoff(
+        protos=protos,
+        masks_in=masks_in,
+        bboxes=bboxes,
+        shape=shape,
+        tradeoff_factor=TRADEOFF_FACTOR,
+    )
+
+
+def _process_mask_fast_stage(inputs: ProcessingBenchmarkInputs) -> Callable[[], Any]:
+    protos, masks_in, bboxes, shape = _generate_mask_inputs(inputs=inputs)
+    return lambda: process_mask_fast(
+        protos=protos, masks_in=masks_in, bboxes=bboxes, shape=shape
+    )
+
+
+def _process_mask_roi_stage(inputs: ProcessingBenchmarkInputs) -> Callable[[], Any]:
+    protos, masks_in, bboxes, shape = _generate_mask_inputs(inputs=inputs)
+    return lambda: process_mask_roi(
+        protos=protos, masks_in=masks_in, bboxes=bboxes, shape=shape
+    )
+
+
+def _masks2poly_stage(inputs: ProcessingBenchmarkInputs) -> Callable[[], Any]:
+    masks = _generate_binary_masks(inputs=inputs)
+    return lambda: masks2poly(masks=masks)
+
+
+def _serialise_sv_detections_stage(
+    inputs: ProcessingBenchmarkInputs,
+) -> Callable[[], Any]:
+    detections = _generate_sv_detections(inputs=inputs)
+    return lambda: serialise_sv_detections(detections=detections)
+
+
+PROCESSING_STAGES: Dict[str, StageFactory] = {
+    "prepare": _prepare_stage,
+    "letterbox_image": _letterbox_image_stage,
+    "w_np_non_max_suppression": _nms_stage,
+    "post_process_bboxes": _post_process_bboxes_stage,
+    "process_mask_accurate": _process_mask_accurate_stage,
+    "process_mask_tradeoff": _process_mask_tradeoff_stage,
+    "process_mask_fast": _process_mask_fast_stage,
+    "process_mask_roi": _process_mask_roi_stage,
+    "masks2poly": _masks2poly_stage,
+    "serialise_sv_detections": _serialise_sv_detections_stage,
+}
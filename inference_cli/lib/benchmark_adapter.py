@@ -1,15 +1,24 @@
 import os.path
 from dataclasses import asdict
 from datetime import datetime
+from enum import Enum
 from threading import Thread
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
 
 from inference_cli.lib.benchmark.api_speed import (
     coordinate_infer_api_speed_benchmark,
     coordinate_workflow_api_speed_benchmark,
     display_benchmark_statistics,
 )
+from inference_cli.lib.benchmark.baseline import (
+    compare_with_baseline,
+    ensure_no_regression,
+    load_load_test_report,
+)
 from inference_cli.lib.benchmark.dataset import load_dataset_images
+from inference_cli.lib.benchmark.load_generator import LoadTestReport
 from inference_cli.lib.benchmark.platform import retrieve_platform_specifics
 from inference_cli.lib.benchmark.results_gathering import (
     InferenceStatistics,
@@ -22,6 +31,11 @@ from inference_cli.lib.utils import (
 )
 
 
+class BenchmarkOutputFormat(str, Enum):
+    JSON = "json"
+    CSV = "csv"
+
+
 def run_infer_api_speed_benchmark(
     model_id: str,
     dataset_reference: str,
@@ -36,6 +50,11 @@ def run_infer_api_speed_benchmark(
     output_location: Optional[str] = None,
     enforce_legacy_endpoints: bool = False,
     max_error_rate: Optional[float] = None,
+    output_format: BenchmarkOutputFormat = BenchmarkOutputFormat.JSON,
+    time_series_interval: float = 1.0,
+    baseline: Optional[str] = None,
+    max_latency_regression: Optional[float] = None,
+    max_throughput_regression: Optional[float] = None,
 ) -> None:
     dataset_images = load_dataset_images(
         dataset_reference=dataset_reference,
@@ -51,7 +70,7 @@ def run_infer_api_speed_benchmark(
     client.select_model(model_id=model_id)
     if enforce_legacy_endpoints:
         client.select_api_v0()
-    benchmark_results = coordinate_infer_api_speed_benchmark(
+    benchmark_results, load_test_report = coordinate_infer_api_speed_benchmark(
         client=client,
         images=dataset_images,
         model_id=model_id,
@@ -60,11 +79,16 @@ def run_infer_api_speed_benchmark(
         request_batch_size=request_batch_size,
         number_of_clients=number_of_clients,
         requests_per_second=requests_per_second,
+        time_series_interval=time_series_interval,
     )
     if output_location is None:
-        ensure_error_rate_is_below_threshold(
-            error_rate=benchmark_results.error_rate,
-            threshold=max_error_rate,
+        ensure_api_speed_benchmark_results_are_acceptable(
+            benchmark_results=benchmark_results,
+            load_test_report=load_test_report,
+            max_error_rate=max_error_rate,
+            baseline=baseline,
+            max_latency_regression=max_latency_regression,
+            max_throughput_regression=max_throughput_regression,
         )
         return None
     benchmark_parameters = {
@@ -82,10 +106,16 @@ def run_infer_api_speed_benchmark(
         output_location=output_location,
         benchmark_parameters=benchmark_parameters,
         benchmark_results=benchmark_results,
+        load_test_report=load_test_report,
+        output_format=output_format,
     )
-    ensure_error_rate_is_below_threshold(
-        error_rate=benchmark_results.error_rate,
-        threshold=max_error_rate,
+    ensure_api_speed_benchmark_results_are_acceptable(
+        benchmark_results=benchmark_results,
+        load_test_report=load_test_report,
+        max_error_rate=max_error_rate,
+        baseline=baseline,
+        max_latency_regression=max_latency_regression,
+        max_throughput_regression=max_throughput_regression,
     )
 
 
@@ -105,6 +135,11 @@ def run_workflow_api_speed_benchmark(
     model_configuration: Optional[str] = None,
     output_location: Optional[str] = None,
     max_error_rate: Optional[float] = None,
+    output_format: BenchmarkOutputFormat = BenchmarkOutputFormat.JSON,
+    time_series_interval: float = 1.0,
+    baseline: Optional[str] = None,
+    max_latency_regression: Optional[float] = None,
+    max_throughput_regression: Optional[float] = None,
 ) -> None:
     dataset_images = load_dataset_images(
         dataset_reference=dataset_reference,
@@ -117,7 +152,7 @@ def run_workflow_api_speed_benchmark(
         max_concurrent_requests=1,
         max_batch_size=request_batch_size,
     )
-    benchmark_results = coordinate_workflow_api_speed_benchmark(
+    benchmark_results, load_test_report = coordinate_workflow_api_speed_benchmark(
         client=client,
         images=dataset_images,
         workspace_name=workspace_name,
@@ -128,11 +163,17 @@ def run_workflow_api_speed_benchmark(
         request_batch_size=request_batch_size,
         number_of_clients=number_of_clients,
         requests_per_second=requests_per_second,
+        warm_up_requests=warm_up_requests,
+        time_series_interval=time_series_interval,
     )
     if output_location is None:
-        ensure_error_rate_is_below_threshold(
-            error_rate=benchmark_results.error_rate,
-            threshold=max_error_rate,
+        ensure_api_speed_benchmark_results_are_acceptable(
+            benchmark_results=benchmark_results,
+            load_test_report=load_test_report,
+            max_error_rate=max_error_rate,
+            baseline=baseline,
+            max_latency_regression=max_latency_regression,
+            max_throughput_regression=max_throughput_regression,
         )
         return None
     benchmark_parameters = {
@@ -154,10 +195,16 @@ def run_workflow_api_speed_benchmark(
         output_location=output_location,
         benchmark_parameters=benchmark_parameters,
         benchmark_results=benchmark_results,
+        load_test_report=load_test_report,
+        output_format=output_format,
     )
-    ensure_error_rate_is_below_threshold(
-        error_rate=benchmark_results.error_rate,
-        threshold=max_error_rate,
+    ensure_api_speed_benchmark_results_are_acceptable(
+        benchmark_results=benchmark_results,
+        load_test_report=load_test_report,
+        max_error_rate=max_error_rate,
+        baseline=baseline,
+        max_latency_regression=max_latency_regression,
+        max_throughput_regression=max_throughput_regression,
     )
 
 
@@ -217,27 +264,175 @@ def run_python_package_speed_benchmark(
     )
 
 
+def run_processing_speed_benchmark(
+    stages: Optional[List[str]] = None,
+    image_height: int = 1080,
+    image_width: int = 1920,
+    input_size: int = 640,
+    candidates: int = 8400,
+    detections: int = 100,
+    classes: int = 80,
+    iterations: int = 100,
+    warm_up_iterations: int = 5,
+    output_location: Optional[str] = None,
+    baseline: Optional[str] = None,
+    max_latency_regression: Optional[float] = None,
+    max_allocation_regression: Optional[float] = None,
+) -> None:
+    ensure_inference_is_installed()
+
+    # importing here not to affect other entrypoints by missing `inference` core library
+    from inference_cli.lib.benchmark.processing_speed import (
+        ProcessingBenchmarkInputs,
+        compare_processing_benchmark_results,
+        load_processing_benchmark_results,
+        run_processing_speed_benchmark,
+    )
+
+    inputs = ProcessingBenchmarkInputs(
+        image_height=image_height,
+        image_width=image_width,
+        input_size=input_size,
+        candidates=candidates,
+        detections=detections,
+        classes=classes,
+    )
+    results = run_processing_speed_benchmark(
+        inputs=inputs,
+        stages=stages,
+        iterations=iterations,
+        warm_up_iterations=warm_up_iterations,
+    )
+    if output_location is not None:
+        if os.path.isdir(output_location):
+            target_path = os.path.join(
+                output_location, f"{datetime.now().isoformat()}.json"
+            )
+        else:
+            target_path = output_location
+        print(f"Saving statistics under: {target_path}")
+        content = {
+            "benchmark_parameters": {
+                "datetime": datetime.now().isoformat(),
+                "iterations": iterations,
+                **asdict(inputs),
+            },
+            "processing_benchmark": [result.to_dict() for result in results],
+            "platform": retrieve_platform_specifics(),
+        }
+        dump_json(path=target_path, content=content)
+    if baseline is None:
+        return None
+    comparisons = compare_processing_benchmark_results(
+        baseline=load_processing_benchmark_results(path=baseline),
+        candidate=results,
+        max_latency_regression=max_latency_regression,
+        max_allocation_regression=max_allocation_regression,
+    )
+    for comparison in comparisons:
+        print(comparison.to_string())
+    ensure_no_regression(comparisons=comparisons)
+
+
 def dump_benchmark_results(
     output_location: str,
     benchmark_parameters: dict,
     benchmark_results: InferenceStatistics,
+    load_test_report: Optional[LoadTestReport] = None,
+    output_format: BenchmarkOutputFormat = BenchmarkOutputFormat.JSON,
 ) -> None:
     platform_specifics = retrieve_platform_specifics()
     if os.path.isdir(output_location):
         target_path = os.path.join(
-            output_location, f"{datetime.now().isoformat()}.json"
+            output_location, f"{datetime.now().isoformat()}.{output_format.value}"
         )
     else:
         target_path = output_location
     print(f"Saving statistics under: {target_path}")
+    if output_format is BenchmarkOutputFormat.CSV:
+        if load_test_report is None:
+            raise ValueError("CSV output is only supported for API speed benchmark")
+        dump_load_test_report_to_csv(path=target_path, report=load_test_report)
+        return None
     results = {
         "benchmark_parameters": benchmark_parameters,
         "benchmark_results": asdict(benchmark_results),
         "platform": platform_specifics,
     }
+    if load_test_report is not None:
+        results["load_test"] = load_test_report.to_dict()
     dump_json(path=target_path, content=results)
 
 
+def dump_load_test_report_to_csv(path: str, report: LoadTestReport) -> None:
+    rows = [
+        {
+            "elapsed_seconds": "total",
+            "requests": report.requests,
+            "errors": report.errors,
+            "requests_per_second": report.requests_per_second,
+            **report.latency_ms,
+        }
+    ]
+    for point in report.time_series:
+        rows.append(
+            {
+                "elapsed_seconds": point.elapsed_seconds,
+                "requests": point.requests,
+                "errors": point.errors,
+                "requests_per_second": point.requests_per_second,
+                **point.latency_ms,
+            }
+        )
+    parent_dir = os.path.dirname(os.path.abspath(path))
+    os.makedirs(parent_dir, exist_ok=True)
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+
+def ensure_api_speed_benchmark_results_are_acceptable(
+    benchmark_results: InferenceStatistics,
+    load_test_report: LoadTestReport,
+    max_error_rate: Optional[float],
+    baseline: Optional[str],
+    max_latency_regression: Optional[float],
+    max_throughput_regression: Optional[float],
+) -> None:
+    ensure_error_rate_is_below_threshold(
+        error_rate=benchmark_results.error_rate,
+        threshold=max_error_rate,
+    )
+    if baseline is None:
+        return None
+    comparisons = compare_with_baseline(
+        baseline=load_load_test_report(path=baseline),
+        candidate=load_test_report,
+        max_latency_regression=max_latency_regression,
+        max_throughput_regression=max_throughput_regression,
+    )
+    for comparison in comparisons:
+        print(comparison.to_string())
+    ensure_no_regression(comparisons=comparisons)
+
+
+def run_benchmark_comparison(
+    baseline: str,
+    candidate: str,
+    max_latency_regression: Optional[float] = None,
+    max_throughput_regression: Optional[float] = None,
+    max_error_rate_increase: Optional[float] = None,
+) -> None:
+    comparisons = compare_with_baseline(
+        baseline=load_load_test_report(path=baseline),
+        candidate=load_load_test_report(path=candidate),
+        max_latency_regression=max_latency_regression,
+        max_throughput_regression=max_throughput_regression,
+        max_error_rate_increase=max_error_rate_increase,
+    )
+    for comparison in comparisons:
+        print(comparison.to_string())
+    ensure_no_regression(comparisons=comparisons)
+
+
 def ensure_error_rate_is_below_threshold(
     error_rate: float, threshold: Optional[float]
 ) -> None:
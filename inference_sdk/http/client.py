@@ -1,9 +1,7 @@
 from contextlib import contextmanager
 from typing import Any, Dict, Generator, List, Literal, Optional, Tuple, Union
 
-import aiohttp
 import numpy as np
-import requests
 from aiohttp import ClientConnectionError, ClientResponseError
 from requests import HTTPError
 
@@ -35,6 +33,17 @@ from inference_sdk.http.utils.aliases import (
     resolve_ocr_path,
     resolve_roboflow_model_alias,
 )
+from inference_sdk.http.utils.binary_transport import (
+    BINARY_TRANSPORT_HEADERS,
+    decode_response,
+    encode_images_as_bytes,
+    msgpack_dumps,
+    to_binary_requests_data,
+)
+from inference_sdk.http.utils.connection_pool import (
+    DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    ConnectionPool,
+)
 from inference_sdk.http.utils.executors import (
     RequestMethod,
     execute_requests_packages,
@@ -173,34 +182,72 @@ class InferenceHTTPClient:
         cls,
         api_url: str,
         api_key: Optional[str] = None,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
     ) -> "InferenceHTTPClient":
         """Initialize a new InferenceHTTPClient instance.
 
         Args:
             api_url (str): The base URL for the inference API.
             api_key (Optional[str], optional): API key for authentication. Defaults to None.
+            max_connections_per_host (int, optional): The maximum number of keep-alive
+                connections the client keeps open per host. Defaults to 32.
 
         Returns:
             InferenceHTTPClient: A new instance of the InferenceHTTPClient.
         """
-        return cls(api_url=api_url, api_key=api_key)
+        return cls(
+            api_url=api_url,
+            api_key=api_key,
+            max_connections_per_host=max_connections_per_host,
+        )
 
     def __init__(
         self,
         api_url: str,
         api_key: Optional[str] = None,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
     ):
         """Initialize a new InferenceHTTPClient instance.
 
+        Connections to the server are kept alive and re-used between calls, parallel requests are
+        dispatched to a long-lived executor. Use `close()` (or the client as a context manager)
+        to release those resources once the client is no longer needed.
+
         Args:
             api_url (str): The base URL for the inference API.
             api_key (Optional[str], optional): API key for authentication. Defaults to None.
+            max_connections_per_host (int, optional): The maximum number of keep-alive
+                connections the client keeps open per host. Defaults to 32.
         """
         self.__api_url = api_url
         self.__api_key = api_key
         self.__inference_configuration = InferenceConfiguration.init_default()
         self.__client_mode = _determine_client_mode(api_url=api_url)
         self.__selected_model: Optional[str] = None
+        self.__connection_pool = ConnectionPool(
+            max_connections_per_host=max_connections_per_host
+        )
+
+    def close(self) -> None:
+        """Close connections kept alive by the client and shut down its executor."""
+        self.__connection_pool.close()
+
+    async def close_async(self) -> None:
+        """Close connections kept alive by the client (including the ones used by async methods)
+        and shut down its executor."""
+        await self.__connection_pool.close_async()
+
+    def __enter__(self) -> "InferenceHTTPClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "InferenceHTTPClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close_async()
 
     @property
     def inference_configuration(self) -> InferenceConfiguration:
@@ -348,7 +395,7 @@ class InferenceHTTPClient:
             HTTPCallErrorError: If there is an error in the HTTP call.
             HTTPClientError: If there is an error with the server connection.
         """
-        response = requests.get(f"{self.__api_url}/info")
+        response = self.__connection_pool.session.get(f"{self.__api_url}/info")
         response.raise_for_status()
         response_payload = response.json()
         return ServerInfo.from_dict(response_payload)
@@ -490,6 +537,10 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__connection_pool.session,
+            executor=self.__connection_pool.get_executor(
+                min_workers=self.__inference_configuration.max_concurrent_requests
+            ),
         )
         results = []
         for request_data, response in zip(requests_data, responses):
@@ -568,6 +619,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            connector=self.__connection_pool.get_async_connector(),
         )
         results = []
         for request_data, response in zip(requests_data, responses):
@@ -635,14 +687,20 @@ class InferenceHTTPClient:
             max_batch_size=self.__inference_configuration.max_batch_size,
             image_placement=ImagePlacement.JSON,
         )
+        if self.__inference_configuration.binary_transport:
+            requests_data = to_binary_requests_data(requests_data=requests_data)
         responses = execute_requests_packages(
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__connection_pool.session,
+            executor=self.__connection_pool.get_executor(
+                min_workers=self.__inference_configuration.max_concurrent_requests
+            ),
         )
         results = []
         for request_data, response in zip(requests_data, responses):
-            parsed_response = response.json()
+            parsed_response = decode_response(response=response)
             if not issubclass(type(parsed_response), list):
                 parsed_response = [parsed_response]
             for parsed_response_element, scaling_factor in zip(
@@ -712,6 +770,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            connector=self.__connection_pool.get_async_connector(),
         )
         results = []
         for request_data, parsed_response in zip(requests_data, responses):
@@ -821,7 +880,7 @@ class InferenceHTTPClient:
             HTTPClientError: If there is an error with the server connection.
         """
         self.__ensure_v1_client_mode()
-        response = requests.get(
+        response = self.__connection_pool.session.get(
             f"{self.__api_url}/model/registry?api_key={self.__api_key}"
         )
         response.raise_for_status()
@@ -841,7 +900,7 @@ class InferenceHTTPClient:
             HTTPClientError: If there is an error with the server connection.
         """
         self.__ensure_v1_client_mode()
-        async with aiohttp.ClientSession() as session:
+        async with self.__connection_pool.async_session() as session:
             async with session.get(
                 f"{self.__api_url}/model/registry?api_key={self.__api_key}"
             ) as response:
@@ -869,7 +928,7 @@ class InferenceHTTPClient:
         """
         self.__ensure_v1_client_mode()
         de_aliased_model_id = resolve_roboflow_model_alias(model_id=model_id)
-        response = requests.post(
+        response = self.__connection_pool.session.post(
             f"{self.__api_url}/model/add",
             json={
                 "model_id": de_aliased_model_id,
@@ -907,7 +966,7 @@ class InferenceHTTPClient:
             "model_id": de_aliased_model_id,
             "api_key": self.__api_key,
         }
-        async with aiohttp.ClientSession() as session:
+        async with self.__connection_pool.async_session() as session:
             async with session.post(
                 f"{self.__api_url}/model/add",
                 json=payload,
@@ -936,7 +995,7 @@ class InferenceHTTPClient:
         """
         self.__ensure_v1_client_mode()
         de_aliased_model_id = resolve_roboflow_model_alias(model_id=model_id)
-        response = requests.post(
+        response = self.__connection_pool.session.post(
             f"{self.__api_url}/model/remove",
             json={
                 "model_id": de_aliased_model_id,
@@ -956,7 +1015,7 @@ class InferenceHTTPClient:
     async def unload_model_async(self, model_id: str) -> RegisteredModels:
         self.__ensure_v1_client_mode()
         de_aliased_model_id = resolve_roboflow_model_alias(model_id=model_id)
-        async with aiohttp.ClientSession() as session:
+        async with self.__connection_pool.async_session() as session:
             async with session.post(
                 f"{self.__api_url}/model/remove",
                 json={
@@ -976,7 +1035,7 @@ class InferenceHTTPClient:
     @wrap_errors
     def unload_all_models(self) -> RegisteredModels:
         self.__ensure_v1_client_mode()
-        response = requests.post(f"{self.__api_url}/model/clear")
+        response = self.__connection_pool.session.post(f"{self.__api_url}/model/clear")
         response.raise_for_status()
         response_payload = response.json()
         self.__selected_model = None
@@ -985,7 +1044,7 @@ class InferenceHTTPClient:
     @wrap_errors_async
     async def unload_all_models_async(self) -> RegisteredModels:
         self.__ensure_v1_client_mode()
-        async with aiohttp.ClientSession() as session:
+        async with self.__connection_pool.async_session() as session:
             async with session.post(f"{self.__api_url}/model/clear") as response:
                 response.raise_for_status()
                 response_payload = await response.json()
@@ -1036,6 +1095,10 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__connection_pool.session,
+            executor=self.__connection_pool.get_executor(
+                min_workers=self.__inference_configuration.max_concurrent_requests
+            ),
         )
         results = [r.json() for r in responses]
         return unwrap_single_element_list(sequence=results)
@@ -1084,6 +1147,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            connector=self.__connection_pool.get_async_connector(),
         )
         return unwrap_single_element_list(sequence=responses)
 
@@ -1218,7 +1282,7 @@ class InferenceHTTPClient:
         payload["text"] = text
         if clip_version is not None:
             payload["clip_version_id"] = clip_version
-        response = requests.post(
+        response = self.__connection_pool.session.post(
             self.__wrap_url_with_api_key(f"{self.__api_url}/clip/embed_text"),
             json=payload,
             headers=DEFAULT_HEADERS,
@@ -1249,7 +1313,7 @@ class InferenceHTTPClient:
         payload["text"] = text
         if clip_version is not None:
             payload["clip_version_id"] = clip_version
-        async with aiohttp.ClientSession() as session:
+        async with self.__connection_pool.async_session() as session:
             async with session.post(
                 self.__wrap_url_with_api_key(f"{self.__api_url}/clip/embed_text"),
                 json=payload,
@@ -1315,7 +1379,7 @@ class InferenceHTTPClient:
             )
         else:
             payload["prompt"] = prompt
-        response = requests.post(
+        response = self.__connection_pool.session.post(
             self.__wrap_url_with_api_key(f"{self.__api_url}/clip/compare"),
             json=payload,
             headers=DEFAULT_HEADERS,
@@ -1380,7 +1444,7 @@ class InferenceHTTPClient:
         else:
             payload["prompt"] = prompt
 
-        async with aiohttp.ClientSession() as session:
+        async with self.__connection_pool.async_session() as session:
             async with session.post(
                 self.__wrap_url_with_api_key(f"{self.__api_url}/clip/compare"),
                 json=payload,
@@ -1549,6 +1613,9 @@ class InferenceHTTPClient:
                 encoded_images=loaded_image,
                 key=image_name,
             )
+        if self.__inference_configuration.binary_transport:
+            for image_name in images.keys():
+                inputs[image_name] = encode_images_as_bytes(images=inputs[image_name])
         inputs.update(parameters)
         payload["inputs"] = inputs
         if excluded_fields is not None:
@@ -1565,13 +1632,20 @@ class InferenceHTTPClient:
                 url = f"{self.__api_url}/infer/workflows/{workspace_name}/{workflow_id}"
             else:
                 url = f"{self.__api_url}/{workspace_name}/workflows/{workflow_id}"
-        response = requests.post(
-            url,
-            json=payload,
-            headers=DEFAULT_HEADERS,
-        )
+        if self.__inference_configuration.binary_transport:
+            response = self.__connection_pool.session.post(
+                url,
+                data=msgpack_dumps(payload),
+                headers={**DEFAULT_HEADERS, **BINARY_TRANSPORT_HEADERS},
+            )
+        else:
+            response = self.__connection_pool.session.post(
+                url,
+                json=payload,
+                headers=DEFAULT_HEADERS,
+            )
         api_key_safe_raise_for_status(response=response)
-        response_data = response.json()
+        response_data = decode_response(response=response)
         workflow_outputs = response_data["outputs"]
         profiler_trace = response_data.get("profiler_trace", [])
         if enable_profiling:
@@ -1635,6 +1709,10 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__connection_pool.session,
+            executor=self.__connection_pool.get_executor(
+                min_workers=self.__inference_configuration.max_concurrent_requests
+            ),
         )
         return [r.json() for r in responses]
 
@@ -1689,6 +1767,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            connector=self.__connection_pool.get_async_connector(),
         )
 
     @experimental(
@@ -1786,7 +1865,7 @@ class InferenceHTTPClient:
                 "results_buffer_size": results_buffer_size,
             },
         }
-        response = requests.post(
+        response = self.__connection_pool.session.post(
             f"{self.__api_url}/inference_pipelines/initialise",
             json=payload,
         )
@@ -1812,7 +1891,7 @@ class InferenceHTTPClient:
             HTTPClientError: If there is an error with the server connection.
         """
         payload = {"api_key": self.__api_key}
-        response = requests.get(
+        response = self.__connection_pool.session.get(
             f"{self.__api_url}/inference_pipelines/list",
             json=payload,
         )
@@ -1839,7 +1918,7 @@ class InferenceHTTPClient:
         """
         self._ensure_pipeline_id_not_empty(pipeline_id=pipeline_id)
         payload = {"api_key": self.__api_key}
-        response = requests.get(
+        response = self.__connection_pool.session.get(
             f"{self.__api_url}/inference_pipelines/{pipeline_id}/status",
             json=payload,
         )
@@ -1869,7 +1948,7 @@ class InferenceHTTPClient:
         """
         self._ensure_pipeline_id_not_empty(pipeline_id=pipeline_id)
         payload = {"api_key": self.__api_key}
-        response = requests.post(
+        response = self.__connection_pool.session.post(
             f"{self.__api_url}/inference_pipelines/{pipeline_id}/pause",
             json=payload,
         )
@@ -1899,7 +1978,7 @@ class InferenceHTTPClient:
         """
         self._ensure_pipeline_id_not_empty(pipeline_id=pipeline_id)
         payload = {"api_key": self.__api_key}
-        response = requests.post(
+        response = self.__connection_pool.session.post(
             f"{self.__api_url}/inference_pipelines/{pipeline_id}/resume",
             json=payload,
         )
@@ -1929,7 +2008,7 @@ class InferenceHTTPClient:
         """
         self._ensure_pipeline_id_not_empty(pipeline_id=pipeline_id)
         payload = {"api_key": self.__api_key}
-        response = requests.post(
+        response = self.__connection_pool.session.post(
             f"{self.__api_url}/inference_pipelines/{pipeline_id}/terminate",
             json=payload,
         )
@@ -1964,7 +2043,7 @@ class InferenceHTTPClient:
         if excluded_fields is None:
             excluded_fields = []
         payload = {"api_key": self.__api_key, "excluded_fields": excluded_fields}
-        response = requests.get(
+        response = self.__connection_pool.session.get(
             f"{self.__api_url}/inference_pipelines/{pipeline_id}/consume",
             json=payload,
         )
@@ -2004,6 +2083,10 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__connection_pool.session,
+            executor=self.__connection_pool.get_executor(
+                min_workers=self.__inference_configuration.max_concurrent_requests
+            ),
         )
         results = [r.json() for r in responses]
         return unwrap_single_element_list(sequence=results)
@@ -2037,6 +2120,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            connector=self.__connection_pool.get_async_connector(),
         )
         return unwrap_single_element_list(sequence=responses)
 
@@ -115,6 +115,8 @@ class InferenceConfiguration:
         max_detections: The maximum number of detections for the inference.
         iou_threshold: The intersection over union threshold for the inference.
         stroke_width: The stroke width for the inference.
+        binary_transport: If true, requests to `/infer/...` and workflows endpoints are sent with msgpack
+            (images as raw bytes instead of base64) and responses are received in msgpack.
     """
 
     confidence_threshold: Optional[float] = None
@@ -152,6 +154,7 @@ class InferenceConfiguration:
     source: Optional[str] = None
     source_info: Optional[str] = None
     profiling_directory: str = "./inference_profiling"
+    binary_transport: bool = False
 
     @classmethod
     def init_default(cls) -> "InferenceConfiguration":
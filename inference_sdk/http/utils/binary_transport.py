@@ -0,0 +1,119 @@
+import base64
+from dataclasses import replace
+from typing import Any, Dict, List
+
+import msgpack
+import numpy as np
+from requests import Response
+
+from inference_sdk.http.utils.request_building import RequestData
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+NUMPY_ARRAY_EXT_TYPE = 1
+BINARY_TRANSPORT_HEADERS = {
+    "Content-Type": MSGPACK_CONTENT_TYPE,
+    "Accept": MSGPACK_CONTENT_TYPE,
+}
+
+
+def msgpack_dumps(content: Any) -> bytes:
+    """Encode content with msgpack, numpy arrays are encoded as raw buffers.
+
+    Args:
+        content: The content to encode.
+
+    Returns:
+        The encoded content.
+    """
+    return msgpack.packb(content, default=_encode_extension_type)
+
+
+def msgpack_loads(payload: bytes) -> Any:
+    """Decode content encoded with msgpack.
+
+    Args:
+        payload: The payload to decode.
+
+    Returns:
+        The decoded content.
+    """
+    return msgpack.unpackb(payload, ext_hook=_decode_extension_type)
+
+
+def encode_images_as_bytes(images: Any) -> Any:
+    """Replace base64 images (or nested lists of them) with raw bytes, to be sent with msgpack.
+
+    Args:
+        images: Image in format `{"type": "base64", "value": ...}` or (nested) list of them.
+
+    Returns:
+        Images in format `{"type": "bytes", "value": ...}`.
+    """
+    if isinstance(images, list):
+        return [encode_images_as_bytes(images=element) for element in images]
+    if isinstance(images, dict) and images.get("type") == "base64":
+        return {"type": "bytes", "value": base64.b64decode(images["value"])}
+    return images
+
+
+def to_binary_requests_data(requests_data: List[RequestData]) -> List[RequestData]:
+    """Convert JSON requests data into requests with msgpack-encoded payload and raw image bytes.
+
+    Args:
+        requests_data: The requests data with JSON payload.
+
+    Returns:
+        The requests data with msgpack body.
+    """
+    result = []
+    for request_data in requests_data:
+        payload = dict(request_data.payload)
+        if "image" in payload:
+            payload["image"] = encode_images_as_bytes(images=payload["image"])
+        result.append(
+            replace(
+                request_data,
+                headers=_with_binary_transport_headers(headers=request_data.headers),
+                data=msgpack_dumps(payload),
+                payload=None,
+            )
+        )
+    return result
+
+
+def decode_response(response: Response) -> Any:
+    """Decode the response body, respecting its content type.
+
+    Args:
+        response: The response to decode.
+
+    Returns:
+        The decoded response.
+    """
+    content_type = response.headers.get("content-type", "")
+    if content_type.startswith(MSGPACK_CONTENT_TYPE):
+        return msgpack_loads(response.content)
+    return response.json()
+
+
+def _with_binary_transport_headers(headers: Dict[str, str]) -> Dict[str, str]:
+    return {**(headers or {}), **BINARY_TRANSPORT_HEADERS}
+
+
+def _encode_extension_type(obj: Any) -> Any:
+    if isinstance(obj, np.ndarray):
+        array = np.ascontiguousarray(obj)
+        return msgpack.ExtType(
+            NUMPY_ARRAY_EXT_TYPE,
+            msgpack.packb([array.dtype.str, list(array.shape), array.tobytes()]),
+        )
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj)} cannot be serialised with msgpack")
+
+
+def _decode_extension_type(code: int, data: bytes) -> Any:
+    if code != NUMPY_ARRAY_EXT_TYPE:
+        return msgpack.ExtType(code, data)
+    dtype, shape, buffer = msgpack.unpackb(data)
+    return np.frombuffer(buffer, dtype=np.dtype(dtype)).reshape(shape)
@@ -0,0 +1,148 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from threading import Lock
+from typing import AsyncGenerator, Optional
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+
+from inference_sdk.http.errors import InvalidParameterError
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 32
+
+
+class ConnectionPool:
+    """Long-lived HTTP resources shared by all requests of a client.
+
+    The pool owns `requests.Session` (keep-alive connections, up to `max_connections_per_host`
+    connections kept per host), `ThreadPoolExecutor` used to dispatch parallel requests and
+    `aiohttp.TCPConnector` shared by async requests. All resources are created lazily, on first
+    use. The async connector is bound to the event loop it was created in - and is re-created
+    when used from another loop (for instance when each call is made with `asyncio.run(...)`).
+
+    Attributes:
+        max_connections_per_host: The maximum number of connections kept open per host.
+    """
+
+    def __init__(
+        self, max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST
+    ):
+        if max_connections_per_host < 1:
+            raise InvalidParameterError(
+                f"`max_connections_per_host` must be positive, got {max_connections_per_host}"
+            )
+        self.max_connections_per_host = max_connections_per_host
+        self._session: Optional[requests.Session] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_workers = 0
+        self._async_connector: Optional[aiohttp.TCPConnector] = None
+        self._async_connector_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the shared session, keeping connections to the server alive between calls.
+
+        Returns:
+            requests.Session: The shared session.
+        """
+        with self._lock:
+            if self._session is None:
+                self._session = self._create_session()
+            return self._session
+
+    def get_executor(self, min_workers: int) -> ThreadPoolExecutor:
+        """Get the shared executor, providing at least `min_workers` workers.
+
+        Threads are spawned by the executor on demand, so the executor is only replaced
+        when a higher concurrency than ever before is requested. The replaced executor is
+        not shut down - requests dispatched to it by other threads still complete, and its
+        threads exit once it is garbage collected.
+
+        Args:
+            min_workers: The minimum number of workers required.
+
+        Returns:
+            ThreadPoolExecutor: The shared executor.
+        """
+        with self._lock:
+            if self._executor is None or self._executor_workers < min_workers:
+                self._executor_workers = max(min_workers, self.max_connections_per_host)
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._executor_workers,
+                    thread_name_prefix="inference_sdk",
+                )
+            return self._executor
+
+    def get_async_connector(self) -> aiohttp.TCPConnector:
+        """Get the shared async connector, bound to the running event loop.
+
+        Returns:
+            aiohttp.TCPConnector: The shared async connector.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_connector is not None and self._async_connector_loop is loop:
+            if not self._async_connector.closed:
+                return self._async_connector
+        elif self._async_connector is not None:
+            _close_connector_of_other_loop(connector=self._async_connector)
+        self._async_connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=self.max_connections_per_host,
+        )
+        self._async_connector_loop = loop
+        return self._async_connector
+
+    @asynccontextmanager
+    async def async_session(self) -> AsyncGenerator[aiohttp.ClientSession, None]:
+        """Open a session using the shared async connector - the connector (along with
+        connections kept alive) outlives the session.
+
+        Yields:
+            aiohttp.ClientSession: The session.
+        """
+        async with aiohttp.ClientSession(
+            connector=self.get_async_connector(), connector_owner=False
+        ) as session:
+            yield session
+
+    def close(self) -> None:
+        """Close the session and shut down the executor."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+                self._executor_workers = 0
+
+    async def close_async(self) -> None:
+        """Close all resources, including the async session."""
+        if self._async_connector is not None:
+            if self._async_connector_loop is asyncio.get_running_loop():
+                await self._async_connector.close()
+            else:
+                _close_connector_of_other_loop(connector=self._async_connector)
+        self._async_connector = None
+        self._async_connector_loop = None
+        self.close()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_connections_per_host,
+            pool_maxsize=self.max_connections_per_host,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+
+def _close_connector_of_other_loop(connector: aiohttp.BaseConnector) -> None:
+    # the loop the connector is bound to may be already closed, so awaiting `close()` is not
+    # possible - connections are dropped synchronously instead, not to be reported as leaked
+    if not connector.closed:
+        connector._close()
@@ -1,9 +1,9 @@
 import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor, ThreadPoolExecutor
 from enum import Enum
 from functools import partial
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 
 import aiohttp
 import backoff
@@ -39,6 +39,8 @@ def execute_requests_packages(
     requests_data: List[RequestData],
     request_method: RequestMethod,
     max_concurrent_requests: int,
+    session: Optional[requests.Session] = None,
+    executor: Optional[Executor] = None,
 ) -> List[Response]:
     """Execute a list of requests in parallel.
 
@@ -46,6 +48,10 @@ def execute_requests_packages(
         requests_data: The list of requests to execute.
         request_method: The method to use for the requests.
         max_concurrent_requests: The maximum number of concurrent requests.
+        session: The session to send requests with, to re-use connections between calls.
+            If not given, each request opens a new connection.
+        executor: The executor to dispatch requests to. If not given, a new one is created
+            for each package of requests.
 
     Returns:
         The list of responses.
@@ -59,6 +65,8 @@ def execute_requests_packages(
         responses = make_parallel_requests(
             requests_data=requests_data_package,
             request_method=request_method,
+            session=session,
+            executor=executor,
         )
         results.extend(responses)
     for response in results:
@@ -69,18 +77,26 @@ def execute_requests_packages(
 def make_parallel_requests(
     requests_data: List[RequestData],
     request_method: RequestMethod,
+    session: Optional[requests.Session] = None,
+    executor: Optional[Executor] = None,
 ) -> List[Response]:
     """Execute a list of requests in parallel.
 
     Args:
         requests_data: The list of requests to execute.
         request_method: The method to use for the requests.
+        session: The session to send requests with.
+        executor: The executor to dispatch requests to.
 
     Returns:
         The list of responses.
     """
-    workers = len(requests_data)
     make_request_closure = partial(make_request, request_method=request_method)
+    if session is not None:
+        make_request_closure = partial(make_request_closure, session=session)
+    if executor is not None:
+        return list(executor.map(make_request_closure, requests_data))
+    workers = len(requests_data)
     with ThreadPoolExecutor(max_workers=workers) as executor:
         return list(executor.map(make_request_closure, requests_data))
 
@@ -101,17 +117,23 @@ def make_parallel_requests(
     backoff_log_level=logging.DEBUG,
     giveup_log_level=logging.DEBUG,
 )
-def make_request(request_data: RequestData, request_method: RequestMethod) -> Response:
+def make_request(
+    request_data: RequestData,
+    request_method: RequestMethod,
+    session: Optional[requests.Session] = None,
+) -> Response:
     """Make a request to the API.
 
     Args:
         request_data: The request data.
         request_method: The method to use for the request.
+        session: The session to send request with.
 
     Returns:
         The response from the API.
     """
-    method = requests.get if request_method is RequestMethod.GET else requests.post
+    client = session if session is not None else requests
+    method = client.get if request_method is RequestMethod.GET else client.post
     return method(
         request_data.url,
         headers=request_data.headers,
@@ -125,6 +147,7 @@ async def execute_requests_packages_async(
     requests_data: List[RequestData],
     request_method: RequestMethod,
     max_concurrent_requests: int,
+    connector: Optional[aiohttp.BaseConnector] = None,
 ) -> List[Union[dict, bytes]]:
     """Execute a list of requests in parallel asynchronously.
 
@@ -132,6 +155,8 @@ async def execute_requests_packages_async(
         requests_data: The list of requests to execute.
         request_method: The method to use for the requests.
         max_concurrent_requests: The maximum number of concurrent requests.
+        connector: The connector to send requests with, to re-use connections between calls.
+            If not given, each package of requests opens new connections.
 
     Returns:
         The list of responses.
@@ -145,6 +170,7 @@ async def execute_requests_packages_async(
         responses = await make_parallel_requests_async(
             requests_data=requests_data_package,
             request_method=request_method,
+            connector=connector,
         )
         results.extend(responses)
     return results
@@ -153,17 +179,21 @@ async def execute_requests_packages_async(
 async def make_parallel_requests_async(
     requests_data: List[RequestData],
     request_method: RequestMethod,
+    connector: Optional[aiohttp.BaseConnector] = None,
 ) -> List[Union[dict, bytes]]:
     """Execute a list of requests in parallel asynchronously.
 
     Args:
         requests_data: The list of requests to execute.
         request_method: The method to use for the requests.
+        connector: The connector to send requests with - left open once requests are done.
 
     Returns:
         The list of responses.
     """
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(
+        connector=connector, connector_owner=connector is None
+    ) as session:
         make_request_closure = partial(
             make_request_async,
             request_method=request_method,
@@ -162,18 +162,23 @@ def response_contains_jpeg_image(response: Response) -> bool:
 
 
 def transform_base64_visualisation(
-    visualisation: str,
+    visualisation: Union[str, bytes],
     expected_format: VisualisationResponseFormat,
 ) -> Union[str, np.ndarray, Image.Image]:
     """Transform a base64 visualisation.
 
     Args:
-        visualisation: The visualisation to transform.
+        visualisation: The visualisation to transform - raw bytes are accepted, as binary
+            (msgpack) responses do not encode visualisations with base64.
         expected_format: The expected format of the visualisation.
 
     Returns:
         The transformed visualisation.
     """
+    if isinstance(visualisation, bytes):
+        return transform_visualisation_bytes(
+            visualisation=visualisation, expected_format=expected_format
+        )
     visualisation_bytes = base64.b64decode(visualisation)
     return transform_visualisation_bytes(
         visualisation=visualisation_bytes, expected_format=expected_format
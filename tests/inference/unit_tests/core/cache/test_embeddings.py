@@ -0,0 +1,450 @@
+import os
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+from inference.core.cache.embeddings import (
+    CacheEmbeddingsStore,
+    EmbeddingsCache,
+    FileEmbeddingsStore,
+    SpillingEmbeddingsCache,
+    get_or_compute_embeddings,
+)
+from inference.core.cache.memory import MemoryCache
+
+
+def test_embeddings_cache_returns_found_and_unique_missing_keys() -> None:
+    # given
+    cache = EmbeddingsCache(max_size_bytes=1024)
+    cache.set_many(entries={"a": np.ones((4,), dtype=np.float32)})
+
+    # when
+    found, missing = cache.get_many(keys=["a", "b", "b", "a", "c"])
+
+    # then
+    assert list(found.keys()) == ["a"]
+    assert np.array_equal(found["a"], np.ones((4,), dtype=np.float32))
+    assert missing == ["b", "c"]
+    assert cache.stats() == {"hits": 1, "misses": 2, "entries": 1, "size_bytes": 17}
+
+
+def test_embeddings_cache_evicts_least_recently_used_entries() -> None:
+    # given
+    cache = EmbeddingsCache(max_size_bytes=2 * 17)
+    cache.set_many(
+        entries={
+            "a": np.zeros((4,), dtype=np.float32),
+            "b": np.zeros((4,), dtype=np.float32),
+        }
+    )
+    _ = cache.get_many(keys=["a"])
+
+    # when
+    cache.set_many(entries={"c": np.zeros((4,), dtype=np.float32)})
+
+    # then
+    found, missing = cache.get_many(keys=["a", "b", "c"])
+    assert set(found.keys()) == {"a", "c"}
+    assert missing == ["b"]
+    assert len(cache) == 2
+
+
+def test_embeddings_cache_skips_entries_larger_than_cache() -> None:
+    # given
+    cache = EmbeddingsCache(max_size_bytes=16)
+
+    # when
+    cache.set_many(entries={"a": np.zeros((4,), dtype=np.float32)})
+
+    # then
+    assert len(cache) == 0
+    assert cache.stats()["size_bytes"] == 0
+
+
+def test_embeddings_cache_persistence(empty_local_dir: str) -> None:
+    # given
+    persistence_path = os.path.join(empty_local_dir, "model", "embeddings.npz")
+    cache = EmbeddingsCache(max_size_bytes=1024, persistence_path=persistence_path)
+    cache.set_many(
+        entries={
+            "a photo of a cat": np.array([1, 2], dtype=np.float32),
+            "a dog": np.array([3, 4], dtype=np.float32),
+        }
+    )
+
+    # when
+    cache.persist()
+    restored_cache = EmbeddingsCache(
+        max_size_bytes=1024, persistence_path=persistence_path
+    )
+
+    # then
+    found, missing = restored_cache.get_many(keys=["a photo of a cat", "a dog"])
+    assert missing == []
+    assert np.array_equal(found["a photo of a cat"], [1, 2])
+    assert np.array_equal(found["a dog"], [3, 4])
+
+
+def test_embeddings_cache_ignores_corrupted_persistence_file(
+    empty_local_dir: str,
+) -> None:
+    # given
+    persistence_path = os.path.join(empty_local_dir, "embeddings.npz")
+    with open(persistence_path, "w") as f:
+        f.write("not a numpy file")
+
+    # when
+    cache = EmbeddingsCache(max_size_bytes=1024, persistence_path=persistence_path)
+
+    # then
+    assert len(cache) == 0
+
+
+def test_embeddings_cache_ignores_truncated_persistence_file(
+    empty_local_dir: str,
+) -> None:
+    # given
+    persistence_path = os.path.join(empty_local_dir, "embeddings.npz")
+    cache = EmbeddingsCache(max_size_bytes=1024, persistence_path=persistence_path)
+    cache.set_many(entries={"a dog": np.array([3, 4], dtype=np.float32)})
+    cache.persist()
+    with open(persistence_path, "rb") as f:
+        content = f.read()
+    with open(persistence_path, "wb") as f:
+        f.write(content[: len(content) // 2])
+
+    # when
+    cache = EmbeddingsCache(max_size_bytes=1024, persistence_path=persistence_path)
+
+    # then
+    assert len(cache) == 0
+
+
+def test_embeddings_cache_persist_if_needed_waits_for_enough_new_entries(
+    empty_local_dir: str,
+) -> None:
+    # given
+    persistence_path = os.path.join(empty_local_dir, "embeddings.npz")
+    cache = EmbeddingsCache(
+        max_size_bytes=1024,
+        persistence_path=persistence_path,
+        persist_after_entries=2,
+    )
+
+    # when
+    cache.set_many(entries={"a": np.array([1, 2], dtype=np.float32)})
+    cache.persist_if_needed()
+    persisted_after_first_entry = os.path.exists(persistence_path)
+    cache.set_many(entries={"b": np.array([3, 4], dtype=np.float32)})
+    cache.persist_if_needed()
+
+    # then
+    assert not persisted_after_first_entry
+    restored_cache = EmbeddingsCache(
+        max_size_bytes=1024, persistence_path=persistence_path
+    )
+    assert len(restored_cache) == 2
+
+
+def test_embeddings_cache_persist_when_called_concurrently(
+    empty_local_dir: str,
+) -> None:
+    # given
+    persistence_path = os.path.join(empty_local_dir, "embeddings.npz")
+    cache = EmbeddingsCache(
+        max_size_bytes=1024 * 1024, persistence_path=persistence_path
+    )
+    cache.set_many(
+        entries={str(i): np.full((64,), i, dtype=np.float32) for i in range(256)}
+    )
+
+    # when
+    threads = [threading.Thread(target=cache.persist) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # then
+    restored_cache = EmbeddingsCache(
+        max_size_bytes=1024 * 1024, persistence_path=persistence_path
+    )
+    assert len(restored_cache) == 256
+    assert os.listdir(empty_local_dir) == ["embeddings.npz"]
+
+
+def test_get_or_compute_embeddings_computes_only_missing_unique_keys() -> None:
+    # given
+    cache = EmbeddingsCache(max_size_bytes=1024)
+    cache.set_many(entries={"b": np.array([-1.0, -1.0], dtype=np.float32)})
+    computed = []
+
+    def compute(inputs: List[str]) -> np.ndarray:
+        computed.append(inputs)
+        return np.array([[len(i), i.count("x")] for i in inputs], dtype=np.float32)
+
+    # when
+    result = get_or_compute_embeddings(
+        cache=cache,
+        keys=["a", "b", "c", "a"],
+        inputs=["x", "B", "xxy", "xx"],
+        compute=compute,
+    )
+
+    # then
+    assert computed == [
+        ["x", "xxy"]
+    ], "Each missing key must be computed once, for its first input"
+    assert np.array_equal(result, [[1, 1], [-1, -1], [3, 2], [1, 1]])
+    found, missing = cache.get_many(keys=["a", "c"])
+    assert missing == []
+    assert np.array_equal(found["c"], [3, 2])
+
+
+def test_get_or_compute_embeddings_when_all_keys_found() -> None:
+    # given
+    cache = EmbeddingsCache(max_size_bytes=1024)
+    cache.set_many(
+        entries={
+            "a": np.array([1.0], dtype=np.float32),
+            "b": np.array([2.0], dtype=np.float32),
+        }
+    )
+
+    # when
+    result = get_or_compute_embeddings(
+        cache=cache,
+        keys=["b", "a", "b"],
+        inputs=["B", "A", "B"],
+        compute=lambda inputs: 1 / 0,
+    )
+
+    # then
+    assert np.array_equal(result, [[2.0], [1.0], [2.0]])
+
+
+def _spilling_cache(
+    max_entries: int = 10,
+    max_size_bytes: int = 0,
+    spill_directory: Optional[str] = None,
+    max_spill_size_bytes: int = 0,
+) -> SpillingEmbeddingsCache:
+    return SpillingEmbeddingsCache(
+        max_entries=max_entries,
+        max_size_bytes=max_size_bytes,
+        size_of=lambda value: value[0].nbytes,
+        to_arrays=lambda value: [value[0], np.array(value[1])],
+        from_arrays=lambda arrays: (np.array(arrays[0]), tuple(arrays[1].tolist())),
+        spill_directory=spill_directory,
+        max_spill_size_bytes=max_spill_size_bytes,
+    )
+
+
+def test_spilling_embeddings_cache_evicts_entries_exceeding_size_limit() -> None:
+    # given
+    cache = _spilling_cache(max_size_bytes=2 * 400)
+    for key in ["a", "b"]:
+        cache.set(key, (np.zeros((100,), dtype=np.float32), (10, 20)))
+    _ = cache.get("a")
+
+    # when
+    cache.set("c", (np.zeros((100,), dtype=np.float32), (10, 20)))
+
+    # then
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.stats() == {
+        "hits": 1,
+        "disk_hits": 0,
+        "misses": 1,
+        "evictions": 1,
+        "spills": 0,
+        "entries": 2,
+        "size_bytes": 800,
+        "spilled_entries": 0,
+        "spilled_size_bytes": 0,
+    }
+
+
+def test_spilling_embeddings_cache_evicts_entries_exceeding_entries_limit() -> None:
+    # given
+    cache = _spilling_cache(max_entries=1)
+
+    # when
+    cache.set("a", (np.zeros((100,), dtype=np.float32), (10, 20)))
+    cache.set("b", (np.zeros((100,), dtype=np.float32), (10, 20)))
+
+    # then
+    assert "a" not in cache
+    assert len(cache) == 1
+
+
+def test_spilling_embeddings_cache_rehydrates_spilled_entries(
+    empty_local_dir: str,
+) -> None:
+    # given
+    cache = _spilling_cache(
+        max_entries=1, spill_directory=empty_local_dir, max_spill_size_bytes=1024
+    )
+    embedding = np.arange(100, dtype=np.float32)
+    cache.set("a", (embedding, (10, 20)))
+    cache.set("b", (np.zeros((100,), dtype=np.float32), (30, 40)))
+
+    # when
+    result = cache.get("a")
+
+    # then
+    assert np.array_equal(result[0], embedding)
+    assert result[1] == (10, 20)
+    assert len(cache) == 2, "Expected b to be spilled when a was re-hydrated"
+    stats = cache.stats()
+    assert stats["disk_hits"] == 1
+    assert stats["spills"] == 2
+    assert stats["spilled_entries"] == 1
+    assert stats["spilled_size_bytes"] == 400 + np.array((30, 40)).nbytes
+
+
+def test_spilling_embeddings_cache_bounds_spilled_entries(
+    empty_local_dir: str,
+) -> None:
+    # given
+    cache = _spilling_cache(
+        max_entries=1, spill_directory=empty_local_dir, max_spill_size_bytes=500
+    )
+
+    # when
+    for key in ["a", "b", "c"]:
+        cache.set(key, (np.zeros((100,), dtype=np.float32), (10, 20)))
+
+    # then
+    assert "a" not in cache
+    assert "b" in cache
+    assert "c" in cache
+    assert cache.stats()["spilled_entries"] == 1
+
+
+def test_spilling_embeddings_cache_clear_removes_spilled_files(
+    empty_local_dir: str,
+) -> None:
+    # given
+    cache = _spilling_cache(
+        max_entries=1, spill_directory=empty_local_dir, max_spill_size_bytes=1024
+    )
+    cache.set("a", (np.zeros((100,), dtype=np.float32), (10, 20)))
+    cache.set("b", (np.zeros((100,), dtype=np.float32), (10, 20)))
+
+    # when
+    cache.clear()
+
+    # then
+    assert len(cache) == 0
+    spilled_files = [files for _, _, files in os.walk(empty_local_dir) if files]
+    assert spilled_files == []
+
+
+def test_spilling_embeddings_cache_writes_spilled_entries_without_holding_lock(
+    empty_local_dir: str,
+) -> None:
+    # given
+    spill_started, spill_released = threading.Event(), threading.Event()
+
+    def to_arrays(value: tuple) -> List[np.ndarray]:
+        spill_started.set()
+        spill_released.wait(timeout=5)
+        return [value[0], np.array(value[1])]
+
+    cache = SpillingEmbeddingsCache(
+        max_entries=1,
+        max_size_bytes=0,
+        size_of=lambda value: value[0].nbytes,
+        to_arrays=to_arrays,
+        from_arrays=lambda arrays: (np.array(arrays[0]), tuple(arrays[1].tolist())),
+        spill_directory=empty_local_dir,
+        max_spill_size_bytes=1024,
+    )
+    cache.set("a", (np.zeros((100,), dtype=np.float32), (10, 20)))
+    setting_thread = threading.Thread(
+        target=cache.set, args=("b", (np.ones((100,), dtype=np.float32), (30, 40)))
+    )
+
+    results = []
+    getting_thread = threading.Thread(target=lambda: results.append(cache.get("b")))
+
+    # when
+    setting_thread.start()
+    spill_started.wait(timeout=5)
+    getting_thread.start()
+    getting_thread.join(timeout=1)
+    blocked_by_spill = getting_thread.is_alive()
+    spill_released.set()
+    setting_thread.join()
+    getting_thread.join()
+
+    # then
+    assert blocked_by_spill is False
+    assert results[0][1] == (30, 40)
+    assert cache.stats()["spills"] == 1
+    assert cache.get("a")[1] == (10, 20)
+
+
+def test_file_embeddings_store_when_entry_is_missing(empty_local_dir: str) -> None:
+    # given
+    store = FileEmbeddingsStore(directory=empty_local_dir)
+
+    # when
+    result = store.get("image/some")
+
+    # then
+    assert result is None
+
+
+def test_file_embeddings_store_is_shared_between_instances(
+    empty_local_dir: str,
+) -> None:
+    # given
+    directory = os.path.join(empty_local_dir, "owlv2", "embeddings")
+    store = FileEmbeddingsStore(directory=directory)
+    arrays = {
+        "class_names": np.array(["cat", "dog"]),
+        "positive_0": np.ones((2, 4), dtype=np.float16),
+    }
+
+    # when
+    store.set("class/some", arrays)
+    result = FileEmbeddingsStore(directory=directory).get("class/some")
+
+    # then
+    assert set(result.keys()) == {"class_names", "positive_0"}
+    assert result["class_names"].tolist() == ["cat", "dog"]
+    assert np.array_equal(result["positive_0"], arrays["positive_0"])
+    assert result["positive_0"].dtype == np.float16
+    assert [name for name in os.listdir(directory) if name.startswith(".tmp")] == []
+
+
+def test_file_embeddings_store_keeps_first_entry_saved_under_key(
+    empty_local_dir: str,
+) -> None:
+    # given
+    store = FileEmbeddingsStore(directory=empty_local_dir)
+    store.set("image/some", {"boxes": np.zeros((3, 4))})
+
+    # when
+    store.set("image/some", {"boxes": np.ones((3, 4))})
+
+    # then
+    assert np.array_equal(store.get("image/some")["boxes"], np.zeros((3, 4)))
+
+
+def test_cache_embeddings_store() -> None:
+    # given
+    store = CacheEmbeddingsStore(cache=MemoryCache(), key_prefix="owlv2:v1")
+    arrays = {"boxes": np.zeros((3, 4))}
+
+    # when
+    store.set("image/some", arrays)
+
+    # then
+    assert store.get("image/some") is arrays
+    assert store.get("image/other") is None
@@ -0,0 +1,108 @@
+import time
+
+from inference.core.cache.memory import MemoryCache, SortedSet
+
+
+def test_sorted_set_keeps_members_with_colliding_scores() -> None:
+    # given
+    sorted_set = SortedSet()
+
+    # when
+    sorted_set.add(value={"a": 1}, score=1.0, sequence_number=0)
+    sorted_set.add(value={"b": 2}, score=1.0, sequence_number=1)
+    sorted_set.add(value={"c": 3}, score=0.5, sequence_number=2)
+
+    # then
+    result = sorted_set.range_by_score(min=-1, max=float("inf"))
+    assert [value for value, _, _ in result] == [{"c": 3}, {"a": 1}, {"b": 2}]
+
+
+def test_sorted_set_updates_score_of_hashable_member() -> None:
+    # given
+    sorted_set = SortedSet()
+    sorted_set.add(value="model", score=1.0, sequence_number=0)
+
+    # when
+    sorted_set.add(value="model", score=2.0, sequence_number=1)
+
+    # then
+    assert len(sorted_set) == 1
+    assert sorted_set.range_by_score(min=1.5, max=3.0) == [("model", 2.0, 1)]
+
+
+def test_memory_cache_zrangebyscore() -> None:
+    # given
+    cache = MemoryCache()
+    for score in [3, 1, 2, 2]:
+        cache.zadd("key", value={"score": score}, score=score)
+
+    # when
+    result = cache.zrangebyscore("key", min=2, max=3, withscores=True)
+
+    # then
+    assert result == [({"score": 2}, 2), ({"score": 2}, 2), ({"score": 3}, 3)]
+    assert cache.zrangebyscore("non-existing") == []
+
+
+def test_memory_cache_zremrangebyscore() -> None:
+    # given
+    cache = MemoryCache()
+    for score in range(10):
+        cache.zadd("key", value=score, score=score)
+
+    # when
+    result = cache.zremrangebyscore("key", min=2, max=7)
+
+    # then
+    assert result == 6
+    assert cache.zrangebyscore("key") == [0, 1, 8, 9]
+    assert cache.get_stats()["sorted_set_entries"] == 4
+
+
+def test_memory_cache_expires_sorted_set_members_and_keys() -> None:
+    # given
+    cache = MemoryCache()
+    cache.zadd("key", value="expiring", score=1, expire=0.01)
+    cache.zadd("key", value="persistent", score=2)
+    cache.set("value", "expiring", expire=0.01)
+    time.sleep(0.02)
+
+    # when
+    with cache._lock:
+        cache._remove_expired(now=time.time())
+
+    # then
+    assert cache.zrangebyscore("key") == ["persistent"]
+    assert cache.get("value") is None
+    assert cache.get_stats()["expired_entries"] == 2
+
+
+def test_memory_cache_evicts_oldest_sorted_set_members_when_limit_reached() -> None:
+    # given
+    cache = MemoryCache(max_sorted_set_entries=3)
+
+    # when
+    for score in range(5):
+        cache.zadd(f"key_{score % 2}", value={"score": score}, score=score)
+
+    # then
+    assert cache.zrangebyscore("key_0") == [{"score": 2}, {"score": 4}]
+    assert cache.zrangebyscore("key_1") == [{"score": 3}]
+    stats = cache.get_stats()
+    assert stats["sorted_set_entries"] == 3
+    assert stats["evicted_entries"] == 2
+
+
+def test_memory_cache_get_stats_reports_operations() -> None:
+    # given
+    cache = MemoryCache()
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+
+    # when
+    result = cache.get_stats()
+
+    # then
+    assert result["operations"]["get"]["calls"] == 2
+    assert result["operations"]["set"]["calls"] == 1
@@ -1,11 +1,14 @@
 import os
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
+import supervision as sv
 
 from inference.core.cache.serializers import (
     build_condensed_response,
     to_cachable_inference_item,
+    to_cachable_sv_detections_item,
 )
 from inference.core.entities.requests.inference import (
     ClassificationInferenceRequest,
@@ -261,3 +264,38 @@ def test_build_condensed_response_object_detection(mock_object_detection_data):
     assert len(result) == 1
     assert "predictions" in result[0]
     assert "time" in result[0]
+
+
+def test_to_cachable_sv_detections_item() -> None:
+    # given
+    request = ObjectDetectionInferenceRequest(
+        model_id="some/1",
+        image={"type": "numpy", "value": "not-serialised"},
+        api_key="key",
+    )
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 10, 10], [5, 5, 10, 10]]),
+        confidence=np.array([0.9, 0.5]),
+        class_id=np.array([0, 1]),
+        data={"class_name": np.array(["a", "b"])},
+    )
+
+    # when
+    result = to_cachable_sv_detections_item(
+        infer_request=request,
+        detections=[detections, sv.Detections.empty()],
+        inference_time=0.5,
+    )
+
+    # then
+    assert result["inference_id"] == request.id
+    assert result["request"]["api_key"] == "key"
+    assert result["response"] == [
+        {
+            "predictions": [
+                {"class": "a", "confidence": 0.9},
+                {"class": "b", "confidence": 0.5},
+            ],
+            "time": 0.5,
+        }
+    ]
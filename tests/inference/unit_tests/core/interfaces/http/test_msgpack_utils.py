@@ -0,0 +1,131 @@
+import base64
+
+import cv2
+import numpy as np
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from inference.core.entities.requests.inference import ObjectDetectionInferenceRequest
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+)
+from inference.core.interfaces.http.msgpack_utils import (
+    MSGPACK_CONTENT_TYPE,
+    MsgPackRoute,
+    msgpack_dumps,
+    msgpack_loads,
+)
+from inference.core.interfaces.http.orjson_utils import orjson_response
+from inference.core.utils.image_utils import load_image
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+    app.router.route_class = MsgPackRoute
+
+    @app.post("/infer")
+    async def infer(inference_request: ObjectDetectionInferenceRequest):
+        images = inference_request.image
+        if not isinstance(images, list):
+            images = [images]
+        responses = []
+        for image in images:
+            np_image, _ = load_image(image)
+            responses.append(
+                ObjectDetectionInferenceResponse(
+                    predictions=[],
+                    image=InferenceResponseImage(
+                        width=np_image.shape[1], height=np_image.shape[0]
+                    ),
+                )
+            )
+        return orjson_response(responses)
+
+    return app
+
+
+def _encoded_image(height: int, width: int) -> bytes:
+    return cv2.imencode(".jpg", np.zeros((height, width, 3), dtype=np.uint8))[
+        1
+    ].tobytes()
+
+
+def test_msgpack_roundtrip_of_numpy_arrays() -> None:
+    # given
+    content = {"a": np.arange(6, dtype=np.float32).reshape(2, 3), "b": np.int64(3)}
+
+    # when
+    result = msgpack_loads(msgpack_dumps(content))
+
+    # then
+    assert result["b"] == 3
+    assert result["a"].dtype == np.float32
+    assert np.array_equal(result["a"], content["a"])
+
+
+def test_msgpack_route_accepts_batch_of_raw_image_bytes() -> None:
+    # given
+    client = TestClient(_create_app())
+    payload = {
+        "model_id": "some/1",
+        "image": [
+            {"type": "bytes", "value": _encoded_image(height=48, width=64)},
+            {"type": "bytes", "value": _encoded_image(height=32, width=16)},
+        ],
+    }
+
+    # when
+    response = client.post(
+        "/infer",
+        content=msgpack_dumps(payload),
+        headers={"Content-Type": MSGPACK_CONTENT_TYPE, "Accept": MSGPACK_CONTENT_TYPE},
+    )
+
+    # then
+    assert response.status_code == 200
+    assert response.headers["content-type"] == MSGPACK_CONTENT_TYPE
+    assert [r["image"] for r in msgpack_loads(response.content)] == [
+        {"width": 64, "height": 48},
+        {"width": 16, "height": 32},
+    ]
+
+
+def test_msgpack_route_responds_with_json_when_msgpack_not_accepted() -> None:
+    # given
+    client = TestClient(_create_app())
+    payload = {
+        "model_id": "some/1",
+        "image": {"type": "bytes", "value": _encoded_image(height=48, width=64)},
+    }
+
+    # when
+    response = client.post(
+        "/infer",
+        content=msgpack_dumps(payload),
+        headers={"Content-Type": MSGPACK_CONTENT_TYPE},
+    )
+
+    # then
+    assert response.status_code == 200
+    assert response.json()[0]["image"] == {"width": 64, "height": 48}
+
+
+def test_msgpack_route_handles_json_requests() -> None:
+    # given
+    client = TestClient(_create_app())
+    payload = {
+        "model_id": "some/1",
+        "image": {
+            "type": "base64",
+            "value": base64.b64encode(_encoded_image(height=48, width=64)).decode(),
+        },
+    }
+
+    # when
+    response = client.post("/infer", json=payload)
+
+    # then
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json()[0]["image"] == {"width": 64, "height": 48}
@@ -29,8 +29,15 @@ from inference.core.interfaces.camera.video_source import (
     lock_state_transition,
 )
 from inference.core.interfaces.stream.entities import ModelConfig
-from inference.core.interfaces.stream.inference_pipeline import InferencePipeline
+from inference.core.interfaces.stream.inference_pipeline import (
+    INFERENCE_ERROR_EVENT,
+    MODEL_FORWARD_STAGE,
+    POSTPROCESSING_STAGE,
+    PREPROCESSING_STAGE,
+    InferencePipeline,
+)
 from inference.core.interfaces.stream.model_handlers.roboflow_models import (
+    build_default_inference_stages,
     default_process_frame,
 )
 from inference.core.interfaces.stream.sinks import active_learning_sink, multi_sink
@@ -140,6 +147,29 @@ class ModelStub:
         ] * len(image)
 
 
+class StagedModelStub(ModelStub):
+    def __init__(self, fail_on_predict: bool = False):
+        super().__init__()
+        self.endpoint = "some/1"
+        self._fail_on_predict = fail_on_predict
+
+    def split_into_batches(self, image: Any) -> List[Any]:
+        return [image]
+
+    def preprocess(self, image: Any, **kwargs) -> Tuple[Any, dict]:
+        return np.stack(image), {}
+
+    def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray]:
+        if self._fail_on_predict:
+            raise RuntimeError()
+        return (img_in,)
+
+    def postprocess(
+        self, predictions: Tuple[np.ndarray], metadata: dict, **kwargs
+    ) -> List[ObjectDetectionInferenceResponse]:
+        return self.infer(list(predictions[0]))
+
+
 @pytest.mark.timeout(90)
 @pytest.mark.slow
 def test_inference_pipeline_works_correctly_against_video_file(
@@ -658,3 +688,92 @@ def test_inference_pipeline_works_correctly_against_multiple_video_files_with_ac
     assert frames_by_sources[1] == list(
         range(1, 431 * 2 + 1)
     ), "Order of prediction frames violated for source 1"
+
+
+@pytest.mark.parametrize("use_main_thread", [True, False])
+def test_inference_pipeline_works_correctly_when_inference_stages_are_pipelined(
+    use_main_thread: bool,
+) -> None:
+    # given
+    model = StagedModelStub()
+    video_source = VideoSourceStub(frames_number=100, is_file=False, rounds=1)
+    watchdog = BasePipelineWatchDog()
+    watchdog.register_video_sources(video_sources=[video_source])
+    predictions = []
+
+    def on_prediction(prediction: dict, video_frame: VideoFrame) -> None:
+        predictions.append((video_frame, prediction))
+
+    inference_config = ModelConfig.init(confidence=0.5, iou_threshold=0.5)
+    inference_pipeline = InferencePipeline(
+        on_video_frame=partial(
+            default_process_frame, model=model, inference_config=inference_config
+        ),
+        video_sources=[video_source],
+        on_prediction=on_prediction,
+        predictions_queue=Queue(maxsize=512),
+        watchdog=watchdog,
+        status_update_handlers=[watchdog.on_status_update],
+        inference_stages=build_default_inference_stages(
+            model=model, inference_config=inference_config
+        ),
+        stages_queue_size=1,
+    )
+
+    def stop() -> None:
+        inference_pipeline._stop = True
+
+    video_source.on_end = stop
+
+    # when
+    inference_pipeline.start(use_main_thread=use_main_thread)
+    inference_pipeline.join()
+
+    # then
+    frame_ids = [p[0].frame_id for p in predictions]
+    assert frame_ids == list(range(1, 101)), "Expected all frames processed in order"
+    assert predictions[0][1]["predictions"][0]["class"] == "car"
+    report = watchdog.get_report()
+    assert set(report.stages_latency.keys()) == {
+        PREPROCESSING_STAGE,
+        MODEL_FORWARD_STAGE,
+        POSTPROCESSING_STAGE,
+    }
+    assert (
+        report.latency_reports[0].inference_latency is not None
+    ), "Expected inference latency to be measured despite overlapping stages"
+
+
+def test_inference_pipeline_stops_when_pipelined_inference_stage_fails() -> None:
+    # given
+    model = StagedModelStub(fail_on_predict=True)
+    video_source = VideoSourceStub(frames_number=100, is_file=False, rounds=1)
+    predictions, status_updates = [], []
+
+    def on_prediction(prediction: dict, video_frame: VideoFrame) -> None:
+        predictions.append((video_frame, prediction))
+
+    inference_config = ModelConfig.init(confidence=0.5, iou_threshold=0.5)
+    watchdog = BasePipelineWatchDog()
+    watchdog.register_video_sources(video_sources=[video_source])
+    inference_pipeline = InferencePipeline(
+        on_video_frame=partial(
+            default_process_frame, model=model, inference_config=inference_config
+        ),
+        video_sources=[video_source],
+        on_prediction=on_prediction,
+        predictions_queue=Queue(maxsize=512),
+        watchdog=watchdog,
+        status_update_handlers=[status_updates.append],
+        inference_stages=build_default_inference_stages(
+            model=model, inference_config=inference_config
+        ),
+    )
+
+    # when
+    inference_pipeline.start()
+    inference_pipeline.join()
+
+    # then
+    assert predictions == [], "No frame could be processed"
+    assert INFERENCE_ERROR_EVENT in [u.event_type for u in status_updates]
@@ -293,3 +293,41 @@ def test_base_watchdog_gives_correct_report_when_all_events_are_in_series_relate
     assert (
         result.sources_metadata[0] == "METADATA"
     ), "Metadata must match mocked video source response"
+
+
+def test_base_watchdog_gives_correct_report_when_frames_are_processed_in_overlapping_stages() -> (
+    None
+):
+    # given
+    watchdog = BasePipelineWatchDog()
+    source_mock = MagicMock()
+    source_mock.source_id = 0
+    watchdog.register_video_sources(video_sources=[source_mock])
+    frames = [
+        VideoFrame(
+            image=np.zeros((192, 168, 3)),
+            source_id=0,
+            frame_id=frame_id,
+            frame_timestamp=datetime.now(),
+        )
+        for frame_id in [1, 2]
+    ]
+
+    # when
+    watchdog.on_model_inference_started(frames=[frames[0]])
+    watchdog.on_model_inference_started(frames=[frames[1]])
+    watchdog.on_inference_stage_completed(
+        stage="preprocessing", frames=[frames[0]], duration=0.1
+    )
+    watchdog.on_inference_stage_completed(
+        stage="preprocessing", frames=[frames[1]], duration=0.3
+    )
+    watchdog.on_model_prediction_ready(frames=[frames[0]])
+    watchdog.on_model_prediction_ready(frames=[frames[1]])
+    result = watchdog.get_report()
+
+    # then
+    assert (
+        result.latency_reports[0].inference_latency is not None
+    ), "Events of the same frames should be matched despite interleaving"
+    assert abs(result.stages_latency["preprocessing"] - 0.2) < 1e-5
@@ -0,0 +1,191 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from starlette.testclient import TestClient
+
+from inference.core.exceptions import ModelLoadingInProgressError
+from inference.core.interfaces.http.http_api import HttpInterface
+from inference.core.managers.base import ModelManager
+from inference.core.managers.batching import DynamicBatchingScheduler
+from inference.core.managers.decorators.async_load import AsyncLoadModelManagerDecorator
+from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+
+
+def _model_manager_with_slow_models(
+    load_event: threading.Event, loads_counter: list
+) -> ModelManager:
+    model_registry = MagicMock()
+
+    def get_model(model_id: str, api_key: str):
+        def initialise_model(**kwargs):
+            loads_counter.append(model_id)
+            load_event.wait(timeout=5)
+            if model_id.startswith("broken"):
+                raise RuntimeError("broken model")
+            return MagicMock()
+
+        return initialise_model
+
+    model_registry.get_model.side_effect = get_model
+    return ModelManager(model_registry=model_registry)
+
+
+def test_add_model_when_concurrent_requests_for_the_same_model() -> None:
+    # given
+    load_event, loads_counter = threading.Event(), []
+    model_manager = AsyncLoadModelManagerDecorator(
+        _model_manager_with_slow_models(load_event, loads_counter),
+        background_loading=False,
+    )
+    threads = [
+        threading.Thread(target=model_manager.add_model, args=("a/1", "key"))
+        for _ in range(4)
+    ]
+
+    # when
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    load_event.set()
+    for thread in threads:
+        thread.join()
+
+    # then
+    assert loads_counter == ["a/1"]
+    assert "a/1" in model_manager
+    assert not model_manager.is_loading("a/1")
+
+
+def test_preload_models_loads_models_in_parallel() -> None:
+    # given
+    load_event, loads_counter = threading.Event(), []
+    model_manager = AsyncLoadModelManagerDecorator(
+        _model_manager_with_slow_models(load_event, loads_counter),
+        max_workers=2,
+    )
+
+    # when
+    futures = model_manager.preload_models(["a/1", "b/1"], api_key="key")
+    time.sleep(0.1)
+    loads_in_progress = sorted(loads_counter)
+    load_event.set()
+    for future in futures:
+        future.result(timeout=5)
+
+    # then
+    assert loads_in_progress == ["a/1", "b/1"]
+    assert set(model_manager.keys()) == {"a/1", "b/1"}
+
+
+@pytest.mark.asyncio
+async def test_add_model_async_when_background_loading_enabled() -> None:
+    # given
+    load_event, loads_counter = threading.Event(), []
+    model_manager = AsyncLoadModelManagerDecorator(
+        _model_manager_with_slow_models(load_event, loads_counter),
+        background_loading=True,
+        retry_after=7,
+    )
+
+    # when
+    with pytest.raises(ModelLoadingInProgressError) as error:
+        await model_manager.add_model_async("a/1", api_key="key")
+    load_event.set()
+    model_manager.load_model("a/1", api_key="key").result(timeout=5)
+    await model_manager.add_model_async("a/1", api_key="key")
+
+    # then
+    assert error.value.retry_after == 7
+    assert loads_counter == ["a/1"]
+    assert "a/1" in model_manager
+
+
+@pytest.mark.asyncio
+async def test_add_model_async_reports_background_load_error_once() -> None:
+    # given
+    load_event, loads_counter = threading.Event(), []
+    load_event.set()
+    model_manager = AsyncLoadModelManagerDecorator(
+        _model_manager_with_slow_models(load_event, loads_counter),
+        background_loading=True,
+    )
+    _ = model_manager.load_model("broken/1", api_key="key").exception(timeout=5)
+
+    # when
+    with pytest.raises(RuntimeError):
+        await model_manager.add_model_async("broken/1", api_key="key")
+    retried_load = model_manager.load_model("broken/1", api_key="key")
+    _ = retried_load.exception(timeout=5)
+
+    # then
+    assert loads_counter == ["broken/1", "broken/1"]
+    assert "broken/1" not in model_manager
+
+
+class _LoadedModel:
+    task_type = "object-detection"
+    batch_size = 1
+    img_size_h = 640
+    img_size_w = 640
+
+    def __init__(self, model_id: str, api_key: str):
+        self.model_id = model_id
+
+    def clear_cache(self, delete_from_disk: bool = True) -> None:
+        pass
+
+
+def _production_model_manager() -> AsyncLoadModelManagerDecorator:
+    # decorators stack used by docker configs of HTTP server
+    model_registry = MagicMock()
+    model_registry.get_model.return_value = _LoadedModel
+    model_manager = ModelManager(
+        model_registry=model_registry,
+        batching_scheduler=DynamicBatchingScheduler(),
+    )
+    model_manager = WithFixedSizeCache(model_manager, max_size=2)
+    return AsyncLoadModelManagerDecorator(model_manager, background_loading=False)
+
+
+def test_describe_models_when_decorated_as_in_production() -> None:
+    # given
+    model_manager = _production_model_manager()
+    model_manager.add_model("a/1", api_key="key")
+    model_manager.pin_model("a/1")
+
+    # when
+    result = model_manager.describe_models()
+
+    # then
+    assert len(result) == 1
+    assert result[0].model_id == "a/1"
+    assert result[0].task_type == "object-detection"
+    assert result[0].memory_footprint_bytes == 3 * 640 * 640 * 4
+    assert result[0].pinned is True
+    assert [r.model_id for r in model_manager.get_residency_stats()] == ["a/1"]
+
+
+def test_model_registry_routes_when_decorated_as_in_production() -> None:
+    # given
+    model_manager = _production_model_manager()
+    client = TestClient(HttpInterface(model_manager).app)
+
+    # when
+    add_response = client.post("/model/add", json={"model_id": "a/1"})
+    registry_response = client.get("/model/registry")
+    remove_response = client.post("/model/remove", json={"model_id": "a/1"})
+    _ = client.post("/model/add", json={"model_id": "b/1"})
+    clear_response = client.post("/model/clear")
+
+    # then
+    assert add_response.status_code == 200
+    assert [m["model_id"] for m in add_response.json()["models"]] == ["a/1"]
+    assert registry_response.status_code == 200
+    assert registry_response.json()["models"][0]["pinned"] is False
+    assert remove_response.status_code == 200
+    assert remove_response.json()["models"] == []
+    assert clear_response.status_code == 200
+    assert clear_response.json()["models"] == []
+    assert len(model_manager) == 0
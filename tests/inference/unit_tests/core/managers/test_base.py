@@ -1,9 +1,12 @@
+from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 
 from inference.core.exceptions import InferenceModelNotFound
+from inference.core.managers import base
 from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
 from inference.core.managers.entities import ModelDescription
 
 
@@ -384,3 +387,40 @@ def test_model_manager_describe_models() -> None:
             input_height=480,
         ),
     ]
+
+
+def test_infer_sv_detections_from_request_sync_goes_through_decorators() -> None:
+    # given
+    model = MagicMock()
+    model.infer_sv_detections_from_request.return_value = ["detections"]
+    model_manager = WithFixedSizeCache(
+        ModelManager(model_registry=MagicMock(), models={"some/1": model}),
+        max_size=8,
+    )
+    request = MagicMock()
+
+    # when
+    with mock.patch.object(base, "DISABLE_INFERENCE_CACHE", True), mock.patch.object(
+        model_manager._residency, "touch"
+    ) as touch_mock:
+        result = model_manager.infer_sv_detections_from_request_sync(
+            model_id="some/1", request=request
+        )
+
+    # then
+    assert result == ["detections"]
+    model.infer_sv_detections_from_request.assert_called_once_with(request)
+    model.infer_from_request.assert_not_called()
+    touch_mock.assert_called_once_with("some/1")
+
+
+def test_infer_sv_detections_from_request_sync_when_model_not_available() -> None:
+    # given
+    model_manager = ModelManager(model_registry=MagicMock())
+
+    # when
+    with mock.patch.object(base, "DISABLE_INFERENCE_CACHE", True):
+        with pytest.raises(InferenceModelNotFound):
+            _ = model_manager.infer_sv_detections_from_request_sync(
+                model_id="some/1", request=MagicMock()
+            )
@@ -0,0 +1,230 @@
+import threading
+from typing import List, Tuple
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from inference.core.entities.requests.inference import (
+    ClassificationInferenceRequest,
+    InferenceRequestImage,
+    InstanceSegmentationInferenceRequest,
+    ObjectDetectionInferenceRequest,
+)
+from inference.core.managers.base import ModelManager
+from inference.core.managers.batching import DynamicBatchingScheduler
+from inference.core.models.base import BaseInference
+from inference.models.yolact.yolact_instance_segmentation import YOLACT
+from inference.usage_tracking.collector import usage_collector
+
+
+class DummyModel(BaseInference):
+    batching_enabled = True
+    batch_first_predictions = True
+    dataset_id = "some"
+    version_id = "1"
+
+    def __init__(self) -> None:
+        self.batch_sizes: List[int] = []
+        self._lock = threading.Lock()
+
+    def preprocess(self, image, **kwargs) -> Tuple[np.ndarray, dict]:
+        value = float(image["value"])
+        return np.full((1, 3, 4, 4), value, dtype=np.float32), {"value": value}
+
+    def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray, ...]:
+        with self._lock:
+            self.batch_sizes.append(img_in.shape[0])
+        return (img_in.mean(axis=(1, 2, 3)) * 2,)
+
+    def postprocess(self, predictions, preprocess_return_metadata, **kwargs):
+        response = MagicMock()
+        response.predicted = float(predictions[0][0])
+        response.expected = preprocess_return_metadata["value"] * 2
+        response.batch_elements = predictions[0].shape[0]
+        return [response]
+
+    def clear_cache(self, delete_from_disk: bool = True) -> None:
+        pass
+
+
+class ModelWithPriorsOutput(DummyModel):
+    # like YOLACT - prior boxes output is shared by all images of the batch
+    batch_first_predictions = False
+
+    def predict(self, img_in: np.ndarray, **kwargs) -> Tuple[np.ndarray, ...]:
+        predictions = super().predict(img_in, **kwargs)
+        return predictions[0], np.zeros((5, 4), dtype=np.float32)
+
+
+def test_dynamic_batching_scheduler_when_request_not_eligible() -> None:
+    # given
+    scheduler = DynamicBatchingScheduler(max_batch_size=4, max_wait_time=0.01)
+    request = ObjectDetectionInferenceRequest(
+        model_id="some/1",
+        image=[
+            InferenceRequestImage(type="numpy", value=1),
+            InferenceRequestImage(type="numpy", value=2),
+        ],
+    )
+
+    # when
+    list_request_result = scheduler.is_eligible(model=DummyModel(), request=request)
+    mock_model_result = scheduler.is_eligible(
+        model=MagicMock(),
+        request=ObjectDetectionInferenceRequest(
+            model_id="some/1", image=InferenceRequestImage(type="numpy", value=1)
+        ),
+    )
+
+    # then
+    assert list_request_result is False
+    assert mock_model_result is False
+
+
+def test_dynamic_batching_scheduler_when_model_outputs_not_batch_first() -> None:
+    # given
+    scheduler = DynamicBatchingScheduler(max_batch_size=4, max_wait_time=0.01)
+    request = ObjectDetectionInferenceRequest(
+        model_id="some/1", image=InferenceRequestImage(type="numpy", value=1)
+    )
+
+    # when
+    result = scheduler.is_eligible(model=ModelWithPriorsOutput(), request=request)
+
+    # then
+    assert result is False
+
+
+def test_dynamic_batching_scheduler_when_yolact_model_requested() -> None:
+    # given
+    scheduler = DynamicBatchingScheduler(max_batch_size=4, max_wait_time=0.01)
+    model = YOLACT.__new__(YOLACT)
+    model.batching_enabled = True
+    request = InstanceSegmentationInferenceRequest(
+        model_id="some/1", image=InferenceRequestImage(type="numpy", value=1)
+    )
+
+    # when
+    result = scheduler.is_eligible(model=model, request=request)
+
+    # then
+    assert result is False
+
+
+def test_dynamic_batching_scheduler_when_request_eligible() -> None:
+    # given
+    scheduler = DynamicBatchingScheduler(max_batch_size=4, max_wait_time=0.01)
+    request = ClassificationInferenceRequest(
+        model_id="some/1", image=InferenceRequestImage(type="numpy", value=1)
+    )
+
+    # when
+    result = scheduler.is_eligible(model=DummyModel(), request=request)
+
+    # then
+    assert result is True
+
+
+def test_dynamic_batching_scheduler_coalesces_concurrent_requests() -> None:
+    # given
+    scheduler = DynamicBatchingScheduler(max_batch_size=4, max_wait_time=1.0)
+    model = DummyModel()
+    requests = [
+        ObjectDetectionInferenceRequest(
+            model_id="some/1",
+            image=InferenceRequestImage(type="numpy", value=i),
+        )
+        for i in range(8)
+    ]
+    results = [None] * len(requests)
+
+    def infer(index: int) -> None:
+        results[index] = scheduler.infer_from_request_sync(
+            model_id="some/1", model=model, request=requests[index]
+        )
+
+    # when
+    threads = [threading.Thread(target=infer, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    scheduler.clear()
+
+    # then
+    assert sum(model.batch_sizes) == 8
+    assert max(model.batch_sizes) <= 4
+    assert len(model.batch_sizes) < 8, "Expected requests to be coalesced"
+    for request, result in zip(requests, results):
+        assert result.predicted == result.expected
+        assert result.batch_elements == 1
+        assert result.inference_id == request.id
+
+
+@mock.patch.object(usage_collector, "record_usage")
+def test_dynamic_batching_scheduler_records_usage_of_model(
+    record_usage_mock: MagicMock,
+) -> None:
+    # given
+    scheduler = DynamicBatchingScheduler(max_batch_size=4, max_wait_time=0.001)
+    request = ObjectDetectionInferenceRequest(
+        model_id="some/1",
+        image=InferenceRequestImage(type="numpy", value=1),
+        api_key="my-api-key",
+    )
+
+    # when
+    _ = scheduler.infer_from_request_sync(
+        model_id="some/1", model=DummyModel(), request=request
+    )
+    scheduler.clear()
+
+    # then
+    record_usage_mock.assert_called_once()
+    assert record_usage_mock.call_args.kwargs["category"] == "model"
+    assert record_usage_mock.call_args.kwargs["resource_id"] == "some/1"
+    assert record_usage_mock.call_args.kwargs["api_key"] == "my-api-key"
+
+
+def test_dynamic_batching_scheduler_propagates_predict_errors() -> None:
+    # given
+    scheduler = DynamicBatchingScheduler(max_batch_size=4, max_wait_time=0.001)
+    model = DummyModel()
+    model.predict = MagicMock(side_effect=RuntimeError("forward failed"))
+    request = ObjectDetectionInferenceRequest(
+        model_id="some/1", image=InferenceRequestImage(type="numpy", value=1)
+    )
+
+    # when
+    with pytest.raises(RuntimeError):
+        _ = scheduler.infer_from_request_sync(
+            model_id="some/1", model=model, request=request
+        )
+    scheduler.clear()
+
+
+@pytest.mark.asyncio
+async def test_model_manager_routes_eligible_requests_through_batching_scheduler() -> (
+    None
+):
+    # given
+    scheduler = DynamicBatchingScheduler(max_batch_size=4, max_wait_time=0.001)
+    model_manager = ModelManager(
+        model_registry=MagicMock(), batching_scheduler=scheduler
+    )
+    model = DummyModel()
+    model_manager._models = {"some/1": model}
+    request = ObjectDetectionInferenceRequest(
+        model_id="some/1", image=InferenceRequestImage(type="numpy", value=3)
+    )
+
+    # when
+    result = await model_manager.model_infer(model_id="some/1", request=request)
+    model_manager.remove("some/1")
+
+    # then
+    assert model.batch_sizes == [1]
+    assert result.predicted == 6.0
+    assert scheduler._queues == {}
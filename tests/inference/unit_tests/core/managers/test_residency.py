@@ -0,0 +1,189 @@
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.managers.base import ModelManager
+from inference.core.managers.decorators import fixed_size_cache
+from inference.core.managers.decorators.fixed_size_cache import WithFixedSizeCache
+from inference.core.managers.residency import ModelResidencyTracker
+
+
+def test_residency_tracker_when_invalid_policy_given() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = ModelResidencyTracker(eviction_policy="invalid")
+
+
+def test_residency_tracker_lru_selects_least_recently_used_not_pinned_model() -> None:
+    # given
+    tracker = ModelResidencyTracker(pinned_models=["a"])
+    for model_id in ["a", "b", "c"]:
+        tracker.register(model_id=model_id)
+    tracker.touch("b")
+
+    # when
+    result = tracker.select_victim()
+
+    # then
+    assert result == "c"
+
+
+def test_residency_tracker_when_all_models_pinned() -> None:
+    # given
+    tracker = ModelResidencyTracker(pinned_models=["a"])
+    tracker.register(model_id="a")
+    tracker.register(model_id="b")
+    tracker.pin("b")
+
+    # when
+    result = tracker.select_victim()
+
+    # then
+    assert result is None
+    assert all(entry.pinned for entry in tracker.stats())
+
+
+def test_residency_tracker_cost_aware_keeps_expensive_models() -> None:
+    # given
+    tracker = ModelResidencyTracker(eviction_policy="cost_aware")
+    tracker.register(model_id="expensive", size_bytes=100, load_time=10.0)
+    tracker.register(model_id="cheap", size_bytes=100, load_time=0.1)
+    tracker.register(model_id="cheap_but_hot", size_bytes=100, load_time=0.1)
+    for _ in range(200):
+        tracker.touch("cheap_but_hot")
+
+    # when
+    first_victim = tracker.select_victim()
+    tracker.discard(first_victim)
+    second_victim = tracker.select_victim()
+
+    # then
+    assert first_victim == "cheap"
+    assert second_victim == "expensive"
+
+
+def test_residency_tracker_total_bytes() -> None:
+    # given
+    tracker = ModelResidencyTracker()
+    tracker.register(model_id="a", size_bytes=100)
+    tracker.register(model_id="b")
+    tracker.update(model_id="b", size_bytes=50, load_time=1.0)
+
+    # when
+    result = tracker.total_bytes
+
+    # then
+    assert result == 150
+    assert tracker.get("b").load_time == 1.0
+
+
+def _model_manager_with_mocked_models() -> ModelManager:
+    model_registry = MagicMock()
+    model_manager = ModelManager(model_registry=model_registry)
+
+    def get_model(model_id: str, api_key: str):
+        model = MagicMock()
+        model.img_size_h, model.img_size_w = None, None
+        model.cache_file.side_effect = FileNotFoundError
+        return lambda **kwargs: model
+
+    model_registry.get_model.side_effect = get_model
+    return model_manager
+
+
+def test_fixed_size_cache_evicts_least_recently_used_model() -> None:
+    # given
+    model_manager = WithFixedSizeCache(
+        _model_manager_with_mocked_models(), max_size=2, pinned_models=[]
+    )
+    model_manager.add_model("a/1", api_key="key")
+    model_manager.add_model("b/1", api_key="key")
+    model_manager.add_model("a/1", api_key="key")
+
+    # when
+    model_manager.add_model("c/1", api_key="key")
+
+    # then
+    assert set(model_manager.keys()) == {"a/1", "c/1"}
+    assert [e.model_id for e in model_manager.get_residency_stats()] == ["a/1", "c/1"]
+
+
+def test_fixed_size_cache_does_not_evict_pinned_model() -> None:
+    # given
+    model_manager = WithFixedSizeCache(
+        _model_manager_with_mocked_models(), max_size=2, pinned_models=["a/1"]
+    )
+    model_manager.add_model("a/1", api_key="key")
+    model_manager.add_model("b/1", api_key="key")
+
+    # when
+    model_manager.add_model("c/1", api_key="key")
+
+    # then
+    assert set(model_manager.keys()) == {"a/1", "c/1"}
+
+
+def test_fixed_size_cache_evicts_models_exceeding_memory_budget() -> None:
+    # given
+    model_manager = WithFixedSizeCache(
+        _model_manager_with_mocked_models(),
+        max_size=10,
+        memory_budget_mb=1.0,
+        pinned_models=[],
+    )
+    model_manager._estimate_model_size = lambda model_id: 600 * 1024
+    model_manager.add_model("a/1", api_key="key")
+
+    # when
+    model_manager.add_model("b/1", api_key="key")
+
+    # then
+    assert set(model_manager.keys()) == {"b/1"}
+    descriptions = model_manager.describe_models()
+    assert descriptions[0].memory_footprint_bytes == 600 * 1024
+    assert descriptions[0].pinned is False
+
+
+def test_fixed_size_cache_when_just_loaded_model_exceeds_memory_budget() -> None:
+    # given
+    model_manager = WithFixedSizeCache(
+        _model_manager_with_mocked_models(),
+        max_size=10,
+        memory_budget_mb=1.0,
+        pinned_models=[],
+    )
+    model_manager._estimate_model_size = lambda model_id: 2 * 1024 * 1024
+
+    # when
+    with mock.patch.object(fixed_size_cache.logger, "warning") as warning_mock:
+        model_manager.add_model("a/1", api_key="key")
+
+    # then
+    assert set(model_manager.keys()) == {"a/1"}
+    warnings = [call.args[0] for call in warning_mock.call_args_list]
+    assert len(warnings) == 2
+    assert "only the just-loaded model remains" in warnings[0]
+    assert "memory budget cannot be met after loading a/1" in warnings[1]
+
+
+def test_fixed_size_cache_when_memory_budget_exceeded_by_pinned_models() -> None:
+    # given
+    model_manager = WithFixedSizeCache(
+        _model_manager_with_mocked_models(),
+        max_size=10,
+        memory_budget_mb=1.0,
+        pinned_models=["a/1"],
+    )
+    model_manager._estimate_model_size = lambda model_id: 600 * 1024
+    model_manager.add_model("a/1", api_key="key")
+
+    # when
+    with mock.patch.object(fixed_size_cache.logger, "warning") as warning_mock:
+        model_manager.add_model("b/1", api_key="key")
+
+    # then
+    assert set(model_manager.keys()) == {"a/1", "b/1"}
+    warnings = [call.args[0] for call in warning_mock.call_args_list]
+    assert "remaining models are pinned: a/1" in warnings[0]
+    assert "memory budget cannot be met after loading b/1" in warnings[1]
@@ -0,0 +1,215 @@
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import supervision as sv
+
+from inference.core.entities.requests.inference import ObjectDetectionInferenceRequest
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+    ObjectDetectionPrediction,
+)
+from inference.core.managers import base, metrics, telemetry
+from inference.core.managers.base import ModelManager
+from inference.core.managers.telemetry import (
+    InferenceTelemetryBuffer,
+    build_telemetry_record,
+    should_store_full_payload,
+)
+
+
+def _response(num_predictions: int, time: float) -> ObjectDetectionInferenceResponse:
+    prediction = ObjectDetectionPrediction(
+        x=10, y=10, width=5, height=5, confidence=0.9, **{"class": "a"}, class_id=0
+    )
+    return ObjectDetectionInferenceResponse(
+        predictions=[prediction] * num_predictions,
+        image=InferenceResponseImage(width=640, height=480),
+        time=time,
+    )
+
+
+def test_build_telemetry_record() -> None:
+    # when
+    result = build_telemetry_record(
+        inference_server_id="server",
+        model_id="some/1",
+        response=[_response(num_predictions=2, time=0.1), _response(3, time=0.3)],
+        start_time=10.0,
+        finish_time=10.5,
+    )
+
+    # then
+    assert result.inference_server_id == "server"
+    assert result.model_id == "some/1"
+    assert abs(result.processing_time - 0.5) < 1e-6
+    assert abs(result.inference_time - 0.4) < 1e-6
+    assert result.num_images == 2
+    assert result.num_predictions == 5
+    assert (result.image_width, result.image_height) == (640, 480)
+    assert result.error is False
+
+
+def test_telemetry_buffer_overwrites_oldest_records_and_summarizes() -> None:
+    # given
+    buffer = InferenceTelemetryBuffer(size=3)
+    for i in range(4):
+        buffer.append(
+            build_telemetry_record(
+                inference_server_id="server",
+                model_id="some/1",
+                response=_response(num_predictions=1, time=0.1 * (i + 1)),
+                start_time=float(i),
+                finish_time=float(i),
+            )
+        )
+    buffer.append(
+        build_telemetry_record(
+            inference_server_id="server",
+            model_id="some/1",
+            response=None,
+            start_time=4.0,
+            finish_time=4.0,
+        )
+    )
+
+    # when
+    result = buffer.summarize(
+        inference_server_id="server", model_id="some/1", min=2.0, max=10.0
+    )
+
+    # then
+    assert len(buffer) == 3
+    assert result["num_inferences"] == 2
+    assert abs(result["avg_inference_time"] - 0.35) < 1e-6
+    assert result["num_errors"] == 1
+
+
+def test_get_model_metrics_when_lightweight_telemetry_mode() -> None:
+    # given
+    buffer = InferenceTelemetryBuffer(size=10)
+    for inference_server_id in ["server", "other-server", "server"]:
+        buffer.append(
+            build_telemetry_record(
+                inference_server_id=inference_server_id,
+                model_id="some/1",
+                response=_response(num_predictions=1, time=0.1),
+                start_time=1.0,
+                finish_time=1.0,
+            )
+        )
+
+    # when
+    with mock.patch.object(
+        telemetry, "INFERENCE_TELEMETRY_MODE", "lightweight"
+    ), mock.patch.object(metrics, "telemetry_buffer", buffer):
+        result = metrics.get_model_metrics(
+            inference_server_id="server", model_id="some/1"
+        )
+
+    # then
+    assert result["num_inferences"] == 2
+    assert result["num_errors"] == 0
+
+
+def test_should_store_full_payload_when_full_telemetry_mode() -> None:
+    # when
+    with mock.patch.object(telemetry, "INFERENCE_TELEMETRY_MODE", "full"):
+        result = should_store_full_payload(sample_rate=0.0)
+
+    # then
+    assert result is True
+
+
+def test_should_store_full_payload_when_lightweight_telemetry_mode() -> None:
+    # when
+    with mock.patch.object(telemetry, "INFERENCE_TELEMETRY_MODE", "lightweight"):
+        never = should_store_full_payload(sample_rate=0.0)
+        always = should_store_full_payload(sample_rate=1.0)
+
+    # then
+    assert never is False
+    assert always is True
+
+
+def test_infer_from_request_sync_when_lightweight_telemetry_mode() -> None:
+    # given
+    model = MagicMock()
+    model.infer_from_request.return_value = [_response(num_predictions=2, time=0.1)]
+    model_manager = ModelManager(model_registry=MagicMock())
+    model_manager._models = {"some/1": model}
+    request = ObjectDetectionInferenceRequest(
+        model_id="some/1",
+        image={"type": "numpy", "value": "not-serialised"},
+        api_key="key",
+    )
+    buffer = InferenceTelemetryBuffer(size=10)
+    cache = MagicMock()
+
+    # when
+    with mock.patch.object(
+        telemetry, "INFERENCE_TELEMETRY_MODE", "lightweight"
+    ), mock.patch.object(
+        telemetry, "INFERENCE_TELEMETRY_SAMPLE_RATE", 0.0
+    ), mock.patch.object(
+        base, "telemetry_buffer", buffer
+    ), mock.patch.object(
+        base, "cache", cache
+    ):
+        _ = model_manager.infer_from_request_sync("some/1", request)
+
+    # then
+    records = buffer.get_records(
+        inference_server_id=base.GLOBAL_INFERENCE_SERVER_ID, model_id="some/1"
+    )
+    assert len(records) == 1
+    assert records[0].num_predictions == 2
+    zadd_keys = [call.args[0] for call in cache.zadd.call_args_list]
+    assert zadd_keys == ["models"]
+
+
+def test_infer_sv_detections_from_request_sync_when_lightweight_telemetry_mode() -> (
+    None
+):
+    # given
+    model = MagicMock()
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 10, 10], [5, 5, 10, 10]]),
+        confidence=np.array([0.9, 0.5]),
+        class_id=np.array([0, 1]),
+        data={"image_dimensions": np.array([[480, 640], [480, 640]])},
+    )
+    model.infer_sv_detections_from_request.return_value = [detections]
+    model_manager = ModelManager(model_registry=MagicMock())
+    model_manager._models = {"some/1": model}
+    request = ObjectDetectionInferenceRequest(
+        model_id="some/1",
+        image={"type": "numpy", "value": "not-serialised"},
+        api_key="key",
+    )
+    buffer = InferenceTelemetryBuffer(size=10)
+    cache = MagicMock()
+
+    # when
+    with mock.patch.object(
+        telemetry, "INFERENCE_TELEMETRY_MODE", "lightweight"
+    ), mock.patch.object(
+        telemetry, "INFERENCE_TELEMETRY_SAMPLE_RATE", 0.0
+    ), mock.patch.object(
+        base, "telemetry_buffer", buffer
+    ), mock.patch.object(
+        base, "cache", cache
+    ):
+        result = model_manager.infer_sv_detections_from_request_sync("some/1", request)
+
+    # then
+    assert result == [detections]
+    model.infer_from_request.assert_not_called()
+    records = buffer.get_records(
+        inference_server_id=base.GLOBAL_INFERENCE_SERVER_ID, model_id="some/1"
+    )
+    assert len(records) == 1
+    assert records[0].num_images == 1
+    assert records[0].num_predictions == 2
+    assert (records[0].image_width, records[0].image_height) == (640, 480)
@@ -3,6 +3,7 @@ from typing import Optional
 from unittest import mock
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from inference.core.exceptions import ModelArtefactError
@@ -14,6 +15,10 @@ from inference.core.models.roboflow import (
     get_color_mapping_from_environment,
     is_model_artefacts_bucket_available,
 )
+from inference.core.utils.image_representations import (
+    ImageRepresentationsCache,
+    attach_representations_cache,
+)
 
 
 @mock.patch.object(roboflow, "AWS_ACCESS_KEY_ID", None)
@@ -194,3 +199,74 @@ def test_get_class_names_from_environment_file() -> None:
         "class_k",
         "class_l",
     ]
+
+
+def _build_model_with_input_size(
+    size: int, resize_method: str = "Stretch to"
+) -> roboflow.RoboflowInferenceModel:
+    model = roboflow.RoboflowInferenceModel.__new__(roboflow.RoboflowInferenceModel)
+    model.preproc = {}
+    model.resize_method = resize_method
+    model.img_size_h = size
+    model.img_size_w = size
+    return model
+
+
+def test_preproc_image_reuses_model_input_of_image_with_attached_cache() -> None:
+    # given
+    np_image = np.random.randint(0, 255, (96, 128, 3), dtype=np.uint8)
+    cache = ImageRepresentationsCache()
+    attach_representations_cache(image=np_image, cache=cache)
+    first_model = _build_model_with_input_size(size=32)
+    second_model = _build_model_with_input_size(size=32)
+
+    # when
+    with mock.patch.object(
+        roboflow.RoboflowInferenceModel,
+        "resize_to_model_input",
+        autospec=True,
+        side_effect=roboflow.RoboflowInferenceModel.resize_to_model_input,
+    ) as resize_mock:
+        first_result, first_dims = first_model.preproc_image(
+            {"type": "numpy_object", "value": np_image}
+        )
+        first_result /= 255.0
+        second_result, second_dims = second_model.preproc_image(
+            {"type": "numpy_object", "value": np_image}
+        )
+
+    # then
+    assert resize_mock.call_count == 1
+    assert len(cache) == 1
+    assert first_dims == second_dims == (96, 128)
+    assert np.allclose(
+        first_result * 255.0, second_result
+    ), "Cached input must not be affected by in-place modifications of returned value"
+
+
+def test_preproc_image_computes_model_input_for_each_preprocessing_config() -> None:
+    # given
+    np_image = np.random.randint(0, 255, (96, 128, 3), dtype=np.uint8)
+    cache = ImageRepresentationsCache()
+    attach_representations_cache(image=np_image, cache=cache)
+    stretching_model = _build_model_with_input_size(size=32)
+    letterboxing_model = _build_model_with_input_size(
+        size=32, resize_method="Fit (black edges) in"
+    )
+    out = np.zeros((1, 3, 32, 32), dtype=np.float32)
+
+    # when
+    stretched, _ = stretching_model.preproc_image(
+        {"type": "numpy_object", "value": np_image}
+    )
+    letterboxed, _ = letterboxing_model.preproc_image(
+        {"type": "numpy_object", "value": np_image}, out=out
+    )
+
+    # then
+    assert letterboxed is out
+    assert len(cache) == 2
+    assert not np.allclose(stretched, letterboxed)
+    assert np.allclose(
+        letterboxed[:, :, :4, :], 0
+    ), "Letterboxed input should be padded at the top"
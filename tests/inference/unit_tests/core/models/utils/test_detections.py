@@ -0,0 +1,241 @@
+from typing import List
+
+import numpy as np
+import supervision as sv
+
+from inference.core.entities.responses.inference import (
+    InferenceResponseImage,
+    ObjectDetectionInferenceResponse,
+    ObjectDetectionPrediction,
+)
+from inference.core.models.instance_segmentation_base import (
+    InstanceSegmentationBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.models.keypoints_detection_base import (
+    KeypointsDetectionBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.models.object_detection_base import (
+    ObjectDetectionBaseOnnxRoboflowInferenceModel,
+)
+from inference.core.models.utils.detections import (
+    inference_response_to_sv_detections,
+    polygons_to_masks,
+)
+from inference.core.workflows.core_steps.common.utils import (
+    add_inference_keypoints_to_sv_detections,
+    convert_inference_detections_batch_to_sv_detections,
+)
+
+
+def _assert_detections_equal(result: sv.Detections, expected: sv.Detections) -> None:
+    assert np.array_equal(result.xyxy, expected.xyxy)
+    assert np.array_equal(result.confidence, expected.confidence)
+    assert np.array_equal(result.class_id, expected.class_id)
+    if expected.mask is None:
+        assert result.mask is None
+    else:
+        assert np.array_equal(result.mask, expected.mask)
+    assert set(result.data.keys()) == set(expected.data.keys())
+    for key in ["class_name", "parent_id", "image_dimensions"]:
+        assert np.array_equal(result.data[key], expected.data[key]), key
+    assert len(result.data["detection_id"]) == len(expected.data["detection_id"])
+
+
+def _responses_to_sv_detections(responses: list) -> List[sv.Detections]:
+    serialised = [r.model_dump(by_alias=True, exclude_none=True) for r in responses]
+    return convert_inference_detections_batch_to_sv_detections(serialised)
+
+
+def test_object_detection_sv_detections_match_converted_responses() -> None:
+    # given
+    model = ObjectDetectionBaseOnnxRoboflowInferenceModel.__new__(
+        ObjectDetectionBaseOnnxRoboflowInferenceModel
+    )
+    model.class_names = ["a", "bb", "ccc"]
+    predictions = [
+        [
+            [10.1, 20.3, 50.7, 80.9, 0.91, 0.91, 0],
+            [1.5, 2.25, 3.125, 4.0625, 0.37, 0.37, 2],
+        ],
+        [],
+    ]
+    img_dims = [(100, 200), (50, 60)]
+
+    # when
+    result = model.make_sv_detections(predictions, img_dims)
+
+    # then
+    expected = _responses_to_sv_detections(model.make_response(predictions, img_dims))
+    assert len(result) == 2
+    _assert_detections_equal(result[0], expected[0])
+    _assert_detections_equal(result[1], expected[1])
+    assert len(result[1]) == 0
+
+
+def test_object_detection_sv_detections_respect_class_filter() -> None:
+    # given
+    model = ObjectDetectionBaseOnnxRoboflowInferenceModel.__new__(
+        ObjectDetectionBaseOnnxRoboflowInferenceModel
+    )
+    model.class_names = ["a", "b"]
+    predictions = [
+        [
+            [10, 20, 50, 80, 0.9, 0.9, 0],
+            [1, 2, 3, 4, 0.3, 0.3, 1],
+        ]
+    ]
+
+    # when
+    result = model.make_response(
+        predictions, [(100, 100)], class_filter=["b"], return_sv_detections=True
+    )
+
+    # then
+    assert len(result) == 1
+    assert result[0]["class_name"].tolist() == ["b"]
+    assert np.allclose(result[0].xyxy, [[1, 2, 3, 4]])
+
+
+def test_keypoints_detection_sv_detections_match_converted_responses() -> None:
+    # given
+    model = KeypointsDetectionBaseOnnxRoboflowInferenceModel.__new__(
+        KeypointsDetectionBaseOnnxRoboflowInferenceModel
+    )
+    model.class_names = ["person", "dog"]
+    model.keypoints_metadata = {0: {0: "nose", 1: "eye"}, 1: {0: "tail"}}
+    predictions = [
+        [
+            [10.1, 20.3, 50.7, 80.9, 0.91, 0.91, 0, 1.5, 2.5, 0.9, 3.5, 4.5, 0.1],
+            [1.5, 2.25, 3.125, 4.0625, 0.37, 0.37, 1, 7.5, 8.5, 0.8, 0.0, 0.0, 0.0],
+        ]
+    ]
+    img_dims = [(100, 200)]
+
+    # when
+    result = model.make_sv_detections(predictions, img_dims)
+
+    # then
+    responses = model.make_response(predictions, img_dims)
+    expected = _responses_to_sv_detections(responses)
+    add_inference_keypoints_to_sv_detections(
+        inference_prediction=responses[0].model_dump(by_alias=True)["predictions"],
+        detections=expected[0],
+    )
+    _assert_detections_equal(result[0], expected[0])
+    for key in ["keypoints_class_name", "keypoints_class_id", "keypoints_confidence"]:
+        for result_value, expected_value in zip(result[0][key], expected[0][key]):
+            assert np.array_equal(result_value, expected_value), key
+    for result_value, expected_value in zip(
+        result[0]["keypoints_xy"], expected[0]["keypoints_xy"]
+    ):
+        assert np.array_equal(result_value, expected_value)
+        assert result_value.dtype == expected_value.dtype
+
+
+def test_instance_segmentation_sv_detections_match_converted_responses() -> None:
+    # given
+    model = InstanceSegmentationBaseOnnxRoboflowInferenceModel.__new__(
+        InstanceSegmentationBaseOnnxRoboflowInferenceModel
+    )
+    model.class_names = ["a", "b"]
+    predictions = [
+        np.array(
+            [
+                [10.1, 20.3, 50.7, 80.9, 0.91, 0.91, 0],
+                [1.5, 2.25, 3.125, 4.0625, 0.37, 0.37, 1],
+            ],
+            dtype=np.float32,
+        )
+    ]
+    masks = [
+        [
+            np.array([[10.5, 20.5], [50.2, 20.7], [50.9, 80.1]], dtype=np.float32),
+            np.array([[1.5, 2.5], [3.1, 2.7], [3.2, 4.1], [1.1, 4.0]]),
+        ]
+    ]
+    img_dims = [(100, 120)]
+
+    # when
+    result = model.make_sv_detections(predictions, masks, img_dims)
+
+    # then
+    expected = _responses_to_sv_detections(
+        model.make_response(predictions, masks, img_dims)
+    )
+    assert len(result[0]) == 2
+    _assert_detections_equal(result[0], expected[0])
+
+
+def test_instance_segmentation_sv_detections_keep_decoded_masks() -> None:
+    # given
+    model = InstanceSegmentationBaseOnnxRoboflowInferenceModel.__new__(
+        InstanceSegmentationBaseOnnxRoboflowInferenceModel
+    )
+    model.class_names = ["a", "b"]
+    predictions = [
+        np.array(
+            [
+                [10.1, 20.3, 50.7, 80.9, 0.91, 0.91, 0],
+                [1.5, 2.25, 3.125, 4.0625, 0.37, 0.37, 1],
+                [5.0, 5.0, 9.0, 9.0, 0.55, 0.55, 1],
+            ],
+            dtype=np.float32,
+        )
+    ]
+    masks = np.zeros((3, 100, 120), dtype=bool)
+    masks[0, 21:80, 11:50] = True
+    masks[2, 5:9, 5:9] = True
+
+    # when
+    result = model.make_sv_detections(
+        predictions, [masks], [(100, 120)], class_filter=["a"]
+    )
+
+    # then
+    assert len(result[0]) == 1, "Filtered class and empty mask must be rejected"
+    assert np.array_equal(result[0].mask, masks[2:3])
+    assert result[0]["class_name"].tolist() == ["b"]
+    assert result[0]["image_dimensions"].tolist() == [[100, 120]]
+
+
+def test_polygons_to_masks_when_polygons_are_degenerated() -> None:
+    # when
+    valid_indices, masks = polygons_to_masks(
+        polygons=[np.array([[0, 0], [1, 1]]), np.array([[0, 0], [4, 0], [4, 4]])],
+        image_dims=(8, 6),
+    )
+
+    # then
+    assert valid_indices.tolist() == [1]
+    assert masks.shape == (1, 8, 6)
+    assert masks.dtype == bool
+
+
+def test_inference_response_to_sv_detections() -> None:
+    # given
+    response = ObjectDetectionInferenceResponse(
+        predictions=[
+            ObjectDetectionPrediction(
+                **{"class": "a"},
+                x=10,
+                y=10,
+                width=4,
+                height=6,
+                confidence=0.5,
+                class_id=0,
+                detection_id="some",
+            )
+        ],
+        image=InferenceResponseImage(width=20, height=30),
+        inference_id="my-inference",
+    )
+
+    # when
+    result = inference_response_to_sv_detections(response)
+
+    # then
+    assert np.allclose(result.xyxy, [[8, 7, 12, 13]])
+    assert result["detection_id"].tolist() == ["some"]
+    assert result["parent_id"].tolist() == [""]
+    assert result["image_dimensions"].tolist() == [[30, 20]]
+    assert result["inference_id"].tolist() == ["my-inference"]
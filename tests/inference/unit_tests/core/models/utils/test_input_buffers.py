@@ -0,0 +1,45 @@
+from inference.core.models.utils.input_buffers import ModelInputBuffers
+
+
+def test_acquire_when_used_outside_of_reuse_scope() -> None:
+    # given
+    buffers = ModelInputBuffers()
+
+    # when
+    result = buffers.acquire(shape=(1, 3, 32, 32))
+
+    # then
+    assert result is None
+
+
+def test_acquire_when_used_within_reuse_scope() -> None:
+    # given
+    buffers = ModelInputBuffers()
+
+    # when
+    with buffers.reuse():
+        first = buffers.acquire(shape=(2, 3, 32, 32))
+        second = buffers.acquire(shape=(2, 3, 32, 32))
+    with buffers.reuse():
+        third = buffers.acquire(shape=(1, 3, 32, 32))
+
+    # then
+    assert first.shape == (2, 3, 32, 32)
+    assert second is None, "Buffer must be handed out only once per scope"
+    assert third.shape == (1, 3, 32, 32)
+    assert third.base is first.base, "Smaller batch should reuse the memory"
+
+
+def test_acquire_when_reuse_scopes_are_nested() -> None:
+    # given
+    buffers = ModelInputBuffers()
+
+    # when
+    with buffers.reuse():
+        outer = buffers.acquire(shape=(1, 3, 32, 32))
+        with buffers.reuse():
+            inner = buffers.acquire(shape=(1, 3, 32, 32))
+
+    # then
+    assert outer is not None
+    assert inner is None, "Nested inference must not overwrite input of outer one"
@@ -0,0 +1,167 @@
+import numpy as np
+import pytest
+
+from inference.core.nms import (
+    grouped_non_max_suppression,
+    non_max_suppression_fast,
+    select_top_k_per_group,
+    w_np_non_max_suppression,
+)
+
+
+def _prediction(rows: list, num_classes: int) -> np.ndarray:
+    # rows: (x_center, y_center, w, h, class_id, confidence)
+    result = np.zeros((1, len(rows), 5 + num_classes), dtype=np.float32)
+    for i, (x, y, w, h, class_id, confidence) in enumerate(rows):
+        result[0, i, :4] = (x, y, w, h)
+        result[0, i, 4] = confidence
+        result[0, i, 5 + class_id] = confidence
+    return result
+
+
+def test_w_np_non_max_suppression_when_class_aware() -> None:
+    # given
+    prediction = _prediction(
+        rows=[
+            (50, 50, 20, 20, 0, 0.9),
+            (51, 51, 20, 20, 0, 0.8),
+            (51, 51, 20, 20, 1, 0.7),
+            (200, 200, 20, 20, 0, 0.6),
+            (200, 200, 20, 20, 0, 0.1),
+        ],
+        num_classes=2,
+    )
+
+    # when
+    result = w_np_non_max_suppression(prediction, conf_thresh=0.5, iou_thresh=0.5)
+
+    # then
+    assert len(result) == 1
+    assert isinstance(result[0], np.ndarray)
+    assert np.allclose(result[0][:, 4], [0.9, 0.7, 0.6])
+    assert np.allclose(result[0][:, 6], [0, 1, 0])
+    assert np.allclose(result[0][0, :4], [40, 40, 60, 60])
+
+
+def test_w_np_non_max_suppression_when_class_agnostic() -> None:
+    # given
+    prediction = _prediction(
+        rows=[
+            (50, 50, 20, 20, 0, 0.9),
+            (51, 51, 20, 20, 1, 0.7),
+            (200, 200, 20, 20, 0, 0.6),
+        ],
+        num_classes=2,
+    )
+
+    # when
+    result = w_np_non_max_suppression(
+        prediction, conf_thresh=0.5, iou_thresh=0.5, class_agnostic=True
+    )
+
+    # then
+    assert np.allclose(result[0][:, 4], [0.9, 0.6])
+
+
+def test_w_np_non_max_suppression_when_batch_contains_empty_image() -> None:
+    # given
+    prediction = np.concatenate(
+        [
+            _prediction(rows=[(50, 50, 20, 20, 0, 0.1)], num_classes=2),
+            _prediction(rows=[(50, 50, 20, 20, 1, 0.9)], num_classes=2),
+        ],
+        axis=0,
+    )
+
+    # when
+    result = w_np_non_max_suppression(prediction, conf_thresh=0.5)
+
+    # then
+    assert len(result) == 2
+    assert result[0].shape == (0, 7)
+    assert result[1].shape == (1, 7)
+    assert result[1][0, 6] == 1
+
+
+def test_w_np_non_max_suppression_with_masks_and_max_detections() -> None:
+    # given
+    rows = [(i * 100, i * 100, 20, 20, 0, 0.9 - i * 0.1) for i in range(5)]
+    prediction = _prediction(rows=rows, num_classes=1)
+    masks = np.arange(5 * 3, dtype=np.float32).reshape((1, 5, 3))
+    prediction = np.concatenate([prediction, masks], axis=2)
+
+    # when
+    result = w_np_non_max_suppression(
+        prediction, conf_thresh=0.5, num_masks=3, max_detections=2
+    )
+
+    # then
+    assert result[0].shape == (2, 10)
+    assert np.allclose(result[0][:, 7:], masks[0, :2])
+
+
+def test_w_np_non_max_suppression_when_invalid_box_format_given() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = w_np_non_max_suppression(np.zeros((1, 1, 7)), box_format="invalid")
+
+
+def test_w_np_non_max_suppression_matches_per_class_reference() -> None:
+    # given
+    rng = np.random.default_rng(42)
+    prediction = np.zeros((2, 500, 5 + 4), dtype=np.float32)
+    prediction[:, :, :2] = rng.uniform(0, 200, (2, 500, 2))
+    prediction[:, :, 2:4] = rng.uniform(10, 60, (2, 500, 2))
+    prediction[:, :, 5:] = rng.random((2, 500, 4))
+    prediction[:, :, 4] = prediction[:, :, 5:].max(axis=2)
+
+    # when
+    result = w_np_non_max_suppression(
+        prediction.copy(), conf_thresh=0.6, iou_thresh=0.4, max_detections=10_000
+    )
+
+    # then
+    for image_prediction, image_result in zip(prediction, result):
+        image_prediction = image_prediction[image_prediction[:, 4] >= 0.6]
+        xyxy = np.concatenate(
+            [
+                image_prediction[:, :2] - image_prediction[:, 2:4] / 2,
+                image_prediction[:, :2] + image_prediction[:, 2:4] / 2,
+            ],
+            axis=1,
+        )
+        class_ids = image_prediction[:, 5:].argmax(axis=1)
+        expected = []
+        for class_id in np.unique(class_ids):
+            class_boxes = np.concatenate([xyxy, image_prediction[:, 4:5]], axis=1)[
+                class_ids == class_id
+            ]
+            expected.extend(non_max_suppression_fast(class_boxes, 0.4)[:, 4].tolist())
+        assert np.allclose(sorted(expected), sorted(image_result[:, 4].tolist()))
+
+
+def test_select_top_k_per_group() -> None:
+    # given
+    group_ids = np.array([0, 0, 0, 1, 1])
+    scores = np.array([0.1, 0.9, 0.5, 0.3, 0.2])
+
+    # when
+    result = select_top_k_per_group(group_ids=group_ids, scores=scores, k=2)
+
+    # then
+    assert result.tolist() == [1, 2, 3, 4]
+
+
+def test_grouped_non_max_suppression_keeps_groups_independent() -> None:
+    # given
+    boxes = np.array([[0, 0, 10, 10], [0, 0, 10, 10], [0, 0, 10, 10]], dtype=float)
+    scores = np.array([0.5, 0.9, 0.7])
+    group_ids = np.array([0, 0, 1])
+
+    # when
+    result = grouped_non_max_suppression(
+        boxes=boxes, scores=scores, group_ids=group_ids, iou_thresh=0.5
+    )
+
+    # then
+    assert sorted(result.tolist()) == [1, 2]
@@ -0,0 +1,110 @@
+import gc
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from inference.core.utils.image_representations import (
+    ImageRepresentationsCache,
+    attach_representations_cache,
+    get_attached_representations_cache,
+)
+
+
+def test_get_or_compute_computes_value_once_when_requested_concurrently() -> None:
+    # given
+    cache = ImageRepresentationsCache()
+    calls = []
+    lock = threading.Lock()
+
+    def compute() -> str:
+        with lock:
+            calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    # when
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                lambda _: cache.get_or_compute(key="key", compute=compute), range(8)
+            )
+        )
+
+    # then
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+    assert "key" in cache
+
+
+def test_get_or_compute_computes_different_keys_separately() -> None:
+    # given
+    cache = ImageRepresentationsCache()
+
+    # when
+    first = cache.get_or_compute(key=("resize", 32), compute=lambda: 1)
+    second = cache.get_or_compute(key=("resize", 64), compute=lambda: 2)
+    third = cache.get_or_compute(key=("resize", 32), compute=lambda: 3)
+
+    # then
+    assert (first, second, third) == (1, 2, 1)
+    assert len(cache) == 2
+
+
+def test_image_representations_cache_pickling_drops_content() -> None:
+    # given
+    cache = ImageRepresentationsCache()
+    cache.get_or_compute(key="key", compute=lambda: "value")
+
+    # when
+    result = pickle.loads(pickle.dumps(cache))
+
+    # then
+    assert len(result) == 0
+    assert result.get_or_compute(key="key", compute=lambda: "other") == "other"
+
+
+def test_get_attached_representations_cache_when_cache_attached() -> None:
+    # given
+    image = np.zeros((32, 32, 3), dtype=np.uint8)
+    cache = ImageRepresentationsCache()
+    attach_representations_cache(image=image, cache=cache)
+
+    # when
+    result = get_attached_representations_cache(image=image)
+
+    # then
+    assert result is cache
+
+
+def test_get_attached_representations_cache_when_cache_not_attached() -> None:
+    # given
+    image = np.zeros((32, 32, 3), dtype=np.uint8)
+    attach_representations_cache(
+        image=np.zeros((32, 32, 3), dtype=np.uint8),
+        cache=ImageRepresentationsCache(),
+    )
+
+    # when
+    result = get_attached_representations_cache(image=image)
+
+    # then
+    assert result is None
+    assert get_attached_representations_cache(image="not-an-array") is None
+
+
+def test_get_attached_representations_cache_when_cache_owner_released() -> None:
+    # given
+    image = np.zeros((32, 32, 3), dtype=np.uint8)
+    cache = ImageRepresentationsCache()
+    attach_representations_cache(image=image, cache=cache)
+
+    # when
+    del cache
+    gc.collect()
+    result = get_attached_representations_cache(image=image)
+
+    # then
+    assert result is None
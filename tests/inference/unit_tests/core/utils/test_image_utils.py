@@ -517,6 +517,28 @@ def test_load_image_from_encoded_bytes_when_decoding_should_fail() -> None:
         _ = load_image_from_encoded_bytes(value=b"FOR SURE NOT AN IMAGE :)")
 
 
+def test_load_image_from_encoded_bytes_when_memoryview_given(
+    image_as_jpeg_bytes: bytes,
+) -> None:
+    # when
+    result = load_image_from_encoded_bytes(value=memoryview(image_as_jpeg_bytes))
+
+    # then
+    assert result.shape == (128, 128, 3)
+
+
+@pytest.mark.parametrize("value", ["/9j/4AAQSkZJRgABAQ", 42, None])
+def test_load_image_with_known_type_when_bytes_type_declared_for_non_bytes_value(
+    value: Any,
+) -> None:
+    # when
+    with pytest.raises(InputImageLoadError) as error:
+        _ = load_image_with_known_type(value=value, image_type=ImageType.BYTES)
+
+    # then
+    assert "must be sent as binary data" in error.value.get_public_error_details()
+
+
 @mock.patch.object(image_utils, "ALLOW_NUMPY_INPUT", True)
 @pytest.mark.parametrize(
     "fixture_name",
@@ -11,9 +11,14 @@ from inference.core.utils.postprocess import (
     cosine_similarity,
     crop_mask,
     get_static_crop_dimensions,
+    mask_crops2poly,
+    masks2poly,
     post_process_bboxes,
     post_process_keypoints,
+    post_process_masks,
     post_process_polygons,
+    process_mask_accurate,
+    process_mask_roi,
     scale_bboxes,
     scale_polygons,
     shift_bboxes,
@@ -96,6 +101,45 @@ def test_crop_mask() -> None:
     assert np.allclose(result, expected_result)
 
 
+def test_process_mask_roi_gives_the_same_masks_as_accurate_mode() -> None:
+    # given
+    generator = np.random.default_rng(42)
+    protos = np.kron(
+        generator.normal(size=(8, 10, 12)), np.ones((1, 4, 4))
+    ) + 0.1 * generator.normal(size=(8, 40, 48))
+    masks_in = generator.normal(size=(3, 8))
+    bboxes = np.array(
+        [[10.3, 20.7, 80.1, 100.9], [0.0, 0.0, 191.9, 159.2], [50.5, 50.5, 50.7, 52.0]]
+    )
+
+    # when
+    mask_crops = process_mask_roi(
+        protos=protos, masks_in=masks_in, bboxes=bboxes.copy(), shape=(160, 192)
+    )
+
+    # then
+    expected_masks = process_mask_accurate(
+        protos=protos, masks_in=masks_in, bboxes=bboxes.copy(), shape=(160, 192)
+    )
+    for (crop, (x, y)), expected_mask in zip(mask_crops, expected_masks):
+        mask = np.zeros((160, 192), dtype=bool)
+        mask[y : y + crop.shape[0], x : x + crop.shape[1]] = crop > 0
+        assert np.array_equal(mask, expected_mask >= 0.5)
+    for polygon, expected_polygon in zip(
+        mask_crops2poly(mask_crops), masks2poly(expected_masks)
+    ):
+        assert np.array_equal(polygon, expected_polygon)
+
+
+def test_mask_crops2poly_when_crop_is_empty() -> None:
+    # when
+    result = mask_crops2poly(mask_crops=[(np.zeros((0, 0), dtype=np.uint8), (3, 4))])
+
+    # then
+    assert len(result) == 1
+    assert result[0].shape == (0, 2)
+
+
 def test_standardise_static_crop() -> None:
     # when
     result = standardise_static_crop(
@@ -721,6 +765,69 @@ def test_post_process_polygons_when_fit_resize_used() -> None:
     assert np.allclose(np.array(result), expected_result)
 
 
+def test_post_process_masks_when_stretching_resize_used() -> None:
+    # given
+    masks = np.zeros((1, 10, 10), dtype=np.float32)
+    masks[0, :, :5] = 0.7
+
+    # when
+    result = post_process_masks(
+        origin_shape=(20, 40),
+        masks=masks,
+        preproc={},
+    )
+
+    # then
+    assert result.shape == (1, 20, 40)
+    assert result.dtype == bool
+    assert result[0, :, :20].all()
+    assert not result[0, :, 20:].any()
+
+
+def test_post_process_masks_when_fit_resize_used() -> None:
+    # given
+    masks = np.zeros((2, 100, 100), dtype=bool)
+    masks[0, 20:40, 35:45] = True
+    masks[1, :, :25] = True  # padding only
+    # there is a crop from (x=10, y=20) to (x=90, y=180) (box size - h=160, w=80)
+    # for inference, we scale 0.625, making 25px padding OX each side
+    # so effectively out(OX) = (in(OX) - 25) * 1.6 + 10, out(OY) = in(OY) * 1.6 + 20
+
+    # when
+    result = post_process_masks(
+        origin_shape=(200, 100),
+        masks=masks,
+        preproc={
+            "static-crop": {
+                "enabled": True,
+                "x_min": 10,
+                "y_min": 10,
+                "x_max": 90,
+                "y_max": 90,
+            }
+        },
+        resize_method="Fit (black edges) in",
+    )
+
+    # then
+    assert result.shape == (2, 200, 100)
+    assert result[0, 53:83, 27:41].all()
+    assert result[0].sum() == result[0, 51:85, 25:43].sum()
+    assert not result[1].any(), "Mask of padding must be cut off"
+
+
+def test_post_process_masks_when_no_masks_given() -> None:
+    # when
+    result = post_process_masks(
+        origin_shape=(20, 40),
+        masks=np.zeros((0, 10, 10)),
+        preproc={},
+    )
+
+    # then
+    assert result.shape == (0, 20, 40)
+
+
 def test_shift_keypoints() -> None:
     # given
     keypoints = np.array([[0, 0, 0.9, 10, 10, 0.9, 20, 25, 0.8]])
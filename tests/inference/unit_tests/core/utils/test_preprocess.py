@@ -1,6 +1,7 @@
 from unittest import mock
 from unittest.mock import MagicMock
 
+import cv2
 import numpy as np
 import pytest
 
@@ -11,7 +12,9 @@ from inference.core.utils.preprocess import (
     apply_contrast_adjustment,
     contrast_adjustments_should_be_applied,
     grayscale_conversion_should_be_applied,
+    letterbox_image,
     prepare,
+    resize_image_into_buffer,
     static_crop_should_be_applied,
     take_static_crop,
 )
@@ -296,3 +299,44 @@ def test_prepare_when_misconfiguration_error_is_encountered(
             image=np.zeros((128, 128, 3), dtype=np.uint8),
             preproc={"static-crop": {"enabled": True}},
         )
+
+
+@pytest.mark.parametrize("image_shape", [(480, 640, 3), (700, 300, 3)])
+@pytest.mark.parametrize("bgr_to_rgb", [True, False])
+def test_resize_image_into_buffer_when_aspect_ratio_is_kept(
+    image_shape: tuple, bgr_to_rgb: bool
+) -> None:
+    # given
+    image = np.random.randint(0, 255, image_shape, dtype=np.uint8)
+    out = np.full((3, 320, 320), -1, dtype=np.float32)
+    expected = letterbox_image(image, (320, 320), color=(10, 20, 30))
+    if bgr_to_rgb:
+        expected = cv2.cvtColor(expected, cv2.COLOR_BGR2RGB)
+
+    # when
+    result = resize_image_into_buffer(
+        image,
+        out=out,
+        keep_aspect_ratio=True,
+        color=(10, 20, 30),
+        bgr_to_rgb=bgr_to_rgb,
+    )
+
+    # then
+    assert result is out
+    assert np.array_equal(out, expected.transpose(2, 0, 1).astype(np.float32))
+
+
+def test_resize_image_into_buffer_when_image_is_stretched() -> None:
+    # given
+    image = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
+    out = np.empty((3, 320, 256), dtype=np.float32)
+    expected = cv2.resize(image.astype(np.float32), (256, 320))[:, :, ::-1]
+
+    # when
+    _ = resize_image_into_buffer(
+        image, out=out, keep_aspect_ratio=False, bgr_to_rgb=True
+    )
+
+    # then
+    assert np.array_equal(out, expected.transpose(2, 0, 1))
@@ -0,0 +1,91 @@
+import importlib
+import sys
+import types
+from typing import Generator, List
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from inference.core.cache.embeddings import EmbeddingsCache
+
+
+class _TokenizedTexts:
+    def __init__(self, texts: List[str]):
+        self._tokens = np.array([[len(text), text.count("a")] for text in texts])
+
+    def numpy(self) -> np.ndarray:
+        return self._tokens
+
+
+class _TextualSession:
+    def __init__(self):
+        self.encoded_batches = []
+
+    def get_inputs(self) -> list:
+        return [types.SimpleNamespace(name="input")]
+
+    def run(self, output_names: None, inputs: dict) -> List[np.ndarray]:
+        self.encoded_batches.append(inputs["input"].tolist())
+        return [inputs["input"].astype(np.float32)]
+
+
+@pytest.fixture(scope="function")
+def clip_model_module() -> Generator[types.ModuleType, None, None]:
+    # `clip` package is optional - stubbed with tokenizer producing (length, number of "a") tokens
+    clip_module = types.ModuleType("clip")
+    clip_module.tokenize = lambda texts: _TokenizedTexts(texts=texts)
+    simple_tokenizer_module = types.ModuleType("clip.simple_tokenizer")
+    simple_tokenizer_module.basic_clean = lambda text: text.strip()
+    simple_tokenizer_module.whitespace_clean = lambda text: " ".join(text.split())
+    clip_module.simple_tokenizer = simple_tokenizer_module
+    with mock.patch.dict(
+        sys.modules,
+        {"clip": clip_module, "clip.simple_tokenizer": simple_tokenizer_module},
+    ):
+        sys.modules.pop("inference.models.clip.clip_model", None)
+        yield importlib.import_module("inference.models.clip.clip_model")
+
+
+def _clip_model(
+    clip_model_module: types.ModuleType, text_embeddings_cache: EmbeddingsCache
+):
+    # bypassing __init__(...) which downloads model weights
+    model = clip_model_module.Clip.__new__(clip_model_module.Clip)
+    model.textual_onnx_session = _TextualSession()
+    model.text_embeddings_cache = text_embeddings_cache
+    return model
+
+
+def test_clip_embed_text_encodes_only_texts_missing_in_cache(
+    clip_model_module: types.ModuleType,
+) -> None:
+    # given
+    model = _clip_model(
+        clip_model_module=clip_model_module,
+        text_embeddings_cache=EmbeddingsCache(max_size_bytes=1024),
+    )
+    _ = model.embed_text(text="a cat")
+
+    # when
+    result = model.embed_text(text=["A  cat ", "a banana", "a banana"])
+
+    # then
+    assert model.textual_onnx_session.encoded_batches == [[[5, 2]], [[8, 4]]]
+    assert np.array_equal(result, [[5, 2], [8, 4], [8, 4]])
+    assert model.text_embeddings_cache.stats()["hits"] == 1
+
+
+def test_clip_embed_text_when_cache_is_disabled(
+    clip_model_module: types.ModuleType,
+) -> None:
+    # given
+    model = _clip_model(clip_model_module=clip_model_module, text_embeddings_cache=None)
+
+    # when
+    first_result = model.embed_text(text="a cat")
+    second_result = model.embed_text(text="a cat")
+
+    # then
+    assert model.textual_onnx_session.encoded_batches == [[[5, 2]], [[5, 2]]]
+    assert np.array_equal(first_result, second_result)
@@ -0,0 +1,184 @@
+import importlib
+import sys
+import types
+from typing import Generator
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from inference.core.cache.embeddings import CacheEmbeddingsStore
+from inference.core.cache.memory import MemoryCache
+from inference.core.cache.redis import RedisCache
+
+
+@pytest.fixture(scope="function")
+def owlv2_module() -> Generator[types.ModuleType, None, None]:
+    # `torch`, `torchvision` and `transformers` are optional - stubbed with numpy arrays used as tensors
+    torch_module = types.ModuleType("torch")
+    torch_module.Tensor = np.ndarray
+    torch_module.cuda = types.SimpleNamespace(is_available=lambda: False)
+    torch_module.no_grad = lambda: (lambda function: function)
+    torch_module.tensor = lambda data, device=None: np.asarray(data)
+    torch_nn_module = types.ModuleType("torch.nn")
+    torch_functional_module = types.ModuleType("torch.nn.functional")
+    torch_nn_module.functional = torch_functional_module
+    torch_module.nn = torch_nn_module
+    transformers_module = types.ModuleType("transformers")
+    transformers_module.Owlv2ForObjectDetection = MagicMock()
+    transformers_module.Owlv2Processor = MagicMock()
+    modeling_owlv2_module = types.ModuleType("transformers.models.owlv2.modeling_owlv2")
+    modeling_owlv2_module.box_iou = MagicMock()
+    with mock.patch.dict(
+        sys.modules,
+        {
+            "torch": torch_module,
+            "torch.nn": torch_nn_module,
+            "torch.nn.functional": torch_functional_module,
+            "torchvision": types.ModuleType("torchvision"),
+            "transformers": transformers_module,
+            "transformers.models": types.ModuleType("transformers.models"),
+            "transformers.models.owlv2": types.ModuleType("transformers.models.owlv2"),
+            "transformers.models.owlv2.modeling_owlv2": modeling_owlv2_module,
+        },
+    ):
+        sys.modules.pop("inference.models.owlv2.owlv2", None)
+        yield importlib.import_module("inference.models.owlv2.owlv2")
+        sys.modules.pop("inference.models.owlv2.owlv2", None)
+
+
+def _owlv2_model(owlv2_module: types.ModuleType, embeddings_store):
+    # bypassing __init__(...) which downloads model weights
+    model = owlv2_module.OwlV2.__new__(owlv2_module.OwlV2)
+    model.embeddings_store = embeddings_store
+    model.reset_cache()
+    return model
+
+
+def _image_embeds_arrays(owlv2_module: types.ModuleType) -> dict:
+    return {
+        name: np.full((2, 3), idx, dtype=np.float32)
+        for idx, name in enumerate(owlv2_module.IMAGE_EMBEDS_NAMES)
+    }
+
+
+def test_owlv2_get_image_embeds_when_embeddings_found_in_store(
+    owlv2_module: types.ModuleType,
+) -> None:
+    # given
+    store = CacheEmbeddingsStore(cache=MemoryCache(), key_prefix="owlv2:test")
+    store.set("image/some-hash", _image_embeds_arrays(owlv2_module=owlv2_module))
+    model = _owlv2_model(owlv2_module=owlv2_module, embeddings_store=store)
+
+    # when
+    result = model.get_image_embeds(image_hash="some-hash")
+
+    # then
+    assert len(result) == len(owlv2_module.IMAGE_EMBEDS_NAMES)
+    for idx, tensor in enumerate(result):
+        assert np.array_equal(tensor, np.full((2, 3), idx, dtype=np.float32))
+    assert model.image_embed_cache["some-hash"] is result
+
+
+def test_owlv2_get_image_embeds_when_embeddings_not_found_in_store(
+    owlv2_module: types.ModuleType,
+) -> None:
+    # given
+    store = CacheEmbeddingsStore(cache=MemoryCache(), key_prefix="owlv2:test")
+    model = _owlv2_model(owlv2_module=owlv2_module, embeddings_store=store)
+
+    # when
+    result = model.get_image_embeds(image_hash="some-hash")
+
+    # then
+    assert result is None
+    assert "some-hash" not in model.image_embed_cache
+
+
+def test_owlv2_get_image_embeds_when_store_is_not_configured(
+    owlv2_module: types.ModuleType,
+) -> None:
+    # given
+    model = _owlv2_model(owlv2_module=owlv2_module, embeddings_store=None)
+    model.image_embed_cache["cached-hash"] = ("cached",)
+
+    # when
+    cached_result = model.get_image_embeds(image_hash="cached-hash")
+    missing_result = model.get_image_embeds(image_hash="some-hash")
+
+    # then
+    assert cached_result == ("cached",)
+    assert missing_result is None
+
+
+def test_owlv2_make_class_embeddings_dict_when_embeddings_found_in_store(
+    owlv2_module: types.ModuleType,
+) -> None:
+    # given
+    store = CacheEmbeddingsStore(cache=MemoryCache(), key_prefix="owlv2:test")
+    model = _owlv2_model(owlv2_module=owlv2_module, embeddings_store=store)
+    model.embed_image = MagicMock()
+    training_data = [
+        {
+            "image": {"type": "url", "value": "https://some.com/image.jpg"},
+            "boxes": [{"x": 1, "y": 2, "w": 3, "h": 4, "cls": "a", "negative": False}],
+        }
+    ]
+    training_data_hash = owlv2_module.hash_wrapped_training_data(
+        [
+            {
+                "image": owlv2_module.LazyImageRetrievalWrapper(d["image"]),
+                "boxes": d["boxes"],
+            }
+            for d in training_data
+        ]
+    )
+    store.set(
+        f"class/{training_data_hash}",
+        {
+            "class_names": np.array(["a"]),
+            "positive_0": np.ones((1, 4), dtype=np.float32),
+        },
+    )
+
+    # when
+    result = model.make_class_embeddings_dict(
+        training_data=training_data, iou_threshold=0.4
+    )
+
+    # then
+    model.embed_image.assert_not_called()
+    assert list(result.keys()) == ["a"]
+    assert np.array_equal(result["a"]["positive"], np.ones((1, 4), dtype=np.float32))
+    assert result["a"]["negative"] is None
+    assert model.class_embeddings_cache[training_data_hash] is result
+
+
+def test_init_embeddings_store_when_redis_store_requested_without_redis(
+    owlv2_module: types.ModuleType,
+) -> None:
+    # when
+    with mock.patch.object(
+        owlv2_module, "OWLV2_EMBEDDINGS_STORE", "redis"
+    ), mock.patch.object(owlv2_module, "cache", MemoryCache()), mock.patch.object(
+        owlv2_module.logger, "warning"
+    ) as warning_mock:
+        result = owlv2_module.init_embeddings_store(version_id="owlv2-base-patch16")
+
+    # then
+    assert result is None
+    warning_mock.assert_called_once()
+
+
+def test_init_embeddings_store_when_redis_store_requested_with_redis(
+    owlv2_module: types.ModuleType,
+) -> None:
+    # when
+    with mock.patch.object(
+        owlv2_module, "OWLV2_EMBEDDINGS_STORE", "redis"
+    ), mock.patch.object(owlv2_module, "cache", MagicMock(spec=RedisCache)):
+        result = owlv2_module.init_embeddings_store(version_id="owlv2-base-patch16")
+
+    # then
+    assert isinstance(result, CacheEmbeddingsStore)
@@ -0,0 +1,166 @@
+import importlib
+import sys
+import types
+from typing import Generator
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+
+class _Tensor:
+    def __init__(self, array: np.ndarray):
+        self._array = array
+
+    def cpu(self) -> "_Tensor":
+        return self
+
+    def numpy(self) -> np.ndarray:
+        return self._array
+
+
+class _SamPredictor:
+    # embedding is filled with the value of the first pixel of embedded image
+    def __init__(self):
+        self.embedded_images = []
+
+    def set_image(self, image: np.ndarray) -> None:
+        self.embedded_images.append(image)
+
+    def get_image_embedding(self) -> _Tensor:
+        return _Tensor(np.full((1, 2, 3), self.embedded_images[-1][0, 0, 0]))
+
+
+@pytest.fixture(scope="function")
+def sam_module() -> Generator[types.ModuleType, None, None]:
+    # `torch`, `segment_anything` and `rasterio` are optional - stubbed, as image encoder is mocked in tests
+    torch_module = types.ModuleType("torch")
+    torch_module.cuda = types.SimpleNamespace(is_available=lambda: False)
+    segment_anything_module = types.ModuleType("segment_anything")
+    segment_anything_module.SamPredictor = MagicMock()
+    segment_anything_module.sam_model_registry = MagicMock()
+    rasterio_module = types.ModuleType("rasterio")
+    rasterio_features_module = types.ModuleType("rasterio.features")
+    rasterio_module.features = rasterio_features_module
+    with mock.patch.dict(
+        sys.modules,
+        {
+            "torch": torch_module,
+            "segment_anything": segment_anything_module,
+            "rasterio": rasterio_module,
+            "rasterio.features": rasterio_features_module,
+        },
+    ):
+        sys.modules.pop("inference.models.sam", None)
+        sys.modules.pop("inference.models.sam.segment_anything", None)
+        yield importlib.import_module("inference.models.sam.segment_anything")
+
+
+def _sam_model(
+    sam_module: types.ModuleType,
+    cache_dir: str,
+    max_entries: int = 10,
+    spill_size_mb: float = 0,
+):
+    def init_core_model(self, *args, **kwargs) -> None:
+        self.version_id = "vit_h"
+
+    # core model __init__(...) downloads weights - encoder and decoder are mocked
+    with mock.patch.object(
+        sam_module.RoboflowCoreModel, "__init__", init_core_model
+    ), mock.patch.object(
+        sam_module.SegmentAnything,
+        "cache_file",
+        lambda self, f: f"{cache_dir}/{f}",
+    ), mock.patch.object(
+        sam_module, "onnxruntime"
+    ), mock.patch.object(
+        sam_module, "SAM_MAX_EMBEDDING_CACHE_SIZE", max_entries
+    ), mock.patch.object(
+        sam_module, "SAM_EMBEDDING_CACHE_SPILL_SIZE_MB", spill_size_mb
+    ):
+        model = sam_module.SegmentAnything()
+    model.preproc_image = lambda image: np.full((4, 6, 3), image, dtype=np.uint8)
+    model.predictor = _SamPredictor()
+    return model
+
+
+def test_sam_embed_image_when_embedding_not_cached(
+    sam_module: types.ModuleType, empty_local_dir: str
+) -> None:
+    # given
+    model = _sam_model(sam_module=sam_module, cache_dir=empty_local_dir)
+
+    # when
+    embedding, image_size = model.embed_image(image=7, image_id="some")
+
+    # then
+    assert np.array_equal(embedding, np.full((1, 2, 3), 7))
+    assert image_size == (4, 6)
+    assert "some" in model.embedding_cache
+    assert model.embedding_cache.stats()["misses"] == 1
+
+
+def test_sam_embed_image_when_embedding_cached(
+    sam_module: types.ModuleType, empty_local_dir: str
+) -> None:
+    # given
+    model = _sam_model(sam_module=sam_module, cache_dir=empty_local_dir)
+    _ = model.embed_image(image=7, image_id="some")
+
+    # when
+    embedding, image_size = model.embed_image(image=8, image_id="some")
+
+    # then
+    assert np.array_equal(embedding, np.full((1, 2, 3), 7))
+    assert image_size == (4, 6)
+    assert len(model.predictor.embedded_images) == 1
+    assert model.embedding_cache.stats()["hits"] == 1
+
+
+def test_sam_embed_image_when_embedding_was_spilled_to_disk(
+    sam_module: types.ModuleType, empty_local_dir: str
+) -> None:
+    # given
+    model = _sam_model(
+        sam_module=sam_module, cache_dir=empty_local_dir, max_entries=1, spill_size_mb=1
+    )
+    _ = model.embed_image(image=7, image_id="first")
+    _ = model.embed_image(image=8, image_id="second")
+
+    # when
+    embedding, image_size = model.embed_image(image=9, image_id="first")
+
+    # then
+    assert np.array_equal(embedding, np.full((1, 2, 3), 7))
+    assert image_size == (4, 6)
+    assert len(model.predictor.embedded_images) == 2
+    assert model.embedding_cache.stats()["disk_hits"] == 1
+
+
+def test_sam_embed_image_when_embedding_evicted_and_spilling_disabled(
+    sam_module: types.ModuleType, empty_local_dir: str
+) -> None:
+    # given
+    model = _sam_model(sam_module=sam_module, cache_dir=empty_local_dir, max_entries=1)
+    _ = model.embed_image(image=7, image_id="first")
+    _ = model.embed_image(image=8, image_id="second")
+
+    # when
+    embedding, _ = model.embed_image(image=9, image_id="first")
+
+    # then
+    assert np.array_equal(embedding, np.full((1, 2, 3), 9))
+    assert len(model.predictor.embedded_images) == 3
+
+
+def test_sam_segment_image_when_image_id_not_cached_and_image_not_given(
+    sam_module: types.ModuleType, empty_local_dir: str
+) -> None:
+    # given
+    model = _sam_model(sam_module=sam_module, cache_dir=empty_local_dir)
+
+    # when
+    with pytest.raises(ValueError):
+        _ = model.segment_image(image=None, image_id="some")
@@ -0,0 +1,202 @@
+import contextlib
+import importlib
+import sys
+import types
+from typing import Generator
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+
+class _Tensor:
+    def __init__(self, array: np.ndarray):
+        self.array = array
+
+    def cpu(self) -> "_Tensor":
+        return self
+
+    def numpy(self) -> np.ndarray:
+        return self.array
+
+    def to(self, device: str) -> "_Tensor":
+        return self
+
+    def element_size(self) -> int:
+        return self.array.itemsize
+
+    def nelement(self) -> int:
+        return self.array.size
+
+
+class _Sam2Predictor:
+    # features are filled with the value of the first pixel of embedded image
+    def __init__(self):
+        self.embedded_images = []
+        self._features = None
+
+    def set_image(self, image: np.ndarray) -> None:
+        self.embedded_images.append(image)
+        value = image[0, 0, 0]
+        self._features = {
+            "image_embed": _Tensor(np.full((1, 4, 2, 2), value, dtype=np.float32)),
+            "high_res_feats": [
+                _Tensor(np.full((1, 2, 4, 4), value, dtype=np.float32)),
+                _Tensor(np.full((1, 2, 8, 8), value, dtype=np.float32)),
+            ],
+        }
+
+
+@pytest.fixture(scope="function")
+def sam2_module() -> Generator[types.ModuleType, None, None]:
+    # `torch` and `sam2` are optional - stubbed, as image encoder is mocked in tests
+    torch_module = types.ModuleType("torch")
+    torch_module.cuda = types.SimpleNamespace(is_available=lambda: False)
+    torch_module.inference_mode = contextlib.nullcontext
+    torch_module.from_numpy = _Tensor
+    torch_nn_module = types.ModuleType("torch.nn")
+    torch_attention_module = types.ModuleType("torch.nn.attention")
+    torch_attention_module.SDPBackend = MagicMock()
+    sam2_package = types.ModuleType("sam2")
+    sam2_utils_module = types.ModuleType("sam2.utils")
+    sam2_misc_module = types.ModuleType("sam2.utils.misc")
+    sam2_package.utils = sam2_utils_module
+    sam2_utils_module.misc = sam2_misc_module
+    sam2_build_module = types.ModuleType("sam2.build_sam")
+    sam2_build_module.build_sam2 = MagicMock()
+    sam2_predictor_module = types.ModuleType("sam2.sam2_image_predictor")
+    sam2_predictor_module.SAM2ImagePredictor = MagicMock()
+    with mock.patch.dict(
+        sys.modules,
+        {
+            "torch": torch_module,
+            "torch.nn": torch_nn_module,
+            "torch.nn.attention": torch_attention_module,
+            "sam2": sam2_package,
+            "sam2.utils": sam2_utils_module,
+            "sam2.utils.misc": sam2_misc_module,
+            "sam2.build_sam": sam2_build_module,
+            "sam2.sam2_image_predictor": sam2_predictor_module,
+        },
+    ):
+        sys.modules.pop("inference.models.sam2", None)
+        sys.modules.pop("inference.models.sam2.segment_anything2", None)
+        yield importlib.import_module("inference.models.sam2.segment_anything2")
+
+
+def _sam2_model(
+    sam2_module: types.ModuleType,
+    cache_dir: str,
+    embedding_cache_size: int = 10,
+    embedding_cache_spill_size_mb: float = 0,
+):
+    def init_core_model(self, *args, **kwargs) -> None:
+        self.version_id = "hiera_tiny"
+
+    # core model __init__(...) downloads weights - image encoder is mocked
+    with mock.patch.object(
+        sam2_module.RoboflowCoreModel, "__init__", init_core_model
+    ), mock.patch.object(
+        sam2_module.SegmentAnything2,
+        "cache_file",
+        lambda self, f: f"{cache_dir}/{f}",
+    ):
+        model = sam2_module.SegmentAnything2(
+            embedding_cache_size=embedding_cache_size,
+            embedding_cache_spill_size_mb=embedding_cache_spill_size_mb,
+        )
+    model.preproc_image = lambda image: np.full((4, 6, 3), image, dtype=np.uint8)
+    model.predictor = _Sam2Predictor()
+    return model
+
+
+def test_sam2_embed_image_when_embedding_not_cached(
+    sam2_module: types.ModuleType, empty_local_dir: str
+) -> None:
+    # given
+    model = _sam2_model(sam2_module=sam2_module, cache_dir=empty_local_dir)
+
+    # when
+    features, image_size, image_id = model.embed_image(image=7, image_id="some")
+
+    # then
+    assert np.array_equal(features["image_embed"].array, np.full((1, 4, 2, 2), 7))
+    assert image_size == (4, 6)
+    assert image_id == "some"
+    assert "some" in model.embedding_cache
+    assert model.embedding_cache.stats()["size_bytes"] == (16 + 32 + 128) * 4
+
+
+def test_sam2_embed_image_when_embedding_of_the_same_image_cached(
+    sam2_module: types.ModuleType, empty_local_dir: str
+) -> None:
+    # given
+    model = _sam2_model(sam2_module=sam2_module, cache_dir=empty_local_dir)
+    _, _, first_image_id = model.embed_image(image=7)
+
+    # when
+    features, image_size, second_image_id = model.embed_image(image=7)
+
+    # then
+    assert first_image_id == second_image_id
+    assert np.array_equal(features["image_embed"].array, np.full((1, 4, 2, 2), 7))
+    assert image_size == (4, 6)
+    assert len(model.predictor.embedded_images) == 1
+    assert model.embedding_cache.stats()["hits"] == 1
+
+
+def test_sam2_embed_image_when_embedding_was_spilled_to_disk(
+    sam2_module: types.ModuleType, empty_local_dir: str
+) -> None:
+    # given
+    model = _sam2_model(
+        sam2_module=sam2_module,
+        cache_dir=empty_local_dir,
+        embedding_cache_size=1,
+        embedding_cache_spill_size_mb=1,
+    )
+    _ = model.embed_image(image=7, image_id="first")
+    _ = model.embed_image(image=8, image_id="second")
+
+    # when
+    features, image_size, _ = model.embed_image(image=9, image_id="first")
+
+    # then
+    assert np.array_equal(features["image_embed"].array, np.full((1, 4, 2, 2), 7))
+    assert [tensor.array.shape for tensor in features["high_res_feats"]] == [
+        (1, 2, 4, 4),
+        (1, 2, 8, 8),
+    ]
+    assert image_size == (4, 6)
+    assert len(model.predictor.embedded_images) == 2
+    assert model.embedding_cache.stats()["disk_hits"] == 1
+
+
+def test_sam2_embed_image_when_embedding_evicted_and_spilling_disabled(
+    sam2_module: types.ModuleType, empty_local_dir: str
+) -> None:
+    # given
+    model = _sam2_model(
+        sam2_module=sam2_module, cache_dir=empty_local_dir, embedding_cache_size=1
+    )
+    _ = model.embed_image(image=7, image_id="first")
+    _ = model.embed_image(image=8, image_id="second")
+
+    # when
+    features, _, _ = model.embed_image(image=9, image_id="first")
+
+    # then
+    assert np.array_equal(features["image_embed"].array, np.full((1, 4, 2, 2), 9))
+    assert len(model.predictor.embedded_images) == 3
+
+
+def test_sam2_segment_image_when_image_id_not_cached_and_image_not_given(
+    sam2_module: types.ModuleType, empty_local_dir: str
+) -> None:
+    # given
+    model = _sam2_model(sam2_module=sam2_module, cache_dir=empty_local_dir)
+
+    # when
+    with pytest.raises(ValueError):
+        _ = model.segment_image(image=None, image_id="some")
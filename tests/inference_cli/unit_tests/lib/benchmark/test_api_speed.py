@@ -0,0 +1,69 @@
+from functools import partial
+from unittest import mock
+
+import pytest
+
+from inference_cli.lib.benchmark import api_speed
+from inference_cli.lib.benchmark.api_speed import run_api_speed_benchmark
+
+
+@mock.patch.object(
+    api_speed,
+    "display_benchmark_statistics",
+    partial(api_speed.display_benchmark_statistics, sleep_time=0.01),
+)
+def test_run_api_speed_benchmark_in_closed_loop_sends_requests_per_client() -> None:
+    # when
+    statistics, report = run_api_speed_benchmark(
+        request_function=lambda: None,
+        warm_up_requests=2,
+        benchmark_requests=5,
+        request_batch_size=1,
+        number_of_clients=3,
+        requests_per_second=None,
+        time_series_interval=1.0,
+    )
+
+    # then
+    assert report.requests == 15
+    assert report.concurrency == 3
+
+
+@mock.patch.object(
+    api_speed,
+    "display_benchmark_statistics",
+    partial(api_speed.display_benchmark_statistics, sleep_time=0.01),
+)
+def test_run_api_speed_benchmark_in_open_loop_sends_requests_in_total() -> None:
+    # when
+    _, report = run_api_speed_benchmark(
+        request_function=lambda: None,
+        warm_up_requests=0,
+        benchmark_requests=5,
+        request_batch_size=1,
+        number_of_clients=3,
+        requests_per_second=500,
+        time_series_interval=1.0,
+    )
+
+    # then
+    assert report.requests == 5
+
+
+@mock.patch.object(
+    api_speed,
+    "display_benchmark_statistics",
+    partial(api_speed.display_benchmark_statistics, sleep_time=0.01),
+)
+def test_run_api_speed_benchmark_when_load_test_fails_to_start() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = run_api_speed_benchmark(
+            request_function=lambda: None,
+            warm_up_requests=0,
+            benchmark_requests=5,
+            request_batch_size=1,
+            number_of_clients=0,
+            requests_per_second=-1,
+            time_series_interval=1.0,
+        )
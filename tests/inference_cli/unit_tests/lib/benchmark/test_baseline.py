@@ -0,0 +1,107 @@
+import json
+import os.path
+
+import pytest
+
+from inference_cli.lib.benchmark.baseline import (
+    compare_with_baseline,
+    ensure_no_regression,
+    load_load_test_report,
+)
+from inference_cli.lib.benchmark.load_generator import LoadMode, LoadTestReport
+
+
+def _report(p99: float, requests_per_second: float, error_rate: float = 0.0):
+    return LoadTestReport(
+        mode=LoadMode.OPEN_LOOP,
+        requests_per_second_target=50.0,
+        concurrency=None,
+        warm_up_requests=10,
+        requests=1000,
+        errors=int(error_rate * 10),
+        error_rate=error_rate,
+        duration_seconds=20.0,
+        requests_per_second=requests_per_second,
+        latency_ms={"mean": 10.0, "p50": 10.0, "p99": p99},
+        error_status_codes={},
+    )
+
+
+def test_compare_with_baseline_when_results_are_within_thresholds() -> None:
+    # when
+    result = compare_with_baseline(
+        baseline=_report(p99=100.0, requests_per_second=50.0),
+        candidate=_report(p99=109.0, requests_per_second=46.0),
+        max_latency_regression=10.0,
+        max_throughput_regression=10.0,
+    )
+
+    # then
+    assert [c.metric for c in result] == [
+        "latency mean [ms]",
+        "latency p50 [ms]",
+        "latency p99 [ms]",
+        "throughput [rps]",
+        "error rate [%]",
+    ]
+    assert result[2].change == 9.0
+    assert result[3].change == -8.0
+    assert not any(c.is_regression for c in result)
+    ensure_no_regression(comparisons=result)
+
+
+def test_compare_with_baseline_when_tail_latency_regressed() -> None:
+    # given
+    comparisons = compare_with_baseline(
+        baseline=_report(p99=100.0, requests_per_second=50.0),
+        candidate=_report(p99=150.0, requests_per_second=50.0),
+        max_latency_regression=10.0,
+    )
+
+    # when
+    with pytest.raises(RuntimeError) as error:
+        ensure_no_regression(comparisons=comparisons)
+
+    # then
+    assert "latency p99 [ms]" in str(error.value)
+
+
+def test_compare_with_baseline_when_throughput_and_error_rate_regressed() -> None:
+    # when
+    result = compare_with_baseline(
+        baseline=_report(p99=100.0, requests_per_second=50.0),
+        candidate=_report(p99=100.0, requests_per_second=40.0, error_rate=1.5),
+        max_throughput_regression=10.0,
+        max_error_rate_increase=1.0,
+    )
+
+    # then
+    assert [c.metric for c in result if c.is_regression] == [
+        "throughput [rps]",
+        "error rate [%]",
+    ]
+
+
+def test_compare_with_baseline_without_thresholds_never_reports_regression() -> None:
+    # when
+    result = compare_with_baseline(
+        baseline=_report(p99=100.0, requests_per_second=50.0),
+        candidate=_report(p99=1000.0, requests_per_second=1.0, error_rate=90.0),
+    )
+
+    # then
+    assert not any(c.is_regression for c in result)
+
+
+def test_load_load_test_report_from_api_speed_results(empty_directory: str) -> None:
+    # given
+    report = _report(p99=100.0, requests_per_second=50.0)
+    path = os.path.join(empty_directory, "results.json")
+    with open(path, "w") as f:
+        json.dump({"benchmark_results": {}, "load_test": report.to_dict()}, f)
+
+    # when
+    result = load_load_test_report(path=path)
+
+    # then
+    assert result == report
@@ -0,0 +1,185 @@
+import threading
+import time
+
+import pytest
+
+from inference_cli.lib.benchmark.load_generator import (
+    LatencyHistogram,
+    LoadMode,
+    LoadTestReport,
+    get_error_status_code,
+    run_load_test,
+)
+from inference_cli.lib.benchmark.results_gathering import ResultsCollector
+from inference_sdk.http.errors import HTTPCallErrorError
+
+
+def test_latency_histogram_percentiles_are_accurate() -> None:
+    # given
+    histogram = LatencyHistogram()
+
+    # when
+    for value in range(1, 10001):
+        histogram.record(value_ms=value / 10)
+
+    # then
+    assert histogram.count == 10000
+    assert abs(histogram.mean() - 500.05) < 1e-6
+    for percentile, expected in [(50, 500.0), (90, 900.0), (99, 990.0), (99.9, 999.0)]:
+        assert (
+            abs(histogram.percentile(percentile=percentile) - expected) / expected
+            < 0.01
+        ), f"Relative error for p{percentile} must be below 1%"
+    assert histogram.percentile(percentile=100) == 1000.0
+    assert histogram.max() == 1000.0
+
+
+def test_latency_histogram_merge() -> None:
+    # given
+    histogram = LatencyHistogram()
+    histogram.record(value_ms=1.0)
+    other = LatencyHistogram()
+    other.record(value_ms=100.0)
+
+    # when
+    histogram.merge(other)
+
+    # then
+    assert histogram.count == 2
+    assert abs(histogram.percentile(percentile=50) - 1.0) < 0.01
+    assert histogram.percentile(percentile=100) == 100.0
+
+
+def test_latency_histogram_when_empty() -> None:
+    # given
+    histogram = LatencyHistogram()
+
+    # when
+    result = histogram.summary()
+
+    # then
+    assert result == {
+        "mean": 0.0,
+        "p50": 0.0,
+        "p90": 0.0,
+        "p99": 0.0,
+        "p99.9": 0.0,
+        "max": 0.0,
+    }
+
+
+def test_run_load_test_in_closed_loop_mode_respects_concurrency() -> None:
+    # given
+    lock = threading.Lock()
+    in_flight, max_in_flight = [0], [0]
+
+    def request_function() -> None:
+        with lock:
+            in_flight[0] += 1
+            max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+
+    # when
+    report = run_load_test(
+        request_function=request_function,
+        benchmark_requests=20,
+        concurrency=3,
+        warm_up_requests=4,
+    )
+
+    # then
+    assert report.mode is LoadMode.CLOSED_LOOP
+    assert report.concurrency == 3
+    assert report.requests == 20, "Warm-up requests must be excluded from results"
+    assert report.errors == 0
+    assert max_in_flight[0] == 3
+    assert report.latency_ms["p50"] >= 10.0
+    assert sum(p.requests for p in report.time_series) == 20
+
+
+def test_run_load_test_in_open_loop_mode_keeps_arrival_rate_when_server_is_slow() -> (
+    None
+):
+    # given
+    def request_function() -> None:
+        time.sleep(0.2)
+
+    # when
+    start = time.monotonic()
+    report = run_load_test(
+        request_function=request_function,
+        benchmark_requests=20,
+        requests_per_second=100,
+    )
+    duration = time.monotonic() - start
+
+    # then
+    assert report.mode is LoadMode.OPEN_LOOP
+    assert report.requests == 20
+    assert (
+        duration < 1.0
+    ), "Requests must be sent at given rate, without waiting for responses"
+    assert report.latency_ms["p50"] >= 200.0
+
+
+def test_run_load_test_registers_errors() -> None:
+    # given
+    calls = [0]
+    lock = threading.Lock()
+
+    def request_function() -> None:
+        with lock:
+            calls[0] += 1
+            call_number = calls[0]
+        if call_number % 2 == 0:
+            raise HTTPCallErrorError(
+                description="some", status_code=503, api_message=None
+            )
+
+    results_collector = ResultsCollector()
+
+    # when
+    report = run_load_test(
+        request_function=request_function,
+        benchmark_requests=10,
+        results_collector=results_collector,
+    )
+
+    # then
+    assert report.errors == 5
+    assert report.error_rate == 50.0
+    assert report.error_status_codes == {"503": 5}
+    assert results_collector.has_benchmark_finished()
+    assert results_collector.get_statistics().error_rate == 50.0
+
+
+def test_run_load_test_when_invalid_rate_given() -> None:
+    # when
+    with pytest.raises(ValueError):
+        _ = run_load_test(
+            request_function=lambda: None,
+            benchmark_requests=10,
+            requests_per_second=0,
+        )
+
+
+def test_load_test_report_serialisation_roundtrip() -> None:
+    # given
+    report = run_load_test(request_function=lambda: None, benchmark_requests=5)
+
+    # when
+    result = LoadTestReport.from_dict(report.to_dict())
+
+    # then
+    assert result == report
+    assert report.to_dict()["mode"] == "closed_loop"
+
+
+def test_get_error_status_code_when_error_is_not_http_error() -> None:
+    # when
+    result = get_error_status_code(error=ConnectionError())
+
+    # then
+    assert result == "ConnectionError"
@@ -0,0 +1,116 @@
+import json
+import os.path
+
+import numpy as np
+import pytest
+
+from inference_cli.lib.benchmark.baseline import ensure_no_regression
+from inference_cli.lib.benchmark.processing_speed import (
+    PROCESSING_STAGES,
+    ProcessingBenchmarkInputs,
+    StageBenchmarkResult,
+    compare_processing_benchmark_results,
+    load_processing_benchmark_results,
+    measure_peak_allocation,
+    run_processing_speed_benchmark,
+)
+
+SMALL_INPUTS = ProcessingBenchmarkInputs(
+    image_height=120,
+    image_width=160,
+    input_size=64,
+    candidates=200,
+    detections=5,
+    classes=3,
+    mask_prototypes=4,
+)
+
+
+def _result(stage: str, p50: float, peak_allocated_bytes: int):
+    return StageBenchmarkResult(
+        stage=stage,
+        iterations=10,
+        operations_per_second=round(1000 / p50, 2),
+        latency_ms={"mean": p50, "p50": p50, "p99": p50},
+        peak_allocated_bytes=peak_allocated_bytes,
+    )
+
+
+def test_run_processing_speed_benchmark_for_all_stages() -> None:
+    # when
+    result = run_processing_speed_benchmark(
+        inputs=SMALL_INPUTS,
+        iterations=2,
+        warm_up_iterations=1,
+    )
+
+    # then
+    assert [r.stage for r in result] == list(PROCESSING_STAGES.keys())
+    for stage_result in result:
+        assert stage_result.iterations == 2
+        assert stage_result.operations_per_second > 0
+        assert stage_result.latency_ms["p50"] > 0
+        assert stage_result.peak_allocated_bytes >= 0
+
+
+def test_run_processing_speed_benchmark_when_unknown_stage_requested() -> None:
+    # when
+    with pytest.raises(ValueError) as error:
+        _ = run_processing_speed_benchmark(
+            inputs=SMALL_INPUTS,
+            stages=["prepare", "invalid"],
+        )
+
+    # then
+    assert "invalid" in str(error.value)
+
+
+def test_measure_peak_allocation_captures_numpy_allocations() -> None:
+    # when
+    result = measure_peak_allocation(stage_function=lambda: np.ones((1024, 1024)))
+
+    # then
+    assert result >= 1024 * 1024 * 8
+
+
+def test_compare_processing_benchmark_results_when_stage_regressed() -> None:
+    # given
+    comparisons = compare_processing_benchmark_results(
+        baseline=[
+            _result(stage="prepare", p50=10.0, peak_allocated_bytes=1000),
+            _result(stage="masks2poly", p50=10.0, peak_allocated_bytes=1000),
+        ],
+        candidate=[
+            _result(stage="prepare", p50=10.5, peak_allocated_bytes=1000),
+            _result(stage="masks2poly", p50=10.0, peak_allocated_bytes=2000),
+            _result(stage="letterbox_image", p50=1.0, peak_allocated_bytes=10),
+        ],
+        max_latency_regression=10.0,
+        max_allocation_regression=10.0,
+    )
+
+    # when
+    with pytest.raises(RuntimeError) as error:
+        ensure_no_regression(comparisons=comparisons)
+
+    # then
+    assert len(comparisons) == 4, "Stages not present in baseline must be skipped"
+    assert comparisons[0].change == 5.0
+    assert [c.metric for c in comparisons if c.is_regression] == [
+        "masks2poly peak alloc [B]"
+    ]
+    assert "masks2poly peak alloc [B]" in str(error.value)
+
+
+def test_load_processing_benchmark_results(empty_directory: str) -> None:
+    # given
+    results = [_result(stage="prepare", p50=10.0, peak_allocated_bytes=1000)]
+    path = os.path.join(empty_directory, "results.json")
+    with open(path, "w") as f:
+        json.dump({"processing_benchmark": [r.to_dict() for r in results]}, f)
+
+    # when
+    result = load_processing_benchmark_results(path=path)
+
+    # then
+    assert result == results
@@ -1,6 +1,13 @@
+import os.path
+
+import pandas as pd
 import pytest
 
-from inference_cli.lib.benchmark_adapter import ensure_error_rate_is_below_threshold
+from inference_cli.lib.benchmark.load_generator import run_load_test
+from inference_cli.lib.benchmark_adapter import (
+    dump_load_test_report_to_csv,
+    ensure_error_rate_is_below_threshold,
+)
 
 
 def test_ensure_error_rate_is_below_threshold_when_threshold_not_given() -> None:
@@ -28,3 +35,32 @@ def test_ensure_error_rate_is_below_threshold_when_value_above_threshold() -> No
     # when
     with pytest.raises(RuntimeError):
         ensure_error_rate_is_below_threshold(error_rate=30.51, threshold=30.5)
+
+
+def test_dump_load_test_report_to_csv(empty_directory: str) -> None:
+    # given
+    report = run_load_test(
+        request_function=lambda: None,
+        benchmark_requests=5,
+    )
+    path = os.path.join(empty_directory, "nested", "results.csv")
+
+    # when
+    dump_load_test_report_to_csv(path=path, report=report)
+
+    # then
+    result = pd.read_csv(path)
+    assert list(result.columns) == [
+        "elapsed_seconds",
+        "requests",
+        "errors",
+        "requests_per_second",
+        "mean",
+        "p50",
+        "p90",
+        "p99",
+        "p99.9",
+        "max",
+    ]
+    assert result["elapsed_seconds"].tolist()[0] == "total"
+    assert result["requests"].tolist() == [5, 5]
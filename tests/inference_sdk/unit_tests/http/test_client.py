@@ -39,6 +39,7 @@ from inference_sdk.http.errors import (
     ModelTaskTypeNotSupportedError,
     WrongClientModeError,
 )
+from inference_sdk.http.utils import connection_pool
 
 
 def test_ensure_model_is_selected_when_model_is_selected() -> None:
@@ -834,6 +835,30 @@ def test_list_loaded_models_when_successful_response_expected(
     )
 
 
+
+def test_client_reuses_session_between_calls_and_closes_it_on_exit(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    requests_mock.get(f"{api_url}/model/registry", json={"models": []})
+
+    # when
+    with mock.patch.object(
+        connection_pool.requests, "Session", wraps=connection_pool.requests.Session
+    ) as session_mock:
+        with InferenceHTTPClient(api_key="my-api-key", api_url=api_url) as http_client:
+            _ = http_client.list_loaded_models()
+            _ = http_client.list_loaded_models()
+
+    # then
+    assert requests_mock.call_count == 2
+    assert session_mock.call_count == 1, "Session must be created once per client"
+    assert (
+        http_client._InferenceHTTPClient__connection_pool._session is None
+    ), "Session must be closed on exit"
+
+
 @pytest.mark.asyncio
 async def test_list_loaded_models_async_when_successful_response_expected() -> None:
     # given
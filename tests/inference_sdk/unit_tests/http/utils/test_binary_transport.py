@@ -0,0 +1,91 @@
+import base64
+
+import numpy as np
+from requests import Response
+
+from inference_sdk.http.utils.binary_transport import (
+    MSGPACK_CONTENT_TYPE,
+    decode_response,
+    encode_images_as_bytes,
+    msgpack_dumps,
+    msgpack_loads,
+    to_binary_requests_data,
+)
+from inference_sdk.http.utils.request_building import RequestData
+
+
+def test_encode_images_as_bytes_when_nested_batches_given() -> None:
+    # given
+    images = [
+        {"type": "base64", "value": base64.b64encode(b"first").decode()},
+        [{"type": "base64", "value": base64.b64encode(b"second").decode()}],
+        {"type": "url", "value": "https://some.com/image.jpg"},
+    ]
+
+    # when
+    result = encode_images_as_bytes(images=images)
+
+    # then
+    assert result == [
+        {"type": "bytes", "value": b"first"},
+        [{"type": "bytes", "value": b"second"}],
+        {"type": "url", "value": "https://some.com/image.jpg"},
+    ]
+
+
+def test_to_binary_requests_data() -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com/infer/object_detection",
+        request_elements=1,
+        headers={"Content-Type": "application/json"},
+        parameters=None,
+        data=None,
+        payload={
+            "model_id": "some/1",
+            "image": {"type": "base64", "value": base64.b64encode(b"image").decode()},
+        },
+        image_scaling_factors=[None],
+    )
+
+    # when
+    result = to_binary_requests_data(requests_data=[request_data])
+
+    # then
+    assert len(result) == 1
+    assert result[0].payload is None
+    assert result[0].headers == {
+        "Content-Type": MSGPACK_CONTENT_TYPE,
+        "Accept": MSGPACK_CONTENT_TYPE,
+    }
+    assert msgpack_loads(result[0].data) == {
+        "model_id": "some/1",
+        "image": {"type": "bytes", "value": b"image"},
+    }
+
+
+def test_decode_response_when_msgpack_response_received() -> None:
+    # given
+    response = Response()
+    response.headers["content-type"] = MSGPACK_CONTENT_TYPE
+    response._content = msgpack_dumps({"embeddings": np.ones((2, 3), dtype=np.float32)})
+
+    # when
+    result = decode_response(response=response)
+
+    # then
+    assert np.array_equal(result["embeddings"], np.ones((2, 3)))
+    assert result["embeddings"].dtype == np.float32
+
+
+def test_decode_response_when_json_response_received() -> None:
+    # given
+    response = Response()
+    response.headers["content-type"] = "application/json"
+    response._content = b'{"predictions": []}'
+
+    # when
+    result = decode_response(response=response)
+
+    # then
+    assert result == {"predictions": []}
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from inference_sdk.http.errors import InvalidParameterError
+from inference_sdk.http.utils.connection_pool import ConnectionPool
+
+
+def test_connection_pool_when_invalid_number_of_connections_given() -> None:
+    # when
+    with pytest.raises(InvalidParameterError):
+        _ = ConnectionPool(max_connections_per_host=0)
+
+
+def test_connection_pool_session_is_reused_and_pooled() -> None:
+    # given
+    pool = ConnectionPool(max_connections_per_host=4)
+
+    # when
+    session = pool.session
+
+    # then
+    assert pool.session is session, "Session must be shared between calls"
+    adapter = session.get_adapter("http://some.com")
+    assert adapter._pool_maxsize == 4
+    assert session.get_adapter("https://some.com") is adapter
+
+
+def test_connection_pool_executor_is_reused_until_higher_concurrency_requested() -> (
+    None
+):
+    # given
+    pool = ConnectionPool(max_connections_per_host=4)
+
+    # when
+    first_executor = pool.get_executor(min_workers=1)
+    second_executor = pool.get_executor(min_workers=4)
+    third_executor = pool.get_executor(min_workers=8)
+
+    # then
+    assert first_executor is second_executor
+    assert first_executor._max_workers == 4
+    assert third_executor is not first_executor
+    assert third_executor._max_workers == 8
+    assert pool.get_executor(min_workers=2) is third_executor
+    assert (
+        first_executor.submit(lambda: 42).result() == 42
+    ), "Replaced executor must not be shut down, as it may be still in use"
+
+
+def test_connection_pool_close() -> None:
+    # given
+    pool = ConnectionPool()
+    session = pool.session
+    executor = pool.get_executor(min_workers=1)
+
+    # when
+    pool.close()
+
+    # then
+    assert pool.session is not session
+    assert pool.get_executor(min_workers=1) is not executor
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+
+@pytest.mark.asyncio
+async def test_connection_pool_async_connector_is_shared_by_sessions() -> None:
+    # given
+    pool = ConnectionPool(max_connections_per_host=4)
+
+    # when
+    async with pool.async_session() as first_session:
+        pass
+    async with pool.async_session() as second_session:
+        pass
+
+    # then
+    assert first_session.closed and second_session.closed
+    assert first_session.connector is None, "Session must not own the connector"
+    connector = pool.get_async_connector()
+    assert not connector.closed
+    assert connector.limit_per_host == 4
+    await pool.close_async()
+    assert connector.closed
+
+
+def test_connection_pool_async_connector_is_recreated_for_new_event_loop() -> None:
+    # given
+    pool = ConnectionPool()
+
+    async def get_connector():
+        return pool.get_async_connector()
+
+    # when
+    first_connector = asyncio.run(get_connector())
+    second_connector = asyncio.run(get_connector())
+
+    # then
+    assert second_connector is not first_connector
+    assert first_connector.closed, "Connector of finished loop must be closed"
+    assert not second_connector.closed
@@ -1,8 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 from unittest.mock import MagicMock, call
 
 import aiohttp
 import pytest
+import requests
 from aiohttp import ClientConnectionError, ClientResponseError
 from aioresponses import aioresponses
 from requests import HTTPError, Response
@@ -314,6 +316,42 @@ def test_execute_requests_packages_when_api_calls_are_successful(
     ), "All responses should be returned with the same, predefined JSON response"
 
 
+def test_execute_requests_packages_when_session_and_executor_are_shared(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers={"some": "header"},
+        data=None,
+        parameters=None,
+        payload={"some": "value"},
+        image_scaling_factors=[None],
+    )
+    requests_mock.post(url="https://some.com", json={"message": "ok"})
+    session = MagicMock(wraps=requests.Session())
+    executor = ThreadPoolExecutor(max_workers=2)
+
+    # when
+    for _ in range(2):
+        result = execute_requests_packages(
+            requests_data=[request_data] * 3,
+            request_method=RequestMethod.POST,
+            max_concurrent_requests=2,
+            session=session,
+            executor=executor,
+        )
+
+    # then
+    assert [r.json() for r in result] == [{"message": "ok"}] * 3
+    assert session.post.call_count == 6, "All requests must be sent with given session"
+    assert (
+        executor.submit(lambda: "alive").result() == "alive"
+    ), "Shared executor must not be shut down after requests are done"
+    executor.shutdown()
+
+
 @pytest.mark.asyncio
 @pytest.mark.slow
 async def test_make_request_async_when_connection_error_occurs_and_does_not_recover() -> (
@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from inference.core.workflows.core_steps.analytics.path_deviation.frechet import (
+    discrete_frechet_distance,
+    discrete_frechet_last_row,
+    extend_frechet_last_rows,
+)
+
+
+def _reference_frechet_table(
+    path: np.ndarray, reference_path: np.ndarray
+) -> np.ndarray:
+    ca = np.zeros((len(path), len(reference_path)))
+    for i in range(len(path)):
+        for j in range(len(reference_path)):
+            distance = np.linalg.norm(path[i] - reference_path[j])
+            if i == 0 and j == 0:
+                ca[i, j] = distance
+            elif i == 0:
+                ca[i, j] = max(ca[i, j - 1], distance)
+            elif j == 0:
+                ca[i, j] = max(ca[i - 1, j], distance)
+            else:
+                ca[i, j] = max(
+                    min(ca[i - 1, j], ca[i - 1, j - 1], ca[i, j - 1]), distance
+                )
+    return ca
+
+
+@pytest.mark.parametrize(
+    "path_length, reference_path_length", [(1, 1), (1, 5), (7, 1), (9, 4), (4, 9)]
+)
+def test_discrete_frechet_last_row_matches_reference_implementation(
+    path_length: int, reference_path_length: int
+) -> None:
+    # given
+    generator = np.random.default_rng(seed=path_length * 10 + reference_path_length)
+    path = generator.uniform(0, 100, size=(path_length, 2))
+    reference_path = generator.uniform(0, 100, size=(reference_path_length, 2))
+
+    # when
+    result = discrete_frechet_last_row(path=path, reference_path=reference_path)
+
+    # then
+    expected = _reference_frechet_table(path=path, reference_path=reference_path)
+    assert np.allclose(result, expected[-1])
+    assert np.isclose(
+        discrete_frechet_distance(path=path, reference_path=reference_path),
+        expected[-1, -1],
+    )
+
+
+def test_discrete_frechet_distance_when_path_follows_reference_path() -> None:
+    # when
+    result = discrete_frechet_distance(
+        path=np.array([[0, 0], [1, 1], [2, 2]]),
+        reference_path=np.array([[0, 0], [1, 1], [2, 2]]),
+    )
+
+    # then
+    assert result == 0.0
+
+
+def test_extend_frechet_last_rows_matches_computation_from_scratch() -> None:
+    # given
+    generator = np.random.default_rng(seed=42)
+    reference_path = generator.uniform(0, 100, size=(6, 2))
+    paths = [generator.uniform(0, 100, size=(length, 2)) for length in (1, 5, 12)]
+    last_rows = np.full((len(paths) + 1, len(reference_path)), np.nan)
+    for i, path in enumerate(paths):
+        last_rows[i] = discrete_frechet_last_row(
+            path=path, reference_path=reference_path
+        )
+    new_points = generator.uniform(0, 100, size=(len(paths) + 1, 2))
+
+    # when
+    result = extend_frechet_last_rows(
+        last_rows=last_rows,
+        points=new_points,
+        reference_path=reference_path,
+    )
+
+    # then
+    for i, path in enumerate(paths + [np.empty((0, 2))]):
+        expected = _reference_frechet_table(
+            path=np.concatenate([path, new_points[i : i + 1]]),
+            reference_path=reference_path,
+        )
+        assert np.allclose(result[i], expected[-1])
@@ -1,12 +1,18 @@
 import datetime
+from unittest import mock
 
 import numpy as np
 import pytest
 import supervision as sv
 
+from inference.core.workflows.core_steps.analytics.path_deviation import v2
+from inference.core.workflows.core_steps.analytics.path_deviation.frechet import (
+    discrete_frechet_distance,
+)
 from inference.core.workflows.core_steps.analytics.path_deviation.v2 import (
     PathDeviationAnalyticsBlockV2,
 )
+from inference.core.workflows.core_steps.common import tracked_objects_state
 from inference.core.workflows.execution_engine.entities.base import (
     ImageParentMetadata,
     VideoMetadata,
@@ -273,3 +279,142 @@ def test_path_deviation_invalid_reference_path():
             triggering_anchor=sv.Position.CENTER,
             reference_path=reference_path,
         )
+
+
+def test_path_deviation_drops_paths_of_lost_trackers() -> None:
+    # given
+    path_deviation_block = PathDeviationAnalyticsBlockV2()
+
+    def run(tracker_id: int, frame_number: int) -> None:
+        metadata = VideoMetadata(
+            video_identifier="vid_1",
+            frame_number=frame_number,
+            fps=1,
+            frame_timestamp=datetime.datetime.fromtimestamp(1726570875).astimezone(
+                tz=datetime.timezone.utc
+            ),
+            comes_from_video_file=True,
+        )
+        _ = path_deviation_block.run(
+            detections=sv.Detections(
+                xyxy=np.array([[0, 0, 2, 2]]),
+                tracker_id=np.array([tracker_id]),
+            ),
+            image=WorkflowImageData(
+                parent_metadata=ImageParentMetadata(parent_id="some"),
+                numpy_image=np.zeros((192, 168, 3), dtype=np.uint8),
+                video_metadata=metadata,
+            ),
+            triggering_anchor=sv.Position.CENTER,
+            reference_path=[(0, 0), (1, 1)],
+        )
+
+    # when
+    with mock.patch.object(
+        tracked_objects_state, "WORKFLOWS_TRACKED_OBJECTS_STATE_EXPIRY_FRAMES", 2
+    ):
+        run(tracker_id=1, frame_number=0)
+        for frame_number in range(1, 4):
+            run(tracker_id=2, frame_number=frame_number)
+
+    # then
+    assert set(path_deviation_block._object_paths["vid_1"].keys()) == {2}
+    assert len(path_deviation_block._object_paths["vid_1"][2]) == 3
+
+
+def _run_path_deviation_block(
+    block: PathDeviationAnalyticsBlockV2,
+    xyxy: np.ndarray,
+    tracker_id: np.ndarray,
+    frame_number: int,
+    reference_path: list,
+) -> sv.Detections:
+    metadata = VideoMetadata(
+        video_identifier="vid_1",
+        frame_number=frame_number,
+        fps=1,
+        frame_timestamp=datetime.datetime.fromtimestamp(1726570875).astimezone(
+            tz=datetime.timezone.utc
+        ),
+        comes_from_video_file=True,
+    )
+    result = block.run(
+        detections=sv.Detections(xyxy=xyxy, tracker_id=tracker_id),
+        image=WorkflowImageData(
+            parent_metadata=ImageParentMetadata(parent_id="some"),
+            numpy_image=np.zeros((192, 168, 3), dtype=np.uint8),
+            video_metadata=metadata,
+        ),
+        triggering_anchor=sv.Position.CENTER,
+        reference_path=reference_path,
+    )
+    return result["path_deviation_detections"]
+
+
+def test_path_deviation_when_reference_path_changes() -> None:
+    # given
+    path_deviation_block = PathDeviationAnalyticsBlockV2()
+    generator = np.random.default_rng(seed=42)
+    centers = generator.uniform(10, 100, size=(6, 2, 2))
+    first_reference_path = [(0, 0), (50, 50), (100, 100)]
+    second_reference_path = [(100, 0), (0, 100)]
+
+    # when
+    results = []
+    for frame_number in range(6):
+        reference_path = (
+            first_reference_path if frame_number < 3 else second_reference_path
+        )
+        # object 2 only shows up after reference path changes
+        tracker_id = np.array([1, 2]) if frame_number >= 4 else np.array([1])
+        frame_centers = centers[frame_number][: len(tracker_id)]
+        results.append(
+            _run_path_deviation_block(
+                block=path_deviation_block,
+                xyxy=np.concatenate([frame_centers - 1, frame_centers + 1], axis=1),
+                tracker_id=tracker_id,
+                frame_number=frame_number,
+                reference_path=reference_path,
+            )
+        )
+
+    # then
+    for frame_number, result in enumerate(results):
+        reference_path = np.array(
+            first_reference_path if frame_number < 3 else second_reference_path
+        )
+        expected = [
+            discrete_frechet_distance(
+                path=(
+                    centers[4 : frame_number + 1, 1]
+                    if tracker_id == 2
+                    else centers[: frame_number + 1, 0]
+                ),
+                reference_path=reference_path,
+            )
+            for tracker_id in result.tracker_id.tolist()
+        ]
+        assert np.allclose(result["path_deviation"], expected)
+
+
+def test_path_deviation_downsamples_long_paths() -> None:
+    # given
+    path_deviation_block = PathDeviationAnalyticsBlockV2()
+
+    # when
+    with mock.patch.object(v2, "WORKFLOWS_PATH_DEVIATION_MAX_PATH_LENGTH", 4):
+        for frame_number in range(5):
+            result = _run_path_deviation_block(
+                block=path_deviation_block,
+                xyxy=np.array([[frame_number, 0, frame_number + 2, 2]]),
+                tracker_id=np.array([1]),
+                frame_number=frame_number,
+                reference_path=[(1, 1), (5, 1)],
+            )
+
+    # then
+    object_path = path_deviation_block._object_paths["vid_1"][1]
+    assert np.allclose(object_path, [[1, 1], [3, 1], [5, 1]])
+    assert np.allclose(
+        result["path_deviation"], [2.0]
+    ), "Distance must be exact for downsampled path, as it is updated incrementally"
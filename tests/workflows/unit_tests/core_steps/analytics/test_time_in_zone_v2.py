@@ -1,4 +1,5 @@
 import datetime
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -7,6 +8,7 @@ import supervision as sv
 from inference.core.workflows.core_steps.analytics.time_in_zone.v2 import (
     TimeInZoneBlockV2,
 )
+from inference.core.workflows.core_steps.common import tracked_objects_state
 from inference.core.workflows.execution_engine.entities.base import (
     ImageParentMetadata,
     VideoMetadata,
@@ -598,3 +600,56 @@ def _wrap_with_workflow_image(
         numpy_image=image,
         video_metadata=metadata,
     )
+
+
+def test_time_in_zone_state_of_lost_trackers_expires() -> None:
+    # given
+    zone = [[10, 10], [10, 20], [20, 20], [20, 10]]
+    in_zone = sv.Detections(
+        xyxy=np.array([[15, 15, 16, 16]]),
+        tracker_id=np.array([1]),
+    )
+    other_object = sv.Detections(
+        xyxy=np.array([[15, 15, 16, 16]]),
+        tracker_id=np.array([2]),
+    )
+    time_in_zone_block = TimeInZoneBlockV2()
+    image = np.zeros((720, 1280, 3))
+
+    def run(detections: sv.Detections, frame_number: int) -> sv.Detections:
+        metadata = VideoMetadata(
+            video_identifier="vid_1",
+            frame_number=frame_number,
+            fps=1,
+            frame_timestamp=datetime.datetime.fromtimestamp(1726570875).astimezone(
+                tz=datetime.timezone.utc
+            ),
+            comes_from_video_file=True,
+        )
+        return time_in_zone_block.run(
+            image=_wrap_with_workflow_image(image=image, metadata=metadata),
+            detections=detections,
+            zone=zone,
+            triggering_anchor="TOP_LEFT",
+            remove_out_of_zone_detections=True,
+            reset_out_of_zone_detections=False,
+        )["timed_detections"]
+
+    # when
+    with mock.patch.object(
+        tracked_objects_state, "WORKFLOWS_TRACKED_OBJECTS_STATE_EXPIRY_FRAMES", 3
+    ):
+        first_result = run(detections=in_zone, frame_number=1)
+        for frame_number in range(2, 4):
+            _ = run(detections=other_object, frame_number=frame_number)
+        not_expired_result = run(detections=in_zone, frame_number=4)
+        for frame_number in range(5, 10):
+            _ = run(detections=other_object, frame_number=frame_number)
+        expired_result = run(detections=in_zone, frame_number=10)
+
+    # then
+    assert first_result["time_in_zone"].tolist() == [0]
+    assert not_expired_result["time_in_zone"].tolist() == [3]
+    assert expired_result["time_in_zone"].tolist() == [
+        0
+    ], "State of tracker not seen for more than 3 frames should be dropped"
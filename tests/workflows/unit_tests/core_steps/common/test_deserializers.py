@@ -1,5 +1,6 @@
 import base64
 
+import cv2
 import numpy as np
 import pytest
 import supervision as sv
@@ -10,6 +11,7 @@ from inference.core.workflows.core_steps.common.deserializers import (
     deserialize_classification_prediction_kind,
     deserialize_detections_kind,
     deserialize_float_zero_to_one_kind,
+    deserialize_image_kind,
     deserialize_integer_kind,
     deserialize_list_of_values_kind,
     deserialize_numpy_array,
@@ -681,3 +683,21 @@ def test_deserialize_bytes_kind_when_base64_string_given() -> None:
 
     # then
     assert result == b"data"
+
+
+def test_deserialize_image_kind_when_encoded_image_bytes_given() -> None:
+    # given
+    image_bytes = cv2.imencode(".png", np.full((48, 64, 3), 7, dtype=np.uint8))[
+        1
+    ].tobytes()
+
+    # when
+    result = deserialize_image_kind(
+        parameter="image",
+        image={"type": "bytes", "value": image_bytes},
+    )
+
+    # then
+    assert result.numpy_image.shape == (48, 64, 3)
+    assert (result.numpy_image == 7).all()
+    assert result.parent_metadata.parent_id == "image"
@@ -5,9 +5,12 @@ import numpy as np
 import supervision as sv
 
 from inference.core.workflows.core_steps.common.serializers import (
+    masks_to_polygons,
     serialise_image,
     serialise_sv_detections,
+    serialise_sv_detections_columnar,
     serialize_wildcard_kind,
+    serialize_wildcard_kind_with_columnar_detections,
 )
 from inference.core.workflows.execution_engine.entities.base import (
     ImageParentMetadata,
@@ -356,3 +359,122 @@ def test_serialize_wildcard_kind_when_compound_input_is_given() -> None:
     assert (
         recovered_image == np_image
     ).all(), "Recovered image should be equal to input image"
+
+
+def test_serialise_sv_detections_when_detections_are_empty() -> None:
+    # when
+    result = serialise_sv_detections(detections=sv.Detections.empty())
+
+    # then
+    assert result == {"image": {"width": None, "height": None}, "predictions": []}
+
+
+def test_serialise_sv_detections_columnar() -> None:
+    # given
+    detections = sv.Detections(
+        xyxy=np.array([[1, 1, 2, 2], [3, 3, 5, 5]], dtype=np.float64),
+        class_id=np.array([1, 2]),
+        confidence=np.array([0.1, 0.9], dtype=np.float64),
+        mask=np.array(
+            [
+                sv.polygon_to_mask(
+                    np.array([[1, 1], [1, 10], [10, 10], [10, 1]]),
+                    resolution_wh=(15, 15),
+                ),
+                np.zeros((15, 15), dtype=bool),
+            ],
+            dtype=bool,
+        ),
+        data={
+            "class_name": np.array(["cat", "dog"]),
+            "detection_id": np.array(["first", "second"]),
+            "keypoints_xy": np.array(
+                [
+                    np.array([[11, 11]], dtype=np.float64),
+                    np.array([[16, 16], [17, 17]], dtype=np.float64),
+                ],
+                dtype="object",
+            ),
+            "keypoints_class_id": np.array(
+                [np.array([1]), np.array([1, 2])], dtype="object"
+            ),
+            "keypoints_class_name": np.array(
+                [np.array(["nose"]), np.array(["nose", "ear"])], dtype="object"
+            ),
+            "keypoints_confidence": np.array(
+                [np.array([0.1]), np.array([0.2, 0.3])], dtype="object"
+            ),
+            "image_dimensions": np.array([[192, 168], [192, 168]]),
+        },
+    )
+
+    # when
+    result = serialise_sv_detections_columnar(detections=detections)
+
+    # then
+    assert result == {
+        "image": {"width": 168, "height": 192},
+        "format": "columnar",
+        "predictions": {
+            "width": [1.0, 2.0],
+            "height": [1.0, 2.0],
+            "x": [1.5, 4.0],
+            "y": [1.5, 4.0],
+            "confidence": [0.1, 0.9],
+            "class_id": [1, 2],
+            "points": [
+                [[1.0, 1.0], [1.0, 10.0], [10.0, 10.0], [10.0, 1.0]],
+                [],
+            ],
+            "class": ["cat", "dog"],
+            "detection_id": ["first", "second"],
+            "keypoints": {
+                "class_id": [[1], [1, 2]],
+                "class": [["nose"], ["nose", "ear"]],
+                "confidence": [[0.1], [0.2, 0.3]],
+                "x": [[11.0], [16.0, 17.0]],
+                "y": [[11.0], [16.0, 17.0]],
+            },
+        },
+    }
+
+
+def test_masks_to_polygons_gives_the_same_polygons_as_supervision() -> None:
+    # given
+    masks = np.zeros((4, 40, 50), dtype=bool)
+    masks[0, 0:10, 0:10] = True
+    masks[1, 30:40, 45:50] = True
+    masks[2, 5:20, 5:20] = True
+    masks[2, 10:12, 10:12] = False
+    masks[2, 25:35, 30:40] = True
+    masks[3, 17, 17] = True
+
+    # when
+    result = masks_to_polygons(masks=masks)
+
+    # then
+    for mask, polygon in zip(masks[:3], result[:3]):
+        assert np.array_equal(polygon, sv.mask_to_polygons(mask=mask)[0])
+    assert result[3].shape == (0, 2), "Expected single pixel to give no polygon"
+
+
+def test_serialize_wildcard_kind_with_columnar_detections() -> None:
+    # given
+    detections = sv.Detections(
+        xyxy=np.array([[1, 1, 2, 2]], dtype=np.float64),
+        class_id=np.array([1]),
+        confidence=np.array([0.5], dtype=np.float64),
+        data={
+            "class_name": np.array(["cat"]),
+            "detection_id": np.array(["first"]),
+        },
+    )
+
+    # when
+    result = serialize_wildcard_kind_with_columnar_detections(
+        value={"some": [detections]}
+    )
+
+    # then
+    assert result["some"][0]["predictions"]["class"] == ["cat"]
+    assert result["some"][0]["format"] == "columnar"
@@ -0,0 +1,66 @@
+import numpy as np
+
+from inference.core.workflows.core_steps.common.tracked_objects_state import (
+    TrackedObjectsState,
+)
+
+
+def test_register_frame_assigns_rows_to_new_and_known_tracker_ids() -> None:
+    # given
+    state = TrackedObjectsState(fields={"position": (2,)}, max_missing_frames=10)
+    rows, _ = state.register_frame(tracker_ids=np.array([7, 3]))
+    state["position"][rows] = np.array([[7.0, 7.0], [3.0, 3.0]])
+
+    # when
+    rows, expired_ids = state.register_frame(tracker_ids=np.array([5, 3, 7]))
+
+    # then
+    assert state.tracker_ids.tolist() == [3, 5, 7]
+    assert np.isnan(state["position"][rows[0]]).all(), "New objects must be NaN"
+    assert state["position"][rows[1:]].tolist() == [[3.0, 3.0], [7.0, 7.0]]
+    assert expired_ids.tolist() == []
+
+
+def test_register_frame_when_tracker_ids_are_duplicated() -> None:
+    # given
+    state = TrackedObjectsState(fields={"value": ()}, max_missing_frames=10)
+
+    # when
+    rows, _ = state.register_frame(tracker_ids=np.array([1, 1, 2]))
+
+    # then
+    assert len(state) == 2
+    assert rows[0] == rows[1]
+
+
+def test_register_frame_expires_objects_missing_for_too_long() -> None:
+    # given
+    state = TrackedObjectsState(fields={"value": ()}, max_missing_frames=2)
+    rows, _ = state.register_frame(tracker_ids=np.array([1, 2]))
+    state["value"][rows] = np.array([1.0, 2.0])
+
+    # when
+    _, first_expired = state.register_frame(tracker_ids=np.array([2]))
+    _, second_expired = state.register_frame(tracker_ids=np.array([2]))
+    rows, third_expired = state.register_frame(tracker_ids=np.array([2]))
+
+    # then
+    assert first_expired.tolist() == []
+    assert second_expired.tolist() == []
+    assert third_expired.tolist() == [1]
+    assert state.tracker_ids.tolist() == [2]
+    assert state["value"][rows].tolist() == [2.0]
+
+
+def test_register_frame_when_expiry_disabled() -> None:
+    # given
+    state = TrackedObjectsState(fields={"value": ()}, max_missing_frames=0)
+    state.register_frame(tracker_ids=np.array([1]))
+
+    # when
+    for _ in range(100):
+        _, expired_ids = state.register_frame(tracker_ids=np.array([], dtype=int))
+
+    # then
+    assert expired_ids.tolist() == []
+    assert state.tracker_ids.tolist() == [1]
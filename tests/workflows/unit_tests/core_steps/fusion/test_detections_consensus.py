@@ -1,4 +1,6 @@
-from typing import Any
+import math
+from collections import Counter
+from typing import Any, Dict, Generator, List, Optional, Set, Tuple
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -13,21 +15,25 @@ from inference.core.workflows.core_steps.fusion.detections_consensus.v1 import (
     BlockManifest,
     aggregate_field_values,
     agree_on_consensus_for_all_detections_sources,
-    calculate_iou,
+    calculate_matching_iou_matrix,
     check_objects_presence_in_consensus_detections,
     does_not_detect_objects_in_any_source,
-    enumerate_detections,
     filter_predictions,
-    get_average_bounding_box,
-    get_class_of_least_confident_detection,
-    get_class_of_most_confident_detection,
-    get_consensus_for_single_detection,
-    get_detections_from_different_sources_with_max_overlap,
-    get_largest_bounding_box,
-    get_majority_class,
+    get_consensus_detections,
     get_parent_id_of_detections_from_sources,
-    get_smallest_bounding_box,
-    merge_detections,
+)
+from inference.core.workflows.execution_engine.constants import (
+    DETECTION_ID_KEY,
+    IMAGE_DIMENSIONS_KEY,
+    PARENT_COORDINATES_KEY,
+    PARENT_DIMENSIONS_KEY,
+    PARENT_ID_KEY,
+    PREDICTION_TYPE_KEY,
+    ROOT_PARENT_COORDINATES_KEY,
+    ROOT_PARENT_DIMENSIONS_KEY,
+    ROOT_PARENT_ID_KEY,
+    SCALING_RELATIVE_TO_PARENT_KEY,
+    SCALING_RELATIVE_TO_ROOT_PARENT_KEY,
 )
 
 
@@ -2102,3 +2108,373 @@ def test_agree_on_consensus_for_all_detections_sources_when_predictions_from_mul
     )
 
     assert result == ("some_parent", True, {"b": 0.95}, expected_consensus)
+
+
+def _random_detections_from_source(
+    generator: np.random.Generator, source_id: int, size: int, with_masks: bool
+) -> sv.Detections:
+    anchors = generator.integers(0, 3, size=(size, 2)) * 20
+    xyxy = np.concatenate(
+        [anchors, anchors + 15 + generator.integers(0, 5, size=(size, 2))], axis=1
+    ).astype(np.float64)
+    class_id = generator.integers(0, 2, size=size)
+    mask = None
+    if with_masks:
+        mask = generator.uniform(size=(size, 100, 100)) > 0.5
+    return sv.Detections(
+        xyxy=xyxy,
+        mask=mask,
+        class_id=class_id,
+        confidence=generator.uniform(0.3, 1.0, size=size),
+        data={
+            "class_name": np.array(["a", "b"])[class_id],
+            "parent_id": np.array(["some_parent"] * size),
+            "detection_id": np.array([f"{source_id}_{i}" for i in range(size)]),
+            "parent_coordinates": np.tile([[0, 0]], (size, 1)),
+            "parent_dimensions": np.tile([[100, 100]], (size, 1)),
+            "root_parent_id": np.array(["root_x"] * size),
+            "root_parent_coordinates": np.tile([[0, 0]], (size, 1)),
+            "root_parent_dimensions": np.tile([[100, 100]], (size, 1)),
+            "prediction_type": np.array(["instance-segmentation"] * size),
+            "image_dimensions": np.tile([[100, 100]], (size, 1)),
+        },
+    )
+
+
+@pytest.mark.parametrize("with_masks", [False, True])
+@pytest.mark.parametrize("class_aware", [False, True])
+@pytest.mark.parametrize("required_votes", [1, 2, 3])
+@pytest.mark.parametrize(
+    "aggregation_mode",
+    [AggregationMode.AVERAGE, AggregationMode.MAX, AggregationMode.MIN],
+)
+@mock.patch.object(v1, "uuid4")
+def test_get_consensus_detections_matches_consensus_for_single_detections(
+    uuid_mock: MagicMock,
+    aggregation_mode: AggregationMode,
+    required_votes: int,
+    class_aware: bool,
+    with_masks: bool,
+) -> None:
+    # given
+    uuid_mock.return_value = "xxx"
+    generator = np.random.default_rng(seed=required_votes)
+    detections_from_sources = [
+        _random_detections_from_source(
+            generator=generator, source_id=source_id, size=size, with_masks=with_masks
+        )
+        for source_id, size in enumerate([20, 0, 15, 25])
+    ]
+    expected_detections, already_considered = [], set()
+    for source_id, detection in enumerate_detections(
+        detections_from_sources=detections_from_sources
+    ):
+        update, already_considered = get_consensus_for_single_detection(
+            detection=detection,
+            source_id=source_id,
+            detections_from_sources=detections_from_sources,
+            iou_threshold=0.3,
+            class_aware=class_aware,
+            required_votes=required_votes,
+            confidence=0.5,
+            detections_merge_confidence_aggregation=aggregation_mode,
+            detections_merge_coordinates_aggregation=aggregation_mode,
+            detections_already_considered=already_considered,
+        )
+        expected_detections += update
+
+    # when
+    result = get_consensus_detections(
+        detections_from_sources=detections_from_sources,
+        iou_threshold=0.3,
+        class_aware=class_aware,
+        required_votes=required_votes,
+        confidence=0.5,
+        detections_merge_confidence_aggregation=aggregation_mode,
+        detections_merge_coordinates_aggregation=aggregation_mode,
+    )
+
+    # then
+    expected = sv.Detections.merge(expected_detections)
+    assert len(expected) > 0, "Test data must lead to consensus"
+    assert np.allclose(result.xyxy, expected.xyxy)
+    assert np.allclose(result.confidence, expected.confidence)
+    assert np.array_equal(result.class_id, expected.class_id)
+    assert result.mask is None
+    assert result.data.keys() == expected.data.keys()
+    for key in expected.data.keys():
+        assert np.array_equal(result[key], expected[key]), f"Missmatch in {key}"
+
+
+def test_get_consensus_detections_when_no_detections_provided() -> None:
+    # when
+    result = get_consensus_detections(
+        detections_from_sources=[sv.Detections.empty(), sv.Detections.empty()],
+        iou_threshold=0.3,
+        class_aware=True,
+        required_votes=1,
+        confidence=0.0,
+        detections_merge_confidence_aggregation=AggregationMode.AVERAGE,
+        detections_merge_coordinates_aggregation=AggregationMode.AVERAGE,
+    )
+
+    # then
+    assert result == sv.Detections.empty()
+
+
+def test_calculate_matching_iou_matrix() -> None:
+    # given
+    detections_from_sources = [
+        sv.Detections(
+            xyxy=np.array([[0, 0, 10, 10], [0, 0, 10, 10]], dtype=np.float64),
+            data={"class_name": np.array(["a", "b"])},
+        ),
+        sv.Detections(
+            xyxy=np.array([[0, 0, 10, 5], [0, 0, 0, 0]], dtype=np.float64),
+            data={"class_name": np.array(["a", "a"])},
+        ),
+    ]
+
+    # when
+    result = calculate_matching_iou_matrix(
+        detections_from_sources=detections_from_sources,
+        iou_threshold=0.3,
+        class_aware=True,
+    )
+
+    # then
+    assert np.allclose(
+        result,
+        [
+            [0.0, 0.0, 0.5, 0.0],
+            [0.0, 0.0, 0.0, 0.0],
+            [0.5, 0.0, 0.0, 0.0],
+            [0.0, 0.0, 0.0, 0.0],
+        ],
+    )
+
+
+# Reference implementation of consensus - detections are visited and merged one by one,
+# results of `get_consensus_detections(...)` are checked against it.
+
+
+def get_detections_from_different_sources_with_max_overlap(
+    detection: sv.Detections,
+    source: int,
+    detections_from_sources: List[sv.Detections],
+    iou_threshold: float,
+    class_aware: bool,
+    detections_already_considered: Set[str],
+) -> Dict[int, Tuple[sv.Detections, float]]:
+    current_max_overlap = {}
+    for other_source, other_detection in enumerate_detections(
+        detections_from_sources=detections_from_sources,
+        excluded_source_id=source,
+    ):
+        if other_detection[DETECTION_ID_KEY][0] in detections_already_considered:
+            continue
+        if (
+            class_aware
+            and detection["class_name"][0] != other_detection["class_name"][0]
+        ):
+            continue
+        iou_value = calculate_iou(
+            detection_a=detection,
+            detection_b=other_detection,
+        )
+        if iou_value <= iou_threshold:
+            continue
+        if current_max_overlap.get(other_source) is None:
+            current_max_overlap[other_source] = (other_detection, iou_value)
+        if current_max_overlap[other_source][1] < iou_value:
+            current_max_overlap[other_source] = (other_detection, iou_value)
+    return current_max_overlap
+
+
+def enumerate_detections(
+    detections_from_sources: List[sv.Detections],
+    excluded_source_id: Optional[int] = None,
+) -> Generator[Tuple[int, sv.Detections], None, None]:
+    for source_id, detections in enumerate(detections_from_sources):
+        if excluded_source_id == source_id:
+            continue
+        for i in range(len(detections)):
+            yield source_id, detections[i]
+
+
+def calculate_iou(detection_a: sv.Detections, detection_b: sv.Detections) -> float:
+    iou = float(sv.box_iou_batch(detection_a.xyxy, detection_b.xyxy)[0][0])
+    if math.isnan(iou):
+        iou = 0
+    return iou
+
+
+def get_consensus_for_single_detection(
+    detection: sv.Detections,
+    source_id: int,
+    detections_from_sources: List[sv.Detections],
+    iou_threshold: float,
+    class_aware: bool,
+    required_votes: int,
+    confidence: float,
+    detections_merge_confidence_aggregation: AggregationMode,
+    detections_merge_coordinates_aggregation: AggregationMode,
+    detections_already_considered: Set[str],
+) -> Tuple[List[sv.Detections], Set[str]]:
+    if detection and detection["detection_id"][0] in detections_already_considered:
+        return [], detections_already_considered
+    consensus_detections = []
+    detections_with_max_overlap = (
+        get_detections_from_different_sources_with_max_overlap(
+            detection=detection,
+            source=source_id,
+            detections_from_sources=detections_from_sources,
+            iou_threshold=iou_threshold,
+            class_aware=class_aware,
+            detections_already_considered=detections_already_considered,
+        )
+    )
+
+    if len(detections_with_max_overlap) < (required_votes - 1):
+        # Returning empty sv.Detections
+        return consensus_detections, detections_already_considered
+    detections_to_merge = sv.Detections.merge(
+        [detection]
+        + [matched_value[0] for matched_value in detections_with_max_overlap.values()]
+    )
+    merged_detection = merge_detections(
+        detections=detections_to_merge,
+        confidence_aggregation_mode=detections_merge_confidence_aggregation,
+        boxes_aggregation_mode=detections_merge_coordinates_aggregation,
+    )
+    if merged_detection.confidence[0] < confidence:
+        # Returning empty sv.Detections
+        return consensus_detections, detections_already_considered
+    consensus_detections.append(merged_detection)
+    detections_already_considered.add(detection[DETECTION_ID_KEY][0])
+    for matched_value in detections_with_max_overlap.values():
+        detections_already_considered.add(matched_value[0][DETECTION_ID_KEY][0])
+    return consensus_detections, detections_already_considered
+
+
+def merge_detections(
+    detections: sv.Detections,
+    confidence_aggregation_mode: AggregationMode,
+    boxes_aggregation_mode: AggregationMode,
+) -> sv.Detections:
+    class_name, class_id = AGGREGATION_MODE2CLASS_SELECTOR[confidence_aggregation_mode](
+        detections
+    )
+    x1, y1, x2, y2 = AGGREGATION_MODE2BOXES_AGGREGATOR[boxes_aggregation_mode](
+        detections
+    )
+    data = {
+        "class_name": np.array([class_name]),
+        PARENT_ID_KEY: np.array([detections[PARENT_ID_KEY][0]]),
+        DETECTION_ID_KEY: np.array([str(v1.uuid4())]),
+        PREDICTION_TYPE_KEY: np.array(["object-detection"]),
+        PARENT_COORDINATES_KEY: np.array([detections[PARENT_COORDINATES_KEY][0]]),
+        PARENT_DIMENSIONS_KEY: np.array([detections[PARENT_DIMENSIONS_KEY][0]]),
+        ROOT_PARENT_ID_KEY: np.array([detections[ROOT_PARENT_ID_KEY][0]]),
+        ROOT_PARENT_COORDINATES_KEY: np.array(
+            [detections[ROOT_PARENT_COORDINATES_KEY][0]]
+        ),
+        ROOT_PARENT_DIMENSIONS_KEY: np.array(
+            [detections[ROOT_PARENT_DIMENSIONS_KEY][0]]
+        ),
+        IMAGE_DIMENSIONS_KEY: np.array([detections[IMAGE_DIMENSIONS_KEY][0]]),
+    }
+    if SCALING_RELATIVE_TO_PARENT_KEY in detections.data:
+        data[SCALING_RELATIVE_TO_PARENT_KEY] = np.array(
+            [detections[SCALING_RELATIVE_TO_PARENT_KEY][0]]
+        )
+    else:
+        data[SCALING_RELATIVE_TO_PARENT_KEY] = np.array([1.0])
+    if SCALING_RELATIVE_TO_ROOT_PARENT_KEY in detections.data:
+        data[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] = np.array(
+            [detections[SCALING_RELATIVE_TO_ROOT_PARENT_KEY][0]]
+        )
+    else:
+        data[SCALING_RELATIVE_TO_ROOT_PARENT_KEY] = np.array([1.0])
+    return sv.Detections(
+        xyxy=np.array([[x1, y1, x2, y2]], dtype=np.float64),
+        class_id=np.array([class_id]),
+        confidence=np.array(
+            [
+                aggregate_field_values(
+                    detections=detections,
+                    field="confidence",
+                    aggregation_mode=confidence_aggregation_mode,
+                )
+            ],
+            dtype=np.float64,
+        ),
+        data=data,
+    )
+
+
+def get_majority_class(detections: sv.Detections) -> Tuple[str, int]:
+    class_counts = Counter(
+        [
+            (str(class_name), int(class_id))
+            for class_name, class_id in zip(
+                detections["class_name"], detections.class_id
+            )
+        ]
+    )
+    return class_counts.most_common(1)[0][0]
+
+
+def get_class_of_most_confident_detection(detections: sv.Detections) -> Tuple[str, int]:
+    confidences: List[float] = detections.confidence.astype(float).tolist()
+    max_confidence_index = confidences.index(max(confidences))
+    max_confidence_detection = detections[max_confidence_index]
+    return (
+        max_confidence_detection["class_name"][0],
+        max_confidence_detection.class_id[0],
+    )
+
+
+def get_class_of_least_confident_detection(
+    detections: sv.Detections,
+) -> Tuple[str, int]:
+    confidences: List[float] = detections.confidence.astype(float).tolist()
+    min_confidence_index = confidences.index(min(confidences))
+    min_confidence_detection = detections[min_confidence_index]
+    return (
+        min_confidence_detection["class_name"][0],
+        min_confidence_detection.class_id[0],
+    )
+
+
+AGGREGATION_MODE2CLASS_SELECTOR = {
+    AggregationMode.MAX: get_class_of_most_confident_detection,
+    AggregationMode.MIN: get_class_of_least_confident_detection,
+    AggregationMode.AVERAGE: get_majority_class,
+}
+
+
+def get_average_bounding_box(detections: sv.Detections) -> Tuple[int, int, int, int]:
+    avg_xyxy: np.ndarray = sum(detections.xyxy) / len(detections)
+    return tuple(avg_xyxy.astype(float))
+
+
+def get_smallest_bounding_box(detections: sv.Detections) -> Tuple[int, int, int, int]:
+    areas: List[float] = detections.area.astype(float).tolist()
+    min_area = min(areas)
+    min_area_index = areas.index(min_area)
+    return tuple(detections[min_area_index].xyxy[0])
+
+
+def get_largest_bounding_box(detections: sv.Detections) -> Tuple[int, int, int, int]:
+    areas: List[float] = detections.area.astype(float).tolist()
+    max_area = max(areas)
+    max_area_index = areas.index(max_area)
+    return tuple(detections[max_area_index].xyxy[0])
+
+
+AGGREGATION_MODE2BOXES_AGGREGATOR = {
+    AggregationMode.MAX: get_largest_bounding_box,
+    AggregationMode.MIN: get_smallest_bounding_box,
+    AggregationMode.AVERAGE: get_average_bounding_box,
+}
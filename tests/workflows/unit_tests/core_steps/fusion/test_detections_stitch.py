@@ -1,9 +1,24 @@
-from typing import Union
+from copy import deepcopy
+from typing import Tuple, Union
 
+import numpy as np
 import pytest
+import supervision as sv
+from supervision import move_boxes, move_masks
 
 from inference.core.workflows.core_steps.fusion.detections_stitch.v1 import (
     BlockManifest,
+    manage_crops_metadata,
+    retrieve_crop_offset,
+    retrieve_crop_wh,
+    stitch_crops_detections,
+)
+from inference.core.workflows.execution_engine.constants import (
+    PARENT_COORDINATES_KEY,
+    PARENT_DIMENSIONS_KEY,
+    PARENT_ID_KEY,
+    ROOT_PARENT_COORDINATES_KEY,
+    SCALING_RELATIVE_TO_PARENT_KEY,
 )
 
 
@@ -55,3 +70,147 @@ def test_detections_stitch_v1_manifest_parsing_when_overlap_mode_invalid() -> No
     # when
     with pytest.raises(ValueError):
         _ = BlockManifest.model_validate(raw_manifest)
+
+
+def _crop_detections(
+    offset: Tuple[int, int], crop_wh: Tuple[int, int], size: int, with_masks: bool
+) -> sv.Detections:
+    generator = np.random.default_rng(seed=offset[0] + offset[1] + size)
+    anchors = generator.integers(0, min(crop_wh) // 2, size=(size, 2))
+    mask = None
+    if with_masks:
+        mask = np.zeros((size, crop_wh[1], crop_wh[0]), dtype=bool)
+        for i, (x, y) in enumerate(anchors):
+            mask[i, y : y + 10, x : x + 10] = True
+    return sv.Detections(
+        xyxy=np.concatenate([anchors, anchors + 10], axis=1).astype(np.float64),
+        mask=mask,
+        confidence=generator.uniform(size=size),
+        class_id=np.zeros(size, dtype=int),
+        data={
+            "class_name": np.array(["a"] * size),
+            PARENT_ID_KEY: np.array([f"crop_{offset}"] * size),
+            PARENT_COORDINATES_KEY: np.array([offset] * size),
+            PARENT_DIMENSIONS_KEY: np.array([[100, 200]] * size),
+            ROOT_PARENT_COORDINATES_KEY: np.array([offset] * size),
+        },
+    )
+
+
+def _move_detections(
+    detections: sv.Detections,
+    offset: np.ndarray,
+    resolution_wh: Tuple[int, int],
+) -> sv.Detections:
+    # reference implementation - moving detections of each crop separately
+    if len(detections) == 0:
+        return detections
+    detections.xyxy = move_boxes(xyxy=detections.xyxy, offset=offset)
+    if detections.mask is not None:
+        detections.mask = move_masks(
+            masks=detections.mask, offset=offset, resolution_wh=resolution_wh
+        )
+    return detections
+
+
+@pytest.mark.parametrize("with_masks", [False, True])
+def test_stitch_crops_detections_matches_moving_each_crop(with_masks: bool) -> None:
+    # given
+    crops_detections = [
+        _crop_detections(
+            offset=(0, 0), crop_wh=(60, 50), size=3, with_masks=with_masks
+        ),
+        sv.Detections.empty(),
+        _crop_detections(
+            offset=(120, 40), crop_wh=(80, 60), size=4, with_masks=with_masks
+        ),
+        _crop_detections(
+            offset=(30, 20), crop_wh=(60, 50), size=2, with_masks=with_masks
+        ),
+    ]
+    expected = []
+    for detections in crops_detections:
+        detections = deepcopy(detections)
+        offset = retrieve_crop_offset(detections=detections)
+        detections = manage_crops_metadata(
+            detections=detections, offset=offset, parent_id="parent"
+        )
+        expected.append(
+            _move_detections(
+                detections=detections,
+                offset=offset,
+                resolution_wh=retrieve_crop_wh(detections=detections),
+            )
+        )
+    expected = sv.Detections.merge(expected)
+
+    # when
+    result = stitch_crops_detections(
+        crops_detections=crops_detections, parent_id="parent"
+    )
+
+    # then
+    assert result == expected
+    assert crops_detections[0][PARENT_ID_KEY][0] == "crop_(0, 0)"
+    assert np.array_equal(
+        crops_detections[2][PARENT_COORDINATES_KEY][0], [120, 40]
+    ), "Crops detections must not be modified"
+
+
+def test_stitch_crops_detections_when_no_detections_given() -> None:
+    # when
+    result = stitch_crops_detections(
+        crops_detections=[sv.Detections.empty()], parent_id="parent"
+    )
+
+    # then
+    assert result == sv.Detections.empty()
+
+
+def test_stitch_crops_detections_when_crops_were_scaled() -> None:
+    # given
+    detections = _crop_detections(
+        offset=(0, 0), crop_wh=(60, 50), size=3, with_masks=False
+    )
+    detections[SCALING_RELATIVE_TO_PARENT_KEY] = np.array([1.0, 1.0, 0.5])
+
+    # when
+    with pytest.raises(ValueError):
+        _ = stitch_crops_detections(crops_detections=[detections], parent_id="parent")
+
+
+def test_stitch_crops_detections_when_crop_reaches_beyond_parent_image() -> None:
+    # given
+    crop_detections = _crop_detections(
+        offset=(150, 80), crop_wh=(80, 60), size=2, with_masks=True
+    )
+    crop_detections.mask[:] = True
+
+    # when
+    result = stitch_crops_detections(
+        crops_detections=[crop_detections], parent_id="parent"
+    )
+
+    # then
+    expected_masks = np.zeros((2, 100, 200), dtype=bool)
+    expected_masks[:, 80:, 150:] = True
+    assert np.array_equal(result.mask, expected_masks)
+    assert np.array_equal(result.xyxy, crop_detections.xyxy + [150, 80, 150, 80])
+
+
+def test_stitch_crops_detections_when_crops_of_different_images_given() -> None:
+    # given
+    first_crop_detections = _crop_detections(
+        offset=(0, 0), crop_wh=(60, 50), size=2, with_masks=True
+    )
+    second_crop_detections = _crop_detections(
+        offset=(30, 20), crop_wh=(60, 50), size=2, with_masks=True
+    )
+    second_crop_detections[PARENT_DIMENSIONS_KEY] = np.array([[300, 400]] * 2)
+
+    # when
+    with pytest.raises(ValueError):
+        _ = stitch_crops_detections(
+            crops_detections=[first_crop_detections, second_crop_detections],
+            parent_id="parent",
+        )
@@ -1,5 +1,6 @@
 import base64
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest import mock
 from unittest.mock import MagicMock
@@ -8,6 +9,9 @@ import cv2
 import numpy as np
 import pytest
 
+from inference.core.utils.image_representations import (
+    get_attached_representations_cache,
+)
 from inference.core.workflows.execution_engine.entities import base
 from inference.core.workflows.execution_engine.entities.base import (
     Batch,
@@ -951,3 +955,104 @@ def test_workflow_image_build_create_crop_with_video_metadata_preservation() ->
         result.video_metadata.video_identifier == "video_id | crop: my_crop"
     ), "Expected preserved metadata with updated id"
     assert result.video_metadata.fps == 40, "Expected preserved metadata"
+
+
+def test_workflow_image_decodes_base64_image_once_when_accessed_concurrently() -> None:
+    # given
+    np_image = np.zeros((192, 168, 3), dtype=np.uint8)
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        base64_image=base64.b64encode(cv2.imencode(".jpg", np_image)[1]).decode(
+            "ascii"
+        ),
+    )
+
+    # when
+    with mock.patch.object(
+        base,
+        "attempt_loading_image_from_string",
+        wraps=base.attempt_loading_image_from_string,
+    ) as decoding_mock, ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: image.numpy_image, range(8)))
+
+    # then
+    assert decoding_mock.call_count == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_workflow_image_jpeg_bytes_are_memoised_per_quality() -> None:
+    # given
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((192, 168, 3), dtype=np.uint8),
+    )
+
+    # when
+    first = image.jpeg_bytes(jpeg_quality=80)
+    second = image.jpeg_bytes(jpeg_quality=80)
+    third = image.jpeg_bytes(jpeg_quality=95)
+
+    # then
+    assert first is second
+    assert third is not first
+    assert base64.b64decode(image.base64_image) == third
+
+
+def test_workflow_image_get_or_compute_representation() -> None:
+    # given
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((192, 168, 3), dtype=np.uint8),
+    )
+    compute = MagicMock(return_value=np.zeros((32, 32, 3), dtype=np.uint8))
+
+    # when
+    first = image.get_or_compute_representation(key=("resize", 32, 32), compute=compute)
+    second = image.get_or_compute_representation(
+        key=("resize", 32, 32), compute=compute
+    )
+
+    # then
+    assert first is second
+    compute.assert_called_once()
+
+
+def test_workflow_image_representations_are_preserved_when_only_metadata_replaced() -> (
+    None
+):
+    # given
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((192, 168, 3), dtype=np.uint8),
+    )
+    jpeg_bytes = image.jpeg_bytes(jpeg_quality=80)
+
+    # when
+    with_new_metadata = WorkflowImageData.copy_and_replace(
+        origin_image_data=image,
+        parent_metadata=ImageParentMetadata(parent_id="other"),
+    )
+    with_new_pixels = WorkflowImageData.copy_and_replace(
+        origin_image_data=image,
+        numpy_image=np.ones((192, 168, 3), dtype=np.uint8),
+    )
+
+    # then
+    assert with_new_metadata.jpeg_bytes(jpeg_quality=80) is jpeg_bytes
+    assert with_new_pixels.jpeg_bytes(jpeg_quality=80) is not jpeg_bytes
+
+
+def test_workflow_image_data_to_inference_format_exposes_representations_to_models() -> (
+    None
+):
+    # given
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((192, 168, 3), dtype=np.uint8),
+    )
+
+    # when
+    result = image.to_inference_format(numpy_preferred=True)
+
+    # then
+    assert get_attached_representations_cache(image=result["value"]) is not None
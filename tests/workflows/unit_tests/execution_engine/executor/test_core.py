@@ -0,0 +1,87 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from unittest import mock
+from unittest.mock import MagicMock
+
+import networkx as nx
+import pytest
+
+from inference.core.workflows.errors import StepExecutionError
+from inference.core.workflows.execution_engine.v1.executor import core
+from inference.core.workflows.execution_engine.v1.executor.core import execute_steps
+from inference.core.workflows.execution_engine.v1.executor.flow_coordinator import (
+    ReadyQueueStepExecutionCoordinator,
+)
+
+
+def _build_coordinator() -> ReadyQueueStepExecutionCoordinator:
+    steps_flow_graph = nx.DiGraph()
+    steps_flow_graph.add_nodes_from(["slow", "fast_1", "fast_2", "join"])
+    steps_flow_graph.add_edge("fast_1", "fast_2")
+    steps_flow_graph.add_edge("slow", "join")
+    steps_flow_graph.add_edge("fast_2", "join")
+    return ReadyQueueStepExecutionCoordinator(steps_flow_graph=steps_flow_graph)
+
+
+@mock.patch.object(core, "safe_execute_step")
+def test_execute_steps_starts_steps_as_soon_as_dependencies_are_finished(
+    safe_execute_step_mock: MagicMock,
+) -> None:
+    # given
+    events, lock = [], Lock()
+
+    def execute_step(step_selector: str, **kwargs) -> None:
+        if step_selector == "slow":
+            time.sleep(0.2)
+        with lock:
+            events.append(step_selector)
+
+    safe_execute_step_mock.side_effect = execute_step
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        execute_steps(
+            execution_coordinator=_build_coordinator(),
+            workflow=MagicMock(),
+            execution_data_manager=MagicMock(),
+            max_concurrent_steps=2,
+            executor=executor,
+        )
+
+    # then
+    assert events == ["fast_1", "fast_2", "slow", "join"]
+
+
+@mock.patch.object(core, "safe_execute_step")
+def test_execute_steps_when_step_fails(
+    safe_execute_step_mock: MagicMock,
+) -> None:
+    # given
+    def execute_step(step_selector: str, **kwargs) -> None:
+        if step_selector == "fast_2":
+            raise StepExecutionError(
+                block_id="fast_2",
+                block_type="some",
+                public_message="some",
+                context="workflow_execution | step_execution",
+            )
+
+    safe_execute_step_mock.side_effect = execute_step
+
+    # when
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        with pytest.raises(StepExecutionError):
+            execute_steps(
+                execution_coordinator=_build_coordinator(),
+                workflow=MagicMock(),
+                execution_data_manager=MagicMock(),
+                max_concurrent_steps=2,
+                executor=executor,
+            )
+
+    # then
+    executed_steps = [
+        call.kwargs["step_selector"] for call in safe_execute_step_mock.call_args_list
+    ]
+    assert "join" not in executed_steps
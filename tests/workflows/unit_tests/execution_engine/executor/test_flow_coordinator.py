@@ -1,3 +1,4 @@
+from typing import Set
 from unittest.mock import MagicMock
 
 import networkx as nx
@@ -9,11 +10,11 @@ from inference.core.workflows.execution_engine.v1.compiler.entities import (
     StepNode,
 )
 from inference.core.workflows.execution_engine.v1.executor.flow_coordinator import (
-    ParallelStepExecutionCoordinator,
+    ReadyQueueStepExecutionCoordinator,
 )
 
 
-def test_parallel_flow_coordinator_when_there_is_simple_execution_path() -> None:
+def test_ready_queue_flow_coordinator_when_there_is_simple_execution_path() -> None:
     # given
     graph = nx.DiGraph()
     graph.add_node("input_1", node_compilation_output=assembly_dummy_input("input_1"))
@@ -27,18 +28,18 @@ def test_parallel_flow_coordinator_when_there_is_simple_execution_path() -> None
     graph.add_edge("step_2", "output_1")
 
     # when
-    coordinator = ParallelStepExecutionCoordinator.init(execution_graph=graph)
+    coordinator = ReadyQueueStepExecutionCoordinator.init(execution_graph=graph)
 
     # then
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {"step_1"}, "At first step_1 must be executed"
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {"step_2"}, "As second - step_2 should be executed"
-    result = coordinator.get_steps_to_execute_next()
-    assert result is None, "Execution path should end up to this point"
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == {"step_1"}, "At first step_1 must be executed"
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == {"step_2"}, "As second - step_2 should be executed"
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == set(), "Execution path should end up to this point"
 
 
-def test_parallel_flow_coordinator_when_there_is_ensemble_of_models() -> None:
+def test_ready_queue_flow_coordinator_when_there_is_ensemble_of_models() -> None:
     # given
     graph = nx.DiGraph()
     graph.add_node("input_1", node_compilation_output=assembly_dummy_input("input_1"))
@@ -55,21 +56,21 @@ def test_parallel_flow_coordinator_when_there_is_ensemble_of_models() -> None:
     graph.add_edge("step_3", "output_1")
 
     # when
-    coordinator = ParallelStepExecutionCoordinator.init(execution_graph=graph)
+    coordinator = ReadyQueueStepExecutionCoordinator.init(execution_graph=graph)
 
     # then
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == {
         "step_1",
         "step_2",
     }, "As first two steps - step_1 and step_2 must be taken in any order"
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {"step_3"}, "As third - step_3 should be executed"
-    result = coordinator.get_steps_to_execute_next()
-    assert result is None, "Execution path should end up to this point"
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == {"step_3"}, "As third - step_3 should be executed"
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == set(), "Execution path should end up to this point"
 
 
-def test_parallel_flow_coordinator_when_there_is_condition_step() -> None:
+def test_ready_queue_flow_coordinator_when_there_is_condition_step() -> None:
     # given
     graph = nx.DiGraph()
     graph.add_node("input_1", node_compilation_output=assembly_dummy_input("input_1"))
@@ -93,26 +94,26 @@ def test_parallel_flow_coordinator_when_there_is_condition_step() -> None:
     graph.add_edge("step_4", "output_2")
 
     # when
-    coordinator = ParallelStepExecutionCoordinator.init(execution_graph=graph)
+    coordinator = ReadyQueueStepExecutionCoordinator.init(execution_graph=graph)
 
     # then
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {"step_1"}, "Step_1 should be executed at first"
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == {"step_1"}, "Step_1 should be executed at first"
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == {
         "step_2",
         "step_3",
     }, "As third - step_2, step_3 should be suggested to be executed, as this is the branching start"
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == {
         "step_4",
         "step_5",
     }, "step_4 is the only successor of step_3 and step_5 is the successor of step_2 - both should be suggested"
-    result = coordinator.get_steps_to_execute_next()
-    assert result is None, "Execution path should end up to this point"
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == set(), "Execution path should end up to this point"
 
 
-def test_parallel_flow_coordinator_when_there_are_two_parallel_execution_paths() -> (
+def test_ready_queue_flow_coordinator_when_there_are_two_parallel_execution_paths() -> (
     None
 ):
     # given
@@ -136,21 +137,69 @@ def test_parallel_flow_coordinator_when_there_are_two_parallel_execution_paths()
     graph.add_edge("step_4", "output_2")
 
     # when
-    coordinator = ParallelStepExecutionCoordinator.init(execution_graph=graph)
+    coordinator = ReadyQueueStepExecutionCoordinator.init(execution_graph=graph)
 
     # then
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == {
         "step_1",
         "step_3",
     }, "As first, two steps - step_1 and step_3 must be taken in any order"
-    result = coordinator.get_steps_to_execute_next()
-    assert set(result) == {
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == {
         "step_2",
         "step_4",
     }, "As second, two steps - step_2 and step_4 must be taken in any order"
-    result = coordinator.get_steps_to_execute_next()
-    assert result is None, "Execution path should end up to this point"
+    result = take_all_ready_steps(coordinator=coordinator)
+    assert result == set(), "Execution path should end up to this point"
+
+
+def test_ready_queue_flow_coordinator_does_not_wait_for_independent_branches() -> None:
+    # given
+    graph = nx.DiGraph()
+    graph.add_node("input_1", node_compilation_output=assembly_dummy_input("input_1"))
+    for step in ["slow", "fast_1", "fast_2", "join"]:
+        graph.add_node(step, node_compilation_output=assembly_dummy_step(step))
+    graph.add_node(
+        "output_1", node_compilation_output=assembly_dummy_output("output_1")
+    )
+    graph.add_edge("input_1", "slow")
+    graph.add_edge("input_1", "fast_1")
+    graph.add_edge("fast_1", "fast_2")
+    graph.add_edge("slow", "join")
+    graph.add_edge("fast_2", "join")
+    graph.add_edge("join", "output_1")
+    coordinator = ReadyQueueStepExecutionCoordinator.init(execution_graph=graph)
+
+    # when
+    first = coordinator.get_next_ready_step()
+    second = coordinator.get_next_ready_step()
+    nothing_ready = coordinator.get_next_ready_step()
+    coordinator.register_step_completion(step_selector="fast_1")
+    third = coordinator.get_next_ready_step()
+    coordinator.register_step_completion(step_selector="fast_2")
+    join_not_ready = coordinator.get_next_ready_step()
+    coordinator.register_step_completion(step_selector="slow")
+    fourth = coordinator.get_next_ready_step()
+    coordinator.register_step_completion(step_selector="join")
+
+    # then
+    assert first == "fast_1", "Step on the longest path to the end must go first"
+    assert second == "slow"
+    assert nothing_ready is None
+    assert third == "fast_2", "fast_2 must not wait for slow step"
+    assert join_not_ready is None, "join step must wait for all of its predecessors"
+    assert fourth == "join"
+    assert coordinator.is_finished() is True
+
+
+def take_all_ready_steps(coordinator: ReadyQueueStepExecutionCoordinator) -> Set[str]:
+    ready_steps = set()
+    while (step := coordinator.get_next_ready_step()) is not None:
+        ready_steps.add(step)
+    for step in ready_steps:
+        coordinator.register_step_completion(step_selector=step)
+    return ready_steps
 
 
 def assembly_dummy_input(name: str) -> InputNode:
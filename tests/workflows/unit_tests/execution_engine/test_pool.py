@@ -0,0 +1,230 @@
+from copy import deepcopy
+from unittest import mock
+from unittest.mock import MagicMock
+
+import pytest
+
+from inference.core.workflows.execution_engine import pool
+from inference.core.workflows.execution_engine.pool import (
+    ExecutionEnginePool,
+    RequestScopedParameter,
+)
+
+WORKFLOW_DEFINITION = {
+    "version": "1.0",
+    "inputs": [{"type": "WorkflowParameter", "name": "value"}],
+    "steps": [
+        {
+            "type": "roboflow_core/first_non_empty_or_default@v1",
+            "name": "first",
+            "data": ["$inputs.value"],
+            "default": "default",
+        }
+    ],
+    "outputs": [
+        {"type": "JsonField", "name": "result", "selector": "$steps.first.output"}
+    ],
+}
+
+
+def test_request_scoped_parameter_when_value_not_bound() -> None:
+    # given
+    parameter = RequestScopedParameter()
+
+    # then
+    assert not parameter
+
+
+def test_request_scoped_parameter_when_value_bound() -> None:
+    # given
+    parameter = RequestScopedParameter()
+    value = MagicMock()
+
+    # when
+    parameter.bind(value)
+    parameter.add_task("some")
+
+    # then
+    assert parameter
+    value.add_task.assert_called_once_with("some")
+
+
+def test_execution_engine_pool_reuses_engine_for_the_same_workflow() -> None:
+    # given
+    engines_pool = ExecutionEnginePool(max_size=4)
+
+    # when
+    with engines_pool.lease(
+        workflow_definition=WORKFLOW_DEFINITION, init_parameters={}, api_key="my-key"
+    ) as first_engine:
+        first_result = first_engine.run(runtime_parameters={"value": 1})
+    with engines_pool.lease(
+        workflow_definition=WORKFLOW_DEFINITION, init_parameters={}, api_key="my-key"
+    ) as second_engine:
+        second_result = second_engine.run(runtime_parameters={"value": 2})
+
+    # then
+    assert first_engine is second_engine
+    assert first_result == [{"result": 1}]
+    assert second_result == [{"result": 2}]
+    assert len(engines_pool) == 1
+
+
+def test_execution_engine_pool_does_not_share_engines_between_api_keys() -> None:
+    # given
+    engines_pool = ExecutionEnginePool(max_size=4)
+
+    # when
+    with engines_pool.lease(
+        workflow_definition=WORKFLOW_DEFINITION, init_parameters={}, api_key="a"
+    ) as first_engine:
+        pass
+    with engines_pool.lease(
+        workflow_definition=WORKFLOW_DEFINITION, init_parameters={}, api_key="b"
+    ) as second_engine:
+        pass
+
+    # then
+    assert first_engine is not second_engine
+    assert len(engines_pool) == 2
+
+
+def test_execution_engine_pool_leases_engines_exclusively() -> None:
+    # given
+    engines_pool = ExecutionEnginePool(max_size=4)
+
+    # when
+    with engines_pool.lease(
+        workflow_definition=WORKFLOW_DEFINITION, init_parameters={}, api_key=None
+    ) as first_engine:
+        with engines_pool.lease(
+            workflow_definition=WORKFLOW_DEFINITION, init_parameters={}, api_key=None
+        ) as second_engine:
+            pass
+
+    # then
+    assert first_engine is not second_engine
+    assert len(engines_pool) == 2
+
+
+def test_execution_engine_pool_evicts_least_recently_used_workflows() -> None:
+    # given
+    engines_pool = ExecutionEnginePool(max_size=2)
+    engines = {}
+
+    # when
+    for api_key in ["a", "b", "a", "c"]:
+        with engines_pool.lease(
+            workflow_definition=WORKFLOW_DEFINITION, init_parameters={}, api_key=api_key
+        ) as engine:
+            engines.setdefault(api_key, []).append(engine)
+    with engines_pool.lease(
+        workflow_definition=WORKFLOW_DEFINITION, init_parameters={}, api_key="a"
+    ) as engine_a:
+        pass
+    with engines_pool.lease(
+        workflow_definition=WORKFLOW_DEFINITION, init_parameters={}, api_key="b"
+    ) as engine_b:
+        pass
+
+    # then
+    assert len(engines_pool) == 2
+    assert engines["a"][0] is engines["a"][1] is engine_a
+    assert engine_b is not engines["b"][0], "Expected engine for key b to be evicted"
+
+
+def test_execution_engine_pool_reuses_engine_for_the_same_workflow_id() -> None:
+    # given
+    engines_pool = ExecutionEnginePool(max_size=4)
+
+    # when
+    with mock.patch.object(pool, "json") as json_mock:
+        with engines_pool.lease(
+            workflow_definition=WORKFLOW_DEFINITION,
+            init_parameters={},
+            api_key="my-key",
+            workflow_id="my-workflow",
+        ) as first_engine:
+            pass
+        with engines_pool.lease(
+            workflow_definition=deepcopy(WORKFLOW_DEFINITION),
+            init_parameters={},
+            api_key="my-key",
+            workflow_id="my-workflow",
+        ) as second_engine:
+            pass
+
+    # then
+    assert first_engine is second_engine
+    assert len(engines_pool) == 1
+    json_mock.dumps.assert_not_called()
+
+
+def test_execution_engine_pool_when_workflow_with_given_id_was_modified() -> None:
+    # given
+    engines_pool = ExecutionEnginePool(max_size=4)
+    modified_definition = deepcopy(WORKFLOW_DEFINITION)
+    modified_definition["steps"][0]["default"] = "modified"
+    with engines_pool.lease(
+        workflow_definition=WORKFLOW_DEFINITION,
+        init_parameters={},
+        api_key="my-key",
+        workflow_id="my-workflow",
+    ) as first_engine:
+        pass
+
+    # when
+    with engines_pool.lease(
+        workflow_definition=modified_definition,
+        init_parameters={},
+        api_key="my-key",
+        workflow_id="my-workflow",
+    ) as second_engine:
+        result = second_engine.run(runtime_parameters={"value": None})
+
+    # then
+    assert first_engine is not second_engine
+    assert result == [{"result": "modified"}]
+    assert len(engines_pool) == 1, "Expected engine of previous definition discarded"
+
+
+def test_execution_engine_pool_discards_engine_when_error_occurs() -> None:
+    # given
+    engines_pool = ExecutionEnginePool(max_size=2)
+
+    # when
+    with pytest.raises(ValueError):
+        with engines_pool.lease(
+            workflow_definition=WORKFLOW_DEFINITION, init_parameters={}, api_key=None
+        ):
+            raise ValueError()
+
+    # then
+    assert len(engines_pool) == 0
+
+
+@mock.patch.object(pool, "ExecutionEngine")
+def test_execution_engine_pool_binds_request_scoped_parameters_for_lease_duration(
+    execution_engine_mock: MagicMock,
+) -> None:
+    # given
+    engines_pool = ExecutionEnginePool(max_size=2)
+    background_tasks = MagicMock()
+
+    # when
+    with engines_pool.lease(
+        workflow_definition=WORKFLOW_DEFINITION,
+        init_parameters={"workflows_core.api_key": "my-key"},
+        api_key="my-key",
+        request_scoped_parameters={"workflows_core.background_tasks": background_tasks},
+    ):
+        init_parameters = execution_engine_mock.init.call_args[1]["init_parameters"]
+        scoped_parameter = init_parameters["workflows_core.background_tasks"]
+        scoped_parameter.add_task("some")
+        bound_during_lease = bool(scoped_parameter)
+
+    # then
+    assert init_parameters["workflows_core.api_key"] == "my-key"
+    assert bound_during_lease is True
+    assert not scoped_parameter, "Expected parameter to be unbound after lease"
+    background_tasks.add_task.assert_called_once_with("some")